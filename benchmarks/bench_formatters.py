@@ -0,0 +1,87 @@
+"""
+Microbenchmark Formatters: per-cell tanpa cache vs per-cell ter-cache
+
+Jalankan dengan:
+    python -m benchmarks.bench_formatters
+    python -m benchmarks.bench_formatters --rows 50000 --repeat 5
+
+Data sintetis meniru hasil query: tanggal dalam satu tahun, harga dari
+daftar layanan, jam per 30 menit (string TIME dari database).
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from utils.formatters import Formatters, _format_currency, _format_date, _format_time
+
+
+def generate_rows(count: int, seed: int = 42):
+    """Buat kolom tanggal, nominal & jam yang berulang seperti data asli"""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    prices = [Decimal(rng.randrange(50, 3000) * 1000) for _ in range(60)]
+    slots = [f"{hour:02d}:{minute:02d}:00" for hour in range(7, 22) for minute in (0, 30)]
+
+    dates = [start + timedelta(days=rng.randrange(365)) for _ in range(count)]
+    amounts = [rng.choice(prices) for _ in range(count)]
+    times = [rng.choice(slots) for _ in range(count)]
+    return dates, amounts, times
+
+
+def best_of(repeat: int, func) -> float:
+    """Waktu terbaik (detik) dari beberapa kali run"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Formatters")
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    dates, amounts, times = generate_rows(args.rows)
+    cells = args.rows * 3
+
+    def uncached():
+        # Implementasi asli tanpa cache (dipanggil lewat __wrapped__)
+        for value in amounts:
+            _format_currency.__wrapped__(value)
+        for value in dates:
+            _format_date.__wrapped__(value)
+        for value in times:
+            _format_time.__wrapped__(value)
+
+    def per_cell():
+        for value in amounts:
+            Formatters.format_currency(value)
+        for value in dates:
+            Formatters.format_date(value)
+        for value in times:
+            Formatters.format_time(value)
+
+    # Hasil harus identik di kedua mode
+    assert [Formatters.format_currency(v) for v in amounts] == [_format_currency.__wrapped__(v) for v in amounts]
+    assert [Formatters.format_date(v) for v in dates] == [_format_date.__wrapped__(v) for v in dates]
+    assert [Formatters.format_time(v) for v in times] == [_format_time.__wrapped__(v) for v in times]
+
+    print(f"⏱️ Formatters: {args.rows} baris x 3 kolom, best of {args.repeat}")
+    print("-" * 50)
+    baseline = None
+    for label, func in (("per-cell tanpa cache", uncached),
+                        ("per-cell ter-cache", per_cell)):
+        elapsed = best_of(args.repeat, func)
+        baseline = baseline or elapsed
+        rate = cells / elapsed if elapsed > 0 else 0
+        print(f"{label:22s} {elapsed * 1000:9.1f} ms  {rate:12,.0f} sel/detik  x{baseline / elapsed:5.1f}")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    main()
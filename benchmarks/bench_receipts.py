@@ -0,0 +1,108 @@
+"""
+Benchmark ReceiptTemplate: region statis sebagai form XObject vs digambar ulang,
+plus ESC/POS langsung untuk format thermal dan tinggi halaman thermal
+otomatis (auto_height) vs halaman tetap 297mm per ukuran keranjang
+
+Jalankan dengan:
+    python -m benchmarks.bench_receipts
+    python -m benchmarks.bench_receipts --count 500 --items 5 --format thermal_58
+    python -m benchmarks.bench_receipts --baskets 1 5 20 100
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from utils.escpos import EscPos
+from utils.receipt_template import MM, ReceiptTemplate
+
+LAYANAN = (
+    "Makeup Wedding Premium", "Makeup Wisuda", "Hair Do Simple",
+    "Makeup Pre-Wedding Outdoor Full Day", "Hijab Styling", "Nail Art",
+)
+
+
+def generate_receipts(count: int, items: int, seed: int = 42):
+    """Struk sintetis: (transaksi_data, detail_items, pembayaran_data)"""
+    rng = random.Random(seed)
+    today = date.today()
+    receipts = []
+    for i in range(count):
+        detail_items = []
+        for _ in range(items):
+            harga = rng.randrange(50, 3000) * 1000
+            jumlah = rng.randrange(1, 4)
+            detail_items.append({'nama_layanan': rng.choice(LAYANAN), 'jumlah': jumlah,
+                                 'harga': harga, 'subtotal': harga * jumlah})
+        total = sum(item['subtotal'] for item in detail_items)
+        tanggal = today - timedelta(days=rng.randrange(365))
+        receipts.append((
+            {'id_transaksi': i + 1, 'tanggal_transaksi': tanggal,
+             'nama_pelanggan': f"Pelanggan {rng.randrange(1000)}", 'total': total},
+            detail_items,
+            {'id_pembayaran': i + 1, 'jumlah_bayar': total + rng.randrange(0, 100) * 1000,
+             'metode_bayar': rng.choice(("Cash", "Transfer", "QRIS")),
+             'status': "Lunas", 'tanggal_bayar': tanggal},
+        ))
+    return receipts
+
+
+def measure(label: str, count: int, func):
+    start = time.perf_counter()
+    size = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<38}: {elapsed * 1000:8.1f} ms  "
+          f"({count / elapsed:7,.0f} struk/detik, {size / 1024:8,.1f} KB)")
+
+
+def basket_sweep(fmt: str, count: int, baskets):
+    """Render time, ukuran file & tinggi halaman per jumlah layanan"""
+    fixed = ReceiptTemplate(ReceiptTemplate.build_layout(fmt))
+    fixed.layout.auto_height = False
+    auto = ReceiptTemplate.get(fmt)
+    print("-" * 76)
+    print(f"{fmt}: tinggi otomatis vs tetap 297mm")
+    for items in baskets:
+        receipts = generate_receipts(count, items)
+        height = auto.page_height(*receipts[0]) / MM
+        for label, template in (("297mm", fixed), (f"{height:.0f}mm", auto)):
+            measure(f"  {items:>3} layanan, {label}", count,
+                    lambda: sum(len(template.render_bytes(*r)) for r in receipts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ReceiptTemplate")
+    parser.add_argument('--count', type=int, default=300)
+    parser.add_argument('--items', type=int, default=3, help="Jumlah layanan per struk")
+    parser.add_argument('--format', choices=ReceiptTemplate.FORMATS, action='append',
+                        help="Format yang diukur (default semua)")
+    parser.add_argument('--baskets', type=int, nargs='+', default=[1, 5, 20, 100],
+                        help="Jumlah layanan per struk untuk perbandingan tinggi halaman thermal")
+    args = parser.parse_args()
+
+    receipts = generate_receipts(args.count, args.items)
+    print(f"⏱️ Render {args.count} struk ({args.items} layanan per struk)")
+
+    for fmt in args.format or ReceiptTemplate.FORMATS:
+        with_forms = ReceiptTemplate.get(fmt)
+        without_forms = ReceiptTemplate(ReceiptTemplate.build_layout(fmt), use_forms=False)
+        print("-" * 76)
+        print(fmt)
+        for label, template in (("tanpa form", without_forms), ("form XObject", with_forms)):
+            measure(f"  satu PDF per struk, {label}", args.count,
+                    lambda: sum(len(template.render_bytes(*r)) for r in receipts))
+        for label, template in (("tanpa form", without_forms), ("form XObject", with_forms)):
+            measure(f"  satu PDF (render_many), {label}", args.count,
+                    lambda: len(template.render_many(receipts)))
+        if fmt.startswith('thermal_'):
+            paper_mm = int(fmt.split('_')[1])
+            measure("  ESC/POS (utils.escpos)", args.count,
+                    lambda: sum(len(EscPos.render(*r, paper_mm=paper_mm)) for r in receipts))
+
+    for fmt in args.format or ReceiptTemplate.FORMATS:
+        if fmt.startswith('thermal_'):
+            basket_sweep(fmt, args.count, args.baskets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark PDF laporan periode (utils.report_generator) tanpa database
+
+Data sintetis dialirkan lewat generator seperti cursor fetchmany, jadi
+peak memory menunjukkan apakah tabel panjang benar-benar di-stream.
+
+Jalankan dengan:
+    python -m benchmarks.bench_report
+    python -m benchmarks.bench_report --months 12 --transaksi 50000
+"""
+import argparse
+import io
+import random
+import re
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from utils.report_generator import ReportGenerator
+
+METODE = ("Cash", "Transfer", "QRIS", "Debit")
+
+
+def synthetic_data(date_from: date, date_to: date, transaksi: int, seed: int = 42):
+    """Data laporan sintetis, setiap bagian berupa generator"""
+    rng = random.Random(seed)
+    days = (date_to - date_from).days + 1
+
+    def per_hari():
+        for i in range(days):
+            count = rng.randrange(0, 40)
+            yield {'tanggal': date_from + timedelta(days=i), 'transaksi': count,
+                   'booking': rng.randrange(0, 30), 'pendapatan': count * rng.randrange(200, 900) * 1000}
+
+    def per_layanan():
+        for i in range(60):
+            yield {'nama_layanan': f"Layanan Makeup Paket {i + 1}", 'qty': rng.randrange(1, 500),
+                   'transaksi': rng.randrange(1, 400), 'pendapatan': rng.randrange(1, 50000) * 10000}
+
+    def per_mua():
+        for i in range(20):
+            yield {'nama_mua': f"MUA {i + 1}", 'booking': rng.randrange(0, 300),
+                   'transaksi': rng.randrange(0, 300), 'pendapatan': rng.randrange(0, 90000) * 10000}
+
+    def per_metode():
+        for metode in METODE:
+            yield {'metode_bayar': metode, 'jumlah': rng.randrange(100, 5000),
+                   'total': rng.randrange(1000, 90000) * 10000}
+
+    def daftar_transaksi():
+        for i in range(transaksi):
+            yield {'id_transaksi': i + 1, 'tanggal_transaksi': date_from + timedelta(days=i * days // transaksi),
+                   'nama_pelanggan': f"Pelanggan {rng.randrange(100000)}",
+                   'nama_mua': f"MUA {rng.randrange(1, 21)}", 'total': rng.randrange(50, 3000) * 1000}
+
+    return {
+        'summary': {'jumlah_transaksi': transaksi, 'pendapatan': 123456789000, 'jumlah_booking': 9000,
+                    'jumlah_pembayaran': 8000, 'diterima': 120000000000},
+        'per_hari': per_hari(),
+        'per_layanan': per_layanan(),
+        'per_mua': per_mua(),
+        'per_metode': per_metode(),
+        'transaksi': daftar_transaksi() if transaksi else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF laporan periode")
+    parser.add_argument('--months', type=int, default=12)
+    parser.add_argument('--transaksi', type=int, nargs='+', default=[0, 10000, 50000],
+                        help="Jumlah baris daftar transaksi (0 = tanpa lampiran)")
+    parser.add_argument('--output', help="Simpan PDF terakhir ke file ini")
+    args = parser.parse_args()
+
+    date_to = date.today()
+    date_from = date_to - timedelta(days=round(args.months * 30.44) - 1)
+    print(f"⏱️ Laporan {date_from} s/d {date_to}")
+    print("-" * 76)
+
+    for count in args.transaksi:
+        # Waktu diukur tanpa tracemalloc (tracemalloc memperlambat berkali-kali lipat)
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        ReportGenerator.build(buffer, date_from, date_to, synthetic_data(date_from, date_to, count))
+        elapsed = time.perf_counter() - start
+        pdf = buffer.getvalue()
+        pages = len(re.findall(rb'/Type /Page\b', pdf))
+
+        tracemalloc.start()
+        ReportGenerator.build(io.BytesIO(), date_from, date_to, synthetic_data(date_from, date_to, count))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{count:>7} baris transaksi: {elapsed:6.2f} s  {pages:>5} halaman  "
+              f"{len(pdf) / 1024:8,.0f} KB  peak memory {peak / 1024 / 1024:6.1f} MB")
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(pdf)
+
+if __name__ == "__main__":
+    main()
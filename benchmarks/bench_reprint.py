@@ -0,0 +1,52 @@
+"""
+Benchmark cetak ulang struk massal (reprint_receipts) tanpa database
+
+Jalankan dengan:
+    python -m benchmarks.bench_reprint
+    python -m benchmarks.bench_reprint --count 2000 --format thermal_80 --workers 1 2 4
+"""
+import argparse
+import io
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_receipts import generate_receipts
+from reprint_receipts import Progress, render_merged, render_pool
+from utils.receipt_template import ReceiptTemplate
+
+
+def report(label: str, progress: Progress):
+    print(f"{label:<28}: {progress.elapsed:7.2f} s  "
+          f"({progress.rate:7,.1f} struk/detik, {progress.size / 1024 / 1024:6.1f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cetak ulang struk massal")
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--items', type=int, default=3, help="Jumlah layanan per struk")
+    parser.add_argument('--format', choices=ReceiptTemplate.FORMATS, default='a4')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help="Jumlah proses yang diuji (default: 1 dan jumlah CPU)")
+    args = parser.parse_args()
+
+    receipts = generate_receipts(args.count, args.items)
+    workers_list = args.workers or sorted({1, os.cpu_count() or 1})
+
+    print(f"⏱️ Cetak ulang {args.count} struk {args.format} ({args.items} layanan per struk)")
+    print("-" * 76)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for workers in workers_list:
+            progress = render_pool(iter(receipts), args.format, workers, tmp / f"w{workers}",
+                                   Progress(io.StringIO()))
+            report(f"File per struk, {workers} proses", progress)
+
+        progress = render_merged(iter(receipts), args.format, tmp / "merged.pdf",
+                                 Progress(io.StringIO()))
+        report("Satu PDF (--merge)", progress)
+
+
+if __name__ == "__main__":
+    main()
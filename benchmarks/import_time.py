@@ -0,0 +1,113 @@
+"""
+Regression check waktu import startup berbasis `python -X importtime`
+
+Jalankan dengan:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 600 --module main
+
+Exit code 1 jika waktu import melebihi budget atau modul berat
+(reportlab, openpyxl, mysql.connector, ui.generated.*) ikut ter-import
+saat startup. Cocok dipasang sebagai langkah CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Budget default (ms), bisa di-override lewat env IMPORT_TIME_BUDGET_MS
+DEFAULT_BUDGET_MS = float(os.getenv('IMPORT_TIME_BUDGET_MS', 800))
+
+# Modul yang harus lazy (hanya di-load saat fitur dipakai)
+LAZY_MODULES = ('reportlab', 'openpyxl', 'mysql.connector', 'ui.generated')
+
+# Jumlah run, diambil median agar tidak terpengaruh cache dingin
+DEFAULT_RUNS = 3
+
+
+def measure(module: str):
+    """
+    Import modul di interpreter baru dengan -X importtime
+
+    Returns:
+        tuple: (cumulative_ms modul target, dict nama_modul -> cumulative_ms)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import {module} gagal:\n{result.stderr}")
+
+    modules = parse_importtime(result.stderr)
+    return modules.get(module, 0.0), modules
+
+
+def parse_importtime(output: str) -> dict:
+    """
+    Parse output -X importtime
+
+    Format baris:
+        import time: self [us] | cumulative | imported package
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(cumulative) / 1000
+        except ValueError:
+            continue
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cek budget waktu import startup")
+    parser.add_argument('--module', default='main', help="Modul entry point (default: main)")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--top', type=int, default=15, help="Tampilkan N modul terlambat")
+    args = parser.parse_args()
+
+    samples = []
+    modules = {}
+    for _ in range(args.runs):
+        total_ms, modules = measure(args.module)
+        samples.append(total_ms)
+    samples.sort()
+    median_ms = samples[len(samples) // 2]
+
+    print(f"⏱️ import {args.module}: {median_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("-" * 50)
+    for name, cumulative in sorted(modules.items(), key=lambda m: m[1], reverse=True)[:args.top]:
+        print(f"{cumulative:9.1f} ms  {name}")
+    print("-" * 50)
+
+    failed = False
+
+    leaked = sorted(
+        name for name in modules
+        if any(name == lazy or name.startswith(lazy + '.') for lazy in LAZY_MODULES)
+    )
+    if leaked:
+        failed = True
+        print("❌ Modul berat ter-import saat startup:")
+        for name in leaked:
+            print(f"   {name}")
+
+    if median_ms > args.budget_ms:
+        failed = True
+        print(f"❌ Waktu import melebihi budget: {median_ms:.1f} ms > {args.budget_ms:.0f} ms")
+
+    if not failed:
+        print("✅ Import startup dalam budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Isi database benchmark dengan data sintetis (benchmarks.synthetic)
+
+Jalankan dengan:
+    python -m benchmarks.seed                       # 100k pelanggan, 500k jadwal, 1M transaksi
+    python -m benchmarks.seed --scale 0.01          # data kecil untuk cek cepat
+    python -m benchmarks.seed --database bench_makeup --source db_jasa_makeup
+    DB_BACKEND=sqlite python -m benchmarks.seed     # file data/makeup_bench.sqlite3, tanpa MySQL
+
+MySQL: struktur tabel disalin dari database aplikasi (CREATE TABLE ... LIKE),
+jadi index & kolom sama persis dengan produksi. SQLite: skema dari
+migrations/sqlite/schema.sql. Database benchmark dikosongkan lalu diisi
+ulang; database aplikasi tidak pernah ditulis.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import COLUMNS, SyntheticData
+from config.settings import Settings
+
+# Baris per executemany (mysql.connector menggabungkan jadi satu INSERT multi-row)
+BATCH_SIZE = 5000
+
+# Tabel yang strukturnya disalin (COLUMNS + tabel pendukung)
+TABLES = tuple(COLUMNS) + ('change_log',)
+
+
+def default_database() -> str:
+    """<DB_NAME>_bench (MySQL) atau <file>_bench.sqlite3 di samping DB_SQLITE_PATH"""
+    if Settings.DB_BACKEND == 'sqlite':
+        path = Path(Settings.DB_SQLITE_PATH)
+        return str(path.with_name(f"{path.stem}_bench{path.suffix}"))
+    return f"{Settings.DB_NAME}_bench"
+
+
+def connect(database=None):
+    """Buka koneksi langsung ke server database (tanpa pool aplikasi)"""
+    import mysql.connector
+    return mysql.connector.connect(
+        host=Settings.DB_HOST,
+        port=Settings.DB_PORT,
+        user=Settings.DB_USER,
+        password=Settings.DB_PASSWORD,
+        database=database,
+        autocommit=False
+    )
+
+
+def create_schema(cursor, database: str, source: str):
+    """Buat database benchmark & salin struktur tabel dari database aplikasi"""
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+    for table in TABLES:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS `{database}`.`{table}` LIKE `{source}`.`{table}`")
+
+
+def open_mysql(database: str, source: str):
+    """Koneksi ke database benchmark MySQL yang sudah dikosongkan"""
+    if database == source:
+        raise ValueError("Database benchmark harus berbeda dari database aplikasi")
+    conn = connect()
+    cursor = conn.cursor()
+    create_schema(cursor, database, source)
+    conn.database = database
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    cursor.execute("SET UNIQUE_CHECKS = 0")
+    for table in TABLES:
+        cursor.execute(f"TRUNCATE TABLE `{table}`")
+    return conn
+
+
+def open_sqlite(path: str):
+    """Koneksi ke file SQLite benchmark (skema dibuat jika belum ada) yang sudah dikosongkan"""
+    from config.db_backends import SQLiteBackend
+
+    if Path(path).resolve() == Path(Settings.DB_SQLITE_PATH).resolve():
+        raise ValueError("Database benchmark harus berbeda dari database aplikasi")
+    backend = SQLiteBackend(path)
+    if not backend.create_pool():
+        raise ValueError(f"Tidak dapat membuat database SQLite: {path}")
+    conn = backend.get_connection()
+    conn.execute("PRAGMA foreign_keys = OFF")
+    # Data benchmark bisa dibuat ulang, tidak perlu fsync per commit
+    conn.execute("PRAGMA synchronous = OFF")
+    for table in TABLES:
+        conn.execute(f"DELETE FROM `{table}`")
+    conn.commit()
+    return conn
+
+
+def finish_mysql(cursor):
+    cursor.execute("SET UNIQUE_CHECKS = 1")
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    # Statistik index diperbarui agar query plan sama dengan data produksi
+    for table in COLUMNS:
+        cursor.execute(f"ANALYZE TABLE `{table}`")
+        cursor.fetchall()
+
+
+def finish_sqlite(cursor):
+    cursor.execute("ANALYZE")
+
+
+def insert_sql(table: str) -> str:
+    columns = COLUMNS[table]
+    return (f"INSERT INTO `{table}` ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})")
+
+
+class Loader:
+    """Buffer baris per tabel, flush per BATCH_SIZE"""
+
+    def __init__(self, conn, expected, translate=str):
+        self.conn = conn
+        self.translate = translate
+        self.cursor = conn.cursor()
+        self.expected = expected
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table: str, row):
+        buffer = self.buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= BATCH_SIZE:
+            self.flush(table)
+
+    def flush(self, table: str):
+        buffer = self.buffers.get(table)
+        if not buffer:
+            return
+        self.cursor.executemany(self.translate(insert_sql(table)), buffer)
+        self.conn.commit()
+        self.counts[table] = self.counts.get(table, 0) + len(buffer)
+        buffer.clear()
+        expected = self.expected.get(table)
+        if expected:
+            sys.stdout.write(f"\r   {table:<18} {self.counts[table]:>10,} / {expected:,}")
+            sys.stdout.flush()
+
+    def finish(self, *tables):
+        for table in tables:
+            self.flush(table)
+        sys.stdout.write("\n")
+
+
+def seed(database: str, source: str, scale: float, seed_value: int):
+    from config.db_backends import create_backend
+
+    backend = create_backend()
+    data = SyntheticData(scale, seed_value)
+    expected = data.expected_counts()
+    conn = None
+    start = time.perf_counter()
+
+    print("🌱 Mengisi database benchmark...")
+    if backend.name == 'sqlite':
+        print(f"   Database : {database} (SQLite)")
+    else:
+        print(f"   Database : {database} (struktur dari {source})")
+    print(f"   Volume   : {expected['pelanggan']:,} pelanggan, {expected['jadwal']:,} jadwal, "
+          f"{expected['transaksi']:,} transaksi")
+    print("-" * 60)
+
+    try:
+        if backend.name == 'sqlite':
+            conn = open_sqlite(database)
+        else:
+            conn = open_mysql(database, source)
+
+        loader = Loader(conn, expected, backend.translate)
+        for table, rows in data.tables():
+            for row in rows:
+                loader.add(table, row)
+            loader.finish(table)
+
+        for row, details, pembayaran in data.transaksi():
+            loader.add('transaksi', row)
+            for detail in details:
+                loader.add('detail_transaksi', detail)
+            if pembayaran:
+                loader.add('pembayaran', pembayaran)
+        loader.finish('transaksi', 'detail_transaksi', 'pembayaran')
+
+        if backend.name == 'sqlite':
+            finish_sqlite(loader.cursor)
+        else:
+            finish_mysql(loader.cursor)
+
+        print("-" * 60)
+        for table in COLUMNS:
+            print(f"   {table:<18} {loader.counts.get(table, 0):>10,} baris")
+        print(f"✅ Selesai dalam {time.perf_counter() - start:.1f} detik")
+        return True
+
+    except (backend.Error, ValueError) as e:
+        print(f"\n❌ Error: {e}")
+        if conn:
+            conn.rollback()
+        return False
+    finally:
+        if conn:
+            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Isi database benchmark dengan data sintetis")
+    parser.add_argument('--database', default=default_database(),
+                        help="Database benchmark, path file untuk SQLite (default: <DB_NAME>_bench)")
+    parser.add_argument('--source', default=Settings.DB_NAME,
+                        help="Database sumber struktur tabel, MySQL saja (default: DB_NAME)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Faktor volume (1.0 = 100k pelanggan, 1M transaksi)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if not seed(args.database, args.source, args.scale, args.seed):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Benchmark suite: service, load tabel Qt (offscreen) & PDF di database benchmark
+
+Jalankan dengan:
+    python -m benchmarks.seed --scale 1.0           # sekali, isi database benchmark
+    python -m benchmarks.suite                      # hasil ke reports/benchmarks/suite_<waktu>.json
+    python -m benchmarks.suite --output v1.1.json --compare v1.0.json
+    python -m benchmarks.suite --group service pdf --runs 5
+    DB_BACKEND=sqlite python -m benchmarks.suite    # tanpa server MySQL (seed dengan DB_BACKEND=sqlite)
+
+Setiap case dijalankan --runs kali (setelah satu warm-up) dan dicatat
+median/min/max dalam ms. --compare membandingkan dengan file hasil rilis
+sebelumnya; exit code 1 jika ada case yang lebih lambat dari --threshold
+(default 20%), sehingga regresi terlihat di CI.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from benchmarks.seed import default_database
+from config.settings import Settings
+
+GROUPS = ('service', 'qt', 'pdf')
+
+DEFAULT_RUNS = 3
+
+# Perlambatan relatif yang dianggap regresi
+DEFAULT_THRESHOLD = 0.2
+
+# Selisih absolut minimum (ms), agar noise case sangat cepat tidak dianggap regresi
+MIN_DELTA_MS = 2.0
+
+
+def timeit(func, runs: int):
+    """
+    Jalankan func (1 warm-up + runs kali)
+
+    Returns:
+        dict: median_ms, min_ms, max_ms, runs, rows (jika hasil berupa list)
+    """
+    result = func()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    stats = {
+        'median_ms': round(statistics.median(samples), 3),
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'runs': runs,
+    }
+    if isinstance(result, (list, tuple)):
+        stats['rows'] = len(result)
+    return stats
+
+
+# ============================================
+# Cases
+# ============================================
+
+def service_cases():
+    from services.dashboard_service import DashboardService
+    from services.jadwal_service import JadwalService
+    from services.layanan_service import LayananService
+    from services.pelanggan_service import PelangganService
+    from services.pembayaran_service import PembayaranService
+    from services.report_service import ReportService
+    from services.transaksi_service import TransaksiService
+    from utils.pelanggan_index import PelangganIndex
+
+    pelanggan = PelangganService()
+    dashboard = DashboardService()
+    report = ReportService()
+    today = date.today()
+    month_start = today.replace(day=1)
+    rows = pelanggan.get_all()
+    index = PelangganIndex(rows)
+
+    return [
+        ('service.pelanggan.get_all', pelanggan.get_all),
+        ('service.pelanggan.search_nama', lambda: pelanggan.search("Sari")),
+        ('service.pelanggan.search_no_hp', lambda: pelanggan.search("081200")),
+        ('service.pelanggan.get_by_phone', lambda: pelanggan.get_by_phone("081200020264")),
+        ('service.pelanggan.index_build', lambda: PelangganIndex(rows)),
+        ('service.pelanggan.index_search_nama', lambda: index.search("siti r")),
+        ('service.pelanggan.index_search_no_hp', lambda: index.search("0812 0002")),
+        ('service.layanan.get_all', LayananService().get_all),
+        ('service.jadwal.get_all', JadwalService().get_all),
+        ('service.jadwal.get_mua_all', JadwalService().get_mua_all),
+        ('service.transaksi.get_all', TransaksiService().get_all),
+        ('service.pembayaran.get_all', PembayaranService().get_all),
+        ('service.dashboard.get_statistics', dashboard.get_statistics),
+        ('service.dashboard.get_jadwal_hari_ini', dashboard.get_jadwal_hari_ini),
+        ('service.report.get_summary_bulan_ini', lambda: report.get_summary(month_start, today)),
+    ]
+
+
+def qt_cases():
+    """Buka view (offscreen) dengan user admin, ukur buka window & reload tabel"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtCore import QEvent
+    from PyQt5.QtWidgets import QApplication
+    from utils.session_manager import SessionManager, User
+    from views.jadwal_view import JadwalView
+    from views.layanan_view import LayananView
+    from views.main_window import MainWindow
+    from views.pelanggan_view import PelangganView
+    from views.pembayaran_view import PembayaranView
+    from views.transaksi_view import TransaksiView
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    SessionManager.login(User(id_user=1, nama_user="Admin Benchmark",
+                              username="bench_admin", role='admin'))
+
+    def open_view(view_class):
+        def run():
+            view = view_class()
+            watcher = getattr(view, 'change_watcher', None)
+            if watcher:
+                watcher.stop()
+            app.processEvents()
+            view.close()
+            view.deleteLater()
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+        return run
+
+    views = {}
+
+    def reload(view_class, method):
+        def run():
+            view = views.get(view_class)
+            if view is None:
+                view = views[view_class] = view_class()
+                watcher = getattr(view, 'change_watcher', None)
+                if watcher:
+                    watcher.stop()
+            getattr(view, method)()
+            app.processEvents()
+        return run
+
+    cases = []
+    for name, view_class, method in (
+        ('dashboard', MainWindow, 'load_dashboard'),
+        ('pelanggan', PelangganView, 'load_data'),
+        ('layanan', LayananView, 'load_data'),
+        ('jadwal', JadwalView, 'load_data'),
+        ('transaksi', TransaksiView, 'load_history'),
+        ('pembayaran', PembayaranView, 'load_history'),
+    ):
+        cases.append((f'qt.{name}.open', open_view(view_class)))
+        cases.append((f'qt.{name}.reload', reload(view_class, method)))
+    return cases
+
+
+def pdf_cases():
+    from benchmarks.bench_receipts import generate_receipts
+    from utils.escpos import EscPos
+    from utils.receipt_template import ReceiptTemplate
+    from utils.report_generator import ReportGenerator
+
+    receipt = generate_receipts(1, 3)[0]
+    receipts = generate_receipts(100, 3)
+    today = date.today()
+
+    def report(days):
+        def run():
+            buffer = io.BytesIO()
+            date_from = today - timedelta(days=days - 1)
+            ReportGenerator.build(buffer, date_from, today, ReportGenerator.period_data(date_from, today))
+            return buffer.getbuffer().nbytes
+        return run
+
+    cases = []
+    for fmt in ReceiptTemplate.FORMATS:
+        template = ReceiptTemplate.get(fmt)
+        cases.append((f'pdf.struk.{fmt}', lambda template=template: template.render_bytes(*receipt)))
+    cases += [
+        ('pdf.struk.a4_x100_merged', lambda: ReceiptTemplate.get('a4').render_many(receipts)),
+        ('escpos.struk.thermal_80', lambda: EscPos.render(*receipt)),
+        ('pdf.laporan.30_hari', report(30)),
+        ('pdf.laporan.12_bulan', report(365)),
+    ]
+    return cases
+
+
+CASES = {
+    'service': service_cases,
+    'qt': qt_cases,
+    'pdf': pdf_cases,
+}
+
+
+# ============================================
+# Hasil
+# ============================================
+
+def table_counts():
+    from config.database import Database
+    counts = {}
+    for table in ('pelanggan', 'jadwal', 'transaksi', 'detail_transaksi', 'pembayaran'):
+        try:
+            counts[table] = Database.execute_query(
+                f"SELECT COUNT(*) AS total FROM {table}", fetch=True)[0]['total']
+        except Exception:
+            counts[table] = None
+    return counts
+
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Settings.BASE_DIR,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Bandingkan dengan hasil sebelumnya
+
+    Returns:
+        list: Nama case yang melambat melebihi threshold
+    """
+    regressions = []
+    print("-" * 76)
+    print(f"Perbandingan dengan {baseline['meta'].get('version')} ({baseline['meta'].get('commit')})")
+    for name, stats in results.items():
+        old = baseline['results'].get(name)
+        if not old:
+            continue
+        delta = stats['median_ms'] - old['median_ms']
+        ratio = delta / old['median_ms'] if old['median_ms'] else 0.0
+        flag = ""
+        if ratio > threshold and delta > MIN_DELTA_MS:
+            regressions.append(name)
+            flag = "⚠️ regresi"
+        print(f"{name:<40}: {old['median_ms']:9.1f} -> {stats['median_ms']:9.1f} ms "
+              f"({ratio:+6.0%}) {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite service, view Qt & PDF")
+    parser.add_argument('--database', default=default_database(),
+                        help="Database benchmark hasil benchmarks.seed (path file untuk SQLite)")
+    parser.add_argument('--group', choices=GROUPS, nargs='+', default=list(GROUPS))
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--output', type=Path, help="File JSON hasil")
+    parser.add_argument('--compare', type=Path, metavar='JSON', help="Hasil rilis sebelumnya")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    # Semua service memakai pool Database, arahkan ke database benchmark
+    if Settings.DB_BACKEND == 'sqlite':
+        Settings.DB_SQLITE_PATH = args.database
+    else:
+        Settings.DB_NAME = args.database
+
+    results = {}
+    print(f"⏱️ Benchmark suite ({args.database}, {args.runs} run per case)")
+    print("-" * 76)
+    for group in args.group:
+        for name, func in CASES[group]():
+            stats = results[name] = timeit(func, args.runs)
+            rows = f"{stats['rows']:>9,} baris" if 'rows' in stats else ""
+            print(f"{name:<40}: {stats['median_ms']:9.1f} ms  "
+                  f"(min {stats['min_ms']:.1f}, max {stats['max_ms']:.1f}) {rows}")
+
+    output = {
+        'meta': {
+            'version': Settings.APP_VERSION,
+            'commit': git_commit(),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': Settings.DB_BACKEND,
+            'database': args.database,
+            'rows': table_counts(),
+            'runs': args.runs,
+        },
+        'results': results,
+    }
+    path = args.output or (Settings.REPORTS_DIR / 'benchmarks' / f"suite_{datetime.now():%Y%m%d_%H%M%S}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(output, indent=2), encoding='utf-8')
+    print(f"✅ Hasil disimpan: {path}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} case melambat > {args.threshold:.0%}")
+            sys.exit(1)
+        print("✅ Tidak ada regresi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Data sintetis realistis untuk benchmark (deterministik per seed)
+
+Volume default (scale=1.0): 100k pelanggan, 500k jadwal, 1M transaksi
+(+ detail 1-3 layanan per transaksi & pembayaran). Tanggal tersebar di
+DAYS hari terakhir sampai hari ini (jadwal sampai 30 hari ke depan),
+jadi query "hari ini" / "bulan ini" di dashboard ikut terisi.
+
+Semua baris berupa tuple sesuai urutan kolom di COLUMNS, dengan id
+eksplisit agar foreign key bisa dibangkitkan tanpa membaca database.
+
+    data = SyntheticData(scale=0.01)
+    for table, rows in data.tables():
+        ...
+"""
+import random
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+from config.constants import MetodePembayaran, StatusJadwal, StatusPembayaran, UserRole
+
+# Volume pada scale=1.0
+PELANGGAN = 100_000
+JADWAL = 500_000
+TRANSAKSI = 1_000_000
+MUA = 20
+KASIR = 5
+
+# Rentang tanggal data (hari ke belakang dari hari ini)
+DAYS = 730
+
+# Password semua user benchmark (username bench_admin, bench_kasir1, ...)
+PASSWORD = "benchmark"
+
+COLUMNS = {
+    'kategori_layanan': ('id_kategori', 'nama_kategori'),
+    'layanan': ('id_layanan', 'nama_layanan', 'id_kategori', 'harga', 'durasi', 'deskripsi'),
+    'user': ('id_user', 'nama_user', 'username', 'password', 'role'),
+    'pelanggan': ('id_pelanggan', 'nama', 'no_hp', 'no_hp_e164', 'alamat'),
+    'jadwal': ('id_jadwal', 'id_pelanggan', 'id_user', 'tanggal_booking',
+               'jam_mulai', 'jam_selesai', 'status'),
+    'transaksi': ('id_transaksi', 'tanggal_transaksi', 'total', 'id_user',
+                  'id_pelanggan', 'id_jadwal'),
+    'detail_transaksi': ('id_transaksi', 'id_layanan', 'jumlah', 'subtotal'),
+    'pembayaran': ('id_pembayaran', 'id_transaksi', 'jumlah_bayar', 'metode_bayar',
+                   'tanggal_bayar', 'status'),
+}
+
+NAMA_DEPAN = (
+    "Siti", "Dewi", "Ayu", "Putri", "Rina", "Wulan", "Sari", "Indah", "Nur", "Fitri",
+    "Ratna", "Maya", "Intan", "Citra", "Lestari", "Anisa", "Nadia", "Kartika", "Dian", "Mega",
+)
+NAMA_BELAKANG = (
+    "Rahmawati", "Wulandari", "Kusuma", "Permata", "Anggraini", "Pratiwi", "Safitri",
+    "Handayani", "Susanti", "Puspita", "Maharani", "Utami", "Hidayati", "Lestari", "Saputri",
+)
+JALAN = ("Merdeka", "Sudirman", "Diponegoro", "Gatot Subroto", "Ahmad Yani", "Pahlawan",
+         "Melati", "Mawar", "Kenanga", "Cempaka")
+KOTA = ("Jakarta", "Bandung", "Surabaya", "Yogyakarta", "Semarang", "Malang", "Bekasi", "Depok")
+
+KATEGORI = ("Wedding", "Wisuda", "Pre-Wedding", "Party", "Hair Do", "Hijab Styling", "Nail Art")
+VARIAN = ("Simple", "Regular", "Premium", "Luxury")
+
+
+class SyntheticData:
+    """Generator baris sintetis untuk semua tabel aplikasi"""
+
+    def __init__(self, scale: float = 1.0, seed: int = 42, today: date = None):
+        self.seed = seed
+        self.today = today or date.today()
+        self.counts = {
+            'pelanggan': max(1, int(PELANGGAN * scale)),
+            'jadwal': max(1, int(JADWAL * scale)),
+            'transaksi': max(1, int(TRANSAKSI * scale)),
+        }
+        self._layanan = None
+
+    def _rng(self, table: str) -> random.Random:
+        # RNG per tabel: isi satu tabel tidak bergantung urutan generate tabel lain
+        return random.Random(f"{self.seed}:{table}")
+
+    # ============================================
+    # Referensi
+    # ============================================
+
+    def kategori(self) -> List[Tuple]:
+        return [(i + 1, nama) for i, nama in enumerate(KATEGORI)]
+
+    def layanan(self) -> List[Tuple]:
+        if self._layanan is None:
+            rng = self._rng('layanan')
+            rows = []
+            for id_kategori, kategori in self.kategori():
+                for varian in VARIAN:
+                    harga = rng.randrange(10, 300) * 10_000
+                    durasi = f"{rng.choice((1, 2, 3, 4))} jam"
+                    rows.append((len(rows) + 1, f"Makeup {kategori} {varian}", id_kategori,
+                                 harga, durasi, f"Paket {kategori.lower()} {varian.lower()}"))
+            self._layanan = rows
+        return self._layanan
+
+    def users(self) -> List[Tuple]:
+        # bcrypt di-import saat seed saja
+        from utils.password_helper import PasswordHelper
+        password = PasswordHelper.hash_password(PASSWORD)
+        rows = [(1, "Admin Benchmark", "bench_admin", password, UserRole.ADMIN),
+                (2, "Owner Benchmark", "bench_owner", password, UserRole.OWNER)]
+        for i in range(KASIR):
+            rows.append((len(rows) + 1, f"Kasir {i + 1}", f"bench_kasir{i + 1}", password, UserRole.KASIR))
+        for i in range(MUA):
+            rows.append((len(rows) + 1, f"MUA {NAMA_DEPAN[i % len(NAMA_DEPAN)]} {i + 1}",
+                         f"bench_mua{i + 1}", password, UserRole.MAKEUP_ARTIST))
+        return rows
+
+    @staticmethod
+    def mua_ids() -> range:
+        return range(3 + KASIR, 3 + KASIR + MUA)
+
+    @staticmethod
+    def kasir_ids() -> tuple:
+        # Admin + kasir (yang mencatat transaksi)
+        return (1,) + tuple(range(3, 3 + KASIR))
+
+    # ============================================
+    # Data transaksional
+    # ============================================
+
+    def pelanggan(self) -> Iterator[Tuple]:
+        rng = self._rng('pelanggan')
+        for id_pelanggan in range(1, self.counts['pelanggan'] + 1):
+            # Permutasi 8 digit (7919 coprime dengan 10^8): nomor unik tapi tidak berurutan
+            nomor = (id_pelanggan * 7919 + 12345) % 100_000_000
+            no_hp = f"0812{nomor:08d}"
+            nama = f"{rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_BELAKANG)}"
+            alamat = f"Jl. {rng.choice(JALAN)} No. {rng.randrange(1, 200)}, {rng.choice(KOTA)}"
+            yield id_pelanggan, nama, no_hp, f"+62{no_hp[1:]}", alamat
+
+    def jadwal(self) -> Iterator[Tuple]:
+        rng = self._rng('jadwal')
+        pelanggan = self.counts['pelanggan']
+        mua = self.mua_ids()
+        for id_jadwal in range(1, self.counts['jadwal'] + 1):
+            tanggal = self.today - timedelta(days=rng.randrange(-30, DAYS))
+            mulai = time(rng.randrange(6, 18), rng.choice((0, 30)))
+            selesai = time(min(mulai.hour + rng.randrange(1, 5), 23), mulai.minute)
+            if tanggal < self.today:
+                status = StatusJadwal.SELESAI
+            elif tanggal == self.today:
+                status = rng.choice((StatusJadwal.MENUNGGU, StatusJadwal.PROSES))
+            else:
+                status = StatusJadwal.MENUNGGU
+            yield (id_jadwal, rng.randrange(1, pelanggan + 1), rng.choice(mua), tanggal,
+                   mulai, selesai, status)
+
+    def transaksi(self) -> Iterator[Tuple[Tuple, List[Tuple], Tuple]]:
+        """
+        Yields:
+            (baris transaksi, baris detail_transaksi, baris pembayaran atau None)
+        """
+        rng = self._rng('transaksi')
+        layanan = self.layanan()
+        pelanggan = self.counts['pelanggan']
+        jadwal = self.counts['jadwal']
+        kasir = self.kasir_ids()
+        metode = MetodePembayaran.get_all()
+        id_pembayaran = 0
+        for id_transaksi in range(1, self.counts['transaksi'] + 1):
+            tanggal = datetime.combine(self.today - timedelta(days=rng.randrange(DAYS)),
+                                       time(rng.randrange(8, 21), rng.randrange(60)))
+            details = []
+            for item in rng.sample(layanan, rng.choice((1, 1, 2, 3))):
+                jumlah = rng.choice((1, 1, 1, 2))
+                details.append((id_transaksi, item[0], jumlah, item[3] * jumlah))
+            total = sum(detail[3] for detail in details)
+            id_jadwal = rng.randrange(1, jadwal + 1) if rng.random() < 0.5 else None
+            row = (id_transaksi, tanggal, total, rng.choice(kasir),
+                   rng.randrange(1, pelanggan + 1), id_jadwal)
+
+            pembayaran = None
+            chance = rng.random()
+            if chance < 0.95:
+                id_pembayaran += 1
+                if chance < 0.9:
+                    # Dibayar pas atau dibulatkan ke atas (ada kembalian)
+                    jumlah_bayar = -(-total // 50_000) * 50_000 if rng.random() < 0.5 else total
+                    status = StatusPembayaran.LUNAS
+                else:
+                    jumlah_bayar = total // 2
+                    status = StatusPembayaran.DP
+                pembayaran = (id_pembayaran, id_transaksi, jumlah_bayar, rng.choice(metode),
+                              tanggal + timedelta(minutes=rng.randrange(1, 30)), status)
+            yield row, details, pembayaran
+
+    def tables(self) -> Iterator[Tuple[str, Iterator[Tuple]]]:
+        """(nama tabel, iterator baris) urut sesuai foreign key"""
+        yield 'kategori_layanan', iter(self.kategori())
+        yield 'layanan', iter(self.layanan())
+        yield 'user', iter(self.users())
+        yield 'pelanggan', self.pelanggan()
+        yield 'jadwal', self.jadwal()
+
+    def expected_counts(self) -> Dict[str, int]:
+        """Perkiraan jumlah baris per tabel (untuk progress)"""
+        return {
+            'kategori_layanan': len(KATEGORI),
+            'layanan': len(KATEGORI) * len(VARIAN),
+            'user': 2 + KASIR + MUA,
+            **self.counts,
+        }
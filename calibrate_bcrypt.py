@@ -0,0 +1,58 @@
+# ============================================
+# calibrate_bcrypt.py - Simpan di root folder
+# Jalankan di mesin kasir/server tempat aplikasi dipakai
+# ============================================
+"""
+Kalibrasi cost bcrypt sesuai hardware
+Jalankan dengan: python calibrate_bcrypt.py [--budget-ms 250] [--write-env]
+
+Memilih cost tertinggi yang waktu hash-nya masih di bawah budget latency
+login (Settings.LOGIN_HASH_BUDGET_MS). Hash lama dengan cost berbeda akan
+di-rehash otomatis saat user login berikutnya, tanpa migrasi massal.
+"""
+
+import argparse
+from config.settings import Settings
+from utils.password_helper import PasswordHelper
+
+
+def write_env(rounds: int):
+    """Simpan PASSWORD_SALT_ROUNDS ke file .env"""
+    env_path = Settings.BASE_DIR / '.env'
+    lines = env_path.read_text(encoding='utf-8').splitlines() if env_path.exists() else []
+    
+    lines = [line for line in lines if not line.startswith('PASSWORD_SALT_ROUNDS=')]
+    lines.append(f"PASSWORD_SALT_ROUNDS={rounds}")
+    
+    env_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    print(f"📝 PASSWORD_SALT_ROUNDS={rounds} disimpan ke {env_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kalibrasi cost bcrypt")
+    parser.add_argument('--budget-ms', type=float, default=Settings.LOGIN_HASH_BUDGET_MS,
+                        help="Budget waktu verifikasi password saat login (ms)")
+    parser.add_argument('--samples', type=int, default=3, help="Jumlah sampel per cost")
+    parser.add_argument('--write-env', action='store_true', help="Simpan hasil ke .env")
+    args = parser.parse_args()
+    
+    print(f"🔐 Kalibrasi bcrypt (budget {args.budget_ms:.0f} ms)")
+    print("-" * 50)
+    
+    chosen, results = PasswordHelper.calibrate_rounds(args.budget_ms, args.samples)
+    for rounds, elapsed in results:
+        mark = "✅" if elapsed <= args.budget_ms else "❌"
+        print(f"{mark} cost {rounds:2d}: {elapsed:8.1f} ms")
+    
+    print("-" * 50)
+    print(f"Cost terpilih  : {chosen}")
+    print(f"Cost saat ini  : {Settings.PASSWORD_SALT_ROUNDS}")
+    
+    if args.write_env:
+        write_env(chosen)
+    elif chosen != Settings.PASSWORD_SALT_ROUNDS:
+        print(f"💡 Set PASSWORD_SALT_ROUNDS={chosen} di .env (atau jalankan dengan --write-env)")
+
+
+if __name__ == "__main__":
+    main()
@@ -61,4 +61,44 @@ class UserRole:
             UserRole.MAKEUP_ARTIST,
             UserRole.KASIR,
             UserRole.OWNER
-        ]
\ No newline at end of file
+        ]
+
+# Aksi Change Log
+class ChangeAction:
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+# Permission (operasi yang dicek RBAC)
+class Permission:
+    MENU_PELANGGAN = "menu_pelanggan"
+    MENU_LAYANAN = "menu_layanan"
+    MENU_JADWAL = "menu_jadwal"
+    MENU_TRANSAKSI = "menu_transaksi"
+    MENU_PEMBAYARAN = "menu_pembayaran"
+    MANAGE_PELANGGAN = "manage_pelanggan"
+    DELETE_PELANGGAN = "delete_pelanggan"
+    MANAGE_LAYANAN = "manage_layanan"
+    MANAGE_KATEGORI = "manage_kategori"
+    MANAGE_JADWAL = "manage_jadwal"
+    DELETE_JADWAL = "delete_jadwal"
+    MANAGE_TRANSAKSI = "manage_transaksi"
+    PROSES_PEMBAYARAN = "proses_pembayaran"
+    LAPORAN_PERIODE = "laporan_periode"
+    
+    # Matrix default, bisa di-override lewat tabel role_permission
+    DEFAULTS = {
+        MENU_PELANGGAN: frozenset({UserRole.ADMIN, UserRole.KASIR, UserRole.OWNER}),
+        MENU_LAYANAN: frozenset({UserRole.ADMIN}),
+        MENU_JADWAL: frozenset({UserRole.ADMIN, UserRole.MAKEUP_ARTIST, UserRole.OWNER}),
+        MENU_TRANSAKSI: frozenset({UserRole.ADMIN, UserRole.KASIR, UserRole.OWNER}),
+        MENU_PEMBAYARAN: frozenset({UserRole.ADMIN, UserRole.KASIR, UserRole.OWNER}),
+        MANAGE_PELANGGAN: frozenset({UserRole.ADMIN, UserRole.KASIR}),
+        DELETE_PELANGGAN: frozenset({UserRole.ADMIN}),
+        MANAGE_LAYANAN: frozenset({UserRole.ADMIN}),
+        MANAGE_KATEGORI: frozenset({UserRole.ADMIN}),
+        MANAGE_JADWAL: frozenset({UserRole.ADMIN, UserRole.MAKEUP_ARTIST}),
+        DELETE_JADWAL: frozenset({UserRole.ADMIN}),
+        MANAGE_TRANSAKSI: frozenset({UserRole.ADMIN, UserRole.KASIR}),
+        PROSES_PEMBAYARAN: frozenset({UserRole.ADMIN, UserRole.KASIR}),
+        LAPORAN_PERIODE: frozenset({UserRole.ADMIN, UserRole.OWNER}),
+    }
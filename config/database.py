@@ -1,59 +1,138 @@
 """
 Database connection dan query executor
 """
-import mysql.connector
-from mysql.connector import Error, pooling
+from contextlib import contextmanager
 from config.settings import Settings
+import re
+import threading
+import time
 import logging
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(Settings.LOGS_DIR / 'app.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+class DatabaseUnavailable(Exception):
+    """Server database tidak terjangkau (pool gagal dibuat atau sedang offline)"""
+
+
+_INSERT = re.compile(r'\s*(?:INSERT|REPLACE)\b', re.IGNORECASE)
+
+
+def _write_result(query: str, cursor) -> int:
+    """
+    lastrowid untuk INSERT, rowcount untuk UPDATE/DELETE
+    
+    sqlite3 tidak me-reset lastrowid setelah UPDATE, jadi cursor yang
+    sama dengan INSERT sebelumnya (Database.transaction) bisa salah lapor.
+    """
+    if _INSERT.match(query) and cursor.lastrowid:
+        return cursor.lastrowid
+    return cursor.rowcount
+
+
+class Transaction:
+    """Cursor di dalam Database.transaction(), query tetap dialek MySQL"""
+    
+    def __init__(self, backend, cursor):
+        self._backend = backend
+        self._cursor = cursor
+    
+    def execute(self, query, params=None) -> int:
+        """INSERT/UPDATE/DELETE, return lastrowid atau rowcount (commit di akhir blok)"""
+        self._cursor.execute(self._backend.translate(query), params or ())
+        return _write_result(query, self._cursor)
+    
+    def fetch(self, query, params=None) -> list:
+        """SELECT, return list of dict"""
+        self._cursor.execute(self._backend.translate(query), params or ())
+        return self._cursor.fetchall()
+
+
 class Database:
-    """Singleton class untuk database connection pool"""
+    """
+    Singleton class untuk database connection pool
+    
+    Implementasi koneksi ada di config.db_backends (Settings.DB_BACKEND):
+    mysql (default) atau sqlite untuk dev/benchmark tanpa server MySQL.
     
-    _connection_pool = None
+    Setelah error koneksi, server dianggap offline selama
+    Settings.DB_RETRY_SECONDS: query langsung gagal dengan
+    DatabaseUnavailable tanpa menunggu timeout koneksi berulang kali.
+    """
+    
+    _backend = None
+    _pool_lock = threading.Lock()
+    _offline_until = 0.0
     
     @classmethod
     def initialize_pool(cls):
         """
         Initialize connection pool
         Hanya dipanggil sekali saat aplikasi start
+        Aman dipanggil dari beberapa thread (startup berjalan paralel)
         """
-        try:
-            cls._connection_pool = pooling.MySQLConnectionPool(
-                pool_name="makeup_pool",
-                pool_size=5,
-                pool_reset_session=True,
-                host=Settings.DB_HOST,
-                port=Settings.DB_PORT,
-                database=Settings.DB_NAME,
-                user=Settings.DB_USER,
-                password=Settings.DB_PASSWORD,
-                autocommit=False
-            )
-            logger.info("✅ Database connection pool initialized successfully")
+        with cls._pool_lock:
+            if cls._backend is not None:
+                return True
+            if not cls._create_pool():
+                cls.mark_offline()
+                return False
             return True
-        except Error as e:
-            logger.error(f"❌ Error initializing database pool: {e}")
+    
+    @classmethod
+    def _create_pool(cls):
+        """Buat backend & pool, semua koneksi dibuka di sini (warm-up)"""
+        from config.db_backends import create_backend
+        
+        backend = create_backend()
+        if not backend.create_pool():
             return False
+        cls._backend = backend
+        return True
+    
+    @classmethod
+    def backend(cls):
+        """Backend aktif (pool diinisialisasi jika belum)"""
+        if not cls.is_online():
+            raise DatabaseUnavailable("Server database tidak terhubung")
+        if cls._backend is None:
+            if not cls.initialize_pool():
+                raise DatabaseUnavailable("Failed to initialize database connection pool")
+        return cls._backend
+    
+    @classmethod
+    def is_online(cls) -> bool:
+        """False selama jeda retry setelah error koneksi"""
+        return time.monotonic() >= cls._offline_until
+    
+    @classmethod
+    def mark_offline(cls):
+        """Tandai server offline, dicoba lagi setelah Settings.DB_RETRY_SECONDS"""
+        if cls.is_online():
+            logger.warning(f"⚠️ Server database tidak terhubung, coba lagi dalam {Settings.DB_RETRY_SECONDS} detik")
+        cls._offline_until = time.monotonic() + Settings.DB_RETRY_SECONDS
+    
+    @classmethod
+    def is_connection_error(cls, error) -> bool:
+        """True jika error karena server tidak terjangkau (bukan error query/data)"""
+        if isinstance(error, DatabaseUnavailable):
+            return True
+        return cls._backend is not None and cls._backend.is_connection_error(error)
+    
+    @classmethod
+    def is_retryable(cls, error) -> bool:
+        """True jika error sementara (lock wait, deadlock): query aman diulang nanti"""
+        return cls._backend is not None and cls._backend.is_retryable(error)
     
     @classmethod
     def get_connection(cls):
         """Get connection from pool"""
-        if cls._connection_pool is None:
-            if not cls.initialize_pool():
-                raise Exception("Failed to initialize database connection pool")
-        return cls._connection_pool.get_connection()
+        return cls.backend().get_connection()
+    
+    @classmethod
+    def is_duplicate_entry(cls, error) -> bool:
+        """True jika error karena pelanggaran unique index"""
+        return cls._backend is not None and cls._backend.is_duplicate(error)
     
     @classmethod
     def execute_query(cls, query, params=None, fetch=False):
@@ -69,14 +148,17 @@ class Database:
             list: Untuk fetch=True, return list of dict
             int: Untuk fetch=False, return lastrowid atau rowcount
         """
+        backend = cls.backend()
+        Error = backend.Error
+        
         conn = None
         cursor = None
         try:
-            conn = cls.get_connection()
-            cursor = conn.cursor(dictionary=True)
+            conn = backend.get_connection()
+            cursor = backend.cursor(conn)
             
             # Execute query
-            cursor.execute(query, params or ())
+            cursor.execute(backend.translate(query), params or ())
             
             if fetch:
                 # SELECT query
@@ -86,10 +168,12 @@ class Database:
                 # INSERT/UPDATE/DELETE query
                 conn.commit()
                 # Return lastrowid untuk INSERT, rowcount untuk UPDATE/DELETE
-                return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
+                return _write_result(query, cursor)
                 
         except Error as e:
-            if conn:
+            if backend.is_connection_error(e):
+                cls.mark_offline()
+            elif conn:
                 conn.rollback()
             logger.error(f"❌ Database error: {e}")
             logger.error(f"Query: {query}")
@@ -101,6 +185,88 @@ class Database:
             if conn:
                 conn.close()
     
+    @classmethod
+    def iter_query(cls, query, params=None, batch_size=500):
+        """
+        Stream hasil SELECT per batch (fetchmany), untuk data besar
+        
+        Koneksi dipegang sampai iterator habis atau ditutup, jadi
+        konsumsi iterator sampai selesai (atau panggil close()).
+        
+        Yields:
+            dict: Satu baris hasil query
+        """
+        backend = cls.backend()
+        Error = backend.Error
+        
+        conn = None
+        cursor = None
+        try:
+            conn = backend.get_connection()
+            cursor = backend.cursor(conn)
+            cursor.execute(backend.translate(query), params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except Error as e:
+            if backend.is_connection_error(e):
+                cls.mark_offline()
+            logger.error(f"❌ Database error: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Params: {params}")
+            raise
+        finally:
+            if cursor:
+                try:
+                    # Buang sisa hasil jika iterator ditutup sebelum habis
+                    cursor.fetchall()
+                except Error:
+                    pass
+                cursor.close()
+            if conn:
+                conn.close()
+    
+    @classmethod
+    @contextmanager
+    def transaction(cls):
+        """
+        Beberapa statement dalam satu transaksi database
+        
+        Commit di akhir blok, rollback jika ada exception:
+        
+            with Database.transaction() as tx:
+                id_transaksi = tx.execute("INSERT INTO transaksi ...", params)
+                tx.execute("INSERT INTO detail_transaksi ...", (id_transaksi, ...))
+        """
+        backend = cls.backend()
+        Error = backend.Error
+        
+        conn = None
+        cursor = None
+        try:
+            conn = backend.get_connection()
+            cursor = backend.cursor(conn)
+            yield Transaction(backend, cursor)
+            conn.commit()
+        except Error as e:
+            if backend.is_connection_error(e):
+                cls.mark_offline()
+            elif conn:
+                conn.rollback()
+            logger.error(f"❌ Database error (transaction): {e}")
+            raise
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
     @classmethod
     def test_connection(cls):
         """Test database connection"""
@@ -0,0 +1,351 @@
+"""
+Backend database untuk config.database.Database
+
+Settings.DB_BACKEND memilih implementasi:
+    mysql   - mysql.connector pooling (produksi, default)
+    sqlite  - file SQLite lokal (dev, benchmark, profiling tanpa server MySQL)
+
+Query di service tetap ditulis dalam dialek MySQL (%s, CURDATE(), MONTH(), ...);
+SQLiteDialect menerjemahkannya sekali per query (hasil di-cache), dan
+converter kolom mengembalikan tipe yang sama dengan mysql.connector
+(date, datetime, TIME sebagai timedelta, DECIMAL sebagai Decimal).
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from itertools import count
+from pathlib import Path
+import re
+import threading
+from config.settings import Settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# MySQL ER_DUP_ENTRY
+MYSQL_DUPLICATE_ENTRY = 1062
+
+# Client error server tidak terjangkau: socket, host, gone away, lost connection,
+# server lost (handshake)
+MYSQL_CONNECTION_ERRORS = {2002, 2003, 2006, 2013, 2055}
+
+# Lock wait timeout & deadlock: transaksi di-rollback server, aman dicoba ulang
+MYSQL_RETRYABLE_ERRORS = {1205, 1213}
+
+# Nomor database ':memory:' (id() objek bisa dipakai ulang setelah GC sehingga
+# backend baru membuka database lama yang anchor-nya belum ditutup)
+_memory_ids = count(1)
+
+SQLITE_SCHEMA = Settings.BASE_DIR / 'migrations' / 'sqlite' / 'schema.sql'
+
+
+class MySQLBackend:
+    """mysql.connector dengan connection pool (koneksi dibuka saat pool dibuat)"""
+
+    name = 'mysql'
+
+    def __init__(self):
+        self._pool = None
+
+    @property
+    def Error(self):
+        from mysql.connector import Error
+        return Error
+
+    def create_pool(self) -> bool:
+        # mysql.connector di-import saat pool dibuat (di background startup)
+        from mysql.connector import Error, pooling
+
+        try:
+            self._pool = pooling.MySQLConnectionPool(
+                pool_name="makeup_pool",
+                pool_size=5,
+                pool_reset_session=True,
+                host=Settings.DB_HOST,
+                port=Settings.DB_PORT,
+                database=Settings.DB_NAME,
+                user=Settings.DB_USER,
+                password=Settings.DB_PASSWORD,
+                connection_timeout=Settings.DB_CONNECT_TIMEOUT,
+                autocommit=False
+            )
+            logger.info("✅ Database connection pool initialized successfully")
+            return True
+        except Error as e:
+            logger.error(f"❌ Error initializing database pool: {e}")
+            return False
+
+    def get_connection(self):
+        return self._pool.get_connection()
+
+    @staticmethod
+    def cursor(conn):
+        return conn.cursor(dictionary=True)
+
+    @staticmethod
+    def translate(query: str) -> str:
+        return query
+
+    @staticmethod
+    def is_duplicate(error) -> bool:
+        return getattr(error, 'errno', None) == MYSQL_DUPLICATE_ENTRY
+
+    @staticmethod
+    def is_connection_error(error) -> bool:
+        from mysql.connector import errors
+        return (getattr(error, 'errno', None) in MYSQL_CONNECTION_ERRORS
+                or isinstance(error, errors.PoolError))
+
+    @staticmethod
+    def is_retryable(error) -> bool:
+        return getattr(error, 'errno', None) in MYSQL_RETRYABLE_ERRORS
+
+
+class SQLiteDialect:
+    """Terjemahan query dialek MySQL ke SQLite"""
+
+    # String literal SQL ('...' dengan '' sebagai escape), tidak ikut diterjemahkan
+    _LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+    # Fungsi tanpa argumen
+    _CONSTANTS = (
+        (re.compile(r'\bCURDATE\(\s*\)', re.IGNORECASE), "DATE('now', 'localtime')"),
+        (re.compile(r'\bNOW\(\s*\)', re.IGNORECASE), "DATETIME('now', 'localtime')"),
+    )
+
+    # Fungsi dengan nama lain di SQLite (MIN/MAX dengan 2+ argumen = skalar)
+    _RENAMES = (
+        (re.compile(r'\bLEAST\(', re.IGNORECASE), 'MIN('),
+        (re.compile(r'\bGREATEST\(', re.IGNORECASE), 'MAX('),
+    )
+
+    # Fungsi satu argumen -> template (argumen di {0})
+    _FUNCTIONS = {
+        'MONTH': "CAST(STRFTIME('%m', {0}) AS INTEGER)",
+        'YEAR': "CAST(STRFTIME('%Y', {0}) AS INTEGER)",
+        'DAY': "CAST(STRFTIME('%d', {0}) AS INTEGER)",
+    }
+    _FUNCTION_CALL = re.compile(r'\b(MONTH|YEAR|DAY)\(', re.IGNORECASE)
+
+    # DATE(...) AS alias -> kolom bertipe date (PARSE_COLNAMES), sama seperti MySQL
+    _DATE_ALIAS = re.compile(r'\bDATE\(', re.IGNORECASE)
+    _ALIAS = re.compile(r'\s+AS\s+(\w+)', re.IGNORECASE)
+
+    # Pengganti string literal selama terjemahan (tanpa kurung, kutip, atau nama fungsi)
+    _MASK = '\x00{}\x00'
+    _MASKED = re.compile(r'\x00(\d+)\x00')
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def translate(cls, query: str) -> str:
+        # String literal disisihkan dulu: placeholder, fungsi, dan alias
+        # hanya diterjemahkan di luar literal, tapi fungsi yang argumennya
+        # berisi literal (MONTH(... '...' ...)) tetap utuh
+        literals = []
+
+        def mask(match):
+            literals.append(match.group())
+            return cls._MASK.format(len(literals) - 1)
+
+        query = cls._LITERAL.sub(mask, query)
+        query = cls._translate_code(query)
+        query = cls._rewrite_calls(query)
+        query = cls._type_date_aliases(query)
+        return cls._MASKED.sub(lambda match: literals[int(match.group(1))], query)
+
+    @classmethod
+    def _translate_code(cls, code: str) -> str:
+        code = code.replace('%s', '?')
+        for pattern, replacement in cls._CONSTANTS + cls._RENAMES:
+            code = pattern.sub(replacement, code)
+        return code
+
+    @classmethod
+    def _rewrite_calls(cls, query: str) -> str:
+        while True:
+            match = cls._FUNCTION_CALL.search(query)
+            if not match:
+                return query
+            end = cls._closing_paren(query, match.end())
+            argument = query[match.end():end]
+            template = cls._FUNCTIONS[match.group(1).upper()]
+            query = query[:match.start()] + template.format(argument) + query[end + 1:]
+
+    @classmethod
+    def _type_date_aliases(cls, query: str) -> str:
+        pos = 0
+        while True:
+            match = cls._DATE_ALIAS.search(query, pos)
+            if not match:
+                return query
+            end = cls._closing_paren(query, match.end())
+            alias = cls._ALIAS.match(query, end + 1)
+            if alias:
+                typed = f' AS "{alias.group(1)} [date]"'
+                query = query[:alias.start()] + typed + query[alias.end():]
+            pos = end + 1
+
+    @staticmethod
+    def _closing_paren(query: str, start: int) -> int:
+        """Index ')' penutup untuk '(' tepat sebelum start"""
+        depth = 1
+        for index in range(start, len(query)):
+            char = query[index]
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    return index
+        raise ValueError(f"Kurung tidak seimbang di query: {query}")
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def _to_date(value: bytes) -> date:
+    # Kolom DATE bisa berisi datetime (data dari MySQL DATETIME / seed)
+    return date.fromisoformat(value[:10].decode())
+
+
+def _to_datetime(value: bytes) -> datetime:
+    return datetime.fromisoformat(value.decode())
+
+
+def _to_timedelta(value: bytes) -> timedelta:
+    # mysql.connector mengembalikan kolom TIME sebagai timedelta
+    hours, minutes, seconds = value.decode().split(':')
+    return timedelta(hours=int(hours), minutes=int(minutes), seconds=float(seconds))
+
+
+def _from_timedelta(value: timedelta) -> str:
+    seconds = int(value.total_seconds())
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+_registered = False
+_register_lock = threading.Lock()
+
+
+def _register_types():
+    """Adapter/converter sqlite3 (global per proses, didaftarkan sekali)"""
+    global _registered
+    import sqlite3
+
+    with _register_lock:
+        if _registered:
+            return
+        sqlite3.register_adapter(date, date.isoformat)
+        sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+        sqlite3.register_adapter(time, time.isoformat)
+        sqlite3.register_adapter(timedelta, _from_timedelta)
+        sqlite3.register_adapter(Decimal, str)
+        sqlite3.register_converter('DATE', _to_date)
+        sqlite3.register_converter('DATETIME', _to_datetime)
+        sqlite3.register_converter('TIMESTAMP', _to_datetime)
+        sqlite3.register_converter('TIME', _to_timedelta)
+        sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+        _registered = True
+
+
+class SQLiteBackend:
+    """
+    File SQLite lokal
+
+    Setiap get_connection() membuka koneksi baru (murah untuk file lokal)
+    yang ditutup pemanggil, sama seperti mengembalikan koneksi ke pool.
+    Path ':memory:' memakai shared cache dengan satu koneksi anchor agar
+    isi database bertahan selama proses berjalan.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path=None):
+        self.path = str(path or Settings.DB_SQLITE_PATH)
+        self._anchor = None
+        if self.path == ':memory:':
+            self._target, self._uri = f"file:makeup_{next(_memory_ids)}?mode=memory&cache=shared", True
+        else:
+            self._target, self._uri = self.path, False
+
+    @property
+    def Error(self):
+        import sqlite3
+        return sqlite3.Error
+
+    def create_pool(self) -> bool:
+        import sqlite3
+
+        _register_types()
+        try:
+            if not self._uri:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self.get_connection()
+            if self._uri:
+                self._anchor = conn
+            self.bootstrap(conn)
+            if not self._uri:
+                conn.close()
+            logger.info(f"✅ SQLite database ready: {self.path}")
+            return True
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"❌ Error initializing SQLite database: {e}")
+            return False
+
+    def get_connection(self):
+        import sqlite3
+
+        conn = sqlite3.connect(
+            self._target, uri=self._uri, timeout=30, check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+        )
+        conn.row_factory = _dict_row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    @staticmethod
+    def cursor(conn):
+        return conn.cursor()
+
+    @staticmethod
+    def translate(query: str) -> str:
+        return SQLiteDialect.translate(query)
+
+    @staticmethod
+    def is_duplicate(error) -> bool:
+        import sqlite3
+        return isinstance(error, sqlite3.IntegrityError) and 'UNIQUE' in str(error)
+
+    @staticmethod
+    def is_connection_error(error) -> bool:
+        # File lokal: hanya gagal dibuka (path/disk), bukan error query
+        import sqlite3
+        return isinstance(error, sqlite3.OperationalError) and 'unable to open' in str(error)
+
+    @staticmethod
+    def is_retryable(error) -> bool:
+        # Writer lain memegang lock lebih lama dari timeout koneksi
+        import sqlite3
+        return isinstance(error, sqlite3.OperationalError) and 'locked' in str(error)
+
+    @staticmethod
+    def bootstrap(conn):
+        """Buat tabel yang belum ada dari migrations/sqlite/schema.sql"""
+        with open(SQLITE_SCHEMA, encoding='utf-8') as f:
+            conn.executescript(f.read())
+        conn.commit()
+
+
+BACKENDS = {
+    MySQLBackend.name: MySQLBackend,
+    SQLiteBackend.name: SQLiteBackend,
+}
+
+
+def create_backend(name: str = None):
+    """Instance backend sesuai Settings.DB_BACKEND"""
+    name = (name or Settings.DB_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"DB_BACKEND tidak dikenal: {name} (pilihan: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,129 @@
+"""
+Konfigurasi logging aplikasi
+Dipanggil sekali dari entry point, bukan saat modul di-import
+
+Semua logger hanya menaruh record ke queue (QueueHandler), penulisan ke
+file/console dilakukan QueueListener di background thread. GUI thread
+tidak pernah menunggu disk I/O maupun rotasi/kompresi file log.
+"""
+from logging.handlers import (QueueHandler, QueueListener,
+                              RotatingFileHandler, TimedRotatingFileHandler)
+from config.settings import Settings
+import atexit
+import gzip
+import logging
+import os
+import queue
+import shutil
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None
+
+
+def setup_logging():
+    """
+    Setup root logger: logs/app.log (dengan rotasi) + console lewat queue
+
+    Returns:
+        QueueListener yang sedang berjalan (di-stop otomatis saat exit)
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    Settings.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = _create_file_handler(Settings.LOGS_DIR / 'app.log')
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(_parse_level(Settings.LOG_LEVEL, logging.INFO))
+
+    for name, level in parse_module_levels(Settings.LOG_MODULE_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, file_handler, console_handler,
+                              respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush sisa record di queue lalu hentikan writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def parse_module_levels(spec: str) -> dict:
+    """
+    Parse level per modul dari Settings.LOG_MODULE_LEVELS
+
+    Args:
+        spec: Format "modul=LEVEL,modul=LEVEL"
+
+    Returns:
+        dict: nama logger -> level (int)
+    """
+    levels = {}
+    for item in spec.split(','):
+        name, sep, level = item.partition('=')
+        if not sep or not name.strip():
+            continue
+        parsed = _parse_level(level, None)
+        if parsed is not None:
+            levels[name.strip()] = parsed
+    return levels
+
+
+def _parse_level(level: str, default):
+    value = logging.getLevelName(level.strip().upper())
+    return value if isinstance(value, int) else default
+
+
+def _create_file_handler(path):
+    """File handler dengan rotasi waktu/ukuran dan kompresi gzip"""
+    if Settings.LOG_ROTATE_WHEN:
+        handler = TimedRotatingFileHandler(
+            path,
+            when=Settings.LOG_ROTATE_WHEN,
+            backupCount=Settings.LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
+        )
+    else:
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=Settings.LOG_MAX_BYTES,
+            backupCount=Settings.LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
+        )
+
+    if Settings.LOG_COMPRESS:
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    return handler
+
+
+def _gzip_namer(name: str) -> str:
+    return name + '.gz'
+
+
+def _gzip_rotator(source: str, dest: str):
+    """Kompres file log lama (berjalan di thread listener)"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
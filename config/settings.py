@@ -3,6 +3,7 @@ Settings aplikasi dari environment variables
 """
 
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,25 +17,67 @@ class Settings:
     BASE_DIR = Path(__file__).resolve().parent.parent
     
     # Database Configuration
+    # Backend: "mysql" (default) atau "sqlite" (file lokal, tanpa server MySQL)
+    DB_BACKEND = os.getenv('DB_BACKEND', 'mysql').lower()
+    DB_SQLITE_PATH = os.getenv('DB_SQLITE_PATH', str(BASE_DIR / 'data' / 'makeup.sqlite3'))
     DB_HOST = os.getenv('DB_HOST', 'localhost')
     DB_PORT = int(os.getenv('DB_PORT', 3306))
     DB_NAME = os.getenv('DB_NAME', 'db_jasa_makeup')
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
+    # Timeout membuka koneksi (detik) & jeda sebelum mencoba lagi server yang offline
+    DB_CONNECT_TIMEOUT = int(os.getenv('DB_CONNECT_TIMEOUT', 5))
+    DB_RETRY_SECONDS = int(os.getenv('DB_RETRY_SECONDS', 15))
     
     # Security
     SECRET_KEY = os.getenv('SECRET_KEY', 'change-this-secret-key')
-    PASSWORD_SALT_ROUNDS = 12
+    # Cost bcrypt target, hasil kalibrasi: python calibrate_bcrypt.py
+    PASSWORD_SALT_ROUNDS = int(os.getenv('PASSWORD_SALT_ROUNDS', 12))
+    # Budget waktu satu verifikasi bcrypt saat login (ms)
+    LOGIN_HASH_BUDGET_MS = int(os.getenv('LOGIN_HASH_BUDGET_MS', 250))
     
     # Application
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     APP_NAME = "Aplikasi Jasa Makeup"
     APP_VERSION = "1.0.0"
     
+    # Logging
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG' if DEBUG else 'INFO').upper()
+    # Level per modul, contoh: "utils.rbac_helper=DEBUG,services=WARNING"
+    LOG_MODULE_LEVELS = os.getenv('LOG_MODULE_LEVELS', '')
+    # Rotasi: berdasarkan waktu jika LOG_ROTATE_WHEN diisi (contoh: "midnight"),
+    # selain itu berdasarkan ukuran file
+    LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', '')
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 5 * 1024 * 1024))
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 10))
+    LOG_COMPRESS = os.getenv('LOG_COMPRESS', 'True').lower() == 'true'
+    
+    # Change feed antar terminal (interval polling dalam ms)
+    CHANGE_POLL_INTERVAL_MS = int(os.getenv('CHANGE_POLL_INTERVAL_MS', 5000))
+    # Umur maksimum baris change_log (hari), dihapus saat startup. 0 = tidak dihapus
+    CHANGE_LOG_RETENTION_DAYS = int(os.getenv('CHANGE_LOG_RETENTION_DAYS', 30))
+    
+    # Journal write offline: transaksi & pembayaran disimpan ke file lokal dulu,
+    # dikirim ke server berurutan (cek ulang tiap SYNC_INTERVAL_SECONDS)
+    OFFLINE_JOURNAL_PATH = os.getenv('OFFLINE_JOURNAL_PATH', str(BASE_DIR / 'data' / 'offline_journal.sqlite3'))
+    SYNC_INTERVAL_SECONDS = int(os.getenv('SYNC_INTERVAL_SECONDS', 10))
+    # Umur maksimum cache user untuk login offline (hari sejak login online terakhir)
+    OFFLINE_USER_CACHE_DAYS = int(os.getenv('OFFLINE_USER_CACHE_DAYS', 7))
+    
+    # Printer thermal ESC/POS: device (contoh: /dev/usb/lp0) atau folder spool.
+    # Kosong = cetak struk thermal lewat PDF
+    ESCPOS_PRINTER = os.getenv('ESCPOS_PRINTER', '')
+    ESCPOS_PAPER_MM = int(os.getenv('ESCPOS_PAPER_MM', 80))
+    
     # Paths
     REPORTS_DIR = BASE_DIR / 'reports'
     REPORTS_PDF_DIR = REPORTS_DIR / 'pdf'
     REPORTS_EXCEL_DIR = REPORTS_DIR / 'excel'
+    RECEIPT_ARCHIVE_DIR = REPORTS_DIR / 'archive'
+    # File sementara untuk viewer PDF saat cetak struk (arsip tetap di RECEIPT_ARCHIVE_DIR)
+    RECEIPT_PREVIEW_DIR = Path(tempfile.gettempdir()) / 'jasa_makeup_struk'
+    # Cache data referensi (pelanggan, layanan, kategori, MUA) per tabel
+    REFERENCE_CACHE_DIR = BASE_DIR / 'data' / 'reference_cache'
     LOGS_DIR = BASE_DIR / 'logs'
     ASSETS_DIR = BASE_DIR / 'assets'
     
@@ -44,6 +87,7 @@ class Settings:
         directories = [
             cls.REPORTS_PDF_DIR,
             cls.REPORTS_EXCEL_DIR,
+            cls.RECEIPT_ARCHIVE_DIR,
             cls.LOGS_DIR,
             cls.ASSETS_DIR / 'images'
         ]
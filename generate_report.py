@@ -0,0 +1,67 @@
+# ============================================
+# generate_report.py - Simpan di root folder
+# Tool laporan pendapatan & booking per periode
+# ============================================
+"""
+Script untuk membuat PDF laporan pendapatan & booking
+Jalankan dengan:
+    python generate_report.py --bulan 2025-10                        # satu bulan
+    python generate_report.py --from 2025-01-01 --to 2025-12-31      # periode custom
+    python generate_report.py --bulan 2025-10 --transaksi            # + daftar semua transaksi
+
+Data dibaca per batch dari database (Database.iter_query) dan tabel
+diisi per halaman, jadi laporan 12 bulan tetap ringan di memori.
+"""
+
+import argparse
+import calendar
+import time
+from datetime import date, datetime
+from config.settings import Settings
+from utils.report_generator import ReportGenerator
+
+
+def month_period(value: str):
+    """'YYYY-MM' -> (tanggal pertama, tanggal terakhir bulan itu)"""
+    start = datetime.strptime(value, '%Y-%m').date()
+    last_day = calendar.monthrange(start.year, start.month)[1]
+    return start, start.replace(day=last_day)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buat PDF laporan pendapatan & booking")
+    parser.add_argument('--bulan', type=month_period, metavar='YYYY-MM', help="Laporan satu bulan")
+    parser.add_argument('--from', dest='date_from', type=date.fromisoformat,
+                        help="Tanggal awal (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', type=date.fromisoformat,
+                        help="Tanggal akhir (YYYY-MM-DD, inklusif)")
+    parser.add_argument('--transaksi', action='store_true', help="Lampirkan daftar semua transaksi")
+    parser.add_argument('--output', metavar='FILE', help="Nama file PDF di folder reports/pdf")
+    args = parser.parse_args()
+
+    if args.bulan:
+        date_from, date_to = args.bulan
+    elif args.date_from and args.date_to:
+        date_from, date_to = args.date_from, args.date_to
+    else:
+        parser.error("Gunakan --bulan YYYY-MM atau --from dan --to")
+    if date_to < date_from:
+        parser.error("--to harus sama atau setelah --from")
+
+    print("📊 Membuat laporan...")
+    print(f"   Periode : {date_from} s/d {date_to}")
+    start = time.perf_counter()
+    try:
+        path = ReportGenerator.generate_period_report(date_from, date_to, args.output,
+                                                      include_transaksi=args.transaksi)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return
+    print(f"✅ Laporan selesai dalam {time.perf_counter() - start:.2f} detik: {path}")
+
+
+if __name__ == "__main__":
+    # Ensure directories exist
+    Settings.ensure_directories()
+
+    main()
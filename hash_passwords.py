@@ -1,85 +1,176 @@
 # ============================================
 # hash_passwords.py - Simpan di root folder
-# Jalankan sekali untuk hash semua password
+# Tool bulk hashing password user
 # ============================================
 """
-Script untuk hash password user di database
-Jalankan dengan: python hash_passwords.py
+Script untuk hash password user secara massal
+Jalankan dengan:
+    python hash_passwords.py                 # hash password plain text di tabel user
+    python hash_passwords.py --csv user.csv  # hash password dari CSV (username,password)
+    python hash_passwords.py --dry-run       # hitung & benchmark tanpa UPDATE
+
+Hashing dijalankan paralel di ProcessPoolExecutor (satu proses per CPU).
+Hasil ditulis dengan UPDATE batch (CASE ... WHEN) dalam satu
+Database.transaction(), jadi database tidak pernah berisi sebagian
+password lama & sebagian baru.
 """
 
-import bcrypt
-import mysql.connector
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config.database import Database
 from config.settings import Settings
+from utils.password_helper import PasswordHelper
+
+# Jumlah baris per fetch / per statement UPDATE
+BATCH_SIZE = 500
+
 
 def hash_password(password: str) -> str:
-    """Hash password menggunakan bcrypt"""
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
-
-def update_passwords():
-    """Update semua password di database dengan versi ter-hash"""
-    
-    # Data user dengan password plain text
-    users = [
-        (1, '12345'),       # admin
-        (2, 'mua123'),      # MUA Rani
-        (3, 'tia123'),      # MUA Tia
-        (4, 'kasir123'),    # Kasir Dita
-        (5, 'lina123'),     # Owner Lina
-    ]
-    
+    """Hash password menggunakan bcrypt (cost dari Settings.PASSWORD_SALT_ROUNDS)"""
+    return PasswordHelper.hash_password(password)
+
+
+def iter_database_users():
+    """
+    Stream user yang password-nya masih plain text (belum hash bcrypt)
+
+    Yields:
+        (id_user, password)
+    """
+    for row in Database.iter_query("SELECT id_user, password FROM user", batch_size=BATCH_SIZE):
+        password = row['password']
+        if password and PasswordHelper.get_rounds(password) is None:
+            yield row['id_user'], password
+
+
+def iter_csv_users(path):
+    """
+    Stream user dari file CSV dengan header username,password
+
+    Yields:
+        (username, password)
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            username = (row.get('username') or '').strip()
+            password = row.get('password') or ''
+            if username and password:
+                yield username, password
+
+
+def hash_all(users, workers):
+    """
+    Hash semua password secara paralel
+
+    Args:
+        users: Iterable of (key, password)
+        workers: Jumlah proses
+
+    Returns:
+        list of (key, hashed)
+    """
+    keys = []
+    passwords = []
+    for key, password in users:
+        keys.append(key)
+        passwords.append(password)
+
+    if not passwords:
+        return []
+
+    # Bagi rata ke semua proses, kirim per chunk agar overhead IPC kecil
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        hashes = list(executor.map(hash_password, passwords, chunksize=chunksize))
+    return list(zip(keys, hashes))
+
+
+def write_hashes(key_column, results):
+    """
+    Tulis semua hash dengan UPDATE batch dalam satu transaksi
+
+    Returns:
+        int: Jumlah baris yang ter-update
+    """
+    updated = 0
+    with Database.transaction() as tx:
+        for start in range(0, len(results), BATCH_SIZE):
+            batch = results[start:start + BATCH_SIZE]
+            cases = " ".join(["WHEN %s THEN %s"] * len(batch))
+            placeholders = ", ".join(["%s"] * len(batch))
+            query = (
+                f"UPDATE user SET password = CASE {key_column} {cases} END "
+                f"WHERE {key_column} IN ({placeholders})"
+            )
+            params = [value for pair in batch for value in pair]
+            params.extend(key for key, _ in batch)
+            updated += tx.execute(query, params)
+    return updated
+
+
+def update_passwords(csv_path=None, workers=None, dry_run=False):
+    """Hash password dari database/CSV lalu simpan ke tabel user"""
+    workers = workers or os.cpu_count() or 1
+
+    if not Database.initialize_pool():
+        print("❌ Error: gagal terhubung ke database")
+        return
+    Error = Database.backend().Error
+
     try:
-        # Connect ke database
-        conn = mysql.connector.connect(
-            host=Settings.DB_HOST,
-            port=Settings.DB_PORT,
-            database=Settings.DB_NAME,
-            user=Settings.DB_USER,
-            password=Settings.DB_PASSWORD
-        )
-        cursor = conn.cursor()
-        
+        if csv_path:
+            key_column = 'username'
+            users = iter_csv_users(csv_path)
+            source = csv_path
+        else:
+            key_column = 'id_user'
+            users = iter_database_users()
+            source = "tabel user (password plain text)"
+
         print("🔐 Memulai proses hashing password...")
+        print(f"   Sumber  : {source}")
+        print(f"   Cost    : {Settings.PASSWORD_SALT_ROUNDS}")
+        print(f"   Proses  : {workers}")
         print("-" * 50)
-        
-        for user_id, plain_password in users:
-            # Hash password
-            hashed = hash_password(plain_password)
-            
-            # Update di database
-            query = "UPDATE user SET password = %s WHERE id_user = %s"
-            cursor.execute(query, (hashed, user_id))
-            
-            # Get username untuk display
-            cursor.execute("SELECT username FROM user WHERE id_user = %s", (user_id,))
-            result = cursor.fetchone()
-            username = result[0] if result else "Unknown"
-            
-            print(f"✅ Updated: {username} (ID: {user_id})")
-        
-        # Commit changes
-        conn.commit()
-        print("-" * 50)
-        print("✅ Semua password berhasil di-hash!")
-        print()
-        print("📝 Credentials untuk login:")
-        print("   Admin    : sinta_admin / 12345")
-        print("   MUA      : rani_mua / mua123")
-        print("   Kasir    : dita_kasir / kasir123")
-        print("   Owner    : lina_owner / lina123")
-        
-    except mysql.connector.Error as e:
+
+        start = time.perf_counter()
+        results = hash_all(users, workers)
+        elapsed = time.perf_counter() - start
+
+        if not results:
+            print("✅ Tidak ada password yang perlu di-hash")
+            return
+
+        rate = len(results) / elapsed if elapsed > 0 else 0
+        print(f"✅ {len(results)} password di-hash dalam {elapsed:.2f} detik ({rate:.1f} hash/detik)")
+
+        if dry_run:
+            print("ℹ️ Dry run: database tidak diubah")
+            return
+
+        updated = write_hashes(key_column, results)
+        print(f"✅ {updated} user ter-update dalam satu transaksi")
+
+    except (Error, OSError) as e:
         print(f"❌ Error: {e}")
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk hashing password user")
+    parser.add_argument('--csv', dest='csv_path', help="File CSV dengan kolom username,password")
+    parser.add_argument('--workers', type=int, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--dry-run', action='store_true', help="Hash tanpa menyimpan ke database")
+    args = parser.parse_args()
+
+    update_passwords(args.csv_path, args.workers, args.dry_run)
+
 
 if __name__ == "__main__":
     # Ensure directories exist
     Settings.ensure_directories()
-    
+
     # Hash passwords
-    update_passwords()
\ No newline at end of file
+    main()
@@ -3,31 +3,46 @@ Aplikasi Jasa Makeup
 Entry point utama
 """
 import sys
+import time
+
+# Catat waktu mulai sebelum import berat (untuk timeline cold-start)
+T0 = time.perf_counter()
+
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from config.settings import Settings
-from config.database import Database
+from config.logging_setup import setup_logging
 from views.login_view import LoginView
+from utils.startup import StartupPipeline
+from utils.offline_store import OfflineStore
+from services.sync_service import SyncService
 import logging
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main function"""
-    # Ensure directories
-    Settings.ensure_directories()
-    logger.info("✅ Directories checked")
-    
-    # Test database connection
-    logger.info("🔌 Testing database connection...")
-    if not Database.test_connection():
+def on_startup_finished(app, login, success, message):
+    """Dipanggil di GUI thread setelah startup pipeline selesai"""
+    # Journal offline dikirim ke server di background (online maupun offline)
+    SyncService.start()
+
+    if not success and OfflineStore.default().has_cached_users():
+        # Terminal pernah login: tetap jalan, transaksi & pembayaran masuk journal lokal
+        logger.warning(f"⚠️ Startup dalam mode offline: {message}")
+        QMessageBox.warning(
+            login,
+            "Mode Offline",
+            "⚠️ Server database tidak terhubung.\n\n"
+            "Aplikasi berjalan dalam mode offline: login memakai data terakhir "
+            "di terminal ini, transaksi & pembayaran disimpan lokal dan dikirim "
+            "otomatis setelah koneksi kembali."
+        )
+        login.set_connecting(False)
+        return
+
+    if not success:
+        logger.error(f"❌ Startup gagal: {message}")
         QMessageBox.critical(
-            None,
+            login,
             "Database Error",
             "❌ Tidak dapat terhubung ke database!\n\n"
             "Pastikan:\n"
@@ -35,21 +50,38 @@ def main():
             "2. Database 'db_jasa_makeup' sudah dibuat\n"
             "3. File .env sudah dikonfigurasi dengan benar"
         )
+        app.quit()
         return
-    
+
     logger.info("✅ Database connection OK")
+    login.set_connecting(False)
+
+
+def main():
+    """Main function"""
+    # Setup logging
+    setup_logging()
     
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName(Settings.APP_NAME)
-    
-    # Show login
+
+    # Show login langsung, tombol login aktif setelah database siap
     login = LoginView()
+    login.set_connecting(True)
     login.show()
-    
+
+    # Directories, pool warm-up, connection check & preload di background
+    startup = StartupPipeline(T0)
+    startup.mark('login_shown')
+    startup.finished.connect(
+        lambda success, message: on_startup_finished(app, login, success, message)
+    )
+    startup.start()
+
     # Run
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,21 @@
+-- ============================================
+-- 001_change_log.sql
+-- Change feed antar terminal: setiap write path service mencatat
+-- (tabel, id baris, aksi) ke sini. View yang terbuka polling
+-- baris dengan id > watermark-nya lalu patch baris yang berubah saja.
+--
+-- Retensi: baris lebih tua dari CHANGE_LOG_RETENTION_DAYS (default 30
+-- hari) dihapus setiap aplikasi start (ChangeFeedService.prune), karena
+-- watermark view selalu diambil ulang saat view dibuka. Hapus manual:
+--   DELETE FROM change_log WHERE changed_at < NOW() - INTERVAL 30 DAY;
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS change_log (
+    id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    table_name VARCHAR(50) NOT NULL,
+    row_id INT NOT NULL,
+    action ENUM('upsert', 'delete') NOT NULL DEFAULT 'upsert',
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY idx_change_log_table (table_name, id)
+) ENGINE=InnoDB;
@@ -0,0 +1,28 @@
+-- ============================================
+-- 002_role_permission.sql
+-- Permission matrix RBAC (opsional). Jika tabel ini ada, isinya
+-- meng-override Permission.DEFAULTS per operasi; operasi yang tidak
+-- tercantum tetap memakai default. Dimuat sekali saat startup.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS role_permission (
+    operation VARCHAR(50) NOT NULL,
+    role VARCHAR(30) NOT NULL,
+    PRIMARY KEY (operation, role)
+) ENGINE=InnoDB;
+
+INSERT IGNORE INTO role_permission (operation, role) VALUES
+    ('menu_pelanggan', 'admin'), ('menu_pelanggan', 'kasir'), ('menu_pelanggan', 'owner'),
+    ('menu_layanan', 'admin'),
+    ('menu_jadwal', 'admin'), ('menu_jadwal', 'makeup_artist'), ('menu_jadwal', 'owner'),
+    ('menu_transaksi', 'admin'), ('menu_transaksi', 'kasir'), ('menu_transaksi', 'owner'),
+    ('menu_pembayaran', 'admin'), ('menu_pembayaran', 'kasir'), ('menu_pembayaran', 'owner'),
+    ('manage_pelanggan', 'admin'), ('manage_pelanggan', 'kasir'),
+    ('delete_pelanggan', 'admin'),
+    ('manage_layanan', 'admin'),
+    ('manage_kategori', 'admin'),
+    ('manage_jadwal', 'admin'), ('manage_jadwal', 'makeup_artist'),
+    ('delete_jadwal', 'admin'),
+    ('manage_transaksi', 'admin'), ('manage_transaksi', 'kasir'),
+    ('proses_pembayaran', 'admin'), ('proses_pembayaran', 'kasir'),
+    ('laporan_periode', 'admin'), ('laporan_periode', 'owner');
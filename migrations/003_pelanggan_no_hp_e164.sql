@@ -0,0 +1,33 @@
+-- ============================================
+-- 003_pelanggan_no_hp_e164.sql
+-- Key kanonik nomor HP pelanggan (E.164, contoh +6281234567890).
+-- 0812-xxx, 62812xxx dan +62 812 xxx menjadi satu key, sehingga cek
+-- duplikat & lookup nomor HP cukup satu point read di unique index.
+-- Kolom no_hp tetap menyimpan nomor sesuai input (untuk tampilan).
+-- ============================================
+
+ALTER TABLE pelanggan
+    ADD COLUMN no_hp_e164 VARCHAR(16) NULL AFTER no_hp;
+
+-- Backfill: buang spasi, dash, titik, kurung & tanda +
+UPDATE pelanggan
+SET no_hp_e164 = REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
+    no_hp, ' ', ''), '-', ''), '.', ''), '(', ''), ')', ''), '+', '');
+
+-- 08xxx -> +628xxx, 62xxx -> +62xxx, selain itu tidak valid (NULL)
+UPDATE pelanggan
+SET no_hp_e164 = CASE
+    WHEN no_hp_e164 NOT REGEXP '^[0-9]{10,13}$' THEN NULL
+    WHEN no_hp_e164 LIKE '08%' THEN CONCAT('+62', SUBSTRING(no_hp_e164, 2))
+    WHEN no_hp_e164 LIKE '62%' THEN CONCAT('+', no_hp_e164)
+    ELSE NULL
+END;
+
+-- Cek duplikat sebelum membuat unique index (harus kosong):
+--   SELECT no_hp_e164, GROUP_CONCAT(id_pelanggan) AS id_pelanggan, COUNT(*) AS jumlah
+--   FROM pelanggan WHERE no_hp_e164 IS NOT NULL
+--   GROUP BY no_hp_e164 HAVING COUNT(*) > 1;
+-- Gabungkan/ubah data pelanggan yang duplikat terlebih dahulu.
+
+ALTER TABLE pelanggan
+    ADD UNIQUE KEY uq_pelanggan_no_hp_e164 (no_hp_e164);
@@ -0,0 +1,15 @@
+-- ============================================
+-- 004_applied_write.sql
+-- Idempotency key write dari journal offline terminal kasir
+-- (services.sync_service). Key dicatat dalam transaksi yang sama
+-- dengan INSERT-nya, jadi replay ulang entry yang sudah masuk hanya
+-- membaca row_id di sini tanpa menggandakan transaksi/pembayaran.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS applied_write (
+    idempotency_key CHAR(32) NOT NULL,
+    operation VARCHAR(50) NOT NULL,
+    row_id INT NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (idempotency_key)
+) ENGINE=InnoDB;
@@ -0,0 +1,113 @@
+-- ============================================
+-- sqlite/schema.sql
+-- Skema lengkap untuk backend SQLite (DB_BACKEND=sqlite), setara
+-- dengan database MySQL + migrations 001-004. Dijalankan otomatis
+-- saat pool dibuat; CREATE ... IF NOT EXISTS sehingga aman diulang.
+--
+-- Nama tipe kolom menentukan converter di config.db_backends:
+-- DATE -> date, DATETIME/TIMESTAMP -> datetime, TIME -> timedelta,
+-- DECIMAL -> Decimal (sama dengan mysql.connector).
+-- ============================================
+
+PRAGMA journal_mode = WAL;
+
+CREATE TABLE IF NOT EXISTS user (
+    id_user INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama_user VARCHAR(100) NOT NULL,
+    username VARCHAR(50) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    role VARCHAR(30) NOT NULL
+        CHECK (role IN ('admin', 'makeup_artist', 'kasir', 'owner'))
+);
+
+CREATE TABLE IF NOT EXISTS pelanggan (
+    id_pelanggan INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama VARCHAR(100) NOT NULL,
+    no_hp VARCHAR(20) NOT NULL,
+    no_hp_e164 VARCHAR(16) NULL,
+    alamat TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_pelanggan_no_hp_e164 ON pelanggan (no_hp_e164);
+CREATE INDEX IF NOT EXISTS idx_pelanggan_nama ON pelanggan (nama);
+
+CREATE TABLE IF NOT EXISTS kategori_layanan (
+    id_kategori INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama_kategori VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS layanan (
+    id_layanan INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama_layanan VARCHAR(100) NOT NULL,
+    id_kategori INTEGER NOT NULL REFERENCES kategori_layanan (id_kategori),
+    harga DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    durasi VARCHAR(50),
+    deskripsi TEXT
+);
+
+CREATE TABLE IF NOT EXISTS jadwal (
+    id_jadwal INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_pelanggan INTEGER NOT NULL REFERENCES pelanggan (id_pelanggan),
+    id_user INTEGER NOT NULL REFERENCES user (id_user),
+    tanggal_booking DATE NOT NULL,
+    jam_mulai TIME NOT NULL,
+    jam_selesai TIME NOT NULL,
+    status VARCHAR(30) NOT NULL DEFAULT 'Menunggu'
+);
+CREATE INDEX IF NOT EXISTS idx_jadwal_tanggal ON jadwal (tanggal_booking, jam_mulai);
+CREATE INDEX IF NOT EXISTS idx_jadwal_user ON jadwal (id_user);
+
+CREATE TABLE IF NOT EXISTS transaksi (
+    id_transaksi INTEGER PRIMARY KEY AUTOINCREMENT,
+    tanggal_transaksi DATETIME NOT NULL,
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    id_user INTEGER NOT NULL REFERENCES user (id_user),
+    id_pelanggan INTEGER NOT NULL REFERENCES pelanggan (id_pelanggan),
+    id_jadwal INTEGER NULL REFERENCES jadwal (id_jadwal)
+);
+CREATE INDEX IF NOT EXISTS idx_transaksi_tanggal ON transaksi (tanggal_transaksi);
+CREATE INDEX IF NOT EXISTS idx_transaksi_pelanggan ON transaksi (id_pelanggan);
+
+CREATE TABLE IF NOT EXISTS detail_transaksi (
+    id_detail INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_transaksi INTEGER NOT NULL REFERENCES transaksi (id_transaksi) ON DELETE CASCADE,
+    id_layanan INTEGER NOT NULL REFERENCES layanan (id_layanan),
+    jumlah INTEGER NOT NULL DEFAULT 1,
+    subtotal DECIMAL(12, 2) NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_detail_transaksi ON detail_transaksi (id_transaksi);
+
+CREATE TABLE IF NOT EXISTS pembayaran (
+    id_pembayaran INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_transaksi INTEGER NOT NULL REFERENCES transaksi (id_transaksi),
+    jumlah_bayar DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    metode_bayar VARCHAR(50) NOT NULL,
+    tanggal_bayar DATETIME NOT NULL,
+    status VARCHAR(30) NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pembayaran_transaksi ON pembayaran (id_transaksi);
+CREATE INDEX IF NOT EXISTS idx_pembayaran_tanggal ON pembayaran (tanggal_bayar);
+
+-- 001_change_log.sql
+CREATE TABLE IF NOT EXISTS change_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(50) NOT NULL,
+    row_id INTEGER NOT NULL,
+    action VARCHAR(10) NOT NULL DEFAULT 'upsert' CHECK (action IN ('upsert', 'delete')),
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_change_log_table ON change_log (table_name, id);
+
+-- 002_role_permission.sql (kosong = Permission.DEFAULTS)
+CREATE TABLE IF NOT EXISTS role_permission (
+    operation VARCHAR(50) NOT NULL,
+    role VARCHAR(30) NOT NULL,
+    PRIMARY KEY (operation, role)
+);
+
+-- 004_applied_write.sql
+CREATE TABLE IF NOT EXISTS applied_write (
+    idempotency_key CHAR(32) NOT NULL PRIMARY KEY,
+    operation VARCHAR(50) NOT NULL,
+    row_id INTEGER NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,299 @@
+# ============================================
+# reprint_receipts.py - Simpan di root folder
+# Tool cetak ulang struk massal per periode
+# ============================================
+"""
+Script untuk cetak ulang semua struk dalam satu periode
+Jalankan dengan:
+    python reprint_receipts.py --from 2025-10-01 --to 2025-10-31
+    python reprint_receipts.py --from 2025-10-01 --to 2025-10-31 --merge struk_oktober.pdf
+    python reprint_receipts.py --from 2025-10-01 --to 2025-10-31 --format thermal_80 --unpaid
+    python reprint_receipts.py --from 2025-10-01 --to 2025-10-31 --dry-run   # benchmark render saja
+
+Transaksi, detail & pembayaran di-stream dari database (Database.iter_query,
+dua koneksi pool, merge berdasarkan id_transaksi), jadi memori tidak bergantung
+panjang periode. Mode satu file per struk di-render paralel di
+ProcessPoolExecutor; mode --merge menggambar semua struk ke satu canvas
+(seperti ReceiptTemplate.render_many, region statis tersimpan sekali).
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date, timedelta
+from config.database import Database
+from config.settings import Settings
+from utils.money import Money
+from utils.pdf_generator import PDFGenerator
+from utils.receipt_template import ReceiptTemplate
+
+# Jumlah baris per fetch
+BATCH_SIZE = 500
+
+# Jumlah struk per task di process pool
+CHUNK_SIZE = 50
+
+RECEIPT_QUERY = """
+    SELECT t.id_transaksi, t.tanggal_transaksi, t.total, p.nama AS nama_pelanggan,
+           pb.id_pembayaran, pb.jumlah_bayar, pb.metode_bayar, pb.tanggal_bayar, pb.status
+    FROM transaksi t
+    JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+    {join} JOIN pembayaran pb ON pb.id_transaksi = t.id_transaksi
+    WHERE t.tanggal_transaksi >= %s AND t.tanggal_transaksi < %s
+    ORDER BY t.id_transaksi, pb.id_pembayaran
+"""
+
+DETAIL_QUERY = """
+    SELECT dt.id_transaksi, dt.jumlah, dt.subtotal, l.nama_layanan, l.harga
+    FROM detail_transaksi dt
+    JOIN transaksi t ON dt.id_transaksi = t.id_transaksi
+    JOIN layanan l ON dt.id_layanan = l.id_layanan
+    WHERE t.tanggal_transaksi >= %s AND t.tanggal_transaksi < %s
+    ORDER BY dt.id_transaksi
+"""
+
+
+def iter_receipts(receipt_rows, detail_rows):
+    """
+    Gabungkan stream pembayaran & detail (keduanya urut id_transaksi)
+
+    Transaksi tanpa pembayaran (LEFT JOIN, --unpaid) dicetak sebagai
+    tagihan: jumlah bayar 0, status "Belum Lunas".
+
+    Yields:
+        (transaksi_data, detail_items, pembayaran_data)
+    """
+    details = iter(detail_rows)
+    pending = next(details, None)
+    current_id = None
+    items = []
+
+    for row in receipt_rows:
+        id_transaksi = row['id_transaksi']
+        if id_transaksi != current_id:
+            current_id = id_transaksi
+            items = []
+            # Lewati detail transaksi yang tidak punya baris pembayaran
+            while pending is not None and pending['id_transaksi'] < id_transaksi:
+                pending = next(details, None)
+            while pending is not None and pending['id_transaksi'] == id_transaksi:
+                items.append(pending)
+                pending = next(details, None)
+            Money.normalize(items, 'harga', 'subtotal')
+
+        transaksi_data = {
+            'id_transaksi': id_transaksi,
+            'tanggal_transaksi': row['tanggal_transaksi'],
+            'nama_pelanggan': row['nama_pelanggan'],
+            'total': Money.to_rupiah(row['total']),
+        }
+        if row['id_pembayaran'] is None:
+            pembayaran_data = {
+                'id_pembayaran': None,
+                'jumlah_bayar': 0,
+                'metode_bayar': '-',
+                'tanggal_bayar': None,
+                'status': 'Belum Lunas',
+            }
+        else:
+            pembayaran_data = {
+                'id_pembayaran': row['id_pembayaran'],
+                'jumlah_bayar': Money.to_rupiah(row['jumlah_bayar']),
+                'metode_bayar': row['metode_bayar'],
+                'tanggal_bayar': row['tanggal_bayar'],
+                'status': row['status'],
+            }
+        yield transaksi_data, items, pembayaran_data
+
+
+def iter_chunks(iterable, size):
+    """Potong stream menjadi list berukuran size"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def receipt_filename(transaksi_data, pembayaran_data) -> str:
+    """Nama file tetap per struk, cetak ulang menimpa file yang sama"""
+    id_pembayaran = pembayaran_data['id_pembayaran']
+    if id_pembayaran is None:
+        return f"tagihan_{transaksi_data['id_transaksi']}.pdf"
+    return f"struk_{transaksi_data['id_transaksi']}_{id_pembayaran}.pdf"
+
+
+def render_chunk(fmt, chunk, out_dir=None):
+    """
+    Render (dan simpan) satu chunk struk, dijalankan di worker process
+
+    Args:
+        fmt: Format ReceiptTemplate
+        chunk: List of (transaksi_data, detail_items, pembayaran_data)
+        out_dir: Folder output, None = hanya render (benchmark)
+
+    Returns:
+        (jumlah struk, total bytes)
+    """
+    template = ReceiptTemplate.get(fmt)
+    size = 0
+    for transaksi_data, detail_items, pembayaran_data in chunk:
+        pdf_bytes = template.render_bytes(transaksi_data, detail_items, pembayaran_data)
+        size += len(pdf_bytes)
+        if out_dir is not None:
+            PDFGenerator.save(pdf_bytes, receipt_filename(transaksi_data, pembayaran_data), out_dir)
+    return len(chunk), size
+
+
+class Progress:
+    """Laporan progress satu baris (struk, struk/detik)"""
+
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+        self.count = 0
+        self.size = 0
+        self.start = time.perf_counter()
+
+    def update(self, count, size=0):
+        self.count += count
+        self.size += size
+        self.stream.write(f"\r   {self.count} struk ({self.rate:.1f} struk/detik)")
+        self.stream.flush()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    @property
+    def rate(self) -> float:
+        elapsed = self.elapsed
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def finish(self):
+        self.stream.write("\n")
+
+
+def render_pool(receipts, fmt, workers, out_dir=None, progress=None):
+    """
+    Render struk di ProcessPoolExecutor, satu file per struk
+
+    Task dikirim per CHUNK_SIZE struk dan maksimal workers * 2 task
+    in-flight, jadi stream tidak dibaca habis ke memori.
+    """
+    progress = progress or Progress()
+    in_flight = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in iter_chunks(receipts, CHUNK_SIZE):
+            if len(in_flight) >= workers * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    progress.update(*future.result())
+            in_flight.add(executor.submit(render_chunk, fmt, chunk, out_dir))
+        for future in in_flight:
+            progress.update(*future.result())
+    progress.finish()
+    return progress
+
+
+def render_merged(receipts, fmt, path, progress=None):
+    """Render semua struk ke satu PDF (satu canvas, form XObject dipakai ulang)"""
+    progress = progress or Progress()
+    template = ReceiptTemplate.get(fmt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    c = template.new_canvas(str(path))
+    pending = 0
+    for transaksi_data, detail_items, pembayaran_data in receipts:
+        template.draw(c, transaksi_data, detail_items, pembayaran_data)
+        pending += 1
+        if pending == CHUNK_SIZE:
+            progress.update(pending)
+            pending = 0
+    c.save()
+    progress.update(pending, path.stat().st_size)
+    progress.finish()
+    return progress
+
+
+def reprint(date_from, date_to, fmt='a4', merge=None, out_dir=None, workers=None,
+            unpaid=False, dry_run=False):
+    """Cetak ulang semua struk transaksi dengan tanggal date_from s/d date_to"""
+    workers = workers or os.cpu_count() or 1
+    params = (date_from, date_to + timedelta(days=1))
+
+    if not Database.initialize_pool():
+        print("❌ Error: gagal terhubung ke database")
+        return
+    Error = Database.backend().Error
+
+    # Dua iterator (dua koneksi pool) dibaca bersamaan
+    receipt_rows = Database.iter_query(
+        RECEIPT_QUERY.format(join='LEFT' if unpaid else ''), params, BATCH_SIZE
+    )
+    detail_rows = Database.iter_query(DETAIL_QUERY, params, BATCH_SIZE)
+
+    try:
+        receipts = iter_receipts(receipt_rows, detail_rows)
+
+        print("🖨️ Memulai cetak ulang struk...")
+        print(f"   Periode : {date_from} s/d {date_to}")
+        print(f"   Format  : {fmt}")
+
+        if merge and not dry_run:
+            path = Settings.REPORTS_PDF_DIR / merge
+            print(f"   Output  : {path} (satu PDF)")
+            print("-" * 50)
+            progress = render_merged(receipts, fmt, path)
+        else:
+            out_dir = None if dry_run else (
+                out_dir or Settings.REPORTS_PDF_DIR / f"reprint_{date_from:%Y%m%d}_{date_to:%Y%m%d}"
+            )
+            print(f"   Output  : {out_dir or '(dry run, tidak disimpan)'}")
+            print(f"   Proses  : {workers}")
+            print("-" * 50)
+            progress = render_pool(receipts, fmt, workers, out_dir)
+
+        if not progress.count:
+            print("✅ Tidak ada struk pada periode ini")
+            return
+        print(f"✅ {progress.count} struk dalam {progress.elapsed:.2f} detik "
+              f"({progress.rate:.1f} struk/detik, {progress.size / 1024 / 1024:.1f} MB)")
+
+    except (Error, OSError) as e:
+        print(f"\n❌ Error: {e}")
+    finally:
+        # Koneksi dikembalikan walaupun stream belum habis dibaca
+        receipt_rows.close()
+        detail_rows.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cetak ulang struk massal per periode")
+    parser.add_argument('--from', dest='date_from', type=date.fromisoformat, required=True,
+                        help="Tanggal awal transaksi (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', type=date.fromisoformat, required=True,
+                        help="Tanggal akhir transaksi (YYYY-MM-DD, inklusif)")
+    parser.add_argument('--format', choices=ReceiptTemplate.FORMATS, default='a4')
+    parser.add_argument('--merge', metavar='FILE', help="Gabungkan semua struk ke satu PDF")
+    parser.add_argument('--workers', type=int, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--unpaid', action='store_true',
+                        help="Sertakan transaksi belum dibayar sebagai tagihan")
+    parser.add_argument('--dry-run', action='store_true', help="Render tanpa menyimpan (benchmark)")
+    args = parser.parse_args()
+
+    if args.date_to < args.date_from:
+        parser.error("--to harus sama atau setelah --from")
+
+    reprint(args.date_from, args.date_to, args.format, args.merge, workers=args.workers,
+            unpaid=args.unpaid, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    # Ensure directories exist
+    Settings.ensure_directories()
+
+    main()
@@ -1,38 +1,109 @@
 # ============================================
 """Authentication service"""
 from config.database import Database
+from utils.offline_store import OfflineStore
 from utils.password_helper import PasswordHelper
 from utils.session_manager import SessionManager, User
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
 class AuthService:
+    # Hash dummy untuk username yang tidak ada, dibuat sekali saat dibutuhkan
+    _dummy_hash: Optional[str] = None
+    
     @staticmethod
-    def login(username: str, password: str) -> Tuple[bool, str, Optional[User]]:
+    def find_user(username: str) -> Optional[Dict]:
+        """
+        Lookup user by username (tanpa verifikasi password)
+        Bisa dijalankan lebih awal (prefetch) selagi user mengetik password
+        
+        Server database offline: pakai data user yang tersimpan saat
+        login terakhir di terminal ini (login offline), selama belum lebih
+        tua dari Settings.OFFLINE_USER_CACHE_DAYS. User yang sudah tidak ada
+        di server dihapus dari cache agar tidak bisa login offline lagi.
+        """
         try:
             query = "SELECT * FROM user WHERE username = %s"
             result = Database.execute_query(query, (username,), fetch=True)
-            
-            if not result:
-                return False, "Username atau password salah", None
-            
-            user_data = result[0]
-            
-            if not PasswordHelper.verify_password(password, user_data['password']):
-                return False, "Username atau password salah", None
-            
-            user = User(
-                id_user=user_data['id_user'],
-                nama_user=user_data['nama_user'],
-                username=user_data['username'],
-                role=user_data['role']
-            )
-            
-            SessionManager.login(user)
-            logger.info(f"✅ User {username} logged in")
-            return True, "Login berhasil", user
+        except Exception as e:
+            if not Database.is_connection_error(e):
+                raise
+            logger.warning(f"⚠️ Server database tidak terhubung, login offline untuk {username}")
+            return OfflineStore.default().cached_user(username)
+        if not result:
+            OfflineStore.default().forget_user(username)
+            return None
+        return result[0]
+    
+    @staticmethod
+    def authenticate(user_data: Optional[Dict], password: str) -> Tuple[bool, str, Optional[User]]:
+        """
+        Verifikasi password terhadap hasil find_user dan buat session
+        
+        Bcrypt tetap dijalankan walaupun user tidak ditemukan agar waktu
+        respons sama (mencegah enumerasi username lewat timing).
+        """
+        if not user_data:
+            if AuthService._dummy_hash is None:
+                AuthService._dummy_hash = PasswordHelper.hash_password("dummy-password")
+            PasswordHelper.verify_password(password, AuthService._dummy_hash)
+            return False, "Username atau password salah", None
+        
+        if not PasswordHelper.verify_password(password, user_data['password']):
+            return False, "Username atau password salah", None
+        
+        # Cost hash beda dari target: rehash di background, login tidak menunggu
+        if PasswordHelper.needs_rehash(user_data['password']):
+            threading.Thread(
+                target=AuthService.rehash_password,
+                args=(user_data['id_user'], user_data['password'], password),
+                daemon=True
+            ).start()
+        
+        user = User(
+            id_user=user_data['id_user'],
+            nama_user=user_data['nama_user'],
+            username=user_data['username'],
+            role=user_data['role']
+        )
+        
+        # Data user disimpan lokal agar terminal bisa login saat server offline
+        OfflineStore.default().cache_user(user_data)
+        
+        SessionManager.login(user)
+        logger.info(f"✅ User {user.username} logged in")
+        return True, "Login berhasil", user
+    
+    @staticmethod
+    def rehash_password(id_user: int, old_hash: str, password: str) -> bool:
+        """
+        Simpan ulang hash password dengan cost Settings.PASSWORD_SALT_ROUNDS
+        
+        UPDATE hanya berlaku jika hash lama belum berubah, sehingga tidak
+        menimpa password yang diganti di terminal lain sementara itu.
+        """
+        try:
+            new_hash = PasswordHelper.hash_password(password)
+            query = "UPDATE user SET password = %s WHERE id_user = %s AND password = %s"
+            updated = Database.execute_query(query, (new_hash, id_user, old_hash))
+            if updated:
+                logger.info(
+                    f"🔐 Password user {id_user} di-rehash: cost "
+                    f"{PasswordHelper.get_rounds(old_hash)} → {PasswordHelper.get_rounds(new_hash)}"
+                )
+            return bool(updated)
+        except Exception as e:
+            logger.error(f"❌ Error rehash password user {id_user}: {e}")
+            return False
+    
+    @staticmethod
+    def login(username: str, password: str) -> Tuple[bool, str, Optional[User]]:
+        try:
+            user_data = AuthService.find_user(username)
+            return AuthService.authenticate(user_data, password)
             
         except Exception as e:
             logger.error(f"❌ Login error: {e}")
@@ -40,4 +111,4 @@ class AuthService:
     
     @staticmethod
     def logout():
-        SessionManager.logout()
\ No newline at end of file
+        SessionManager.logout()
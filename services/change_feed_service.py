@@ -0,0 +1,95 @@
+"""Change feed service (notifikasi perubahan antar terminal)"""
+from config.database import Database
+from config.constants import ChangeAction
+from config.settings import Settings
+from datetime import datetime, timedelta
+from typing import List, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ChangeFeedService:
+    # Batas baris per polling, sisanya diambil di polling berikutnya
+    BATCH_LIMIT = 500
+    
+    @staticmethod
+    def record(table_name: str, row_id: int, action: str = ChangeAction.UPSERT):
+        """
+        Catat perubahan satu baris ke change_log
+        
+        Kegagalan mencatat tidak boleh menggagalkan write utama,
+        terminal lain tetap bisa refresh manual.
+        Cache data referensi lokal untuk tabel ini ikut di-invalidate.
+        """
+        from services.reference_service import ReferenceService
+        ReferenceService.invalidate(table_name)
+        
+        try:
+            query = "INSERT INTO change_log (table_name, row_id, action) VALUES (%s, %s, %s)"
+            Database.execute_query(query, (table_name, row_id, action))
+        except Exception as e:
+            logger.warning(f"Gagal mencatat change_log {table_name}#{row_id}: {e}")
+    
+    @staticmethod
+    def prune(days: int = None) -> int:
+        """
+        Hapus change_log yang lebih tua dari days hari (dipanggil saat startup)
+        
+        Terminal hanya membaca perubahan setelah watermark saat view dibuka,
+        jadi baris lama tidak dibutuhkan lagi. Dihapus berdasarkan id (primary
+        key) agar DELETE tidak scan tabel per kolom waktu.
+        
+        Returns:
+            int: Jumlah baris yang dihapus
+        """
+        days = Settings.CHANGE_LOG_RETENTION_DAYS if days is None else days
+        if days <= 0:
+            return 0
+        try:
+            cutoff = datetime.now() - timedelta(days=days)
+            query = "SELECT MAX(id) as last_id FROM change_log WHERE changed_at < %s"
+            result = Database.execute_query(query, (cutoff,), fetch=True)
+            last_id = result[0]['last_id'] if result else None
+            if not last_id:
+                return 0
+            deleted = Database.execute_query("DELETE FROM change_log WHERE id <= %s", (last_id,))
+            logger.info(f"🧹 change_log: {deleted} baris lebih dari {days} hari dihapus")
+            return deleted
+        except Exception as e:
+            logger.error(f"Error prune change_log: {e}")
+            return 0
+    
+    def get_watermark(self) -> int:
+        """Get id perubahan terakhir saat ini"""
+        try:
+            query = "SELECT COALESCE(MAX(id), 0) as watermark FROM change_log"
+            result = Database.execute_query(query, fetch=True)
+            return int(result[0]['watermark'])
+        except Exception as e:
+            logger.error(f"Error get_watermark: {e}")
+            return 0
+    
+    def get_changes(self, watermark: int, tables: List[str]) -> List[Dict]:
+        """
+        Get perubahan setelah watermark untuk tabel tertentu
+        
+        Args:
+            watermark: id change_log terakhir yang sudah diproses
+            tables: Nama tabel yang ditampilkan view
+            
+        Returns:
+            list: [{id, table_name, row_id, action}] urut id ASC
+        """
+        try:
+            placeholders = ", ".join(["%s"] * len(tables))
+            query = f"""
+                SELECT id, table_name, row_id, action
+                FROM change_log
+                WHERE id > %s AND table_name IN ({placeholders})
+                ORDER BY id ASC
+                LIMIT {self.BATCH_LIMIT}
+            """
+            return Database.execute_query(query, (watermark, *tables), fetch=True)
+        except Exception as e:
+            logger.error(f"Error get_changes: {e}")
+            return []
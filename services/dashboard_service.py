@@ -1,5 +1,6 @@
 """Dashboard service"""
 from config.database import Database
+from utils.money import Money
 from datetime import date
 import logging
 
@@ -30,7 +31,7 @@ class DashboardService:
                 WHERE DATE(tanggal_transaksi) = CURDATE()
             """
             result = Database.execute_query(query, fetch=True)
-            stats['pendapatan_hari_ini'] = result[0]['pendapatan']
+            stats['pendapatan_hari_ini'] = Money.to_rupiah(result[0]['pendapatan'])
             
             # Jadwal hari ini
             query = """
@@ -1,6 +1,8 @@
 """Jadwal service"""
 from config.database import Database
-from typing import List, Dict, Tuple
+from services.change_feed_service import ChangeFeedService
+from config.constants import ChangeAction
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,4 +20,106 @@ class JadwalService:
             return Database.execute_query(query, fetch=True)
         except Exception as e:
             logger.error(f"Error get_all: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_mua_all(self) -> List[Dict]:
+        try:
+            query = """
+                SELECT id_user, nama_user 
+                FROM user 
+                WHERE role = 'makeup_artist'
+                ORDER BY nama_user ASC
+            """
+            return Database.execute_query(query, fetch=True)
+        except Exception as e:
+            logger.error(f"Error get_mua_all: {e}")
+            return []
+    
+    def get_by_id(self, id_jadwal: int) -> Optional[Dict]:
+        try:
+            query = """
+                SELECT j.*, p.nama as nama_pelanggan, u.nama_user as nama_mua
+                FROM jadwal j
+                JOIN pelanggan p ON j.id_pelanggan = p.id_pelanggan
+                JOIN user u ON j.id_user = u.id_user
+                WHERE j.id_jadwal = %s
+            """
+            result = Database.execute_query(query, (id_jadwal,), fetch=True)
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_by_id: {e}")
+            return None
+    
+    def get_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"""
+                SELECT j.*, p.nama as nama_pelanggan, u.nama_user as nama_mua
+                FROM jadwal j
+                JOIN pelanggan p ON j.id_pelanggan = p.id_pelanggan
+                JOIN user u ON j.id_user = u.id_user
+                WHERE j.id_jadwal IN ({placeholders})
+            """
+            return Database.execute_query(query, tuple(ids), fetch=True)
+        except Exception as e:
+            logger.error(f"Error get_by_ids: {e}")
+            return None
+    
+    def create(self, id_pelanggan: int, id_user: int, tanggal_booking, jam_mulai: str,
+               jam_selesai: str, status: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = """
+                INSERT INTO jadwal (id_pelanggan, id_user, tanggal_booking, 
+                                   jam_mulai, jam_selesai, status) 
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            id_jadwal = Database.execute_query(query, (id_pelanggan, id_user, tanggal_booking,
+                                                       jam_mulai, jam_selesai, status))
+            ChangeFeedService.record('jadwal', id_jadwal)
+            logger.info(f"✅ Jadwal created: {id_jadwal}")
+            return True, "Jadwal berhasil dibuat", self.get_by_id(id_jadwal)
+        except Exception as e:
+            logger.error(f"❌ Error create: {e}")
+            return False, "Gagal membuat jadwal", None
+    
+    def update(self, id_jadwal: int, id_pelanggan: int, id_user: int, tanggal_booking,
+               jam_mulai: str, jam_selesai: str, status: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = """
+                UPDATE jadwal 
+                SET id_pelanggan=%s, id_user=%s, tanggal_booking=%s, 
+                    jam_mulai=%s, jam_selesai=%s, status=%s 
+                WHERE id_jadwal=%s
+            """
+            Database.execute_query(query, (id_pelanggan, id_user, tanggal_booking,
+                                          jam_mulai, jam_selesai, status, id_jadwal))
+            ChangeFeedService.record('jadwal', id_jadwal)
+            logger.info(f"✅ Jadwal updated: {id_jadwal}")
+            return True, "Jadwal berhasil diupdate", self.get_by_id(id_jadwal)
+        except Exception as e:
+            logger.error(f"❌ Error update: {e}")
+            return False, "Gagal mengupdate jadwal", None
+    
+    def delete(self, id_jadwal: int) -> Tuple[bool, str]:
+        try:
+            check = "SELECT COUNT(*) as count FROM transaksi WHERE id_jadwal = %s"
+            result = Database.execute_query(check, (id_jadwal,), fetch=True)
+            if result[0]['count'] > 0:
+                return False, "Jadwal sudah digunakan dalam transaksi, tidak dapat dihapus"
+            
+            query = "DELETE FROM jadwal WHERE id_jadwal = %s"
+            Database.execute_query(query, (id_jadwal,))
+            ChangeFeedService.record('jadwal', id_jadwal, ChangeAction.DELETE)
+            logger.info(f"✅ Jadwal deleted: {id_jadwal}")
+            return True, "Jadwal berhasil dihapus"
+        except Exception as e:
+            logger.error(f"❌ Error delete: {e}")
+            return False, "Gagal menghapus jadwal"
@@ -1,5 +1,8 @@
 """Layanan service"""
 from config.database import Database
+from services.change_feed_service import ChangeFeedService
+from config.constants import ChangeAction
+from utils.money import Money
 from typing import List, Dict, Tuple, Optional
 import logging
 
@@ -14,15 +17,162 @@ class LayananService:
                 JOIN kategori_layanan k ON l.id_kategori = k.id_kategori
                 ORDER BY l.nama_layanan ASC
             """
-            return Database.execute_query(query, fetch=True)
+            return Money.normalize(Database.execute_query(query, fetch=True), 'harga')
         except Exception as e:
             logger.error(f"Error get_all: {e}")
             return []
     
+    def get_by_id(self, id_layanan: int) -> Optional[Dict]:
+        try:
+            query = """
+                SELECT l.*, k.nama_kategori 
+                FROM layanan l
+                JOIN kategori_layanan k ON l.id_kategori = k.id_kategori
+                WHERE l.id_layanan = %s
+            """
+            result = Money.normalize(Database.execute_query(query, (id_layanan,), fetch=True), 'harga')
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_by_id: {e}")
+            return None
+    
+    def get_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"""
+                SELECT l.*, k.nama_kategori 
+                FROM layanan l
+                JOIN kategori_layanan k ON l.id_kategori = k.id_kategori
+                WHERE l.id_layanan IN ({placeholders})
+            """
+            return Money.normalize(Database.execute_query(query, tuple(ids), fetch=True), 'harga')
+        except Exception as e:
+            logger.error(f"Error get_by_ids: {e}")
+            return None
+    
+    def create(self, nama_layanan: str, id_kategori: int, harga, durasi: str,
+               deskripsi: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = """
+                INSERT INTO layanan (nama_layanan, id_kategori, harga, durasi, deskripsi) 
+                VALUES (%s, %s, %s, %s, %s)
+            """
+            id_layanan = Database.execute_query(query, (nama_layanan, id_kategori, harga, durasi, deskripsi))
+            ChangeFeedService.record('layanan', id_layanan)
+            logger.info(f"✅ Layanan created: {nama_layanan}")
+            return True, "Layanan berhasil ditambahkan", self.get_by_id(id_layanan)
+        except Exception as e:
+            logger.error(f"❌ Error create: {e}")
+            return False, "Gagal menambahkan layanan", None
+    
+    def update(self, id_layanan: int, nama_layanan: str, id_kategori: int, harga,
+               durasi: str, deskripsi: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = """
+                UPDATE layanan 
+                SET nama_layanan=%s, id_kategori=%s, harga=%s, durasi=%s, deskripsi=%s 
+                WHERE id_layanan=%s
+            """
+            Database.execute_query(query, (nama_layanan, id_kategori, harga, durasi, deskripsi, id_layanan))
+            ChangeFeedService.record('layanan', id_layanan)
+            logger.info(f"✅ Layanan updated: {id_layanan}")
+            return True, "Layanan berhasil diupdate", self.get_by_id(id_layanan)
+        except Exception as e:
+            logger.error(f"❌ Error update: {e}")
+            return False, "Gagal mengupdate layanan", None
+    
+    def delete(self, id_layanan: int) -> Tuple[bool, str]:
+        try:
+            check = "SELECT COUNT(*) as count FROM detail_transaksi WHERE id_layanan = %s"
+            result = Database.execute_query(check, (id_layanan,), fetch=True)
+            if result[0]['count'] > 0:
+                return False, "Layanan sudah digunakan dalam transaksi, tidak dapat dihapus"
+            
+            query = "DELETE FROM layanan WHERE id_layanan = %s"
+            Database.execute_query(query, (id_layanan,))
+            ChangeFeedService.record('layanan', id_layanan, ChangeAction.DELETE)
+            logger.info(f"✅ Layanan deleted: {id_layanan}")
+            return True, "Layanan berhasil dihapus"
+        except Exception as e:
+            logger.error(f"❌ Error delete: {e}")
+            return False, "Gagal menghapus layanan"
+    
     def get_kategori_all(self) -> List[Dict]:
         try:
             query = "SELECT * FROM kategori_layanan ORDER BY nama_kategori ASC"
             return Database.execute_query(query, fetch=True)
         except Exception as e:
             logger.error(f"Error get_kategori_all: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_kategori_by_id(self, id_kategori: int) -> Optional[Dict]:
+        try:
+            query = "SELECT * FROM kategori_layanan WHERE id_kategori = %s"
+            result = Database.execute_query(query, (id_kategori,), fetch=True)
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_kategori_by_id: {e}")
+            return None
+    
+    def get_kategori_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_kategori_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"SELECT * FROM kategori_layanan WHERE id_kategori IN ({placeholders})"
+            return Database.execute_query(query, tuple(ids), fetch=True)
+        except Exception as e:
+            logger.error(f"Error get_kategori_by_ids: {e}")
+            return None
+    
+    def create_kategori(self, nama_kategori: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = "INSERT INTO kategori_layanan (nama_kategori) VALUES (%s)"
+            id_kategori = Database.execute_query(query, (nama_kategori,))
+            ChangeFeedService.record('kategori_layanan', id_kategori)
+            logger.info(f"✅ Kategori created: {nama_kategori}")
+            return True, "Kategori berhasil ditambahkan", self.get_kategori_by_id(id_kategori)
+        except Exception as e:
+            logger.error(f"❌ Error create_kategori: {e}")
+            return False, "Gagal menambahkan kategori", None
+    
+    def update_kategori(self, id_kategori: int, nama_kategori: str) -> Tuple[bool, str, Optional[Dict]]:
+        try:
+            query = "UPDATE kategori_layanan SET nama_kategori=%s WHERE id_kategori=%s"
+            Database.execute_query(query, (nama_kategori, id_kategori))
+            ChangeFeedService.record('kategori_layanan', id_kategori)
+            logger.info(f"✅ Kategori updated: {id_kategori}")
+            return True, "Kategori berhasil diupdate", self.get_kategori_by_id(id_kategori)
+        except Exception as e:
+            logger.error(f"❌ Error update_kategori: {e}")
+            return False, "Gagal mengupdate kategori", None
+    
+    def delete_kategori(self, id_kategori: int) -> Tuple[bool, str]:
+        try:
+            check = "SELECT COUNT(*) as count FROM layanan WHERE id_kategori = %s"
+            result = Database.execute_query(check, (id_kategori,), fetch=True)
+            if result[0]['count'] > 0:
+                return False, "Kategori sudah digunakan dalam layanan, tidak dapat dihapus"
+            
+            query = "DELETE FROM kategori_layanan WHERE id_kategori = %s"
+            Database.execute_query(query, (id_kategori,))
+            ChangeFeedService.record('kategori_layanan', id_kategori, ChangeAction.DELETE)
+            logger.info(f"✅ Kategori deleted: {id_kategori}")
+            return True, "Kategori berhasil dihapus"
+        except Exception as e:
+            logger.error(f"❌ Error delete_kategori: {e}")
+            return False, "Gagal menghapus kategori"
@@ -1,8 +1,11 @@
 """Pelanggan service"""
 from config.database import Database
+from services.change_feed_service import ChangeFeedService
+from config.constants import ChangeAction, Permission
 from typing import List, Dict, Tuple, Optional
 import logging
 from utils.rbac_helper import RBACHelper
+from utils.validators import Validators
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,36 @@ class PelangganService:
             logger.error(f"Error get_by_id: {e}")
             return None
     
+    def get_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"SELECT * FROM pelanggan WHERE id_pelanggan IN ({placeholders})"
+            return Database.execute_query(query, tuple(ids), fetch=True)
+        except Exception as e:
+            logger.error(f"Error get_by_ids: {e}")
+            return None
+    
+    def get_by_phone(self, no_hp: str) -> Optional[Dict]:
+        """Cari pelanggan berdasarkan nomor HP (format apa pun) lewat index no_hp_e164"""
+        try:
+            no_hp_e164 = Validators.normalize_phone(no_hp)
+            if not no_hp_e164:
+                return None
+            query = "SELECT * FROM pelanggan WHERE no_hp_e164 = %s"
+            result = Database.execute_query(query, (no_hp_e164,), fetch=True)
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_by_phone: {e}")
+            return None
+    
     def search(self, keyword: str) -> List[Dict]:
         try:
             query = """
@@ -37,43 +70,54 @@ class PelangganService:
             logger.error(f"Error search: {e}")
             return []
     
-    def create(self, nama: str, no_hp: str, alamat: str) -> Tuple[bool, str]:
+    def create(self, nama: str, no_hp: str, alamat: str) -> Tuple[bool, str, Optional[Dict]]:
         try:
-            if not RBACHelper.check_permission(['admin', 'kasir'], 'create_pelanggan'):
-                return False, "Anda tidak memiliki izin untuk menambah pelanggan"
-            check = "SELECT COUNT(*) as count FROM pelanggan WHERE no_hp = %s"
-            result = Database.execute_query(check, (no_hp,), fetch=True)
-            if result[0]['count'] > 0:
-                return False, "Nomor HP sudah terdaftar"
+            if not RBACHelper.check_permission(Permission.MANAGE_PELANGGAN):
+                return False, "Anda tidak memiliki izin untuk menambah pelanggan", None
+            no_hp_e164 = Validators.normalize_phone(no_hp)
+            if not no_hp_e164:
+                return False, "Nomor HP tidak valid", None
+            check = "SELECT id_pelanggan FROM pelanggan WHERE no_hp_e164 = %s LIMIT 1"
+            if Database.execute_query(check, (no_hp_e164,), fetch=True):
+                return False, "Nomor HP sudah terdaftar", None
             
-            query = "INSERT INTO pelanggan (nama, no_hp, alamat) VALUES (%s, %s, %s)"
-            Database.execute_query(query, (nama, no_hp, alamat))
+            query = "INSERT INTO pelanggan (nama, no_hp, no_hp_e164, alamat) VALUES (%s, %s, %s, %s)"
+            id_pelanggan = Database.execute_query(query, (nama, no_hp, no_hp_e164, alamat))
+            ChangeFeedService.record('pelanggan', id_pelanggan)
             logger.info(f"✅ Pelanggan created: {nama}")
-            return True, "Pelanggan berhasil ditambahkan"
+            return True, "Pelanggan berhasil ditambahkan", self.get_by_id(id_pelanggan)
         except Exception as e:
+            if Database.is_duplicate_entry(e):  # unique index no_hp_e164
+                return False, "Nomor HP sudah terdaftar", None
             logger.error(f"❌ Error create: {e}")
-            return False, "Gagal menambahkan pelanggan"
+            return False, "Gagal menambahkan pelanggan", None
     
-    def update(self, id_pelanggan: int, nama: str, no_hp: str, alamat: str) -> Tuple[bool, str]:
+    def update(self, id_pelanggan: int, nama: str, no_hp: str, alamat: str) -> Tuple[bool, str, Optional[Dict]]:
         try:
-            if not RBACHelper.check_permission(['admin', 'kasir'], 'update_pelanggan'):
-                return False, "Anda tidak memiliki izin untuk mengubah pelanggan"
-            check = "SELECT COUNT(*) as count FROM pelanggan WHERE no_hp = %s AND id_pelanggan != %s"
-            result = Database.execute_query(check, (no_hp, id_pelanggan), fetch=True)
-            if result[0]['count'] > 0:
-                return False, "Nomor HP sudah digunakan pelanggan lain"
+            if not RBACHelper.check_permission(Permission.MANAGE_PELANGGAN):
+                return False, "Anda tidak memiliki izin untuk mengubah pelanggan", None
+            no_hp_e164 = Validators.normalize_phone(no_hp)
+            if not no_hp_e164:
+                return False, "Nomor HP tidak valid", None
+            check = "SELECT id_pelanggan FROM pelanggan WHERE no_hp_e164 = %s LIMIT 1"
+            result = Database.execute_query(check, (no_hp_e164,), fetch=True)
+            if result and result[0]['id_pelanggan'] != id_pelanggan:
+                return False, "Nomor HP sudah digunakan pelanggan lain", None
             
-            query = "UPDATE pelanggan SET nama=%s, no_hp=%s, alamat=%s WHERE id_pelanggan=%s"
-            Database.execute_query(query, (nama, no_hp, alamat, id_pelanggan))
+            query = "UPDATE pelanggan SET nama=%s, no_hp=%s, no_hp_e164=%s, alamat=%s WHERE id_pelanggan=%s"
+            Database.execute_query(query, (nama, no_hp, no_hp_e164, alamat, id_pelanggan))
+            ChangeFeedService.record('pelanggan', id_pelanggan)
             logger.info(f"✅ Pelanggan updated: {id_pelanggan}")
-            return True, "Pelanggan berhasil diupdate"
+            return True, "Pelanggan berhasil diupdate", self.get_by_id(id_pelanggan)
         except Exception as e:
+            if Database.is_duplicate_entry(e):  # unique index no_hp_e164
+                return False, "Nomor HP sudah digunakan pelanggan lain", None
             logger.error(f"❌ Error update: {e}")
-            return False, "Gagal mengupdate pelanggan"
+            return False, "Gagal mengupdate pelanggan", None
     
     def delete(self, id_pelanggan: int) -> Tuple[bool, str]:
         try:
-            if not RBACHelper.check_permission(['admin'], 'delete_pelanggan'):
+            if not RBACHelper.check_permission(Permission.DELETE_PELANGGAN):
                 return False, "Hanya Admin yang dapat menghapus pelanggan"
             check = "SELECT COUNT(*) as count FROM transaksi WHERE id_pelanggan = %s"
             result = Database.execute_query(check, (id_pelanggan,), fetch=True)
@@ -82,6 +126,7 @@ class PelangganService:
             
             query = "DELETE FROM pelanggan WHERE id_pelanggan = %s"
             Database.execute_query(query, (id_pelanggan,))
+            ChangeFeedService.record('pelanggan', id_pelanggan, ChangeAction.DELETE)
             logger.info(f"✅ Pelanggan deleted: {id_pelanggan}")
             return True, "Pelanggan berhasil dihapus"
         except Exception as e:
@@ -1,6 +1,8 @@
 """Pembayaran service"""
 from config.database import Database
-from typing import List, Dict
+from services.sync_service import SyncService, OFFLINE_MESSAGE
+from utils.money import Money
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,9 +15,91 @@ class PembayaranService:
                 FROM pembayaran pb
                 JOIN transaksi t ON pb.id_transaksi = t.id_transaksi
                 JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
-                ORDER BY pb.tanggal_bayar DESC
+                ORDER BY pb.tanggal_bayar DESC, pb.id_pembayaran DESC
             """
-            return Database.execute_query(query, fetch=True)
+            return Money.normalize(Database.execute_query(query, fetch=True), 'jumlah_bayar', 'total')
         except Exception as e:
             logger.error(f"Error get_all: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_by_id(self, id_pembayaran: int) -> Optional[Dict]:
+        try:
+            query = """
+                SELECT pb.*, t.total, p.nama as nama_pelanggan
+                FROM pembayaran pb
+                JOIN transaksi t ON pb.id_transaksi = t.id_transaksi
+                JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+                WHERE pb.id_pembayaran = %s
+            """
+            result = Money.normalize(
+                Database.execute_query(query, (id_pembayaran,), fetch=True), 'jumlah_bayar', 'total'
+            )
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_by_id: {e}")
+            return None
+    
+    def get_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"""
+                SELECT pb.*, t.total, p.nama as nama_pelanggan
+                FROM pembayaran pb
+                JOIN transaksi t ON pb.id_transaksi = t.id_transaksi
+                JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+                WHERE pb.id_pembayaran IN ({placeholders})
+            """
+            return Money.normalize(
+                Database.execute_query(query, tuple(ids), fetch=True), 'jumlah_bayar', 'total'
+            )
+        except Exception as e:
+            logger.error(f"Error get_by_ids: {e}")
+            return None
+    
+    def create(self, id_transaksi: int, jumlah_bayar, metode_bayar: str,
+               tanggal_bayar, status: str) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Simpan pembayaran (lewat journal SyncService)
+        
+        Returns:
+            (success, message, row pembayaran untuk di-upsert ke tabel history,
+             None jika server offline dan pembayaran menunggu di journal)
+        """
+        try:
+            payload = {
+                'id_transaksi': id_transaksi,
+                'jumlah_bayar': Money.to_rupiah(jumlah_bayar),
+                'metode_bayar': metode_bayar,
+                'tanggal_bayar': tanggal_bayar,
+                'status': status,
+            }
+            id_pembayaran = SyncService.submit('pembayaran.create', payload)
+            if id_pembayaran is None:
+                return True, OFFLINE_MESSAGE.format("Pembayaran"), None
+            
+            logger.info(f"✅ Pembayaran created: {id_pembayaran}")
+            return True, "Pembayaran berhasil diproses", self.get_by_id(id_pembayaran)
+        except Exception as e:
+            logger.error(f"❌ Error create: {e}")
+            return False, f"Gagal menyimpan pembayaran: {str(e)}", None
+    
+    @staticmethod
+    def apply_create(tx, payload: Dict) -> int:
+        """Insert pembayaran (dipanggil SyncService)"""
+        return tx.execute(
+            """
+                INSERT INTO pembayaran (id_transaksi, jumlah_bayar, metode_bayar, 
+                                       tanggal_bayar, status)
+                VALUES (%s, %s, %s, %s, %s)
+            """,
+            (payload['id_transaksi'], payload['jumlah_bayar'], payload['metode_bayar'],
+             payload['tanggal_bayar'], payload['status'])
+        )
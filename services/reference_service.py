@@ -0,0 +1,191 @@
+"""Reference data service (cache pelanggan, layanan, kategori, MUA)"""
+from config.constants import ChangeAction
+from config.database import Database
+from services.change_feed_service import ChangeFeedService
+from services.layanan_service import LayananService
+from services.jadwal_service import JadwalService
+from services.pelanggan_service import PelangganService
+from utils.pelanggan_index import PelangganIndex
+from utils.reference_cache import ReferenceCache
+from typing import List, Dict, Optional
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ReferenceService:
+    """
+    Cache in-memory + disk untuk data referensi yang jarang berubah
+    
+    Di-preload paralel saat startup, lalu dipakai combobox di view.
+    Key cache = nama tabel, sehingga ChangeFeedService.record() bisa
+    langsung meng-invalidate tabel yang ditulis.
+    
+    Isi tabel juga disimpan di disk (utils.reference_cache) bersama
+    version stamp server. Saat startup check_versions() mengambil stamp
+    semua tabel dengan satu query; tabel yang stamp-nya sama dibaca dari
+    disk tanpa download ulang. Server offline: isi disk terakhir dipakai.
+    """
+    
+    _cache: Dict[str, List[Dict]] = {}
+    _versions: Optional[Dict[str, str]] = None
+    _pelanggan_index: Optional[PelangganIndex] = None
+    _pelanggan_watermark = 0
+    _index_lock = threading.Lock()
+    _lock = threading.Lock()
+    
+    # Nama tabel -> loader
+    LOADERS = {
+        'layanan': lambda: LayananService().get_all(),
+        'kategori_layanan': lambda: LayananService().get_kategori_all(),
+        'user': lambda: JadwalService().get_mua_all(),
+        'pelanggan': lambda: PelangganService().get_all(),
+    }
+    
+    # Primary key tiap tabel (untuk version stamp)
+    PRIMARY_KEYS = {
+        'layanan': 'id_layanan',
+        'kategori_layanan': 'id_kategori',
+        'user': 'id_user',
+        'pelanggan': 'id_pelanggan',
+    }
+    
+    @classmethod
+    def check_versions(cls) -> Optional[Dict[str, str]]:
+        """
+        Ambil version stamp semua tabel referensi (satu query, dipanggil saat startup)
+        
+        Stamp = "<id change_log terakhir tabel>:<jumlah baris>:<id terbesar>".
+        change_log menangkap insert/update/delete lewat aplikasi; jumlah
+        baris & id terbesar menangkap perubahan di luar aplikasi (seed,
+        hash_passwords.py, import manual) yang tidak mencatat change_log.
+        
+        Returns:
+            dict: nama tabel -> stamp, None jika server tidak terjangkau
+        """
+        try:
+            selects = []
+            params = []
+            for table_name, primary_key in cls.PRIMARY_KEYS.items():
+                selects.append(f"""
+                    SELECT %s AS table_name,
+                           (SELECT COALESCE(MAX(id), 0) FROM change_log WHERE table_name = %s) AS version,
+                           COUNT(*) AS total, COALESCE(MAX({primary_key}), 0) AS max_id
+                    FROM `{table_name}`
+                """)
+                params += [table_name, table_name]
+            rows = Database.execute_query(" UNION ALL ".join(selects), tuple(params), fetch=True)
+            versions = {
+                row['table_name']: f"{row['version']}:{row['total']}:{row['max_id']}"
+                for row in rows
+            }
+        except Exception as e:
+            logger.error(f"Error check_versions: {e}")
+            return None
+        
+        with cls._lock:
+            cls._versions = versions
+        return versions
+    
+    @classmethod
+    def version(cls, table_name: str) -> Optional[str]:
+        """Stamp server tabel (dicek ulang jika belum ada atau sudah di-invalidate)"""
+        with cls._lock:
+            versions = cls._versions
+        if versions is None or table_name not in versions:
+            versions = cls.check_versions()
+        return versions.get(table_name) if versions else None
+    
+    @classmethod
+    def load(cls, table_name: str) -> List[Dict]:
+        """Get data referensi dari cache (memori, lalu disk), query database jika belum ada"""
+        with cls._lock:
+            if table_name in cls._cache:
+                return cls._cache[table_name]
+        
+        version = cls.version(table_name)
+        cache = ReferenceCache.default()
+        data = cache.read(table_name, version)
+        if data is None:
+            data = cls.LOADERS[table_name]()
+            # Stamp diambil sebelum load: perubahan di antaranya terdeteksi saat startup berikutnya
+            if data and version is not None:
+                cache.write(table_name, version, data)
+        else:
+            logger.debug(f"Data referensi {table_name} dari cache disk ({len(data)} baris)")
+        
+        # Service mengembalikan [] saat error, jangan di-cache
+        if data:
+            with cls._lock:
+                cls._cache[table_name] = data
+        return data
+    
+    @classmethod
+    def invalidate(cls, table_name: str = None):
+        """Hapus cache satu tabel (atau semua jika None), stamp server dicek ulang saat load"""
+        with cls._lock:
+            if table_name is None:
+                cls._cache.clear()
+                cls._versions = None
+            else:
+                cls._cache.pop(table_name, None)
+                if cls._versions is not None:
+                    cls._versions.pop(table_name, None)
+    
+    def get_layanan(self) -> List[Dict]:
+        return self.load('layanan')
+    
+    def get_kategori(self) -> List[Dict]:
+        return self.load('kategori_layanan')
+    
+    @classmethod
+    def pelanggan_index(cls) -> PelangganIndex:
+        """
+        Index prefix pelanggan untuk picker type-ahead (dibuat sekali per proses)
+        
+        Perubahan pelanggan setelahnya diterapkan per baris lewat
+        sync_pelanggan_index(), bukan dengan download ulang semua pelanggan.
+        """
+        with cls._index_lock:
+            if cls._pelanggan_index is None:
+                # Watermark sebelum load: perubahan selama load ikut di-sync
+                cls._pelanggan_watermark = ChangeFeedService().get_watermark()
+                cls._pelanggan_index = PelangganIndex(cls.load('pelanggan'))
+            return cls._pelanggan_index
+    
+    @classmethod
+    def sync_pelanggan_index(cls):
+        """
+        Patch index dengan perubahan pelanggan di change_log (terminal ini & lainnya)
+        
+        Dipanggil sekali per polling ChangeWatcher: satu query change_log +
+        satu query pelanggan (WHERE id IN ...) berapa pun jumlah perubahannya.
+        """
+        with cls._index_lock:
+            index = cls._pelanggan_index
+            if index is None:
+                return
+            changes = ChangeFeedService().get_changes(cls._pelanggan_watermark, ['pelanggan'])
+            if not changes:
+                return
+            
+            # Aksi terakhir per pelanggan, baris yang masih ada diambil dengan satu query
+            actions = {change['row_id']: change['action'] for change in changes}
+            ids = [row_id for row_id, action in actions.items() if action != ChangeAction.DELETE]
+            rows = PelangganService().get_by_ids(ids) if ids else []
+            if rows is None:
+                # Query gagal: watermark tetap, dicoba lagi di polling berikutnya
+                return
+            for row in rows:
+                index.upsert(row)
+            found = {row['id_pelanggan'] for row in rows}
+            for row_id in actions:
+                if row_id not in found:
+                    index.remove(row_id)
+            cls._pelanggan_watermark = changes[-1]['id']
+    
+    def get_mua(self) -> List[Dict]:
+        return self.load('user')
+    
+    def get_pelanggan(self) -> List[Dict]:
+        return self.load('pelanggan')
@@ -0,0 +1,197 @@
+"""Report service (data laporan periode)"""
+from config.database import Database
+from utils.money import Money
+from datetime import timedelta
+from typing import Dict, Iterator
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Baris per fetchmany untuk query laporan
+BATCH_SIZE = 1000
+
+# Bagian pembayaran pb yang menjadi pendapatan: maksimal sisa tagihan setelah
+# pembayaran sebelumnya (id lebih kecil) transaksi yang sama, jadi kembalian
+# pelunasan setelah DP tidak ikut terhitung
+DITERIMA = """
+    LEAST(pb.jumlah_bayar, GREATEST(t.total - COALESCE((
+        SELECT SUM(sebelum.jumlah_bayar) FROM pembayaran sebelum
+        WHERE sebelum.id_transaksi = pb.id_transaksi AND sebelum.id_pembayaran < pb.id_pembayaran
+    ), 0), 0))
+"""
+
+
+class ReportService:
+    """
+    Agregasi laporan pendapatan & booking untuk periode [date_from, date_to]
+
+    Method iter_* mengembalikan iterator yang membaca cursor per batch,
+    dipakai langsung oleh utils.report_generator tanpa menampung seluruh
+    hasil di memori.
+    """
+
+    @staticmethod
+    def _period(date_from, date_to):
+        # Batas atas eksklusif agar kolom DATETIME di hari terakhir ikut terhitung
+        return date_from, date_to + timedelta(days=1)
+
+    def get_summary(self, date_from, date_to) -> Dict:
+        try:
+            params = self._period(date_from, date_to)
+            query = """
+                SELECT COUNT(*) as jumlah_transaksi, COALESCE(SUM(total), 0) as pendapatan
+                FROM transaksi
+                WHERE tanggal_transaksi >= %s AND tanggal_transaksi < %s
+            """
+            transaksi = Database.execute_query(query, params, fetch=True)[0]
+
+            query = """
+                SELECT COUNT(*) as jumlah_booking FROM jadwal
+                WHERE tanggal_booking >= %s AND tanggal_booking < %s
+            """
+            jadwal = Database.execute_query(query, params, fetch=True)[0]
+
+            # Kembalian bukan pendapatan: pembayaran dihitung maksimal sebesar sisa tagihan
+            query = f"""
+                SELECT COUNT(*) as jumlah_pembayaran, COALESCE(SUM({DITERIMA}), 0) as diterima
+                FROM pembayaran pb
+                JOIN transaksi t ON pb.id_transaksi = t.id_transaksi
+                WHERE pb.tanggal_bayar >= %s AND pb.tanggal_bayar < %s
+            """
+            pembayaran = Database.execute_query(query, params, fetch=True)[0]
+
+            return {
+                'jumlah_transaksi': transaksi['jumlah_transaksi'],
+                'pendapatan': Money.to_rupiah(transaksi['pendapatan']),
+                'jumlah_booking': jadwal['jumlah_booking'],
+                'jumlah_pembayaran': pembayaran['jumlah_pembayaran'],
+                'diterima': Money.to_rupiah(pembayaran['diterima']),
+            }
+        except Exception as e:
+            logger.error(f"Error get_summary: {e}")
+            return {
+                'jumlah_transaksi': 0,
+                'pendapatan': 0,
+                'jumlah_booking': 0,
+                'jumlah_pembayaran': 0,
+                'diterima': 0,
+            }
+
+    def iter_per_hari(self, date_from, date_to) -> Iterator[Dict]:
+        """Per tanggal (semua hari di periode): transaksi, booking, pendapatan"""
+        params = self._period(date_from, date_to)
+        # Maksimal satu baris per hari, cukup kecil untuk dict
+        query = """
+            SELECT DATE(tanggal_transaksi) as tanggal, COUNT(*) as transaksi,
+                   SUM(total) as pendapatan
+            FROM transaksi
+            WHERE tanggal_transaksi >= %s AND tanggal_transaksi < %s
+            GROUP BY DATE(tanggal_transaksi)
+        """
+        transaksi = {row['tanggal']: row for row in Database.iter_query(query, params, BATCH_SIZE)}
+        query = """
+            SELECT DATE(tanggal_booking) as tanggal, COUNT(*) as booking
+            FROM jadwal
+            WHERE tanggal_booking >= %s AND tanggal_booking < %s
+            GROUP BY DATE(tanggal_booking)
+        """
+        booking = {row['tanggal']: row['booking'] for row in Database.iter_query(query, params, BATCH_SIZE)}
+
+        day = date_from
+        while day <= date_to:
+            row = transaksi.get(day)
+            yield {
+                'tanggal': day,
+                'transaksi': row['transaksi'] if row else 0,
+                'booking': booking.get(day, 0),
+                'pendapatan': Money.to_rupiah(row['pendapatan']) if row else 0,
+            }
+            day += timedelta(days=1)
+
+    def iter_per_layanan(self, date_from, date_to) -> Iterator[Dict]:
+        """Per layanan: jumlah terjual, transaksi, pendapatan (terbesar dulu)"""
+        query = """
+            SELECT l.nama_layanan, SUM(dt.jumlah) as qty,
+                   COUNT(DISTINCT dt.id_transaksi) as transaksi, SUM(dt.subtotal) as pendapatan
+            FROM detail_transaksi dt
+            JOIN transaksi t ON dt.id_transaksi = t.id_transaksi
+            JOIN layanan l ON dt.id_layanan = l.id_layanan
+            WHERE t.tanggal_transaksi >= %s AND t.tanggal_transaksi < %s
+            GROUP BY l.id_layanan, l.nama_layanan
+            ORDER BY pendapatan DESC
+        """
+        for row in Database.iter_query(query, self._period(date_from, date_to), BATCH_SIZE):
+            row['qty'] = int(row['qty'] or 0)
+            row['pendapatan'] = Money.to_rupiah(row['pendapatan'])
+            yield row
+
+    def iter_per_mua(self, date_from, date_to) -> Iterator[Dict]:
+        """
+        Per MUA: booking di periode, transaksi & pendapatan (lewat jadwal transaksi)
+        Transaksi tanpa jadwal dikelompokkan sebagai "Tanpa MUA"
+        """
+        params = self._period(date_from, date_to)
+        query = """
+            SELECT id_user, COUNT(*) as booking
+            FROM jadwal
+            WHERE tanggal_booking >= %s AND tanggal_booking < %s
+            GROUP BY id_user
+        """
+        booking = {row['id_user']: row['booking'] for row in Database.iter_query(query, params, BATCH_SIZE)}
+
+        query = """
+            SELECT u.id_user, u.nama_user as nama_mua, COUNT(t.id_transaksi) as transaksi,
+                   COALESCE(SUM(t.total), 0) as pendapatan
+            FROM transaksi t
+            LEFT JOIN jadwal j ON t.id_jadwal = j.id_jadwal
+            LEFT JOIN user u ON j.id_user = u.id_user
+            WHERE t.tanggal_transaksi >= %s AND t.tanggal_transaksi < %s
+            GROUP BY u.id_user, u.nama_user
+            ORDER BY pendapatan DESC
+        """
+        for row in Database.iter_query(query, params, BATCH_SIZE):
+            yield {
+                'nama_mua': row['nama_mua'] or "Tanpa MUA",
+                'booking': booking.pop(row['id_user'], 0),
+                'transaksi': row['transaksi'],
+                'pendapatan': Money.to_rupiah(row['pendapatan']),
+            }
+
+        # MUA yang punya booking tapi belum ada transaksi
+        if booking:
+            names = {row['id_user']: row['nama_user'] for row in Database.iter_query(
+                "SELECT id_user, nama_user FROM user WHERE id_user IN ({})".format(
+                    ", ".join(["%s"] * len(booking))), tuple(booking), BATCH_SIZE)}
+            for id_user, count in booking.items():
+                yield {'nama_mua': names.get(id_user, "-"), 'booking': count,
+                       'transaksi': 0, 'pendapatan': 0}
+
+    def iter_per_metode(self, date_from, date_to) -> Iterator[Dict]:
+        """Per metode pembayaran: jumlah pembayaran & total diterima (tanpa kembalian)"""
+        query = f"""
+            SELECT pb.metode_bayar, COUNT(*) as jumlah, SUM({DITERIMA}) as total
+            FROM pembayaran pb
+            JOIN transaksi t ON pb.id_transaksi = t.id_transaksi
+            WHERE pb.tanggal_bayar >= %s AND pb.tanggal_bayar < %s
+            GROUP BY pb.metode_bayar
+            ORDER BY total DESC
+        """
+        for row in Database.iter_query(query, self._period(date_from, date_to), BATCH_SIZE):
+            row['total'] = Money.to_rupiah(row['total'])
+            yield row
+
+    def iter_transaksi(self, date_from, date_to) -> Iterator[Dict]:
+        """Daftar transaksi periode (urut tanggal), untuk lampiran laporan"""
+        query = """
+            SELECT t.id_transaksi, t.tanggal_transaksi, p.nama as nama_pelanggan,
+                   u.nama_user as nama_mua, t.total
+            FROM transaksi t
+            JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+            LEFT JOIN jadwal j ON t.id_jadwal = j.id_jadwal
+            LEFT JOIN user u ON j.id_user = u.id_user
+            WHERE t.tanggal_transaksi >= %s AND t.tanggal_transaksi < %s
+            ORDER BY t.tanggal_transaksi, t.id_transaksi
+        """
+        for row in Database.iter_query(query, self._period(date_from, date_to), BATCH_SIZE):
+            row['total'] = Money.to_rupiah(row['total'])
+            yield row
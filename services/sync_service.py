@@ -0,0 +1,206 @@
+"""Sync service (write-ahead journal offline -> server database)"""
+from config.database import Database
+from config.settings import Settings
+from services.change_feed_service import ChangeFeedService
+from utils.offline_store import OfflineStore, APPLIED, FAILED
+from typing import Dict, List, Optional
+import json
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Pesan untuk user saat write menunggu di journal ({} = nama data)
+OFFLINE_MESSAGE = (
+    "{} disimpan di terminal ini karena server database tidak terhubung.\n\n"
+    "Data akan dikirim otomatis setelah koneksi kembali."
+)
+
+class SyncService:
+    """
+    Kirim write transaksi & pembayaran lewat journal lokal
+
+    submit() menulis operasi ke OfflineStore dulu, lalu mengirim semua
+    entry pending ke server berurutan (seq). Saat server tidak terjangkau
+    entry tetap di journal dan dikirim oleh thread start() begitu koneksi
+    kembali, jadi checkout kasir tidak ikut gagal saat jaringan putus.
+
+    Setiap entry diterapkan dalam satu transaksi database bersama
+    pencatatan idempotency_key di tabel applied_write, sehingga entry
+    yang sudah masuk tidak diterapkan dua kali saat replay ulang.
+    """
+
+    # Replay berurutan: satu pengirim dalam satu waktu
+    _lock = threading.Lock()
+    _thread = None
+    _stop = threading.Event()
+
+    @staticmethod
+    def _handlers():
+        # Import saat dipakai: service mengimpor SyncService
+        from services.pembayaran_service import PembayaranService
+        from services.transaksi_service import TransaksiService
+        return {
+            'transaksi.create': ('transaksi', TransaksiService.apply_create),
+            'pembayaran.create': ('pembayaran', PembayaranService.apply_create),
+        }
+
+    @classmethod
+    def submit(cls, operation: str, payload: Dict) -> Optional[int]:
+        """
+        Simpan operasi ke journal lalu kirim ke server
+
+        Returns:
+            int: id baris di server jika sudah diterapkan
+            None: server offline, entry menunggu di journal
+
+        Raises:
+            Exception: Ditolak server (contoh: foreign key), entry dibuang
+            dari journal dan error diteruskan ke pemanggil seperti biasa
+        """
+        store = OfflineStore.default()
+        entry = store.append(operation, payload)
+        if not Database.is_online():
+            logger.warning(f"📥 {operation} #{entry['seq']} disimpan di journal offline")
+            return None
+
+        row_ids = cls.replay(raise_for=entry['seq'])
+        if entry['seq'] in row_ids:
+            return row_ids[entry['seq']]
+        
+        # Thread background bisa lebih dulu mengirim entry ini (antara append & replay)
+        current = store.entry(entry['seq'])
+        if current and current['status'] == APPLIED:
+            return current['row_id']
+        if current and current['status'] == FAILED:
+            store.discard(entry['seq'])
+            raise Exception(current['last_error'])
+        return None
+
+    @classmethod
+    def replay(cls, raise_for: int = None) -> Dict[int, int]:
+        """
+        Kirim entry pending berurutan, berhenti di error koneksi pertama
+
+        Error sementara (lock wait, deadlock) diperlakukan seperti error
+        koneksi: entry tetap pending untuk replay berikutnya. Entry yang
+        ditolak server ditandai failed (tidak memblokir antrian, ditinjau
+        user lewat failed_entries()), kecuali entry raise_for: dibuang dan
+        error-nya di-raise.
+
+        Returns:
+            dict: seq -> id baris untuk entry yang berhasil diterapkan
+        """
+        store = OfflineStore.default()
+        applied = {}
+        with cls._lock:
+            for entry in store.pending():
+                try:
+                    applied[entry['seq']] = cls._apply(entry)
+                except Exception as e:
+                    if Database.is_connection_error(e):
+                        store.mark_attempt(entry['seq'], str(e))
+                        break
+                    if Database.is_retryable(e):
+                        # Lock wait / deadlock: tetap pending, urutan antrian dijaga
+                        logger.warning(f"⚠️ Journal {entry['operation']} #{entry['seq']} dicoba lagi nanti: {e}")
+                        store.mark_attempt(entry['seq'], str(e))
+                        break
+                    if entry['seq'] == raise_for:
+                        store.discard(entry['seq'])
+                        raise
+                    logger.error(f"❌ Journal {entry['operation']} #{entry['seq']} ditolak server: {e}")
+                    store.mark_failed(entry['seq'], str(e))
+
+        replayed = len(applied) - (raise_for in applied)
+        if replayed:
+            logger.info(f"✅ {replayed} entry journal offline terkirim ke server")
+        return applied
+
+    @classmethod
+    def _apply(cls, entry: Dict) -> int:
+        """Terapkan satu entry (idempotent), return id baris di server"""
+        table_name, handler = cls._handlers()[entry['operation']]
+        key = entry['idempotency_key']
+
+        with Database.transaction() as tx:
+            done = tx.fetch("SELECT row_id FROM applied_write WHERE idempotency_key = %s", (key,))
+            if done:
+                row_id = done[0]['row_id']
+            else:
+                row_id = handler(tx, entry['payload'])
+                tx.execute(
+                    "INSERT INTO applied_write (idempotency_key, operation, row_id) VALUES (%s, %s, %s)",
+                    (key, entry['operation'], row_id)
+                )
+
+        OfflineStore.default().mark_applied(entry['seq'], row_id)
+        if not done:
+            ChangeFeedService.record(table_name, row_id)
+        return row_id
+
+    @classmethod
+    def pending_count(cls) -> int:
+        try:
+            return OfflineStore.default().count_pending()
+        except Exception as e:
+            logger.error(f"Error pending_count: {e}")
+            return 0
+
+    @classmethod
+    def failed_count(cls) -> int:
+        try:
+            return OfflineStore.default().count_failed()
+        except Exception as e:
+            logger.error(f"Error failed_count: {e}")
+            return 0
+    
+    @classmethod
+    def failed_entries(cls) -> List[Dict]:
+        """Entry yang ditolak server saat replay background"""
+        try:
+            return OfflineStore.default().failed()
+        except Exception as e:
+            logger.error(f"Error failed_entries: {e}")
+            return []
+    
+    @classmethod
+    def retry_failed(cls, seqs: List[int]):
+        """Antrikan ulang entry failed (contoh: setelah data master diperbaiki)"""
+        store = OfflineStore.default()
+        for seq in seqs:
+            store.retry(seq)
+        logger.info(f"🔁 {len(seqs)} entry journal gagal diantrikan ulang")
+    
+    @staticmethod
+    def export_failed(entries: List[Dict], path) -> str:
+        """Simpan entry failed ke file JSON (untuk diinput manual / dilaporkan)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, default=str, ensure_ascii=False, indent=2)
+        return str(path)
+    
+    @classmethod
+    def start(cls):
+        """Thread background: replay journal tiap Settings.SYNC_INTERVAL_SECONDS"""
+        if cls._thread is not None:
+            return
+        cls._stop.clear()
+        cls._thread = threading.Thread(
+            target=cls._run, args=(Settings.SYNC_INTERVAL_SECONDS,), name="sync", daemon=True
+        )
+        cls._thread.start()
+
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
+        cls._thread = None
+
+    @classmethod
+    def _run(cls, interval: int):
+        while not cls._stop.wait(interval):
+            if not Database.is_online() or not cls.pending_count():
+                continue
+            try:
+                cls.replay()
+            except Exception as e:
+                logger.error(f"❌ Error replay journal offline: {e}")
@@ -1,6 +1,8 @@
 """Transaksi service"""
 from config.database import Database
-from typing import List, Dict
+from services.sync_service import SyncService, OFFLINE_MESSAGE
+from utils.money import Money
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,9 +14,98 @@ class TransaksiService:
                 SELECT t.*, p.nama as nama_pelanggan
                 FROM transaksi t
                 JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
-                ORDER BY t.tanggal_transaksi DESC
+                ORDER BY t.tanggal_transaksi DESC, t.id_transaksi DESC
             """
-            return Database.execute_query(query, fetch=True)
+            return Money.normalize(Database.execute_query(query, fetch=True), 'total')
         except Exception as e:
             logger.error(f"Error get_all: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_by_id(self, id_transaksi: int) -> Optional[Dict]:
+        try:
+            query = """
+                SELECT t.*, p.nama as nama_pelanggan
+                FROM transaksi t
+                JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+                WHERE t.id_transaksi = %s
+            """
+            result = Money.normalize(Database.execute_query(query, (id_transaksi,), fetch=True), 'total')
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error get_by_id: {e}")
+            return None
+    
+    def get_by_ids(self, ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Batch get_by_id untuk patch change feed (satu query per polling)
+        
+        Returns:
+            list: Baris yang masih ada, None jika query gagal
+        """
+        if not ids:
+            return []
+        try:
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"""
+                SELECT t.*, p.nama as nama_pelanggan
+                FROM transaksi t
+                JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
+                WHERE t.id_transaksi IN ({placeholders})
+            """
+            return Money.normalize(Database.execute_query(query, tuple(ids), fetch=True), 'total')
+        except Exception as e:
+            logger.error(f"Error get_by_ids: {e}")
+            return None
+    
+    def create(self, tanggal, total, id_user: int, id_pelanggan: int,
+               id_jadwal: Optional[int], detail_items: List[Dict]) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Simpan transaksi beserta detail layanan (lewat journal SyncService)
+        
+        Returns:
+            (success, message, row transaksi untuk di-upsert ke tabel history,
+             None jika server offline dan transaksi menunggu di journal)
+        """
+        try:
+            payload = {
+                'tanggal': tanggal,
+                'total': Money.to_rupiah(total),
+                'id_user': id_user,
+                'id_pelanggan': id_pelanggan,
+                'id_jadwal': id_jadwal,
+                'detail_items': [
+                    {'id_layanan': item['id_layanan'], 'jumlah': item['jumlah'],
+                     'subtotal': Money.to_rupiah(item['subtotal'])}
+                    for item in detail_items
+                ],
+            }
+            id_transaksi = SyncService.submit('transaksi.create', payload)
+            if id_transaksi is None:
+                return True, OFFLINE_MESSAGE.format("Transaksi"), None
+            
+            logger.info(f"✅ Transaksi created: {id_transaksi}")
+            return True, "Transaksi berhasil disimpan", self.get_by_id(id_transaksi)
+        except Exception as e:
+            logger.error(f"❌ Error create: {e}")
+            return False, f"Gagal menyimpan transaksi: {str(e)}", None
+    
+    @staticmethod
+    def apply_create(tx, payload: Dict) -> int:
+        """Insert transaksi & detail dalam satu transaksi database (dipanggil SyncService)"""
+        id_transaksi = tx.execute(
+            """
+                INSERT INTO transaksi (tanggal_transaksi, total, id_user, id_pelanggan, id_jadwal)
+                VALUES (%s, %s, %s, %s, %s)
+            """,
+            (payload['tanggal'], payload['total'], payload['id_user'],
+             payload['id_pelanggan'], payload['id_jadwal'])
+        )
+        for item in payload['detail_items']:
+            tx.execute(
+                """
+                    INSERT INTO detail_transaksi (id_transaksi, id_layanan, jumlah, subtotal)
+                    VALUES (%s, %s, %s, %s)
+                """,
+                (id_transaksi, item['id_layanan'], item['jumlah'], item['subtotal'])
+            )
+        return id_transaksi
@@ -0,0 +1,58 @@
+"""
+Helper test: Database diarahkan ke SQLite in-memory yang baru per test
+"""
+from datetime import datetime
+import unittest
+
+from config.database import Database
+from config.db_backends import SQLiteBackend
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """
+    Base test yang memakai backend SQLite in-memory (schema lengkap dari
+    migrations/sqlite/schema.sql) sebagai Database aktif
+    """
+
+    def setUp(self):
+        self.backend = SQLiteBackend(':memory:')
+        self.assertTrue(self.backend.create_pool())
+        saved = Database._backend, Database._offline_until
+        Database._backend, Database._offline_until = self.backend, 0.0
+        self.addCleanup(self._restore, saved)
+
+    def _restore(self, saved):
+        Database._backend, Database._offline_until = saved
+        self.backend._anchor.close()
+
+    def insert(self, query, params) -> int:
+        """INSERT fixture, return id baris baru"""
+        with Database.transaction() as tx:
+            return tx.execute(query, params)
+
+    def create_user(self, username='kasir', role='kasir') -> int:
+        return self.insert(
+            "INSERT INTO user (nama_user, username, password, role) VALUES (%s, %s, %s, %s)",
+            (username.title(), username, 'x', role)
+        )
+
+    def create_pelanggan(self, nama='Sari', no_hp='081234567890', no_hp_e164=None) -> int:
+        return self.insert(
+            "INSERT INTO pelanggan (nama, no_hp, no_hp_e164, alamat) VALUES (%s, %s, %s, %s)",
+            (nama, no_hp, no_hp_e164, None)
+        )
+
+    def create_transaksi(self, total, id_user, id_pelanggan, tanggal=None) -> int:
+        return self.insert(
+            "INSERT INTO transaksi (tanggal_transaksi, total, id_user, id_pelanggan) "
+            "VALUES (%s, %s, %s, %s)",
+            (tanggal or datetime(2025, 1, 10, 10, 0), total, id_user, id_pelanggan)
+        )
+
+    def create_pembayaran(self, id_transaksi, jumlah_bayar, metode_bayar='Cash',
+                          tanggal=None, status='Lunas') -> int:
+        return self.insert(
+            "INSERT INTO pembayaran (id_transaksi, jumlah_bayar, metode_bayar, tanggal_bayar, status) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            (id_transaksi, jumlah_bayar, metode_bayar, tanggal or datetime(2025, 1, 10, 10, 0), status)
+        )
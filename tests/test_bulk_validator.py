@@ -0,0 +1,140 @@
+"""
+Test validasi massal (utils.bulk_validator)
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+import unittest
+
+from utils.bulk_validator import BulkValidator, Rule, ValidationReport
+
+
+def check(rule, *columns):
+    """Index baris yang error untuk satu rule"""
+    return [i for i, _ in rule.check(*columns)]
+
+
+class RuleTest(unittest.TestCase):
+
+    def test_required(self):
+        rule = Rule.required('nama', 'Nama')
+        self.assertEqual(check(rule, ['Sari', '', '  ', None, 0]), [1, 2, 3])
+        self.assertEqual(rule.check([None])[0][1], "Nama wajib diisi")
+
+    def test_phone(self):
+        rule = Rule.phone('no_hp')
+        values = ['081234567890', '+62 812-3456-7890', '6281234567890', '(0812) 3456.7890',
+                  '0712345678', '08123', '0812345678901234', 81234567890, None, ['0812345678']]
+        self.assertEqual(check(rule, values), [4, 5, 6, 7, 8, 9])
+
+    def test_positive(self):
+        rule = Rule.positive('harga', 'Harga')
+        values = [1, Decimal('0.5'), 2.5, '150000', ' 10.5 ', 0, -1, '0', '-5',
+                  'abc', None, True, float('nan'), Decimal('NaN'), Decimal('sNaN')]
+        errors = dict(rule.check(values))
+        self.assertEqual(sorted(errors), list(range(5, 15)))
+        self.assertEqual(errors[5], "Harga harus lebih besar dari 0")
+        self.assertEqual(errors[9], "Harga harus berupa angka")
+        self.assertEqual(errors[12], "Harga harus berupa angka")
+        self.assertEqual(errors[13], "Harga harus berupa angka")
+
+    def test_date_range(self):
+        rule = Rule.date_range('tanggal', 'Tanggal', min_date=date(2025, 1, 1),
+                               max_date=date(2025, 12, 31))
+        values = [date(2025, 1, 1), datetime(2025, 6, 1, 10, 0), '2025-12-31', '2024-02-29',
+                  '2025-02-29', '2025-13-01', '01-02-2025', date(2024, 12, 31), '2026-01-01',
+                  None, 20250101]
+        errors = dict(rule.check(values))
+        self.assertEqual(sorted(errors), [3, 4, 5, 6, 7, 8, 9, 10])
+        self.assertEqual(errors[3], "Tanggal tidak boleh sebelum 2025-01-01")
+        self.assertEqual(errors[4], "Tanggal bukan tanggal yang valid (YYYY-MM-DD)")
+        self.assertEqual(errors[8], "Tanggal tidak boleh setelah 2025-12-31")
+
+    def test_date_range_leap_year(self):
+        rule = Rule.date_range('tanggal', 'Tanggal')
+        self.assertEqual(check(rule, ['2000-02-29', '1900-02-29', '2024-02-29', '2023-02-29']),
+                         [1, 3])
+
+    def test_time_range(self):
+        rule = Rule.time_range('jam_mulai', 'jam_selesai')
+        starts = ['09:00', time(9, 0), timedelta(hours=9), '9:00:30', '10:00', '25:00', '09:00', None]
+        ends = ['10:00', '09:30', timedelta(hours=9, minutes=1), '09:00:31', '09:00', '26:00', 'x', '10:00']
+        errors = dict(rule.check(starts, ends))
+        self.assertEqual(sorted(errors), [4, 5, 6, 7])
+        self.assertEqual(errors[4], "Jam selesai harus lebih besar dari jam mulai")
+        self.assertEqual(errors[5], "Jam bukan format waktu yang valid (HH:MM)")
+        self.assertEqual(rule.column, 'jam_selesai')
+
+    def test_unhashable_cells_invalid(self):
+        self.assertEqual(check(Rule.date_range('tanggal', 'Tanggal'),
+                               [['2025-01-01'], '2025-01-01', {'d': 1}]), [0, 2])
+        self.assertEqual(check(Rule.time_range('a', 'b'),
+                               [['09:00'], '09:00'], ['10:00', {'t': '10:00'}]), [0, 1])
+
+    def test_repeated_values_parsed_consistently(self):
+        rule = Rule.date_range('tanggal', 'Tanggal', min_date=date(2025, 1, 1))
+        values = ['2025-05-05', '2024-05-05'] * 100 + [Decimal('sNaN')]
+        self.assertEqual(check(rule, values), list(range(1, 200, 2)) + [200])
+
+
+class BulkValidatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = BulkValidator([
+            Rule.required('nama', 'Nama'),
+            Rule.phone('no_hp'),
+            Rule.positive('harga', 'Harga'),
+        ])
+
+    def test_rows_and_columns_same_report(self):
+        rows = [
+            {'nama': 'Sari', 'no_hp': '081234567890', 'harga': 100000},
+            {'nama': '', 'no_hp': '123', 'harga': 0},
+            {'nama': 'Dewi', 'no_hp': '081234567891', 'harga': 'abc'},
+        ]
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+        for data in (rows, columns):
+            report = self.validator.validate(data)
+            self.assertFalse(report.is_valid)
+            self.assertEqual(report.row_count, 3)
+            self.assertEqual(report.error_count, 4)
+            self.assertEqual(report.invalid_rows(), [1, 2])
+
+    def test_missing_column_reported_as_empty(self):
+        report = self.validator.validate([{'no_hp': '081234567890', 'harga': 1}])
+        self.assertEqual(report.matrix(), {0: {'nama': "Nama wajib diisi"}})
+
+    def test_valid(self):
+        report = self.validator.validate([{'nama': 'Sari', 'no_hp': '081234567890', 'harga': 1}])
+        self.assertTrue(report.is_valid)
+        self.assertEqual(report.summary(), "✅ 1 baris valid")
+
+
+class ValidationReportTest(unittest.TestCase):
+
+    def test_matrix_sorted_first_message_per_column(self):
+        report = ValidationReport(5, {
+            'harga': [(3, "harga salah"), (0, "harga kosong")],
+            'nama': [(3, "nama kosong"), (3, "nama duplikat")],
+            'jam_selesai': [],
+        })
+        self.assertEqual(report.matrix(), {
+            0: {'harga': "harga kosong"},
+            3: {'harga': "harga salah", 'nama': "nama kosong"},
+        })
+        self.assertEqual(list(report.matrix()), [0, 3])
+        self.assertEqual(report.error_count, 4)
+
+    def test_summary_limit(self):
+        report = ValidationReport(20, {'nama': [(i, "kosong") for i in range(12)]})
+        lines = report.summary(limit=10).splitlines()
+        self.assertEqual(lines[0], "❌ 12 dari 20 baris tidak valid:")
+        self.assertEqual(lines[1], "  Baris 1: kosong")
+        self.assertEqual(lines[-1], "  ... dan 2 baris lainnya")
+        self.assertEqual(len(lines), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
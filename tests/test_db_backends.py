@@ -0,0 +1,152 @@
+"""
+Test terjemahan dialek MySQL -> SQLite & converter tipe (config.db_backends)
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import unittest
+
+from config.database import Transaction
+from config.db_backends import (
+    SQLiteBackend, SQLiteDialect, _from_timedelta, _to_date, _to_datetime, _to_timedelta
+)
+
+
+class SQLiteDialectTest(unittest.TestCase):
+
+    def translate(self, query):
+        return SQLiteDialect.translate(query)
+
+    def test_placeholder(self):
+        self.assertEqual(self.translate("SELECT * FROM t WHERE a = %s AND b = %s"),
+                         "SELECT * FROM t WHERE a = ? AND b = ?")
+
+    def test_constants(self):
+        self.assertEqual(self.translate("SELECT CURDATE(), now( )"),
+                         "SELECT DATE('now', 'localtime'), DATETIME('now', 'localtime')")
+
+    def test_date_part_functions(self):
+        self.assertEqual(
+            self.translate("SELECT MONTH(tanggal), year(tanggal), DAY(tanggal) FROM t"),
+            "SELECT CAST(STRFTIME('%m', tanggal) AS INTEGER), "
+            "CAST(STRFTIME('%Y', tanggal) AS INTEGER), "
+            "CAST(STRFTIME('%d', tanggal) AS INTEGER) FROM t"
+        )
+
+    def test_nested_call(self):
+        self.assertEqual(
+            self.translate("SELECT MONTH(COALESCE(a, CURDATE())) FROM t"),
+            "SELECT CAST(STRFTIME('%m', COALESCE(a, DATE('now', 'localtime'))) AS INTEGER) FROM t"
+        )
+
+    def test_function_name_suffix_untouched(self):
+        self.assertEqual(self.translate("SELECT BIRTHDAY(x), TODAY(x) FROM t"),
+                         "SELECT BIRTHDAY(x), TODAY(x) FROM t")
+
+    def test_least_greatest(self):
+        self.assertEqual(self.translate("SELECT SUM(LEAST(a, b)), GREATEST(a, b) FROM t"),
+                         "SELECT SUM(MIN(a, b)), MAX(a, b) FROM t")
+
+    def test_date_alias_typed(self):
+        self.assertEqual(
+            self.translate("SELECT DATE(tanggal) as tanggal, COUNT(*) AS jumlah FROM t"),
+            'SELECT DATE(tanggal) AS "tanggal [date]", COUNT(*) AS jumlah FROM t'
+        )
+
+    def test_literal_untouched(self):
+        query = "SELECT 'MONTH(x) %s CURDATE() LEAST(a, b)' FROM t WHERE a = %s"
+        self.assertEqual(self.translate(query),
+                         "SELECT 'MONTH(x) %s CURDATE() LEAST(a, b)' FROM t WHERE a = ?")
+
+    def test_literal_date_alias_untouched(self):
+        self.assertEqual(self.translate("SELECT 'DATE(x) AS foo' AS label FROM t"),
+                         "SELECT 'DATE(x) AS foo' AS label FROM t")
+
+    def test_literal_with_paren_inside_call(self):
+        self.assertEqual(
+            self.translate("SELECT MONTH(COALESCE(d, '2024-01-01')) FROM t WHERE s = 'it''s ('"),
+            "SELECT CAST(STRFTIME('%m', COALESCE(d, '2024-01-01')) AS INTEGER) "
+            "FROM t WHERE s = 'it''s ('"
+        )
+
+    def test_unbalanced_paren(self):
+        with self.assertRaises(ValueError):
+            self.translate("SELECT MONTH(tanggal FROM t")
+
+
+class ConverterTest(unittest.TestCase):
+
+    def test_to_date(self):
+        self.assertEqual(_to_date(b'2025-10-16'), date(2025, 10, 16))
+
+    def test_to_date_from_datetime_text(self):
+        self.assertEqual(_to_date(b'2025-10-16 13:45:00'), date(2025, 10, 16))
+
+    def test_to_datetime(self):
+        self.assertEqual(_to_datetime(b'2025-10-16 13:45:07'), datetime(2025, 10, 16, 13, 45, 7))
+
+    def test_to_timedelta(self):
+        self.assertEqual(_to_timedelta(b'09:30:00'), timedelta(hours=9, minutes=30))
+        self.assertEqual(_to_timedelta(b'26:00:01.5'), timedelta(hours=26, seconds=1.5))
+
+    def test_from_timedelta(self):
+        self.assertEqual(_from_timedelta(timedelta(hours=9, minutes=5, seconds=3)), '09:05:03')
+        self.assertEqual(_from_timedelta(timedelta(hours=30)), '30:00:00')
+
+    def test_timedelta_round_trip(self):
+        value = timedelta(hours=17, minutes=59, seconds=59)
+        self.assertEqual(_to_timedelta(_from_timedelta(value).encode()), value)
+
+
+class SQLiteBackendTest(unittest.TestCase):
+    """Tipe kolom & hasil write lewat koneksi SQLite in-memory"""
+
+    def setUp(self):
+        self.backend = SQLiteBackend(':memory:')
+        self.assertTrue(self.backend.create_pool())
+        self.conn = self.backend.get_connection()
+        self.conn.execute(
+            "CREATE TABLE sample (id INTEGER PRIMARY KEY AUTOINCREMENT, tanggal DATE, "
+            "waktu DATETIME, jam TIME, nominal DECIMAL(15,2))"
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_column_types(self):
+        cursor = self.backend.cursor(self.conn)
+        tx = Transaction(self.backend, cursor)
+        tx.execute(
+            "INSERT INTO sample (tanggal, waktu, jam, nominal) VALUES (%s, %s, %s, %s)",
+            (date(2025, 1, 2), datetime(2025, 1, 2, 8, 30), timedelta(hours=9), Decimal('150000.50'))
+        )
+        row = tx.fetch("SELECT tanggal, waktu, jam, nominal FROM sample")[0]
+        self.assertEqual(row, {
+            'tanggal': date(2025, 1, 2),
+            'waktu': datetime(2025, 1, 2, 8, 30),
+            'jam': timedelta(hours=9),
+            'nominal': Decimal('150000.50'),
+        })
+
+    def test_date_alias_returns_date(self):
+        cursor = self.backend.cursor(self.conn)
+        tx = Transaction(self.backend, cursor)
+        tx.execute("INSERT INTO sample (waktu) VALUES (%s)", (datetime(2025, 3, 4, 10, 0),))
+        row = tx.fetch("SELECT DATE(waktu) AS tanggal FROM sample")[0]
+        self.assertEqual(row['tanggal'], date(2025, 3, 4))
+
+    def test_execute_returns_rowcount_after_insert(self):
+        cursor = self.backend.cursor(self.conn)
+        tx = Transaction(self.backend, cursor)
+        first = tx.execute("INSERT INTO sample (nominal) VALUES (%s)", (Decimal('1'),))
+        second = tx.execute("INSERT INTO sample (nominal) VALUES (%s)", (Decimal('2'),))
+        self.assertEqual((first, second), (1, 2))
+        # UPDATE di cursor yang sama: rowcount, bukan lastrowid INSERT sebelumnya
+        self.assertEqual(tx.execute("UPDATE sample SET nominal = %s", (Decimal('3'),)), 2)
+        self.assertEqual(tx.execute("DELETE FROM sample WHERE id = %s", (99,)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
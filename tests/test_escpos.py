@@ -0,0 +1,119 @@
+"""
+Test struk ESC/POS (utils.escpos) ke file & folder spool sementara
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+import tempfile
+import unittest
+
+from utils.escpos import (
+    ALIGN_CENTER, ALIGN_LEFT, BOLD_OFF, BOLD_ON, CODEPAGE_PC437, COLUMNS, CUT, INIT,
+    SIZE_DOUBLE, SIZE_NORMAL, EscPos, EscPosPrinter
+)
+
+COMMANDS = (INIT, CODEPAGE_PC437, ALIGN_CENTER, ALIGN_LEFT, BOLD_ON, BOLD_OFF,
+            SIZE_NORMAL, SIZE_DOUBLE, CUT)
+
+
+class EscPosTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        self.transaksi = {
+            'id_transaksi': 12,
+            'tanggal_transaksi': datetime(2025, 1, 10, 10, 0),
+            'nama_pelanggan': 'Siti Nurhaliza',
+            'total': Decimal('650000'),
+        }
+        self.details = [
+            {'nama_layanan': 'Makeup Wisuda', 'jumlah': 1,
+             'harga': Decimal('250000'), 'subtotal': Decimal('250000')},
+            {'nama_layanan': 'Makeup Pengantin Adat Jawa Lengkap dengan Sanggul dan Paes Ageng',
+             'jumlah': 1, 'harga': Decimal('400000'), 'subtotal': Decimal('400000')},
+        ]
+        self.pembayaran = {
+            'id_pembayaran': 7, 'jumlah_bayar': Decimal('700000'),
+            'metode_bayar': 'Cash', 'status': 'Lunas',
+        }
+
+    def render(self, paper_mm=80, **kwargs):
+        return EscPos.render(self.transaksi, self.details, self.pembayaran, paper_mm, **kwargs)
+
+    def lines(self, data):
+        """Baris teks struk tanpa byte perintah ESC/POS"""
+        for command in COMMANDS:
+            data = data.replace(command, b'')
+        return data.decode('cp437').split('\n')
+
+    def test_init_and_cut(self):
+        data = self.render()
+        self.assertTrue(data.startswith(INIT))
+        self.assertTrue(data.endswith(CUT))
+        self.assertFalse(self.render(cut=False).endswith(CUT))
+
+    def test_column_width(self):
+        for paper_mm, width in COLUMNS.items():
+            with self.subTest(paper_mm=paper_mm):
+                lines = self.lines(self.render(paper_mm))
+                self.assertIn('-' * width, lines)
+                total = next(line for line in lines if line.startswith('Total:'))
+                self.assertEqual(len(total), width)
+                self.assertTrue(total.endswith('650.000'))
+
+    def test_long_item_name_wrapped(self):
+        name = self.details[1]['nama_layanan']
+        for paper_mm, width in COLUMNS.items():
+            with self.subTest(paper_mm=paper_mm):
+                lines = self.lines(self.render(paper_mm))
+                start = next(i for i, line in enumerate(lines) if name.startswith(line) and line)
+                wrapped = []
+                while ' '.join(wrapped) != name:
+                    self.assertLessEqual(len(lines[start]), width)
+                    wrapped.append(lines[start])
+                    start += 1
+                self.assertGreater(len(wrapped), 1)
+                self.assertNotIn('...', ' '.join(wrapped))
+
+    def test_unsupported_paper(self):
+        with self.assertRaises(ValueError):
+            self.render(70)
+
+    def test_non_cp437_replaced(self):
+        self.transaksi['nama_pelanggan'] = 'Dewi 李'
+        self.assertIn(b'Pelanggan: Dewi ?\n', self.render())
+
+    def test_send_to_file_appends(self):
+        target = self.tmp / 'printer.bin'
+        printer = EscPosPrinter(target)
+        first, second = self.render(), self.render(58)
+        self.assertEqual(printer.send(first), str(target))
+        printer.send(second)
+        self.assertEqual(target.read_bytes(), first + second)
+
+    def test_send_to_spool_dir(self):
+        spool = self.tmp / 'spool'
+        spool.mkdir()
+        data = self.render()
+        path = Path(EscPosPrinter(spool).send(data, 'struk_12'))
+        self.assertEqual(path.parent, spool)
+        self.assertTrue(path.name.startswith('struk_12_') and path.suffix == '.bin')
+        self.assertEqual(path.read_bytes(), data)
+        self.assertEqual([p.name for p in spool.iterdir()], [path.name])
+
+    def test_print_struk_spool(self):
+        spool = self.tmp / 'spool'
+        spool.mkdir()
+        path = Path(EscPosPrinter.print_struk(self.transaksi, self.details, self.pembayaran,
+                                              target=spool, paper_mm=58))
+        self.assertIn('-' * COLUMNS[58], self.lines(path.read_bytes()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Test cache user login offline (utils.offline_store, services.auth_service)
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+import tempfile
+import unittest
+
+from config.settings import Settings
+from services.auth_service import AuthService
+from tests.support import DatabaseTestCase
+from utils.offline_store import OfflineStore
+
+
+class UserCacheTest(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = OfflineStore(Path(tmp.name) / 'journal.sqlite3')
+        saved = OfflineStore._default
+        OfflineStore._default = self.store
+        self.addCleanup(self._restore_store, saved)
+
+        self.user = {'id_user': 1, 'nama_user': 'Kasir', 'username': 'kasir',
+                     'password': 'hash', 'role': 'kasir'}
+
+    def _restore_store(self, saved):
+        OfflineStore._default = saved
+        if self.store._conn is not None:
+            self.store._conn.close()
+
+    def age_cache(self, username, days):
+        cached_at = datetime.now() - timedelta(days=days)
+        with self.store._conn:
+            self.store._conn.execute("UPDATE user_cache SET cached_at = ? WHERE username = ?",
+                                     (cached_at.isoformat(sep=' ', timespec='seconds'), username))
+
+    def test_fresh_cache_returned(self):
+        self.store.cache_user(self.user)
+        self.assertEqual(self.store.cached_user('kasir'), self.user)
+        self.assertTrue(self.store.has_cached_users())
+
+    def test_expired_cache_dropped(self):
+        self.store.cache_user(self.user)
+        self.age_cache('kasir', Settings.OFFLINE_USER_CACHE_DAYS + 1)
+        self.assertFalse(self.store.has_cached_users())
+        self.assertIsNone(self.store.cached_user('kasir'))
+
+        # Entry sudah dihapus, bukan hanya disembunyikan
+        self.age_cache('kasir', 0)
+        self.assertIsNone(self.store.cached_user('kasir'))
+
+    def test_ttl_from_settings(self):
+        self.store.cache_user(self.user)
+        self.age_cache('kasir', 2)
+        with mock.patch.object(Settings, 'OFFLINE_USER_CACHE_DAYS', 1):
+            self.assertIsNone(self.store.cached_user('kasir'))
+
+    def test_online_lookup_missing_user_drops_cache(self):
+        self.store.cache_user(self.user)
+        self.assertIsNone(AuthService.find_user('kasir'))
+        self.assertIsNone(self.store.cached_user('kasir'))
+        self.assertFalse(self.store.has_cached_users())
+
+    def test_online_lookup_existing_user_keeps_cache(self):
+        self.create_user('kasir')
+        self.store.cache_user(self.user)
+        self.assertEqual(AuthService.find_user('kasir')['username'], 'kasir')
+        self.assertEqual(self.store.cached_user('kasir'), self.user)
+
+
+if __name__ == '__main__':
+    unittest.main()
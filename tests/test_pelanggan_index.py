@@ -0,0 +1,99 @@
+"""
+Test index pencarian pelanggan (utils.pelanggan_index)
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+import unittest
+
+from utils.pelanggan_index import PelangganIndex, phone_digits
+from utils.validators import Validators
+
+
+def pelanggan(id_pelanggan, nama, no_hp):
+    return {'id_pelanggan': id_pelanggan, 'nama': nama, 'no_hp': no_hp,
+            'no_hp_e164': Validators.normalize_phone(no_hp)}
+
+
+class PelangganIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = PelangganIndex([
+            pelanggan(1, "Siti Rahmawati", "0812-3456-7890"),
+            pelanggan(2, "Dewi  Lestari", "+62 813 1111 2222"),
+            pelanggan(3, "Rahma Putri", "6285700001111"),
+            pelanggan(4, "Ayu", "12345"),  # nomor tidak valid, no_hp_e164 NULL
+        ])
+
+    def ids(self, text, limit=20):
+        return [row['id_pelanggan'] for row in self.index.search(text, limit)]
+
+    def test_name_prefix(self):
+        self.assertEqual(self.ids("siti"), [1])
+        self.assertEqual(self.ids("SITI  rah"), [1])
+        self.assertEqual(self.ids("dewi lestari"), [2])
+
+    def test_name_word_prefix(self):
+        # "rahma putri" (nama) dan "rahmawati" (kata ke-2 nama)
+        self.assertEqual(self.ids("rahma"), [3, 1])
+        self.assertEqual(self.ids("lest"), [2])
+        self.assertEqual(self.ids("putri"), [3])
+
+    def test_phone_formats(self):
+        for text in ("0812 3456", "+62812-3456", "628123456", "812345"):
+            with self.subTest(text=text):
+                self.assertEqual(self.ids(text), [1])
+        self.assertEqual(self.ids("0813"), [2])
+        self.assertEqual(self.ids("0857 0000"), [3])
+        self.assertEqual(phone_digits("0812-3456"), "628123456")
+
+    def test_raw_number_without_e164(self):
+        self.assertIsNone(self.index.get(4)['no_hp_e164'])
+        self.assertEqual(self.ids("1234"), [4])
+
+    def test_limit_and_empty(self):
+        self.assertEqual(len(self.ids("62", limit=2)), 2)
+        self.assertEqual(self.ids("   "), [])
+        self.assertEqual(self.ids("zzz"), [])
+
+    def test_upsert_name_change_removes_old_keys(self):
+        self.index.upsert(pelanggan(1, "Siti Aminah", "0812-3456-7890"))
+        self.assertEqual(self.ids("rahma"), [3])
+        self.assertEqual(self.ids("amin"), [1])
+        self.assertEqual(self.ids("siti"), [1])
+        self.assertEqual(len(self.index), 4)
+
+    def test_upsert_phone_change_removes_old_keys(self):
+        self.index.upsert(pelanggan(1, "Siti Rahmawati", "0899 0000 1234"))
+        self.assertEqual(self.ids("0812"), [])
+        self.assertEqual(self.ids("0899"), [1])
+        self.assertEqual(self.index.get(1)['no_hp'], "0899 0000 1234")
+
+    def test_upsert_new(self):
+        self.index.upsert(pelanggan(5, "Sinta", "081299998888"))
+        self.assertEqual(self.ids("si"), [5, 1])
+        self.assertEqual(len(self.index), 5)
+
+    def test_remove(self):
+        self.index.remove(2)
+        self.assertEqual(self.ids("dewi"), [])
+        self.assertEqual(self.ids("0813"), [])
+        self.assertIsNone(self.index.get(2))
+        self.index.remove(2)
+        self.assertEqual(len(self.index), 3)
+
+    def test_remove_duplicate_key_keeps_other_id(self):
+        self.index.upsert(pelanggan(6, "Siti Rahmawati", "081377776666"))
+        self.index.upsert(pelanggan(7, "Siti Rahmawati", "081355554444"))
+        self.assertEqual(self.ids("siti rahmawati"), [1, 6, 7])
+
+        self.index.remove(6)
+        self.assertEqual(self.ids("siti rahmawati"), [1, 7])
+        self.assertEqual(self.ids("rahmawati"), [1, 7])
+        self.index.remove(1)
+        self.assertEqual(self.ids("rahmawati"), [7])
+        self.assertEqual(self.index._keys, sorted(self.index._keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
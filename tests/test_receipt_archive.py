@@ -0,0 +1,109 @@
+"""
+Test arsip struk (utils.receipt_archive) di folder sementara
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import datetime
+from pathlib import Path
+import tempfile
+import unittest
+
+from utils.receipt_archive import INDEX_FILE, ReceiptArchive
+
+
+class ReceiptArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.archive = ReceiptArchive(self.root)
+
+        self.transaksi = {'id_transaksi': 12, 'tanggal_transaksi': datetime(2025, 10, 16, 9, 30),
+                          'nama_pelanggan': 'Sari', 'total': 650000}
+        self.details = [{'nama_layanan': 'Makeup Wisuda', 'jumlah': 1,
+                         'harga': 650000, 'subtotal': 650000}]
+        self.pembayaran = {'id_pembayaran': 7, 'jumlah_bayar': 700000, 'metode_bayar': 'Cash',
+                           'status': 'Lunas', 'tanggal_bayar': datetime(2025, 10, 16, 9, 45)}
+
+    def store(self, pdf_bytes=b'%PDF-1 struk', pembayaran=None, transaksi=None):
+        return self.archive.store(pdf_bytes, 'a4', transaksi or self.transaksi, self.details,
+                                  pembayaran or self.pembayaran)
+
+    def archived_files(self):
+        return sorted(path.relative_to(self.root).as_posix()
+                      for path in self.root.glob('*/*/*/*.pdf.gz'))
+
+    def test_store_and_read(self):
+        entry, created = self.store()
+        self.assertTrue(created)
+        self.assertTrue(entry['path'].startswith('2025/10/16/12_7_'))
+        self.assertEqual(self.archive.read(entry), b'%PDF-1 struk')
+
+    def test_identical_store_deduped(self):
+        first, _ = self.store()
+        # Bytes PDF berbeda (waktu cetak), isi struk sama
+        entry, created = self.store(b'%PDF-1 dicetak ulang')
+        self.assertFalse(created)
+        self.assertEqual(entry, first)
+        self.assertEqual(self.archived_files(), [first['path']])
+        self.assertEqual(len((self.root / INDEX_FILE).read_text().splitlines()), 1)
+
+    def test_payment_change_new_key(self):
+        first, _ = self.store()
+        changed = dict(self.pembayaran, metode_bayar='Transfer')
+        entry, created = self.store(pembayaran=changed)
+        self.assertTrue(created)
+        self.assertEqual((entry['id_transaksi'], entry['id_pembayaran']), (12, 7))
+        self.assertNotEqual(entry['hash'], first['hash'])
+        self.assertEqual(len(self.archived_files()), 2)
+
+    def test_find_in_archive_order(self):
+        first, _ = self.store()
+        second, _ = self.store(pembayaran=dict(self.pembayaran, id_pembayaran=8))
+        self.store(transaksi=dict(self.transaksi, id_transaksi=13))
+        third, _ = self.store(pembayaran=dict(self.pembayaran, status='DP'))
+
+        self.assertEqual(self.archive.find(12), [first, second, third])
+        # Index dimuat ulang dari file: urutan sama
+        self.assertEqual(ReceiptArchive(self.root).find(12), [first, second, third])
+        self.assertEqual(self.archive.find(99), [])
+
+    def test_truncated_last_index_line_skipped(self):
+        first, _ = self.store()
+        with open(self.root / INDEX_FILE, 'a', encoding='utf-8') as f:
+            f.write('{"id_transaksi": 12, "id_pemba')
+
+        archive = ReceiptArchive(self.root)
+        self.assertEqual(archive.load_index(), 1)
+        self.assertEqual(archive.find(12), [first])
+
+    def test_missing_file_stored_again(self):
+        entry, _ = self.store()
+        (self.root / entry['path']).unlink()
+        self.assertIsNone(self.archive.get('a4', self.transaksi, self.details, self.pembayaran))
+        again, created = self.store()
+        self.assertTrue(created)
+        self.assertEqual(self.archive.find(12), [again])
+
+    def test_rebuild_index_same_keys(self):
+        self.store()
+        self.store(pembayaran=dict(self.pembayaran, id_pembayaran=8))
+        self.store(transaksi=dict(self.transaksi, id_transaksi=13,
+                                  tanggal_transaksi=datetime(2025, 11, 1, 8, 0)))
+
+        def keys(archive):
+            archive.load_index()
+            return {key: entry['path'] for key, entry in archive._by_key.items()}
+
+        expected = keys(ReceiptArchive(self.root))
+        (self.root / INDEX_FILE).unlink()
+        archive = ReceiptArchive(self.root)
+        self.assertEqual(archive.rebuild_index(), 3)
+        self.assertEqual(keys(archive), expected)
+        self.assertEqual(keys(ReceiptArchive(self.root)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Test agregasi laporan (services.report_service) di backend SQLite
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import date, datetime
+from decimal import Decimal
+import unittest
+
+from services.report_service import ReportService
+from tests.support import DatabaseTestCase
+
+
+class ReportDiterimaTest(DatabaseTestCase):
+    """Pendapatan diterima = pembayaran tanpa kembalian"""
+
+    def setUp(self):
+        super().setUp()
+        self.id_user = self.create_user()
+        self.id_pelanggan = self.create_pelanggan()
+        self.report = ReportService()
+
+    def test_dp_then_pelunasan_with_change(self):
+        id_transaksi = self.create_transaksi(Decimal('1000000'), self.id_user, self.id_pelanggan)
+        self.create_pembayaran(id_transaksi, Decimal('500000'), 'Transfer',
+                               datetime(2025, 1, 10, 10, 0), 'DP')
+        self.create_pembayaran(id_transaksi, Decimal('600000'), 'Cash',
+                               datetime(2025, 1, 12, 15, 0), 'Lunas')
+
+        summary = self.report.get_summary(date(2025, 1, 1), date(2025, 1, 31))
+        self.assertEqual(summary['jumlah_pembayaran'], 2)
+        self.assertEqual(summary['diterima'], 1000000)
+
+        per_metode = {row['metode_bayar']: row['total']
+                      for row in self.report.iter_per_metode(date(2025, 1, 1), date(2025, 1, 31))}
+        self.assertEqual(per_metode, {'Transfer': 500000, 'Cash': 500000})
+
+    def test_pelunasan_in_period_counts_remaining_balance_only(self):
+        id_transaksi = self.create_transaksi(Decimal('1000000'), self.id_user, self.id_pelanggan)
+        self.create_pembayaran(id_transaksi, Decimal('500000'), 'Transfer',
+                               datetime(2025, 1, 30, 10, 0), 'DP')
+        self.create_pembayaran(id_transaksi, Decimal('600000'), 'Cash',
+                               datetime(2025, 2, 2, 15, 0), 'Lunas')
+
+        summary = self.report.get_summary(date(2025, 2, 1), date(2025, 2, 28))
+        self.assertEqual(summary['diterima'], 500000)
+
+    def test_overpayment_after_paid_off_is_zero(self):
+        id_transaksi = self.create_transaksi(Decimal('300000'), self.id_user, self.id_pelanggan)
+        self.create_pembayaran(id_transaksi, Decimal('350000'))
+        self.create_pembayaran(id_transaksi, Decimal('50000'))
+
+        summary = self.report.get_summary(date(2025, 1, 1), date(2025, 1, 31))
+        self.assertEqual(summary['diterima'], 300000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Test journal offline & replay (services.sync_service) di backend SQLite
+
+Jalankan dengan:
+    python -m unittest discover tests
+"""
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from config.database import Database
+from services.sync_service import SyncService
+from tests.support import DatabaseTestCase
+from utils.offline_store import OfflineStore, APPLIED, FAILED, PENDING
+
+
+class SyncServiceTest(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = OfflineStore(Path(tmp.name) / 'journal.sqlite3')
+        saved = OfflineStore._default
+        OfflineStore._default = self.store
+        self.addCleanup(self._restore_store, saved)
+
+        self.id_transaksi = self.create_transaksi(
+            Decimal('1000000'), self.create_user(), self.create_pelanggan()
+        )
+
+    def _restore_store(self, saved):
+        OfflineStore._default = saved
+        if self.store._conn is not None:
+            self.store._conn.close()
+
+    def payload(self, jumlah_bayar, id_transaksi=None):
+        return {
+            'id_transaksi': id_transaksi or self.id_transaksi,
+            'jumlah_bayar': jumlah_bayar,
+            'metode_bayar': 'Cash',
+            'tanggal_bayar': datetime(2025, 1, 10, 10, 0),
+            'status': 'Lunas',
+        }
+
+    def go_offline(self):
+        Database._offline_until = time.monotonic() + 60
+
+    def go_online(self):
+        Database._offline_until = 0.0
+
+    def pembayaran_rows(self):
+        return Database.execute_query(
+            "SELECT id_pembayaran, jumlah_bayar FROM pembayaran ORDER BY id_pembayaran", fetch=True
+        )
+
+    def test_submit_online_applies(self):
+        row_id = SyncService.submit('pembayaran.create', self.payload(Decimal('500000')))
+        self.assertEqual([row['id_pembayaran'] for row in self.pembayaran_rows()], [row_id])
+        self.assertEqual(self.store.count_pending(), 0)
+
+    def test_submit_offline_stays_pending(self):
+        self.go_offline()
+        self.assertIsNone(SyncService.submit('pembayaran.create', self.payload(Decimal('500000'))))
+        self.assertEqual(self.store.count_pending(), 1)
+        self.go_online()
+        self.assertEqual(self.pembayaran_rows(), [])
+
+    def test_replay_in_seq_order(self):
+        self.go_offline()
+        for jumlah in (100, 200, 300):
+            SyncService.submit('pembayaran.create', self.payload(Decimal(jumlah)))
+
+        self.go_online()
+        applied = SyncService.replay()
+        rows = self.pembayaran_rows()
+        self.assertEqual([row['jumlah_bayar'] for row in rows],
+                         [Decimal(100), Decimal(200), Decimal(300)])
+        self.assertEqual(list(applied.values()), [row['id_pembayaran'] for row in rows])
+        self.assertEqual(list(applied), sorted(applied))
+        self.assertEqual(self.store.count_pending(), 0)
+
+    def test_reapplied_idempotency_key_not_duplicated(self):
+        self.go_offline()
+        SyncService.submit('pembayaran.create', self.payload(Decimal('500000')))
+        seq = self.store.pending()[0]['seq']
+        self.go_online()
+        first = SyncService.replay()[seq]
+
+        # Crash setelah commit server tapi sebelum mark_applied: entry pending lagi
+        self.store._update(seq, "status = ?", (PENDING,))
+        self.assertEqual(SyncService.replay(), {seq: first})
+        self.assertEqual(len(self.pembayaran_rows()), 1)
+        self.assertEqual(self.store.entry(seq)['status'], APPLIED)
+
+    def test_submit_entry_applied_by_background_thread(self):
+        append = self.store.append
+
+        def append_then_background_replay(operation, payload):
+            entry = append(operation, payload)
+            SyncService.replay()
+            return entry
+
+        with mock.patch.object(self.store, 'append', side_effect=append_then_background_replay):
+            row_id = SyncService.submit('pembayaran.create', self.payload(Decimal('500000')))
+
+        self.assertIsNotNone(row_id)
+        self.assertEqual([row['id_pembayaran'] for row in self.pembayaran_rows()], [row_id])
+
+    def test_submit_entry_rejected_by_background_thread_raises(self):
+        append = self.store.append
+
+        def append_then_background_replay(operation, payload):
+            entry = append(operation, payload)
+            SyncService.replay()
+            return entry
+
+        with mock.patch.object(self.store, 'append', side_effect=append_then_background_replay):
+            with self.assertRaises(Exception):
+                SyncService.submit('pembayaran.create', self.payload(Decimal('1'), id_transaksi=999))
+
+        self.assertEqual(self.store.count_failed(), 0)
+        self.assertEqual(self.store.count_pending(), 0)
+
+    def test_submit_rejected_raises_and_discards(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            SyncService.submit('pembayaran.create', self.payload(Decimal('1'), id_transaksi=999))
+        self.assertEqual(self.store.count_pending() + self.store.count_failed(), 0)
+
+    def test_retryable_error_stays_pending(self):
+        self.go_offline()
+        SyncService.submit('pembayaran.create', self.payload(Decimal('100')))
+        SyncService.submit('pembayaran.create', self.payload(Decimal('200')))
+        self.go_online()
+
+        locked = sqlite3.OperationalError("database is locked")
+        handlers = {'pembayaran.create': ('pembayaran', mock.Mock(side_effect=locked))}
+        with mock.patch.object(SyncService, '_handlers', return_value=handlers):
+            self.assertEqual(SyncService.replay(), {})
+
+        pending = self.store.pending()
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(pending[0]['attempts'], 1)
+        self.assertEqual(pending[1]['attempts'], 0)
+        self.assertEqual(self.store.count_failed(), 0)
+
+    def test_rejected_entry_marked_failed_queue_continues(self):
+        self.go_offline()
+        SyncService.submit('pembayaran.create', self.payload(Decimal('1'), id_transaksi=999))
+        SyncService.submit('pembayaran.create', self.payload(Decimal('200')))
+        self.go_online()
+
+        applied = SyncService.replay()
+        failed = self.store.failed()
+        self.assertEqual(len(failed), 1)
+        self.assertIn('FOREIGN KEY', failed[0]['last_error'])
+        self.assertEqual(self.store.entry(failed[0]['seq'])['status'], FAILED)
+        self.assertEqual(len(applied), 1)
+        self.assertEqual([row['jumlah_bayar'] for row in self.pembayaran_rows()], [Decimal(200)])
+
+        SyncService.retry_failed([failed[0]['seq']])
+        self.assertEqual(self.store.count_pending(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+"""
+Validasi massal berbasis schema untuk import & edit banyak baris
+
+Berbeda dengan Validators (satu field, satu popup), BulkValidator memeriksa
+satu kolom sekaligus dan mengumpulkan semua error ke satu laporan:
+
+    validator = BulkValidator([
+        Rule.required('nama', 'Nama'),
+        Rule.phone('no_hp', 'No HP'),
+        Rule.positive('harga', 'Harga'),
+        Rule.date_range('tanggal', 'Tanggal', min_date=date.today()),
+        Rule.time_range('jam_mulai', 'jam_selesai'),
+    ])
+    report = validator.validate(rows)       # list of dict atau dict of list
+    if not report.is_valid:
+        report.matrix()                     # {row: {kolom: pesan}}
+
+Pattern di-compile sekali di level modul, tidak ada try/except per baris.
+"""
+import re
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Karakter pemisah nomor HP yang diabaikan (sama dengan Validators.validate_phone)
+_PHONE_STRIP = str.maketrans('', '', ' -.()')
+_PHONE_RE = re.compile(r'^(?:08\d{8,11}|\+?62\d{8,11})$')
+_NUMBER_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+_TIME_RE = re.compile(r'^(\d{1,2}):(\d{2})(?::(\d{2}))?$')
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_NUMBER_TYPES = (int, float, Decimal)
+_MISSING = object()
+
+# Tipe sel yang di-cache _memoized (hashable, sering berulang); tipe lain
+# (list/dict dari JSON, Decimal sNaN) di-parse tanpa cache
+_HASHABLE_SCALARS = frozenset((str, date, datetime, time, timedelta, type(None)))
+
+# Hasil check satu kolom: list of (index baris, pesan error)
+ColumnErrors = List[Tuple[int, str]]
+
+
+class Rule:
+    """
+    Satu aturan validasi kolom
+
+    Buat lewat factory method (Rule.required, Rule.phone, ...). check
+    menerima list nilai kolom (atau tuple kolom untuk aturan multi-kolom)
+    dan mengembalikan list (index, pesan).
+    """
+
+    __slots__ = ('columns', 'field_name', 'check')
+
+    def __init__(self, columns: Tuple[str, ...], field_name: str,
+                 check: Callable[..., ColumnErrors]):
+        self.columns = columns
+        self.field_name = field_name
+        self.check = check
+
+    @property
+    def column(self) -> str:
+        """Kolom tempat error dilaporkan"""
+        return self.columns[-1]
+
+    @staticmethod
+    def required(column: str, field_name: str) -> 'Rule':
+        message = f"{field_name} wajib diisi"
+
+        def check(values):
+            return [
+                (i, message) for i, value in enumerate(values)
+                if value is None or (value.__class__ is str and not value.strip())
+            ]
+        return Rule((column,), field_name, check)
+
+    @staticmethod
+    def phone(column: str, field_name: str = "No HP") -> 'Rule':
+        message = "Nomor HP harus 10-13 digit, diawali 08 atau 62"
+        match = _PHONE_RE.match
+        strip = _PHONE_STRIP
+
+        def check(values):
+            return [
+                (i, message) for i, value in enumerate(values)
+                if value.__class__ is not str or not match(value.translate(strip))
+            ]
+        return Rule((column,), field_name, check)
+
+    @staticmethod
+    def positive(column: str, field_name: str) -> 'Rule':
+        message_nan = f"{field_name} harus berupa angka"
+        message_min = f"{field_name} harus lebih besar dari 0"
+        match = _NUMBER_RE.match
+
+        def check(values):
+            errors = []
+            for i, value in enumerate(values):
+                if isinstance(value, _NUMBER_TYPES) and value.__class__ is not bool:
+                    # NaN: Decimal('NaN') > 0 raise InvalidOperation, float NaN != dirinya
+                    if value.is_nan() if value.__class__ is Decimal else value != value:
+                        errors.append((i, message_nan))
+                    elif not value > 0:
+                        errors.append((i, message_min))
+                elif value.__class__ is str and match(value.strip()):
+                    if not float(value) > 0:
+                        errors.append((i, message_min))
+                else:
+                    errors.append((i, message_nan))
+            return errors
+        return Rule((column,), field_name, check)
+
+    @staticmethod
+    def date_range(column: str, field_name: str,
+                   min_date: Optional[date] = None, max_date: Optional[date] = None) -> 'Rule':
+        message_invalid = f"{field_name} bukan tanggal yang valid (YYYY-MM-DD)"
+        message_min = f"{field_name} tidak boleh sebelum {min_date}"
+        message_max = f"{field_name} tidak boleh setelah {max_date}"
+
+        def check(values):
+            errors = []
+            parsed = _memoized(_to_date)
+            for i, value in enumerate(values):
+                value = parsed(value)
+                if value is None:
+                    errors.append((i, message_invalid))
+                elif min_date is not None and value < min_date:
+                    errors.append((i, message_min))
+                elif max_date is not None and value > max_date:
+                    errors.append((i, message_max))
+            return errors
+        return Rule((column,), field_name, check)
+
+    @staticmethod
+    def time_range(start_column: str, end_column: str, field_name: str = "Jam") -> 'Rule':
+        message_invalid = f"{field_name} bukan format waktu yang valid (HH:MM)"
+        message_order = "Jam selesai harus lebih besar dari jam mulai"
+
+        def check(starts, ends):
+            errors = []
+            parsed = _memoized(_to_seconds)
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                start = parsed(start)
+                end = parsed(end)
+                if start is None or end is None:
+                    errors.append((i, message_invalid))
+                elif start >= end:
+                    errors.append((i, message_order))
+            return errors
+        return Rule((start_column, end_column), field_name, check)
+
+
+class ValidationReport:
+    """Hasil validasi massal"""
+
+    def __init__(self, row_count: int, errors: Dict[str, ColumnErrors]):
+        self.row_count = row_count
+        self.errors = errors  # kolom -> list of (index baris, pesan)
+
+    @property
+    def is_valid(self) -> bool:
+        return not any(self.errors.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(len(errors) for errors in self.errors.values())
+
+    def invalid_rows(self) -> List[int]:
+        """Index baris yang punya minimal satu error (urut)"""
+        return sorted({i for errors in self.errors.values() for i, _ in errors})
+
+    def matrix(self) -> Dict[int, Dict[str, str]]:
+        """Error per baris: {index baris: {kolom: pesan}}"""
+        result = {}
+        for column, errors in self.errors.items():
+            for i, message in errors:
+                result.setdefault(i, {}).setdefault(column, message)
+        return dict(sorted(result.items()))
+
+    def summary(self, limit: int = 10) -> str:
+        """Ringkasan error untuk ditampilkan di satu QMessageBox"""
+        if self.is_valid:
+            return f"✅ {self.row_count} baris valid"
+        matrix = self.matrix()
+        lines = [f"❌ {len(matrix)} dari {self.row_count} baris tidak valid:"]
+        for i, columns in list(matrix.items())[:limit]:
+            lines.append(f"  Baris {i + 1}: " + "; ".join(columns.values()))
+        if len(matrix) > limit:
+            lines.append(f"  ... dan {len(matrix) - limit} baris lainnya")
+        return "\n".join(lines)
+
+
+class BulkValidator:
+    """Validator kolom-per-kolom berdasarkan list Rule"""
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = list(rules)
+
+    def validate(self, data: Union[List[Dict], Dict[str, Sequence]]) -> ValidationReport:
+        """
+        Validasi semua baris
+
+        Args:
+            data: List of dict (per baris) atau dict kolom -> list nilai
+
+        Returns:
+            ValidationReport
+        """
+        columns = data if isinstance(data, dict) else self._to_columns(data)
+        row_count = len(next(iter(columns.values()), ()))
+
+        errors = {}
+        for rule in self.rules:
+            values = [columns.get(name) or [None] * row_count for name in rule.columns]
+            found = rule.check(*values)
+            if found:
+                errors.setdefault(rule.column, []).extend(found)
+        return ValidationReport(row_count, errors)
+
+    def _to_columns(self, rows: Iterable[Dict]) -> Dict[str, List]:
+        """Transpose list of dict menjadi kolom (hanya kolom yang dipakai rule)"""
+        rows = rows if isinstance(rows, list) else list(rows)
+        names = {name for rule in self.rules for name in rule.columns}
+        return {name: [row.get(name) for row in rows] for name in names}
+
+
+def _memoized(parse: Callable) -> Callable:
+    """
+    Cache hasil parse per batch (tanggal & jam di data import sangat berulang)
+    Hanya tipe di _HASHABLE_SCALARS yang di-cache, nilai lain di-parse
+    langsung (hasilnya None sehingga dilaporkan sebagai sel tidak valid)
+    """
+    cache = {}
+    get = cache.get
+    hashable = _HASHABLE_SCALARS
+
+    def parsed(value):
+        if value.__class__ not in hashable:
+            return parse(value)
+        result = get(value, _MISSING)
+        if result is _MISSING:
+            result = cache[value] = parse(value)
+        return result
+    return parsed
+
+
+def _to_date(value) -> Optional[date]:
+    """date/datetime/'YYYY-MM-DD' -> date, None jika tidak valid"""
+    if value.__class__ is date:
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    if value.__class__ is not str:
+        return None
+    match = _DATE_RE.match(value.strip())
+    if not match:
+        return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not 1 <= month <= 12 or year < 1:
+        return None
+    days = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days = 29
+    if not 1 <= day <= days:
+        return None
+    return date(year, month, day)
+
+
+def _to_seconds(value) -> Optional[int]:
+    """time/timedelta/'HH:MM[:SS]' -> detik sejak 00:00, None jika tidak valid"""
+    if value.__class__ is time:
+        return value.hour * 3600 + value.minute * 60 + value.second
+    if hasattr(value, 'total_seconds'):
+        # Kolom TIME dari mysql.connector berupa timedelta
+        return int(value.total_seconds())
+    if value.__class__ is not str:
+        return None
+    match = _TIME_RE.match(value.strip())
+    if not match:
+        return None
+    hour, minute, second = int(match[1]), int(match[2]), int(match[3] or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return hour * 3600 + minute * 60 + second
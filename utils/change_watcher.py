@@ -0,0 +1,108 @@
+"""
+Watcher change feed untuk refresh view lintas terminal
+"""
+from PyQt5.QtCore import QObject, QTimer
+from services.change_feed_service import ChangeFeedService
+from services.reference_service import ReferenceService
+from config.constants import ChangeAction
+from config.settings import Settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeWatcher(QObject):
+    """
+    Polling change_log secara berkala dan teruskan perubahan ke handler view
+
+    Usage:
+        self.change_watcher = ChangeWatcher(self, {
+            'pelanggan': self.on_pelanggan_changed
+        })
+        self.change_watcher.start()
+
+    Handler dipanggil sekali per polling per tabel dengan dict
+    {row_id: action} (aksi terakhir per baris), sehingga baris yang
+    berubah bisa diambil dengan satu query (lihat patch()).
+
+    Tabel referensi (ReferenceService.LOADERS) yang berubah di terminal
+    lain di-invalidate dari cache ReferenceService sebelum handler
+    dipanggil. Handler None: tabel hanya dipantau untuk invalidasi itu
+    (contoh: dialog yang membaca ReferenceService setiap kali dibuka).
+    """
+
+    def __init__(self, view, handlers: dict, interval_ms: int = None):
+        """
+        Args:
+            view: Window pemilik, polling dilewati saat window tidak tampil
+            handlers: Dict nama tabel -> callable({row_id: action}) atau None
+            interval_ms: Interval polling (default Settings.CHANGE_POLL_INTERVAL_MS)
+        """
+        super().__init__(view)
+        self.view = view
+        self.handlers = handlers
+        self.watermark = 0
+        self.service = ChangeFeedService()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms or Settings.CHANGE_POLL_INTERVAL_MS)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        """
+        Ambil watermark lalu mulai polling
+        Panggil SEBELUM full load agar perubahan selama load tidak terlewat
+        """
+        self.watermark = self.service.get_watermark()
+        self.timer.start()
+
+    def stop(self):
+        """Stop polling"""
+        self.timer.stop()
+
+    def poll(self):
+        """Ambil perubahan di atas watermark dan patch baris terkait"""
+        if not self.view.isVisible():
+            return
+
+        changes = self.service.get_changes(self.watermark, list(self.handlers))
+        if not changes:
+            return
+
+        batches = {}
+        for change in changes:
+            batches.setdefault(change['table_name'], {})[change['row_id']] = change['action']
+        for table_name, batch in batches.items():
+            if table_name in ReferenceService.LOADERS:
+                ReferenceService.invalidate(table_name)
+            handler = self.handlers[table_name]
+            if handler is None:
+                continue
+            try:
+                handler(batch)
+            except Exception as e:
+                logger.error(f"Error applying {len(batch)} change {table_name}: {e}")
+        self.watermark = changes[-1]['id']
+
+    @staticmethod
+    def patch(changes: dict, fetch, key: str, upsert, remove):
+        """
+        Terapkan satu batch perubahan ke view
+
+        Args:
+            changes: {row_id: action} dari handler
+            fetch: callable(list id) -> list baris (None jika query gagal)
+            key: Nama kolom id di baris hasil fetch
+            upsert: callable(row) untuk baris yang masih ada
+            remove: callable(row_id) untuk baris yang dihapus/tidak ditemukan
+        """
+        ids = [row_id for row_id, action in changes.items() if action != ChangeAction.DELETE]
+        rows = fetch(ids) if ids else []
+        if rows is None:
+            return
+        for row in rows:
+            upsert(row)
+        found = {row[key] for row in rows}
+        for row_id in changes:
+            if row_id not in found:
+                remove(row_id)
@@ -0,0 +1,197 @@
+"""
+Struk thermal langsung dalam ESC/POS (tanpa PDF)
+
+Data sama dengan PDFGenerator (transaksi_data, detail_items,
+pembayaran_data). Hasilnya byte stream yang langsung dikirim ke printer:
+kertas dipotong tepat setelah konten terakhir, bukan di halaman 297mm.
+
+    data = EscPos.render(transaksi, details, pembayaran, paper_mm=58)
+    EscPosPrinter('/dev/usb/lp0').send(data)    # device printer
+    EscPosPrinter('spool/').send(data)          # folder spool (satu file per struk)
+    EscPosPrinter('printer.bin').send(data)     # file biasa sebagai printer tiruan
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+import os
+import textwrap
+from config.settings import Settings
+from utils.formatters import Formatters
+from utils.receipt_template import ReceiptTemplate
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Perintah ESC/POS
+ESC = b'\x1b'
+GS = b'\x1d'
+INIT = ESC + b'@'
+CODEPAGE_PC437 = ESC + b't\x00'
+ALIGN_LEFT = ESC + b'a\x00'
+ALIGN_CENTER = ESC + b'a\x01'
+BOLD_ON = ESC + b'E\x01'
+BOLD_OFF = ESC + b'E\x00'
+SIZE_NORMAL = GS + b'!\x00'
+SIZE_DOUBLE = GS + b'!\x11'
+CUT = GS + b'V\x42\x00'  # feed sampai posisi pisau lalu partial cut
+
+
+# Jumlah karakter per baris (Font A 12x24) per lebar kertas
+COLUMNS = {80: 48, 58: 32}
+
+ENCODING = 'cp437'
+
+
+def _feed(lines: int) -> bytes:
+    """Feed n baris"""
+    return ESC + b'd' + bytes((lines,))
+
+
+class EscPos:
+    """Renderer struk ESC/POS"""
+
+    @staticmethod
+    def render(transaksi_data, detail_items: List[Dict], pembayaran_data,
+               paper_mm: int = 80, cut: bool = True) -> bytes:
+        """
+        Render struk ke byte stream ESC/POS
+
+        Args:
+            transaksi_data: Dict dengan data transaksi
+            detail_items: List of dict dengan detail layanan
+            pembayaran_data: Dict dengan data pembayaran
+            paper_mm: Lebar kertas, 80 atau 58
+            cut: Potong kertas di akhir struk
+
+        Returns:
+            bytes: Data siap kirim ke printer
+        """
+        if paper_mm not in COLUMNS:
+            raise ValueError(f"Lebar kertas tidak didukung: {paper_mm}mm")
+        width = COLUMNS[paper_mm]
+        values = ReceiptTemplate.values(transaksi_data, pembayaran_data)
+        separator = EscPos._text('-' * width)
+
+        out = [INIT, CODEPAGE_PC437]
+
+        # Header
+        out += [ALIGN_CENTER, SIZE_DOUBLE, BOLD_ON, EscPos._text("MAKEUP APP"),
+                SIZE_NORMAL, BOLD_OFF, EscPos._text("Struk Pembayaran"), ALIGN_LEFT, separator]
+
+        # Info transaksi
+        info = [("ID Trans : ", values['id_transaksi'])]
+        if values['id_pembayaran']:
+            info.append(("ID Bayar : ", values['id_pembayaran']))
+        info += [("Tanggal  : ", values['tanggal']), ("Pelanggan: ", values['pelanggan'])]
+        out += [EscPos._text(EscPos._clip(label + value, width)) for label, value in info]
+        out.append(separator)
+
+        # Items: nama (dilipat jika panjang), "jumlah x harga" + subtotal rata kanan
+        for item in detail_items:
+            harga = Formatters.format_currency(item['harga'])
+            subtotal = Formatters.format_currency(item['subtotal'])
+            out += [EscPos._text(line) for line in EscPos._wrap(item['nama_layanan'], width)]
+            out.append(EscPos._text(EscPos._pair(f"  {item['jumlah']}x {harga}", subtotal, width)))
+        out.append(separator)
+
+        # Summary
+        out += [BOLD_ON,
+                EscPos._text(EscPos._pair("Total:", values['total'], width)),
+                EscPos._text(EscPos._pair("Bayar:", values['bayar'], width)),
+                EscPos._text(EscPos._pair("Kembali:", values['kembalian'], width)),
+                BOLD_OFF, separator,
+                EscPos._text(EscPos._clip("Metode: " + values['metode'], width)),
+                EscPos._text(EscPos._clip("Status: " + values['status'], width))]
+
+        # Footer
+        out += [ALIGN_CENTER, _feed(1), EscPos._text("Terima Kasih"),
+                EscPos._text("Selamat Datang Kembali"), EscPos._text(values['print']), ALIGN_LEFT]
+
+        if cut:
+            out.append(CUT)
+        else:
+            out.append(_feed(4))
+        return b''.join(out)
+
+    # ============================================
+    # Helpers
+    # ============================================
+
+    @staticmethod
+    def _text(line: str) -> bytes:
+        """Satu baris teks + LF (karakter di luar codepage diganti '?')"""
+        return line.encode(ENCODING, errors='replace') + b'\n'
+
+    @staticmethod
+    def _clip(text: str, width: int) -> str:
+        return text if len(text) <= width else text[:width - 3] + "..."
+
+    @staticmethod
+    def _wrap(text: str, width: int) -> List[str]:
+        """Lipat teks per kata ke beberapa baris (kata lebih panjang dari width dipotong)"""
+        return textwrap.wrap(text, width) or [""]
+
+    @staticmethod
+    def _pair(left: str, right: str, width: int) -> str:
+        """Teks kiri & kanan dalam satu baris, kiri dipotong jika tidak muat"""
+        space = width - len(right) - 1
+        return f"{EscPos._clip(left, space)} ".ljust(width - len(right)) + right
+
+
+class EscPosPrinter:
+    """
+    Tujuan output ESC/POS
+
+    target berupa folder = spool (satu file .bin per struk, ditulis atomic
+    agar spooler tidak membaca file setengah jadi); selain itu device
+    printer atau file biasa (data di-append, cocok sebagai printer tiruan
+    untuk pengujian).
+    """
+
+    def __init__(self, target=None):
+        target = target or Settings.ESCPOS_PRINTER
+        if not target:
+            raise ValueError("Printer ESC/POS belum dikonfigurasi (ESCPOS_PRINTER)")
+        self.target = Path(target)
+
+    @property
+    def is_spool(self) -> bool:
+        return self.target.is_dir()
+
+    def send(self, data: bytes, name: str = "struk") -> str:
+        """
+        Kirim data ke printer
+
+        Args:
+            data: Byte stream ESC/POS
+            name: Prefix nama file job (mode spool)
+
+        Returns:
+            str: Path device/file job
+        """
+        if self.is_spool:
+            filepath = self.target / f"{name}_{datetime.now():%Y%m%d_%H%M%S_%f}.bin"
+            tmp_path = filepath.with_name(filepath.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
+            return str(filepath)
+
+        with open(self.target, 'ab') as f:
+            f.write(data)
+            f.flush()
+        return str(self.target)
+
+    @staticmethod
+    def print_struk(transaksi_data, detail_items, pembayaran_data,
+                    target=None, paper_mm: int = None) -> str:
+        """Render & kirim struk ke printer ESC/POS (default dari Settings)"""
+        paper_mm = paper_mm or Settings.ESCPOS_PAPER_MM
+        data = EscPos.render(transaksi_data, detail_items, pembayaran_data, paper_mm)
+        try:
+            path = EscPosPrinter(target).send(data, f"struk_{transaksi_data['id_transaksi']}")
+            logger.info(f"✅ Struk {transaksi_data['id_transaksi']} dikirim ke printer: {path}")
+            return path
+        except OSError as e:
+            logger.error(f"❌ Error mengirim struk ke printer: {e}")
+            raise
@@ -2,89 +2,128 @@
 Formatting utility functions
 """
 from datetime import datetime, date, time
-from typing import Union
+from functools import lru_cache
+from typing import Union, Callable
+
+# Tanggal, nominal & jam di data sangat berulang, hasil format di-cache
+CACHE_SIZE = 4096
+
+MONTHS = (
+    'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
+    'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember'
+)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_currency(amount) -> str:
+    try:
+        # Int rupiah (utils.money) tidak perlu lewat float
+        if type(amount) is int:
+            return f"Rp {amount:,}".replace(',', '.')
+        # Convert to float
+        if isinstance(amount, str):
+            amount = float(amount.replace(',', ''))
+        else:
+            amount = float(amount)
+
+        # Format dengan separator titik
+        formatted = f"{amount:,.0f}".replace(',', '.')
+        return f"Rp {formatted}"
+    except (ValueError, TypeError):
+        return "Rp 0"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_date(date_obj) -> str:
+    try:
+        if isinstance(date_obj, str):
+            date_obj = datetime.strptime(date_obj, '%Y-%m-%d').date()
+
+        return f"{date_obj.day} {MONTHS[date_obj.month - 1]} {date_obj.year}"
+    except:
+        return str(date_obj)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_time(time_obj) -> str:
+    try:
+        if isinstance(time_obj, str):
+            time_obj = datetime.strptime(time_obj, '%H:%M:%S').time()
+
+        return time_obj.strftime('%H:%M')
+    except:
+        return str(time_obj)
+
+
+def _cached(func: Callable, value) -> str:
+    """Panggil fungsi ter-cache, fallback tanpa cache untuk nilai unhashable"""
+    try:
+        return func(value)
+    except TypeError:
+        return func.__wrapped__(value)
 
 
 class Formatters:
     """Helper class untuk formatting data"""
-    
+
     @staticmethod
     def format_currency(amount: Union[int, float, str]) -> str:
         """
         Format angka menjadi format Rupiah
-        
+
         Args:
             amount: Jumlah dalam angka
-            
+
         Returns:
             String format Rupiah (contoh: Rp 1.500.000)
         """
-        try:
-            # Convert to float
-            if isinstance(amount, str):
-                amount = float(amount.replace(',', ''))
-            else:
-                amount = float(amount)
-            
-            # Format dengan separator titik
-            formatted = f"{amount:,.0f}".replace(',', '.')
-            return f"Rp {formatted}"
-        except (ValueError, TypeError):
-            return "Rp 0"
-    
+        return _cached(_format_currency, amount)
+
     @staticmethod
     def format_date(date_obj: Union[date, datetime, str]) -> str:
         """
         Format tanggal ke format Indonesia
-        
+
         Args:
             date_obj: Object date/datetime atau string
-            
+
         Returns:
             String format tanggal (contoh: 16 Oktober 2025)
         """
-        try:
-            if isinstance(date_obj, str):
-                date_obj = datetime.strptime(date_obj, '%Y-%m-%d').date()
-            elif isinstance(date_obj, datetime):
-                date_obj = date_obj.date()
-            
-            months = [
-                'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
-                'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember'
-            ]
-            
-            return f"{date_obj.day} {months[date_obj.month - 1]} {date_obj.year}"
-        except:
-            return str(date_obj)
-    
+        if isinstance(date_obj, datetime):
+            date_obj = date_obj.date()
+        return _cached(_format_date, date_obj)
+
     @staticmethod
     def format_time(time_obj: Union[time, str]) -> str:
         """
         Format waktu
-        
+
         Args:
             time_obj: Object time atau string
-            
+
         Returns:
             String format waktu (contoh: 09:00)
         """
-        try:
-            if isinstance(time_obj, str):
-                time_obj = datetime.strptime(time_obj, '%H:%M:%S').time()
-            
-            return time_obj.strftime('%H:%M')
-        except:
-            return str(time_obj)
-    
+        return _cached(_format_time, time_obj)
+
+    @staticmethod
+    def cache_info() -> dict:
+        """Statistik cache (hits/misses) per formatter"""
+        return {
+            'currency': _format_currency.cache_info(),
+            'date': _format_date.cache_info(),
+            'time': _format_time.cache_info(),
+        }
+
     @staticmethod
     def parse_currency(currency_str: str) -> float:
         """
         Parse string Rupiah ke float
-        
+
         Args:
             currency_str: String format Rupiah
-            
+
         Returns:
             Float value
         """
@@ -93,4 +132,4 @@ class Formatters:
             cleaned = currency_str.replace('Rp', '').replace('.', '').strip()
             return float(cleaned)
         except:
-            return 0.0
\ No newline at end of file
+            return 0.0
@@ -0,0 +1,71 @@
+"""
+Helper uang dalam rupiah bulat (int)
+
+Semua nominal (harga, subtotal, total, jumlah bayar, kembalian) diproses
+sebagai int rupiah: DECIMAL dari database dikonversi sekali di sini,
+lalu dipakai apa adanya oleh spin box, label, dan PDF.
+"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Iterable, List, Dict
+
+
+class Money:
+    """Helper class untuk operasi uang (int rupiah)"""
+
+    @staticmethod
+    def to_rupiah(value) -> int:
+        """
+        Konversi nominal ke int rupiah (pembulatan half-up)
+
+        Args:
+            value: int, Decimal (dari database), float, string angka, atau None
+
+        Returns:
+            int: Nominal dalam rupiah
+
+        Raises:
+            ValueError: Jika value bukan angka
+        """
+        if type(value) is int:
+            return value
+        if value is None:
+            return 0
+        try:
+            if isinstance(value, float):
+                value = Decimal(repr(value))
+            elif not isinstance(value, Decimal):
+                value = Decimal(str(value).strip())
+            return int(value.to_integral_value(rounding=ROUND_HALF_UP))
+        except (InvalidOperation, ValueError, TypeError):
+            raise ValueError(f"Nominal tidak valid: {value!r}")
+
+    @staticmethod
+    def total(values: Iterable) -> int:
+        """Jumlahkan nominal (exact, tanpa rounding drift)"""
+        to_rupiah = Money.to_rupiah
+        return sum(to_rupiah(value) for value in values)
+
+    @staticmethod
+    def subtotal(harga, jumlah: int) -> int:
+        """Harga satuan x jumlah"""
+        return Money.to_rupiah(harga) * int(jumlah)
+
+    @staticmethod
+    def change(jumlah_bayar, total) -> int:
+        """
+        Hitung kembalian
+
+        Returns:
+            int: Kembalian, negatif jika pembayaran kurang
+        """
+        return Money.to_rupiah(jumlah_bayar) - Money.to_rupiah(total)
+
+    @staticmethod
+    def normalize(rows: List[Dict], *keys: str) -> List[Dict]:
+        """Konversi kolom nominal di hasil query ke int rupiah (in-place)"""
+        to_rupiah = Money.to_rupiah
+        for row in rows:
+            for key in keys:
+                if key in row:
+                    row[key] = to_rupiah(row[key])
+        return rows
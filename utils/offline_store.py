@@ -0,0 +1,266 @@
+"""
+Penyimpanan lokal terminal kasir saat server database tidak terjangkau
+
+File SQLite di Settings.OFFLINE_JOURNAL_PATH berisi:
+
+    journal     - write-ahead journal transaksi & pembayaran (urut seq),
+                  dikirim ke server oleh services.sync_service.SyncService
+    user_cache  - user yang pernah login di terminal ini (login offline)
+
+Setiap entry journal punya idempotency_key unik; server mencatat key yang
+sudah diterapkan (tabel applied_write) sehingga replay ulang setelah crash
+atau koneksi putus di tengah jalan tidak menggandakan data.
+
+    store = OfflineStore.default()
+    entry = store.append('transaksi.create', payload)
+    for entry in store.pending():
+        ...
+        store.mark_applied(entry['seq'], row_id)
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import sqlite3
+import threading
+import uuid
+from config.settings import Settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    operation TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    row_id INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    applied_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_journal_status ON journal (status, seq);
+
+CREATE TABLE IF NOT EXISTS user_cache (
+    username TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    cached_at TEXT NOT NULL
+);
+"""
+
+# Status entry journal
+PENDING = 'pending'
+APPLIED = 'applied'
+FAILED = 'failed'
+
+
+class OfflineStore:
+    """Journal write & cache user di file SQLite lokal"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path or Settings.OFFLINE_JOURNAL_PATH)
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @classmethod
+    def default(cls) -> 'OfflineStore':
+        """Store di Settings.OFFLINE_JOURNAL_PATH (satu instance per proses)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _connection(self) -> sqlite3.Connection:
+        # Dipanggil dengan self._lock dipegang
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Entry sudah di disk saat append() selesai (tahan mati listrik)
+            conn.execute("PRAGMA synchronous = FULL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+    # ============================================
+    # Journal
+    # ============================================
+
+    def append(self, operation: str, payload: Dict) -> Dict:
+        """
+        Tulis satu operasi ke journal (durable sebelum return)
+
+        Returns:
+            dict: Entry {seq, idempotency_key, operation, payload, status}
+        """
+        key = uuid.uuid4().hex
+        encoded = json.dumps(payload, default=str, ensure_ascii=False)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO journal (idempotency_key, operation, payload, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, operation, encoded, self._now())
+                )
+        return {'seq': cursor.lastrowid, 'idempotency_key': key, 'operation': operation,
+                'payload': payload, 'status': PENDING}
+
+    def pending(self) -> List[Dict]:
+        """Entry yang belum dikirim ke server, urut seq"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT seq, idempotency_key, operation, payload, status, attempts "
+                "FROM journal WHERE status = ? ORDER BY seq", (PENDING,)
+            ).fetchall()
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry['payload'] = json.loads(entry['payload'])
+            entries.append(entry)
+        return entries
+
+    def failed(self) -> List[Dict]:
+        """Entry yang ditolak server, urut seq (untuk ditinjau user)"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT seq, idempotency_key, operation, payload, status, attempts, last_error, created_at "
+                "FROM journal WHERE status = ? ORDER BY seq", (FAILED,)
+            ).fetchall()
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry['payload'] = json.loads(entry['payload'])
+            entries.append(entry)
+        return entries
+
+    def count_pending(self) -> int:
+        return self._count(PENDING)
+
+    def count_failed(self) -> int:
+        return self._count(FAILED)
+
+    def _count(self, status: str) -> int:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*) FROM journal WHERE status = ?", (status,)
+            ).fetchone()
+        return row[0]
+
+    def entry(self, seq: int) -> Optional[Dict]:
+        """Status satu entry (tanpa payload), None jika sudah dibuang"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT seq, operation, status, row_id, attempts, last_error FROM journal WHERE seq = ?",
+                (seq,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def mark_applied(self, seq: int, row_id: int):
+        self._update(seq, "status = ?, row_id = ?, applied_at = ?", (APPLIED, row_id, self._now()))
+
+    def mark_attempt(self, seq: int, error: str):
+        """Catat percobaan yang gagal karena koneksi (tetap pending)"""
+        self._update(seq, "attempts = attempts + 1, last_error = ?", (error,))
+
+    def mark_failed(self, seq: int, error: str):
+        """Ditolak server (bukan masalah koneksi), tidak dicoba lagi"""
+        self._update(seq, "status = ?, attempts = attempts + 1, last_error = ?", (FAILED, error))
+
+    def retry(self, seq: int):
+        """Kembalikan entry failed ke antrian (dikirim ulang oleh replay berikutnya)"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("UPDATE journal SET status = ? WHERE seq = ? AND status = ?",
+                             (PENDING, seq, FAILED))
+
+    def discard(self, seq: int):
+        """Hapus entry yang gagal saat online (error langsung ditampilkan ke user)"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM journal WHERE seq = ?", (seq,))
+
+    def _update(self, seq: int, assignments: str, params: tuple):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(f"UPDATE journal SET {assignments} WHERE seq = ?", (*params, seq))
+
+    # ============================================
+    # User cache (login offline)
+    # ============================================
+
+    def cache_user(self, user_data: Dict):
+        """Simpan data user (termasuk hash bcrypt) setelah login berhasil"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO user_cache (username, data, cached_at) VALUES (?, ?, ?)",
+                        (user_data['username'], json.dumps(user_data, default=str), self._now())
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan cache user {user_data.get('username')}: {e}")
+
+    def cached_user(self, username: str) -> Optional[Dict]:
+        """
+        Data user dari cache, None jika tidak ada atau lebih tua dari
+        Settings.OFFLINE_USER_CACHE_DAYS (entry kadaluarsa dihapus)
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT data, cached_at FROM user_cache WHERE username = ?", (username,)
+            ).fetchone()
+            if row and row['cached_at'] < self._cache_cutoff():
+                with conn:
+                    conn.execute("DELETE FROM user_cache WHERE username = ?", (username,))
+                logger.info(f"🧹 Cache login offline {username} kadaluarsa, dihapus")
+                return None
+        return json.loads(row['data']) if row else None
+
+    def forget_user(self, username: str):
+        """Hapus user dari cache (contoh: user sudah dihapus di server)"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    deleted = conn.execute(
+                        "DELETE FROM user_cache WHERE username = ?", (username,)
+                    ).rowcount
+            if deleted:
+                logger.info(f"🧹 Cache login offline {username} dihapus")
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menghapus cache user {username}: {e}")
+
+    def has_cached_users(self) -> bool:
+        """True jika terminal ini bisa login offline"""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT 1 FROM user_cache WHERE cached_at >= ? LIMIT 1", (self._cache_cutoff(),)
+                ).fetchone()
+            return row is not None
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca cache user: {e}")
+            return False
+
+    @staticmethod
+    def _cache_cutoff() -> str:
+        # cached_at disimpan dengan format _now(), jadi bisa dibandingkan sebagai teks
+        cutoff = datetime.now() - timedelta(days=Settings.OFFLINE_USER_CACHE_DAYS)
+        return cutoff.isoformat(sep=' ', timespec='seconds')
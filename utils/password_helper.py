@@ -2,7 +2,10 @@
 Helper functions untuk password hashing dan verification
 """
 import bcrypt
+import time
 import logging
+from typing import Optional, List, Tuple
+from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -10,19 +13,24 @@ logger = logging.getLogger(__name__)
 class PasswordHelper:
     """Helper class untuk password operations"""
     
+    # Batas cost yang masuk akal untuk bcrypt
+    MIN_ROUNDS = 10
+    MAX_ROUNDS = 16
+    
     @staticmethod
-    def hash_password(password: str) -> str:
+    def hash_password(password: str, rounds: Optional[int] = None) -> str:
         """
         Hash password menggunakan bcrypt
         
         Args:
             password: Plain text password
+            rounds: Cost bcrypt (default Settings.PASSWORD_SALT_ROUNDS)
             
         Returns:
             Hashed password string
         """
         try:
-            salt = bcrypt.gensalt(rounds=12)
+            salt = bcrypt.gensalt(rounds=rounds or Settings.PASSWORD_SALT_ROUNDS)
             hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
             return hashed.decode('utf-8')
         except Exception as e:
@@ -48,4 +56,65 @@ class PasswordHelper:
             )
         except Exception as e:
             logger.error(f"Error verifying password: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    @staticmethod
+    def get_rounds(hashed: str) -> Optional[int]:
+        """
+        Ambil cost dari hash bcrypt (format $2b$12$...)
+        
+        Returns:
+            int cost, atau None jika bukan hash bcrypt
+        """
+        parts = hashed.split('$')
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+    
+    @staticmethod
+    def needs_rehash(hashed: str) -> bool:
+        """True jika cost hash berbeda dari Settings.PASSWORD_SALT_ROUNDS"""
+        return PasswordHelper.get_rounds(hashed) != Settings.PASSWORD_SALT_ROUNDS
+    
+    @staticmethod
+    def benchmark_rounds(rounds: int, samples: int = 3) -> float:
+        """
+        Ukur waktu satu hash bcrypt di mesin ini
+        
+        Returns:
+            float: Waktu median dalam ms
+        """
+        password = b"calibration-password"
+        timings = []
+        for _ in range(samples):
+            salt = bcrypt.gensalt(rounds=rounds)
+            start = time.perf_counter()
+            bcrypt.hashpw(password, salt)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        return timings[len(timings) // 2]
+    
+    @staticmethod
+    def calibrate_rounds(budget_ms: float, samples: int = 3) -> Tuple[int, List[Tuple[int, float]]]:
+        """
+        Cari cost tertinggi yang masih di bawah budget latency login
+        
+        Setiap kenaikan cost menggandakan waktu, jadi benchmark berhenti
+        begitu satu cost melewati budget.
+        
+        Args:
+            budget_ms: Budget waktu verifikasi (ms)
+            samples: Jumlah sampel per cost
+            
+        Returns:
+            (cost terpilih, list of (cost, ms) hasil benchmark)
+        """
+        results = []
+        chosen = PasswordHelper.MIN_ROUNDS
+        for rounds in range(PasswordHelper.MIN_ROUNDS, PasswordHelper.MAX_ROUNDS + 1):
+            elapsed = PasswordHelper.benchmark_rounds(rounds, samples)
+            results.append((rounds, elapsed))
+            if elapsed > budget_ms:
+                break
+            chosen = rounds
+        return chosen, results
@@ -1,13 +1,19 @@
 """
 PDF Generator untuk struk pembayaran
+
+Layout struk (A4, thermal 80mm & 58mm) ada di utils.receipt_template.
+render_* menggambar struk ke buffer di memori dan mengembalikan bytes
+(untuk preview/print langsung). generate_* tetap menyimpan ke
+Settings.REPORTS_PDF_DIR dan mengembalikan path, atau bytes jika
+as_bytes=True. Penyimpanan async: PDFWriteBehind (file & arsip struk).
 """
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.units import mm
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
-from utils.formatters import Formatters
+import atexit
+import os
+import threading
+from utils.receipt_archive import ReceiptArchive
+from utils.receipt_template import ReceiptTemplate
 from config.settings import Settings
 import logging
 
@@ -18,7 +24,34 @@ class PDFGenerator:
     """Generator untuk membuat PDF struk pembayaran"""
     
     @staticmethod
-    def generate_struk_pembayaran(transaksi_data, detail_items, pembayaran_data, filename=None):
+    def default_filename(transaksi_data, prefix: str = "struk") -> str:
+        """Nama file struk: <prefix>_<id_transaksi>_<timestamp>.pdf"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{prefix}_{transaksi_data['id_transaksi']}_{timestamp}.pdf"
+    
+    @staticmethod
+    def save(pdf_bytes: bytes, filename: str, directory=None) -> str:
+        """
+        Simpan bytes PDF ke Settings.REPORTS_PDF_DIR (atomic replace)
+        
+        Args:
+            directory: Folder tujuan lain (optional, Path)
+        
+        Returns:
+            str: Path file
+        """
+        directory = directory or Settings.REPORTS_PDF_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        filepath = directory / filename
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_path, filepath)
+        return str(filepath)
+    
+    @staticmethod
+    def generate_struk_pembayaran(transaksi_data, detail_items, pembayaran_data, filename=None,
+                                  as_bytes=False):
         """
         Generate struk pembayaran dalam format PDF
         
@@ -27,187 +60,36 @@ class PDFGenerator:
             detail_items: List of dict dengan detail layanan
             pembayaran_data: Dict dengan data pembayaran
             filename: Nama file output (optional)
+            as_bytes: True untuk mengembalikan bytes tanpa menulis file
             
         Returns:
-            str: Path ke file PDF yang dibuat
+            str: Path ke file PDF yang dibuat (bytes jika as_bytes=True)
+        """
+        pdf_bytes = PDFGenerator.render_struk_pembayaran(transaksi_data, detail_items, pembayaran_data)
+        if as_bytes:
+            return pdf_bytes
+        
+        filepath = PDFGenerator.save(pdf_bytes, filename or PDFGenerator.default_filename(transaksi_data))
+        logger.info(f"✅ PDF struk berhasil dibuat: {filepath}")
+        return filepath
+    
+    @staticmethod
+    def render_struk_pembayaran(transaksi_data, detail_items, pembayaran_data) -> bytes:
+        """
+        Render struk pembayaran A4 ke memori
+        
+        Returns:
+            bytes: Isi file PDF
         """
         try:
-            # Generate filename jika tidak ada
-            if not filename:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                id_transaksi = transaksi_data['id_transaksi']
-                filename = f"struk_{id_transaksi}_{timestamp}.pdf"
-            
-            # Full path
-            filepath = Settings.REPORTS_PDF_DIR / filename
-            
-            # Ensure directory exists
-            Settings.REPORTS_PDF_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # Create PDF
-            c = canvas.Canvas(str(filepath), pagesize=A4)
-            width, height = A4
-            
-            # Starting position
-            y = height - 40
-            
-            # Header - Company Name
-            c.setFont("Helvetica-Bold", 20)
-            c.drawCentredString(width/2, y, "💄 MAKEUP APP")
-            y -= 25
-            
-            c.setFont("Helvetica", 12)
-            c.drawCentredString(width/2, y, "Struk Pembayaran")
-            y -= 30
-            
-            # Garis pemisah
-            c.line(50, y, width-50, y)
-            y -= 20
-            
-            # Info Transaksi
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(50, y, "INFORMASI TRANSAKSI")
-            y -= 15
-            
-            c.setFont("Helvetica", 10)
-            
-            # ID Transaksi
-            c.drawString(50, y, f"ID Transaksi:")
-            c.drawRightString(width-50, y, str(transaksi_data['id_transaksi']))
-            y -= 15
-            
-            # Tanggal Transaksi
-            c.drawString(50, y, f"Tanggal Transaksi:")
-            c.drawRightString(width-50, y, Formatters.format_date(transaksi_data['tanggal_transaksi']))
-            y -= 15
-            
-            # Pelanggan
-            c.drawString(50, y, f"Pelanggan:")
-            c.drawRightString(width-50, y, transaksi_data['nama_pelanggan'])
-            y -= 15
-            
-            # ID Pembayaran
-            if pembayaran_data.get('id_pembayaran'):
-                c.drawString(50, y, f"ID Pembayaran:")
-                c.drawRightString(width-50, y, str(pembayaran_data['id_pembayaran']))
-                y -= 15
-            
-            y -= 10
-            
-            # Garis pemisah
-            c.line(50, y, width-50, y)
-            y -= 20
-            
-            # Detail Layanan
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(50, y, "DETAIL LAYANAN")
-            y -= 20
-            
-            # Table header
-            c.setFont("Helvetica-Bold", 9)
-            c.drawString(50, y, "Layanan")
-            c.drawString(350, y, "Qty")
-            c.drawString(400, y, "Harga")
-            c.drawRightString(width-50, y, "Subtotal")
-            y -= 15
-            
-            # Table separator
-            c.line(50, y, width-50, y)
-            y -= 5
-            
-            # Detail items
-            c.setFont("Helvetica", 9)
-            for item in detail_items:
-                if y < 100:  # New page if needed
-                    c.showPage()
-                    y = height - 40
-                    c.setFont("Helvetica", 9)
-                
-                # Layanan name (truncate if too long)
-                layanan_name = item['nama_layanan']
-                if len(layanan_name) > 40:
-                    layanan_name = layanan_name[:37] + "..."
-                
-                c.drawString(50, y, layanan_name)
-                c.drawString(350, y, str(item['jumlah']))
-                c.drawString(400, y, Formatters.format_currency(item['harga']))
-                c.drawRightString(width-50, y, Formatters.format_currency(item['subtotal']))
-                y -= 15
-            
-            y -= 5
-            
-            # Garis pemisah
-            c.line(50, y, width-50, y)
-            y -= 20
-            
-            # Total section
-            c.setFont("Helvetica-Bold", 11)
-            
-            # Total Tagihan
-            c.drawString(350, y, "Total Tagihan:")
-            c.drawRightString(width-50, y, Formatters.format_currency(transaksi_data['total']))
-            y -= 20
-            
-            # Jumlah Bayar
-            c.drawString(350, y, "Jumlah Bayar:")
-            c.drawRightString(width-50, y, Formatters.format_currency(pembayaran_data['jumlah_bayar']))
-            y -= 20
-            
-            # Kembalian
-            kembalian = pembayaran_data['jumlah_bayar'] - float(transaksi_data['total'])
-            c.drawString(350, y, "Kembalian:")
-            c.drawRightString(width-50, y, Formatters.format_currency(kembalian if kembalian >= 0 else 0))
-            y -= 25
-            
-            # Garis tebal
-            c.setLineWidth(2)
-            c.line(50, y, width-50, y)
-            c.setLineWidth(1)
-            y -= 20
-            
-            # Payment info
-            c.setFont("Helvetica", 10)
-            c.drawString(50, y, f"Metode Pembayaran:")
-            c.drawRightString(width-50, y, pembayaran_data['metode_bayar'])
-            y -= 15
-            
-            c.drawString(50, y, f"Status Pembayaran:")
-            c.drawRightString(width-50, y, pembayaran_data['status'])
-            y -= 15
-            
-            c.drawString(50, y, f"Tanggal Pembayaran:")
-            c.drawRightString(width-50, y, Formatters.format_date(pembayaran_data['tanggal_bayar']))
-            y -= 30
-            
-            # Footer
-            c.line(50, y, width-50, y)
-            y -= 20
-            
-            c.setFont("Helvetica-Bold", 11)
-            c.drawCentredString(width/2, y, "Terima Kasih")
-            y -= 15
-            
-            c.setFont("Helvetica", 10)
-            c.drawCentredString(width/2, y, "Selamat Datang Kembali")
-            y -= 20
-            
-            # Print date
-            c.setFont("Helvetica", 8)
-            print_time = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
-            c.drawCentredString(width/2, y, f"Dicetak: {print_time}")
-            
-            # Save PDF
-            c.save()
-            
-            logger.info(f"✅ PDF struk berhasil dibuat: {filepath}")
-            return str(filepath)
-            
+            return ReceiptTemplate.get('a4').render_bytes(transaksi_data, detail_items, pembayaran_data)
         except Exception as e:
             logger.error(f"❌ Error generating PDF: {e}")
             raise
     
     @staticmethod
-    def generate_struk_thermal(transaksi_data, detail_items, pembayaran_data, filename=None):
+    def generate_struk_thermal(transaksi_data, detail_items, pembayaran_data, filename=None,
+                               as_bytes=False, paper_mm: int = 80):
         """
         Generate struk format thermal printer (58mm atau 80mm)
         Untuk printer kasir
@@ -217,115 +99,111 @@ class PDFGenerator:
             detail_items: List of dict dengan detail layanan
             pembayaran_data: Dict dengan data pembayaran
             filename: Nama file output (optional)
+            as_bytes: True untuk mengembalikan bytes tanpa menulis file
+            paper_mm: Lebar kertas, 80 atau 58
             
         Returns:
-            str: Path ke file PDF yang dibuat
+            str: Path ke file PDF yang dibuat (bytes jika as_bytes=True)
+        """
+        pdf_bytes = PDFGenerator.render_struk_thermal(transaksi_data, detail_items, pembayaran_data, paper_mm)
+        if as_bytes:
+            return pdf_bytes
+        
+        filepath = PDFGenerator.save(
+            pdf_bytes, filename or PDFGenerator.default_filename(transaksi_data, "struk_thermal")
+        )
+        logger.info(f"✅ PDF thermal struk berhasil dibuat: {filepath}")
+        return filepath
+    
+    @staticmethod
+    def render_struk_thermal(transaksi_data, detail_items, pembayaran_data, paper_mm: int = 80) -> bytes:
+        """
+        Render struk thermal ke memori
+        
+        Args:
+            paper_mm: Lebar kertas, 80 atau 58
+        
+        Returns:
+            bytes: Isi file PDF
         """
         try:
-            # Generate filename
-            if not filename:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                id_transaksi = transaksi_data['id_transaksi']
-                filename = f"struk_thermal_{id_transaksi}_{timestamp}.pdf"
-            
-            # Full path
-            filepath = Settings.REPORTS_PDF_DIR / filename
-            
-            # Thermal printer paper size (80mm width)
-            page_width = 80 * mm
-            page_height = 297 * mm  # A4 height, will be auto-adjusted
-            
-            # Create PDF
-            c = canvas.Canvas(str(filepath), pagesize=(page_width, page_height))
-            
-            # Starting position
-            y = page_height - 10
-            margin = 5
-            
-            # Header
-            c.setFont("Helvetica-Bold", 12)
-            c.drawCentredString(page_width/2, y, "MAKEUP APP")
-            y -= 12
-            
-            c.setFont("Helvetica", 8)
-            c.drawCentredString(page_width/2, y, "Struk Pembayaran")
-            y -= 10
-            
-            c.line(margin, y, page_width-margin, y)
-            y -= 10
-            
-            # Info Transaksi
-            c.setFont("Helvetica", 7)
-            c.drawString(margin, y, f"ID Trans : {transaksi_data['id_transaksi']}")
-            y -= 8
-            c.drawString(margin, y, f"Tanggal  : {Formatters.format_date(transaksi_data['tanggal_transaksi'])}")
-            y -= 8
-            c.drawString(margin, y, f"Pelanggan: {transaksi_data['nama_pelanggan']}")
-            y -= 10
-            
-            c.line(margin, y, page_width-margin, y)
-            y -= 10
-            
-            # Detail Layanan
-            for item in detail_items:
-                # Layanan name
-                layanan = item['nama_layanan']
-                if len(layanan) > 25:
-                    layanan = layanan[:22] + "..."
-                
-                c.drawString(margin, y, layanan)
-                y -= 8
-                
-                # Qty x Harga = Subtotal
-                detail_line = f"{item['jumlah']}x {Formatters.format_currency(item['harga'])}"
-                c.drawString(margin + 5, y, detail_line)
-                c.drawRightString(page_width-margin, y, Formatters.format_currency(item['subtotal']))
-                y -= 10
-            
-            c.line(margin, y, page_width-margin, y)
-            y -= 10
-            
-            # Totals
-            c.setFont("Helvetica-Bold", 8)
-            c.drawString(margin, y, "Total:")
-            c.drawRightString(page_width-margin, y, Formatters.format_currency(transaksi_data['total']))
-            y -= 10
-            
-            c.drawString(margin, y, "Bayar:")
-            c.drawRightString(page_width-margin, y, Formatters.format_currency(pembayaran_data['jumlah_bayar']))
-            y -= 10
-            
-            kembalian = pembayaran_data['jumlah_bayar'] - float(transaksi_data['total'])
-            c.drawString(margin, y, "Kembali:")
-            c.drawRightString(page_width-margin, y, Formatters.format_currency(kembalian if kembalian >= 0 else 0))
-            y -= 12
-            
-            c.line(margin, y, page_width-margin, y)
-            y -= 10
-            
-            # Payment info
-            c.setFont("Helvetica", 7)
-            c.drawString(margin, y, f"Metode: {pembayaran_data['metode_bayar']}")
-            y -= 8
-            c.drawString(margin, y, f"Status: {pembayaran_data['status']}")
-            y -= 12
-            
-            # Footer
-            c.drawCentredString(page_width/2, y, "Terima Kasih")
-            y -= 8
-            c.drawCentredString(page_width/2, y, "Selamat Datang Kembali")
-            y -= 10
-            
-            print_time = datetime.now().strftime('%d/%m/%Y %H:%M')
-            c.setFont("Helvetica", 6)
-            c.drawCentredString(page_width/2, y, f"Print: {print_time}")
-            
-            # Save
-            c.save()
-            
-            logger.info(f"✅ PDF thermal struk berhasil dibuat: {filepath}")
-            return str(filepath)
-            
+            template = ReceiptTemplate.get(f'thermal_{paper_mm}')
+            return template.render_bytes(transaksi_data, detail_items, pembayaran_data)
         except Exception as e:
             logger.error(f"❌ Error generating thermal PDF: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+class PDFWriteBehind:
+    """
+    Penyimpanan PDF async (write-behind)
+    
+    Struk di-render ke memori lalu langsung dipakai (preview/print);
+    penulisan ke disk diantrikan ke satu writer thread, sehingga latency
+    struk tidak termasuk disk I/O. Antrian di-flush saat aplikasi exit.
+    """
+    
+    _executor = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-writer")
+                atexit.register(cls.shutdown)
+            return cls._executor
+    
+    @classmethod
+    def submit(cls, pdf_bytes: bytes, filename: str, directory=None) -> Future:
+        """
+        Antrikan penyimpanan PDF
+        
+        Args:
+            directory: Folder tujuan (default Settings.REPORTS_PDF_DIR)
+        
+        Returns:
+            Future yang menghasilkan path file (str)
+        """
+        return cls._get_executor().submit(cls._write, pdf_bytes, filename, directory)
+    
+    @staticmethod
+    def _write(pdf_bytes: bytes, filename: str, directory=None) -> str:
+        try:
+            filepath = PDFGenerator.save(pdf_bytes, filename, directory)
+            logger.info(f"✅ PDF disimpan: {filepath}")
+            return filepath
+        except Exception as e:
+            logger.error(f"❌ Error menyimpan PDF {filename}: {e}")
+            raise
+    
+    @classmethod
+    def archive(cls, pdf_bytes: bytes, fmt: str, transaksi_data, detail_items,
+                pembayaran_data) -> Future:
+        """
+        Antrikan penyimpanan ke arsip struk (ReceiptArchive)
+        
+        Returns:
+            Future yang menghasilkan (entry index, created)
+        """
+        return cls._get_executor().submit(
+            cls._archive, pdf_bytes, fmt, transaksi_data, detail_items, pembayaran_data
+        )
+    
+    @staticmethod
+    def _archive(pdf_bytes: bytes, fmt: str, transaksi_data, detail_items, pembayaran_data):
+        try:
+            return ReceiptArchive.default().store(
+                pdf_bytes, fmt, transaksi_data, detail_items, pembayaran_data
+            )
+        except Exception as e:
+            logger.error(f"❌ Error mengarsip struk {transaksi_data['id_transaksi']}: {e}")
+            raise
+    
+    @classmethod
+    def shutdown(cls):
+        """Tunggu semua penulisan selesai"""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,114 @@
+"""
+Picker pelanggan type-ahead untuk QComboBox dari generated UI
+
+Combo dijadikan editable dengan QCompleter; setiap ketikan mengambil
+maksimal LIMIT pelanggan dari ReferenceService.pelanggan_index(), jadi
+combo tidak pernah berisi seluruh data pelanggan.
+
+    self.pelanggan_picker = PelangganPicker(self.ui.cmbPelanggan)
+    id_pelanggan = self.pelanggan_picker.current_id()
+    self.pelanggan_picker.set_pelanggan(jadwal['id_pelanggan'])
+    self.pelanggan_picker.clear()
+"""
+from PyQt5.QtCore import QObject, Qt, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QComboBox, QCompleter
+from services.pelanggan_service import PelangganService
+from services.reference_service import ReferenceService
+from utils.pelanggan_index import PelangganIndex
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Jumlah saran di popup per ketikan
+LIMIT = 20
+
+
+class PelangganPicker(QObject):
+    """Pilih pelanggan dengan mengetik nama atau nomor HP"""
+
+    # id_pelanggan yang dipilih, None jika pilihan dihapus
+    selected = pyqtSignal(object)
+
+    def __init__(self, combo: QComboBox, limit: int = LIMIT):
+        super().__init__(combo)
+        self.combo = combo
+        self.limit = limit
+        self._selected: Optional[Dict] = None
+
+        combo.clear()
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.NoInsert)
+        self.line_edit = combo.lineEdit()
+        self.line_edit.setPlaceholderText("Ketik nama atau no HP pelanggan...")
+
+        # Model hanya berisi hasil pencarian terakhir, filter dilakukan index
+        self.model = QStandardItemModel(self)
+        self.completer = QCompleter(self.model, combo)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(10)
+        # Completer di line edit (bukan combo) agar combo tidak memetakan ke item-nya sendiri
+        self.line_edit.setCompleter(self.completer)
+
+        self.line_edit.textEdited.connect(self.on_text_edited)
+        self.line_edit.returnPressed.connect(self.on_return_pressed)
+        self.completer.activated[QModelIndex].connect(self.on_activated)
+
+        # Pelanggan yang berubah sejak index dibuat (view dibuka ulang)
+        ReferenceService.sync_pelanggan_index()
+
+    def on_pelanggan_changed(self, changes):
+        """Handler ChangeWatcher tabel pelanggan (sekali per polling): patch index"""
+        ReferenceService.sync_pelanggan_index()
+
+    def on_text_edited(self, text: str):
+        """Ketikan user: pilihan lama batal, isi saran dari index"""
+        if self._selected is not None:
+            self._selected = None
+            self.selected.emit(None)
+
+        try:
+            rows = ReferenceService.pelanggan_index().search(text, self.limit)
+        except Exception as e:
+            logger.error(f"Error search pelanggan: {e}")
+            rows = []
+
+        self.model.clear()
+        for row in rows:
+            item = QStandardItem(PelangganIndex.label(row))
+            item.setData(row['id_pelanggan'], Qt.UserRole)
+            self.model.appendRow(item)
+        if rows:
+            self.completer.complete()
+
+    def on_activated(self, index: QModelIndex):
+        self.set_pelanggan(index.data(Qt.UserRole))
+
+    def on_return_pressed(self):
+        """Enter tanpa memilih saran: pilih otomatis jika hanya ada satu yang cocok"""
+        if self._selected is None and self.model.rowCount() == 1:
+            self.set_pelanggan(self.model.item(0).data(Qt.UserRole))
+
+    def current_id(self) -> Optional[int]:
+        """id_pelanggan terpilih, None jika belum memilih dari saran"""
+        return self._selected['id_pelanggan'] if self._selected else None
+
+    def set_pelanggan(self, id_pelanggan) -> bool:
+        """Pilih pelanggan berdasarkan id (contoh: form edit)"""
+        row = ReferenceService.pelanggan_index().get(id_pelanggan)
+        if row is None:
+            # Belum masuk index (change feed belum di-poll): ambil langsung
+            row = PelangganService().get_by_id(id_pelanggan)
+        if row is None:
+            return False
+        self._selected = row
+        self.line_edit.setText(PelangganIndex.label(row))
+        self.selected.emit(row['id_pelanggan'])
+        return True
+
+    def clear(self):
+        """Kosongkan pilihan & teks"""
+        self._selected = None
+        self.model.clear()
+        self.line_edit.clear()
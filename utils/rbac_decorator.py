@@ -4,44 +4,38 @@ RBAC Decorator untuk proteksi akses
 from functools import wraps
 from PyQt5.QtWidgets import QMessageBox
 from utils.session_manager import SessionManager
+from utils.rbac_helper import RBACHelper
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def require_role(*allowed_roles):
+def require_permission(operation):
     """
-    Decorator untuk membatasi akses berdasarkan role
+    Decorator untuk membatasi akses berdasarkan permission matrix
     Compatible dengan PyQt5 signals
-    
+
     Usage:
-        @require_role('admin', 'kasir')
+        @require_permission(Permission.MANAGE_PELANGGAN)
         def some_function(self):
             pass
-    
+
     Args:
-        *allowed_roles: Variable number of role strings
-    
+        operation: Nama operasi (lihat config.constants.Permission)
+
     Returns:
         Decorator function
     """
     def decorator(func):
+        func_name = func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):  # ✅ PENTING: Terima semua args & kwargs
             # args[0] adalah self (instance)
             # args[1:] adalah parameter dari signal PyQt5 (checked, dll)
-            
+
             user = SessionManager.get_current_user()
-            
-            # Log access attempt
-            func_name = func.__name__
-            username = user.username if user else 'unknown'
-            user_role = user.role if user else 'N/A'
-            
-            logger.info(
-                f"Access attempt: {func_name} by {username} ({user_role})"
-            )
-            
+
             # Check if user is logged in
             if not user:
                 logger.warning(f"Unauthorized access to {func_name}")
@@ -51,30 +45,32 @@ def require_role(*allowed_roles):
                     "Anda harus login terlebih dahulu"
                 )
                 return None
-            
+
             # Check if user has required role
+            allowed_roles = RBACHelper.roles_for(operation)
             if user.role not in allowed_roles:
                 logger.warning(
-                    f"Permission denied: {username} ({user_role}) "
-                    f"tried to access {func_name} (requires: {allowed_roles})"
+                    f"Permission denied: {user.username} ({user.role}) "
+                    f"tried to access {func_name} (requires: {operation})"
                 )
-                
+
                 # Format role names untuk display
-                allowed_names = [role.replace('_', ' ').title() for role in allowed_roles]
-                
+                allowed_names = sorted(RBACHelper.get_role_name(role) for role in allowed_roles)
+
                 QMessageBox.warning(
                     None,
                     "Akses Ditolak",
                     f"Fitur ini hanya untuk: {', '.join(allowed_names)}\n\n"
-                    f"Role Anda: {user_role.replace('_', ' ').title()}"
+                    f"Role Anda: {RBACHelper.get_role_name(user.role)}"
                 )
                 return None
-            
-            # Access granted - call original function
-            logger.info(f"Access granted: {username} → {func_name}")
-            
+
+            # Access granted - hanya dicatat di level DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Access granted: {user.username} → {func_name}")
+
             # ✅ PENTING: Forward semua args & kwargs ke function asli
             return func(*args, **kwargs)
-        
+
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -1,50 +1,109 @@
 """
 RBAC Helper untuk validasi di service layer
 """
+from config.constants import Permission
 from utils.session_manager import SessionManager
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+_NO_ROLES = frozenset()
+
 
 class RBACHelper:
-    """Helper class untuk RBAC operations"""
-    
-    @staticmethod
-    def check_permission(allowed_roles: list, operation: str = "") -> bool:
+    """
+    Helper class untuk RBAC operations
+
+    Permission matrix (operasi -> frozenset role) dimuat sekali dari
+    Permission.DEFAULTS, lalu di-override oleh tabel role_permission jika
+    ada. Setelah dimuat, pengecekan hanya dict lookup + set membership.
+    """
+
+    _matrix = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def load_permissions(cls) -> dict:
+        """
+        Muat permission matrix (dipanggil saat startup, aman dipanggil ulang)
+
+        Returns:
+            dict: operasi -> frozenset role
+        """
+        matrix = dict(Permission.DEFAULTS)
+        try:
+            from config.database import Database
+            rows = Database.execute_query(
+                "SELECT operation, role FROM role_permission", fetch=True
+            )
+            overrides = {}
+            for row in rows:
+                overrides.setdefault(row['operation'], set()).add(row['role'])
+            for operation, roles in overrides.items():
+                matrix[operation] = frozenset(roles)
+            if overrides:
+                logger.info(f"✅ Permission matrix dari role_permission ({len(overrides)} operasi)")
+        except Exception as e:
+            # Tabel opsional (migrations/002_role_permission.sql)
+            logger.info(f"Permission matrix default dipakai: {e}")
+
+        with cls._lock:
+            cls._matrix = matrix
+        return matrix
+
+    @classmethod
+    def roles_for(cls, operation: str) -> frozenset:
+        """Get role yang diizinkan untuk operasi"""
+        matrix = cls._matrix
+        if matrix is None:
+            with cls._lock:
+                matrix = cls._matrix
+            if matrix is None:
+                matrix = cls.load_permissions()
+        return matrix.get(operation, _NO_ROLES)
+
+    @classmethod
+    def has_permission(cls, operation: str) -> bool:
+        """Cek izin user aktif tanpa logging (untuk enable/disable UI)"""
+        user = SessionManager.get_current_user()
+        return user is not None and user.role in cls.roles_for(operation)
+
+    @classmethod
+    def check_permission(cls, operation: str) -> bool:
         """
         Check if current user has permission
-        
+
         Args:
-            allowed_roles: List of allowed roles
-            operation: Operation name for logging
-            
+            operation: Nama operasi (lihat config.constants.Permission)
+
         Returns:
             bool: True if allowed, False otherwise
         """
         user = SessionManager.get_current_user()
-        
+
         if not user:
             logger.warning(f"Unauthorized access attempt to {operation}")
             return False
-        
-        if user.role not in allowed_roles:
+
+        if user.role not in cls.roles_for(operation):
             logger.warning(
                 f"Access denied for {user.username} ({user.role}) to {operation}"
             )
             return False
-        
-        logger.info(f"Permission granted: {user.username} → {operation}")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Permission granted: {user.username} → {operation}")
         return True
-    
+
     @staticmethod
     def get_role_name(role: str) -> str:
         """
         Get human-readable role name
-        
+
         Args:
             role: Role code (e.g., 'makeup_artist')
-            
+
         Returns:
             str: Human-readable name (e.g., 'Makeup Artist')
         """
@@ -54,4 +113,4 @@ class RBACHelper:
             'kasir': 'Kasir',
             'owner': 'Owner'
         }
-        return role_names.get(role, role.replace('_', ' ').title())
\ No newline at end of file
+        return role_names.get(role, role.replace('_', ' ').title())
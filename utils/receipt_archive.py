@@ -0,0 +1,249 @@
+"""
+Arsip struk PDF dengan dedupe berbasis isi
+
+Struk disimpan terkompresi (gzip) di folder per tanggal transaksi:
+
+    reports/archive/2025/10/16/<id_transaksi>_<id_pembayaran>_<hash>.pdf.gz
+    reports/archive/index.jsonl      # satu baris JSON per struk
+
+Key arsip = (id_transaksi, id_pembayaran, hash isi). Hash dihitung dari
+data struk (bukan bytes PDF yang selalu berisi waktu cetak), jadi cetak
+ulang struk yang sama tidak menambah file. Index dimuat sekali ke memori
+sehingga mencari struk satu transaksi tidak perlu scan folder.
+
+    archive = ReceiptArchive.default()
+    entry, created = archive.store(pdf_bytes, 'a4', transaksi, details, pembayaran)
+    entries = archive.find(id_transaksi)
+    pdf_bytes = archive.read(entries[-1])
+"""
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import gzip
+import hashlib
+import json
+import os
+import threading
+from config.settings import Settings
+from utils.money import Money
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.jsonl'
+
+# Panjang hash (hex) di nama file & index
+HASH_LENGTH = 16
+
+COMPRESS_LEVEL = 6
+
+
+class ReceiptArchive:
+    """Arsip struk terkompresi dengan index per transaksi"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root or Settings.RECEIPT_ARCHIVE_DIR)
+        self._lock = threading.Lock()
+        self._by_key: Optional[Dict[Tuple[int, int, str], Dict]] = None
+        self._by_transaksi: Dict[int, List[Dict]] = {}
+
+    @classmethod
+    def default(cls) -> 'ReceiptArchive':
+        """Arsip di Settings.RECEIPT_ARCHIVE_DIR (satu instance per proses)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    # ============================================
+    # Key
+    # ============================================
+
+    @staticmethod
+    def content_hash(fmt: str, transaksi_data, detail_items, pembayaran_data) -> str:
+        """Hash isi struk (tanpa waktu cetak), sama untuk cetak ulang yang identik"""
+        to_rupiah = Money.to_rupiah
+        content = [
+            fmt,
+            [transaksi_data['id_transaksi'], transaksi_data['tanggal_transaksi'],
+             transaksi_data['nama_pelanggan'], to_rupiah(transaksi_data['total'])],
+            [[item['nama_layanan'], item['jumlah'], to_rupiah(item['harga']),
+              to_rupiah(item['subtotal'])] for item in detail_items],
+            [pembayaran_data.get('id_pembayaran'), to_rupiah(pembayaran_data['jumlah_bayar']),
+             pembayaran_data['metode_bayar'], pembayaran_data['status'],
+             pembayaran_data.get('tanggal_bayar')],
+        ]
+        encoded = json.dumps(content, default=str, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+    # ============================================
+    # Store & lookup
+    # ============================================
+
+    def store(self, pdf_bytes: bytes, fmt: str, transaksi_data, detail_items,
+              pembayaran_data) -> Tuple[Dict, bool]:
+        """
+        Simpan struk ke arsip (dedupe)
+
+        Returns:
+            (entry index, True jika file baru ditulis / False jika sudah ada)
+        """
+        id_transaksi = transaksi_data['id_transaksi']
+        id_pembayaran = pembayaran_data.get('id_pembayaran') or 0
+        content_hash = self.content_hash(fmt, transaksi_data, detail_items, pembayaran_data)
+        key = (id_transaksi, id_pembayaran, content_hash)
+
+        with self._lock:
+            self._ensure_index()
+            entry = self._by_key.get(key)
+            if entry is not None and (self.root / entry['path']).exists():
+                return entry, False
+
+            relpath = self._shard(transaksi_data['tanggal_transaksi']) / (
+                f"{id_transaksi}_{id_pembayaran}_{content_hash}.pdf.gz"
+            )
+            compressed = gzip.compress(pdf_bytes, COMPRESS_LEVEL, mtime=0)
+            self._write_atomic(self.root / relpath, compressed)
+
+            entry = {
+                'id_transaksi': id_transaksi,
+                'id_pembayaran': id_pembayaran,
+                'hash': content_hash,
+                'format': fmt,
+                'path': relpath.as_posix(),
+                'size': len(pdf_bytes),
+                'stored_size': len(compressed),
+                'created': datetime.now().isoformat(timespec='seconds'),
+            }
+            with open(self.root / INDEX_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._add(entry)
+
+        logger.info(f"✅ Struk diarsip: {relpath} ({len(pdf_bytes)} -> {len(compressed)} bytes)")
+        return entry, True
+
+    def find(self, id_transaksi: int) -> List[Dict]:
+        """Semua struk satu transaksi (urut waktu arsip)"""
+        with self._lock:
+            self._ensure_index()
+            return list(self._by_transaksi.get(id_transaksi, ()))
+
+    def get(self, fmt: str, transaksi_data, detail_items, pembayaran_data) -> Optional[Dict]:
+        """Entry arsip untuk struk dengan isi persis sama, None jika belum ada"""
+        key = (transaksi_data['id_transaksi'], pembayaran_data.get('id_pembayaran') or 0,
+               self.content_hash(fmt, transaksi_data, detail_items, pembayaran_data))
+        with self._lock:
+            self._ensure_index()
+            entry = self._by_key.get(key)
+        if entry is not None and (self.root / entry['path']).exists():
+            return entry
+        return None
+
+    def load_index(self) -> int:
+        """
+        Muat index ke memori (preload saat startup)
+
+        Returns:
+            int: Jumlah struk di index, 0 jika gagal dibaca
+        """
+        try:
+            with self._lock:
+                self._ensure_index()
+                return len(self._by_key)
+        except OSError as e:
+            logger.error(f"❌ Error memuat index arsip struk: {e}")
+            return 0
+
+    def read(self, entry: Dict) -> bytes:
+        """Bytes PDF (sudah didekompresi)"""
+        with open(self.root / entry['path'], 'rb') as f:
+            return gzip.decompress(f.read())
+
+    def rebuild_index(self) -> int:
+        """
+        Bangun ulang index dari file di folder shard (jika index hilang/rusak)
+
+        Returns:
+            int: Jumlah struk ter-index
+        """
+        entries = []
+        for path in sorted(self.root.glob('*/*/*/*.pdf.gz')):
+            id_transaksi, id_pembayaran, content_hash = path.name[:-len('.pdf.gz')].split('_')
+            stat = path.stat()
+            entries.append({
+                'id_transaksi': int(id_transaksi),
+                'id_pembayaran': int(id_pembayaran),
+                'hash': content_hash,
+                'format': None,
+                'path': path.relative_to(self.root).as_posix(),
+                'size': None,
+                'stored_size': stat.st_size,
+                'created': datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='seconds'),
+            })
+        entries.sort(key=lambda entry: entry['created'])
+
+        with self._lock:
+            self._write_atomic(
+                self.root / INDEX_FILE,
+                ''.join(json.dumps(entry) + '\n' for entry in entries).encode('utf-8')
+            )
+            self._by_key = {}
+            self._by_transaksi = {}
+            for entry in entries:
+                self._add(entry)
+        logger.info(f"✅ Index arsip struk dibangun ulang: {len(entries)} struk")
+        return len(entries)
+
+    # ============================================
+    # Helpers
+    # ============================================
+
+    def _ensure_index(self):
+        """Muat index.jsonl sekali (dipanggil dengan _lock)"""
+        if self._by_key is not None:
+            return
+        self._by_key = {}
+        self._by_transaksi = {}
+        index_path = self.root / INDEX_FILE
+        if not index_path.exists():
+            return
+        with open(index_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._add(json.loads(line))
+                except ValueError:
+                    # Baris terakhir bisa terpotong jika aplikasi mati saat menulis
+                    logger.warning(f"Baris index arsip rusak dilewati: {line[:80]}")
+
+    def _add(self, entry: Dict):
+        key = (entry['id_transaksi'], entry['id_pembayaran'], entry['hash'])
+        entries = self._by_transaksi.setdefault(entry['id_transaksi'], [])
+        old = self._by_key.get(key)
+        if old is not None:
+            # File pernah hilang lalu diarsip ulang
+            entries.remove(old)
+        entries.append(entry)
+        self._by_key[key] = entry
+
+    @staticmethod
+    def _shard(tanggal) -> Path:
+        """Folder YYYY/MM/DD berdasarkan tanggal transaksi"""
+        if isinstance(tanggal, str):
+            tanggal = date.fromisoformat(tanggal[:10])
+        elif not isinstance(tanggal, date):
+            tanggal = date.today()
+        return Path(f"{tanggal:%Y}", f"{tanggal:%m}", f"{tanggal:%d}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,471 @@
+"""
+Template struk dengan region statis yang di-compile sekali
+
+Setiap format (A4, thermal 80mm, thermal 58mm) didefinisikan sebagai
+kumpulan Block. Bagian statis block (judul, label, garis, footer) di-compile
+menjadi form XObject sekali per dokumen PDF, lalu setiap struk cukup
+memanggil doForm + mengisi field variabel. Untuk batch (banyak struk dalam
+satu PDF) konten statis hanya tersimpan satu kali di file.
+
+Render dua tahap: measure() membungkus nama layanan yang panjang dan
+menghitung tinggi konten, lalu draw() menggambar. Format thermal memakai
+tinggi halaman persis setinggi konten (auto_height), bukan 297mm.
+
+    pdf_bytes = ReceiptTemplate.get('thermal_80').render_bytes(transaksi, details, pembayaran)
+"""
+from datetime import datetime
+from io import BytesIO
+from typing import Dict, List, Iterable, Tuple
+from utils.formatters import Formatters
+from utils.money import Money
+
+MM = 72 / 25.4  # reportlab.lib.units.mm, tanpa import reportlab di level modul
+
+# Batas tinggi halaman PDF (200 inch); struk lebih panjang dipecah ke halaman baru
+MAX_PAGE_HEIGHT = 14400
+
+LEFT, RIGHT, CENTER = 'left', 'right', 'center'
+
+
+class Block:
+    """
+    Region struk dengan origin di baseline teratas (y=0, menurun ke negatif)
+
+    Args:
+        height: Tinggi block (jarak ke block berikutnya)
+        static: List op statis, di-compile ke form XObject:
+            ('text', font, size, x, dy, text, align)
+            ('line', x1, dy, x2, line_width)
+        fields: List slot variabel, di-stamp per struk:
+            (key, font, size, x, dy, align)
+    """
+
+    __slots__ = ('height', 'static', 'fields')
+
+    def __init__(self, height: float, static: List[Tuple], fields: List[Tuple] = ()):
+        self.height = height
+        self.static = static
+        self.fields = list(fields)
+
+
+class ReceiptLayout:
+    """Definisi satu format struk"""
+
+    def __init__(self, name: str, page_size: Tuple[float, float], margin_top: float,
+                 margin_bottom: float, blocks: Dict[str, Block], item_style: str,
+                 item_font: Tuple[str, float], item_columns: Dict[str, Tuple[float, str]],
+                 item_height: float, item_line_height: float, item_name_width: float,
+                 min_y: float, auto_height: bool = False):
+        self.name = name
+        self.page_size = page_size
+        self.margin_top = margin_top
+        self.margin_bottom = margin_bottom
+        self.blocks = blocks
+        self.item_style = item_style          # 'table' (satu baris) atau 'stacked' (dua baris)
+        self.item_font = item_font
+        self.item_columns = item_columns      # kolom -> (x, align)
+        self.item_height = item_height        # tinggi item dengan nama satu baris
+        self.item_line_height = item_line_height  # tambahan per baris nama berikutnya
+        self.item_name_width = item_name_width    # lebar maksimal nama sebelum dibungkus (pt)
+        self.min_y = min_y                    # page break jika item berakhir di bawah ini
+        self.auto_height = auto_height        # tinggi halaman = tinggi konten
+
+
+def _a4_layout() -> ReceiptLayout:
+    width, height = 595.2755905511812, 841.8897637795277  # A4
+    right = width - 50
+    center = width / 2
+    return ReceiptLayout(
+        name='a4',
+        page_size=(width, height),
+        margin_top=40,
+        margin_bottom=40,
+        blocks={
+            'header': Block(135, [
+                ('text', 'Helvetica-Bold', 20, center, 0, "💄 MAKEUP APP", CENTER),
+                ('text', 'Helvetica', 12, center, -25, "Struk Pembayaran", CENTER),
+                ('line', 50, -55, right, 1),
+                ('text', 'Helvetica-Bold', 10, 50, -75, "INFORMASI TRANSAKSI", LEFT),
+                ('text', 'Helvetica', 10, 50, -90, "ID Transaksi:", LEFT),
+                ('text', 'Helvetica', 10, 50, -105, "Tanggal Transaksi:", LEFT),
+                ('text', 'Helvetica', 10, 50, -120, "Pelanggan:", LEFT),
+            ], [
+                ('id_transaksi', 'Helvetica', 10, right, -90, RIGHT),
+                ('tanggal', 'Helvetica', 10, right, -105, RIGHT),
+                ('pelanggan', 'Helvetica', 10, right, -120, RIGHT),
+            ]),
+            'id_pembayaran': Block(15, [
+                ('text', 'Helvetica', 10, 50, 0, "ID Pembayaran:", LEFT),
+            ], [
+                ('id_pembayaran', 'Helvetica', 10, right, 0, RIGHT),
+            ]),
+            'items_head': Block(80, [
+                ('line', 50, -10, right, 1),
+                ('text', 'Helvetica-Bold', 10, 50, -30, "DETAIL LAYANAN", LEFT),
+                ('text', 'Helvetica-Bold', 9, 50, -50, "Layanan", LEFT),
+                ('text', 'Helvetica-Bold', 9, 350, -50, "Qty", LEFT),
+                ('text', 'Helvetica-Bold', 9, 400, -50, "Harga", LEFT),
+                ('text', 'Helvetica-Bold', 9, right, -50, "Subtotal", RIGHT),
+                ('line', 50, -65, right, 1),
+            ]),
+            'summary': Block(225, [
+                ('line', 50, -5, right, 1),
+                ('text', 'Helvetica-Bold', 11, 350, -25, "Total Tagihan:", LEFT),
+                ('text', 'Helvetica-Bold', 11, 350, -45, "Jumlah Bayar:", LEFT),
+                ('text', 'Helvetica-Bold', 11, 350, -65, "Kembalian:", LEFT),
+                ('line', 50, -90, right, 2),
+                ('text', 'Helvetica', 10, 50, -110, "Metode Pembayaran:", LEFT),
+                ('text', 'Helvetica', 10, 50, -125, "Status Pembayaran:", LEFT),
+                ('text', 'Helvetica', 10, 50, -140, "Tanggal Pembayaran:", LEFT),
+                ('line', 50, -170, right, 1),
+                ('text', 'Helvetica-Bold', 11, center, -190, "Terima Kasih", CENTER),
+                ('text', 'Helvetica', 10, center, -205, "Selamat Datang Kembali", CENTER),
+            ], [
+                ('total', 'Helvetica-Bold', 11, right, -25, RIGHT),
+                ('bayar', 'Helvetica-Bold', 11, right, -45, RIGHT),
+                ('kembalian', 'Helvetica-Bold', 11, right, -65, RIGHT),
+                ('metode', 'Helvetica', 10, right, -110, RIGHT),
+                ('status', 'Helvetica', 10, right, -125, RIGHT),
+                ('tanggal_bayar', 'Helvetica', 10, right, -140, RIGHT),
+                ('dicetak', 'Helvetica', 8, center, -225, CENTER),
+            ]),
+        },
+        item_style='table',
+        item_font=('Helvetica', 9),
+        item_columns={'nama': (50, LEFT), 'jumlah': (350, LEFT),
+                      'harga': (400, LEFT), 'subtotal': (right, RIGHT)},
+        item_height=15,
+        item_line_height=11,
+        item_name_width=290,
+        min_y=85,
+    )
+
+
+def _thermal_layout(name: str, paper_mm: float) -> ReceiptLayout:
+    # Tinggi 297mm hanya default; halaman sebenarnya setinggi konten (auto_height)
+    width, height = paper_mm * MM, 297 * MM
+    margin = 5
+    right = width - margin
+    center = width / 2
+    # Label info & payment dicetak satu baris dengan nilainya ("ID Trans : 12"),
+    # posisi x nilai = margin + lebar label (dihitung saat compile)
+    return ReceiptLayout(
+        name=name,
+        page_size=(width, height),
+        margin_top=10,
+        margin_bottom=10,
+        blocks={
+            'header': Block(68, [
+                ('text', 'Helvetica-Bold', 12, center, 0, "MAKEUP APP", CENTER),
+                ('text', 'Helvetica', 8, center, -12, "Struk Pembayaran", CENTER),
+                ('line', margin, -22, right, 1),
+                ('text', 'Helvetica', 7, margin, -32, "ID Trans : ", LEFT),
+                ('text', 'Helvetica', 7, margin, -40, "Tanggal  : ", LEFT),
+                ('text', 'Helvetica', 7, margin, -48, "Pelanggan: ", LEFT),
+                ('line', margin, -58, right, 1),
+            ], [
+                ('id_transaksi', 'Helvetica', 7, (margin, "ID Trans : "), -32, LEFT),
+                ('tanggal', 'Helvetica', 7, (margin, "Tanggal  : "), -40, LEFT),
+                ('pelanggan', 'Helvetica', 7, (margin, "Pelanggan: "), -48, LEFT),
+            ]),
+            'id_pembayaran': Block(0, []),
+            'items_head': Block(0, []),
+            'summary': Block(90, [
+                ('line', margin, 0, right, 1),
+                ('text', 'Helvetica-Bold', 8, margin, -10, "Total:", LEFT),
+                ('text', 'Helvetica-Bold', 8, margin, -20, "Bayar:", LEFT),
+                ('text', 'Helvetica-Bold', 8, margin, -30, "Kembali:", LEFT),
+                ('line', margin, -42, right, 1),
+                ('text', 'Helvetica', 7, margin, -52, "Metode: ", LEFT),
+                ('text', 'Helvetica', 7, margin, -60, "Status: ", LEFT),
+                ('text', 'Helvetica', 7, center, -72, "Terima Kasih", CENTER),
+                ('text', 'Helvetica', 7, center, -80, "Selamat Datang Kembali", CENTER),
+            ], [
+                ('total', 'Helvetica-Bold', 8, right, -10, RIGHT),
+                ('bayar', 'Helvetica-Bold', 8, right, -20, RIGHT),
+                ('kembalian', 'Helvetica-Bold', 8, right, -30, RIGHT),
+                ('metode', 'Helvetica', 7, (margin, "Metode: "), -52, LEFT),
+                ('status', 'Helvetica', 7, (margin, "Status: "), -60, LEFT),
+                ('print', 'Helvetica', 6, center, -90, CENTER),
+            ]),
+        },
+        item_style='stacked',
+        item_font=('Helvetica', 7),
+        item_columns={'nama': (margin, LEFT), 'detail': (margin + 5, LEFT),
+                      'subtotal': (right, RIGHT)},
+        item_height=18,
+        item_line_height=8,
+        item_name_width=width - 2 * margin,
+        min_y=10,
+        auto_height=True,
+    )
+
+
+class ReceiptTemplate:
+    """
+    Renderer struk berbasis layout
+
+    Instance di-cache per format (get), geometri dihitung sekali. Form
+    XObject di-compile sekali per canvas, dipakai ulang untuk semua
+    struk/halaman di canvas tersebut.
+    """
+
+    FORMATS = ('a4', 'thermal_80', 'thermal_58')
+
+    _instances: Dict[str, 'ReceiptTemplate'] = {}
+
+    def __init__(self, layout: ReceiptLayout, use_forms: bool = True):
+        """
+        Args:
+            layout: Definisi format
+            use_forms: False untuk selalu menggambar region statis langsung
+                (tanpa form XObject, dipakai sebagai pembanding di benchmark)
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        self.layout = layout
+        self.use_forms = use_forms
+        self._wrapped: Dict[str, List[str]] = {}  # nama layanan -> baris (nama sangat berulang)
+        # Resolve x field yang bergantung lebar label: (margin, label) -> angka
+        for block in layout.blocks.values():
+            block.fields = [
+                (key, font, size,
+                 x[0] + stringWidth(x[1], font, size) if isinstance(x, tuple) else x,
+                 dy, align)
+                for key, font, size, x, dy, align in block.fields
+            ]
+
+    @classmethod
+    def get(cls, fmt: str) -> 'ReceiptTemplate':
+        """Get template (di-compile sekali per proses)"""
+        template = cls._instances.get(fmt)
+        if template is None:
+            template = cls._instances[fmt] = cls(cls.build_layout(fmt))
+        return template
+
+    @staticmethod
+    def build_layout(fmt: str) -> ReceiptLayout:
+        """Buat layout untuk format 'a4', 'thermal_80' atau 'thermal_58'"""
+        if fmt == 'a4':
+            return _a4_layout()
+        if fmt == 'thermal_80':
+            return _thermal_layout('thermal_80', 80)
+        if fmt == 'thermal_58':
+            return _thermal_layout('thermal_58', 58)
+        raise ValueError(f"Format struk tidak dikenal: {fmt}")
+
+    # ============================================
+    # Render
+    # ============================================
+
+    def new_canvas(self, output):
+        """Canvas baru dengan ukuran halaman format ini"""
+        from reportlab.pdfgen import canvas
+        return canvas.Canvas(output, pagesize=self.layout.page_size)
+
+    def render_bytes(self, transaksi_data, detail_items, pembayaran_data) -> bytes:
+        """Render satu struk ke bytes PDF"""
+        buffer = BytesIO()
+        c = self.new_canvas(buffer)
+        self.draw(c, transaksi_data, detail_items, pembayaran_data)
+        c.save()
+        return buffer.getvalue()
+
+    def render_many(self, receipts: Iterable[Tuple[Dict, List[Dict], Dict]]) -> bytes:
+        """
+        Render banyak struk ke satu PDF (satu struk per halaman)
+
+        Args:
+            receipts: Iterable of (transaksi_data, detail_items, pembayaran_data)
+        """
+        buffer = BytesIO()
+        c = self.new_canvas(buffer)
+        for transaksi_data, detail_items, pembayaran_data in receipts:
+            self.draw(c, transaksi_data, detail_items, pembayaran_data)
+        c.save()
+        return buffer.getvalue()
+
+    def draw(self, c, transaksi_data, detail_items, pembayaran_data, use_forms: bool = None):
+        """
+        Gambar satu struk di canvas, diakhiri showPage
+
+        Args:
+            use_forms: Pakai form XObject (default self.use_forms)
+        """
+        layout = self.layout
+        if self.use_forms if use_forms is None else use_forms:
+            self.compile(c)
+
+        values = self.values(transaksi_data, pembayaran_data)
+        rows, content_height = self.measure(detail_items, values)
+        page_height = layout.page_size[1]
+        if layout.auto_height:
+            page_height = min(layout.margin_top + content_height + layout.margin_bottom,
+                              MAX_PAGE_HEIGHT)
+            c.setPageSize((layout.page_size[0], page_height))
+        top = page_height - layout.margin_top
+        y = top
+
+        y = self._place(c, 'header', y, values)
+        if values.get('id_pembayaran'):
+            y = self._place(c, 'id_pembayaran', y, values)
+        y = self._place(c, 'items_head', y, values)
+
+        y = self._draw_items(c, rows, y, top)
+        if y - layout.blocks['summary'].height < layout.margin_bottom:
+            c.showPage()
+            y = top
+        self._place(c, 'summary', y, values)
+        c.showPage()
+
+    def measure(self, detail_items, values) -> Tuple[List[Tuple[Dict, List[str]]], float]:
+        """
+        Tahap 1: bungkus nama layanan & hitung tinggi konten
+
+        Returns:
+            (list of (item, baris nama), tinggi konten dalam pt)
+        """
+        blocks = self.layout.blocks
+        rows = [(item, self._wrap(item['nama_layanan'])) for item in detail_items]
+        height = (blocks['header'].height + blocks['items_head'].height
+                  + blocks['summary'].height)
+        if values.get('id_pembayaran'):
+            height += blocks['id_pembayaran'].height
+        height += sum(self._item_height(lines) for _, lines in rows)
+        return rows, height
+
+    def page_height(self, transaksi_data, detail_items, pembayaran_data) -> float:
+        """Tinggi halaman struk (pt), sama dengan hasil draw()"""
+        layout = self.layout
+        if not layout.auto_height:
+            return layout.page_size[1]
+        _, content_height = self.measure(detail_items, self.values(transaksi_data, pembayaran_data))
+        return min(layout.margin_top + content_height + layout.margin_bottom, MAX_PAGE_HEIGHT)
+
+    def compile(self, c):
+        """Compile region statis ke form XObject (sekali per canvas)"""
+        compiled = getattr(c, '_receipt_forms', None)
+        if compiled is None:
+            compiled = c._receipt_forms = set()
+        if self.layout.name in compiled:
+            return
+
+        width = self.layout.page_size[0]
+        for block_name, block in self.layout.blocks.items():
+            if not block.static:
+                continue
+            c.beginForm(self._form_name(block_name),
+                        lowerx=0, lowery=-(block.height + 20), upperx=width, uppery=30)
+            self._draw_static(c, block, 0)
+            c.endForm()
+        compiled.add(self.layout.name)
+
+    @staticmethod
+    def values(transaksi_data, pembayaran_data) -> Dict[str, str]:
+        """Nilai variabel struk (sudah diformat, dipakai juga oleh utils.escpos)"""
+        kembalian = Money.change(pembayaran_data['jumlah_bayar'], transaksi_data['total'])
+        now = datetime.now()
+        return {
+            'id_transaksi': str(transaksi_data['id_transaksi']),
+            'tanggal': Formatters.format_date(transaksi_data['tanggal_transaksi']),
+            'pelanggan': transaksi_data['nama_pelanggan'],
+            'id_pembayaran': str(pembayaran_data['id_pembayaran']) if pembayaran_data.get('id_pembayaran') else '',
+            'total': Formatters.format_currency(transaksi_data['total']),
+            'bayar': Formatters.format_currency(pembayaran_data['jumlah_bayar']),
+            'kembalian': Formatters.format_currency(kembalian if kembalian >= 0 else 0),
+            'metode': pembayaran_data['metode_bayar'],
+            'status': pembayaran_data['status'],
+            'tanggal_bayar': Formatters.format_date(pembayaran_data.get('tanggal_bayar') or now.date()),
+            'dicetak': f"Dicetak: {now.strftime('%d/%m/%Y %H:%M:%S')}",
+            'print': f"Print: {now.strftime('%d/%m/%Y %H:%M')}",
+        }
+
+    # ============================================
+    # Helpers
+    # ============================================
+
+    def _form_name(self, block_name: str) -> str:
+        return f"receipt_{self.layout.name}_{block_name}"
+
+    def _place(self, c, block_name: str, y: float, values: Dict[str, str]) -> float:
+        """Gambar form block di posisi y, stamp field-nya, return y berikutnya"""
+        block = self.layout.blocks[block_name]
+        if block.static:
+            if self.layout.name in getattr(c, '_receipt_forms', ()):
+                c.saveState()
+                c.translate(0, y)
+                c.doForm(self._form_name(block_name))
+                c.restoreState()
+            else:
+                self._draw_static(c, block, y)
+        for key, font, size, x, dy, align in block.fields:
+            c.setFont(font, size)
+            self._draw_text(c, x, y + dy, values[key], align)
+        return y - block.height
+
+    def _draw_items(self, c, rows, y: float, top: float) -> float:
+        """Tahap 2: gambar item hasil measure(), page break jika tidak muat"""
+        layout = self.layout
+        columns = layout.item_columns
+        font, size = layout.item_font
+        line_height = layout.item_line_height
+        c.setFont(font, size)
+
+        for item, lines in rows:
+            if y - self._item_height(lines) < layout.min_y:
+                c.showPage()
+                y = top
+                c.setFont(font, size)
+
+            harga = Formatters.format_currency(item['harga'])
+            subtotal = Formatters.format_currency(item['subtotal'])
+
+            x = columns['nama'][0]
+            for i, line in enumerate(lines):
+                c.drawString(x, y - i * line_height, line)
+
+            if layout.item_style == 'table':
+                c.drawString(columns['jumlah'][0], y, str(item['jumlah']))
+                c.drawString(columns['harga'][0], y, harga)
+                c.drawRightString(columns['subtotal'][0], y, subtotal)
+            else:
+                detail_y = y - len(lines) * line_height
+                c.drawString(columns['detail'][0], detail_y, f"{item['jumlah']}x {harga}")
+                c.drawRightString(columns['subtotal'][0], detail_y, subtotal)
+            y -= self._item_height(lines)
+        return y
+
+    def _item_height(self, lines: List[str]) -> float:
+        return self.layout.item_height + (len(lines) - 1) * self.layout.item_line_height
+
+    def _wrap(self, nama: str) -> List[str]:
+        """Bungkus nama layanan sesuai lebar kolom (di-cache per nama)"""
+        lines = self._wrapped.get(nama)
+        if lines is None:
+            from reportlab.lib.utils import simpleSplit
+            font, size = self.layout.item_font
+            lines = simpleSplit(nama, font, size, self.layout.item_name_width) or ['']
+            self._wrapped[nama] = lines
+        return lines
+
+    def _draw_static(self, c, block: Block, y: float):
+        """Gambar op statis block dengan baseline di y"""
+        for op in block.static:
+            if op[0] == 'text':
+                _, font, size, x, dy, text, align = op
+                c.setFont(font, size)
+                self._draw_text(c, x, y + dy, text, align)
+            else:
+                _, x1, dy, x2, line_width = op
+                c.setLineWidth(line_width)
+                c.line(x1, y + dy, x2, y + dy)
+        c.setLineWidth(1)
+
+    @staticmethod
+    def _draw_text(c, x: float, y: float, text: str, align: str):
+        if align == RIGHT:
+            c.drawRightString(x, y, text)
+        elif align == CENTER:
+            c.drawCentredString(x, y, text)
+        else:
+            c.drawString(x, y, text)
@@ -0,0 +1,94 @@
+"""
+Cache data referensi di disk (cold start tanpa download ulang)
+
+Satu file JSON per tabel di Settings.REFERENCE_CACHE_DIR:
+
+    data/reference_cache/layanan.json
+    {"server": "mysql://localhost:3306/db_jasa_makeup", "version": "12:40:41", "rows": [...]}
+
+version adalah stamp dari server (services.reference_service.ReferenceService
+.check_versions); isi file hanya dipakai jika stamp-nya sama dengan stamp
+server saat ini, atau saat server tidak terjangkau (mode offline).
+
+    cache = ReferenceCache.default()
+    rows = cache.read('layanan', version)
+    cache.write('layanan', version, rows)
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+import threading
+from config.settings import Settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def server_id() -> str:
+    """Identitas database aktif, cache database lain tidak dipakai"""
+    if Settings.DB_BACKEND == 'sqlite':
+        return f"sqlite://{Path(Settings.DB_SQLITE_PATH).resolve()}"
+    return f"{Settings.DB_BACKEND}://{Settings.DB_HOST}:{Settings.DB_PORT}/{Settings.DB_NAME}"
+
+
+class ReferenceCache:
+    """File cache per tabel dengan version stamp"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root or Settings.REFERENCE_CACHE_DIR)
+
+    @classmethod
+    def default(cls) -> 'ReferenceCache':
+        """Cache di Settings.REFERENCE_CACHE_DIR (satu instance per proses)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _path(self, table_name: str) -> Path:
+        return self.root / f"{table_name}.json"
+
+    def read(self, table_name: str, version: Optional[str]) -> Optional[List[Dict]]:
+        """
+        Baca isi cache satu tabel
+
+        Args:
+            version: Stamp server saat ini, None jika server tidak terjangkau
+                     (cache terakhir dipakai apa adanya)
+
+        Returns:
+            list: Baris tabel, None jika tidak ada cache yang cocok
+        """
+        path = self._path(table_name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache referensi {table_name} tidak bisa dibaca: {e}")
+            return None
+
+        if cached.get('server') != server_id():
+            return None
+        if version is not None and cached.get('version') != version:
+            return None
+        return cached.get('rows')
+
+    def write(self, table_name: str, version: str, rows: List[Dict]):
+        """Simpan isi tabel (atomic replace, pembaca tidak melihat file setengah jadi)"""
+        path = self._path(table_name)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'server': server_id(), 'version': version, 'rows': rows}, f,
+                          default=str, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Gagal menyimpan cache referensi {table_name}: {e}")
+            tmp.unlink(missing_ok=True)
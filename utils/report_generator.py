@@ -0,0 +1,275 @@
+"""
+PDF laporan periode (bulanan / custom) dengan reportlab platypus
+
+Tabel panjang memakai StreamedTable: baris diambil dari iterator
+(cursor fetchmany di services.report_service) hanya sebanyak yang muat
+di satu halaman, jadi laporan 12 bulan tidak pernah menampung seluruh
+data di memori.
+
+    path = ReportGenerator.generate_period_report(date(2025, 1, 1), date(2025, 12, 31))
+"""
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Sequence
+from config.settings import Settings
+from utils.formatters import Formatters
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tinggi baris tabel (pt), tetap agar kapasitas per halaman bisa dihitung
+ROW_HEIGHT = 14
+
+FONT = 'Helvetica'
+FONT_BOLD = 'Helvetica-Bold'
+FONT_SIZE = 8
+
+_END = object()
+
+
+def _table_style():
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    return TableStyle([
+        ('FONT', (0, 0), (-1, -1), FONT, FONT_SIZE),
+        ('FONT', (0, 0), (-1, 0), FONT_BOLD, FONT_SIZE),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3E5F5')),
+        ('LINEBELOW', (0, 0), (-1, 0), 0.75, colors.HexColor('#7B1FA2')),
+        ('LINEBELOW', (0, 1), (-1, -1), 0.25, colors.lightgrey),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+
+
+def _make_streamed_table():
+    """Definisi StreamedTable (butuh reportlab, di-import saat laporan dibuat)"""
+    from reportlab.platypus import Flowable, Table
+
+    class StreamedTable(Flowable):
+        """
+        Tabel dengan baris dari iterator, diisi per halaman
+
+        wrap() mengambil baris secukupnya untuk sisa halaman (+1 untuk
+        mendeteksi apakah masih ada lanjutan); jika tidak muat, split()
+        mengembalikan tabel satu halaman + dirinya sendiri untuk halaman
+        berikutnya. Header diulang di setiap halaman.
+        """
+
+        def __init__(self, rows: Iterable, header: Sequence[str], to_cells: Callable[[Dict], List],
+                     col_widths: Sequence[float], aligns: Sequence[str], empty_text="Tidak ada data"):
+            super().__init__()
+            self._rows = iter(rows)
+            self._buffer = []
+            self._table = None
+            self.header = list(header)
+            self.to_cells = to_cells
+            self.col_widths = list(col_widths)
+            self.aligns = aligns
+            self.empty_text = empty_text
+            self.consumed = 0
+
+        def _fill(self, count: int):
+            to_cells = self.to_cells
+            while len(self._buffer) < count:
+                row = next(self._rows, _END)
+                if row is _END:
+                    break
+                self._buffer.append(to_cells(row))
+                self.consumed += 1
+
+        @staticmethod
+        def _capacity(avail_height: float) -> int:
+            # Satu baris untuk header
+            return int(avail_height // ROW_HEIGHT) - 1
+
+        def _make(self, rows: List[List]) -> Table:
+            if not self.consumed:
+                rows = [[self.empty_text] + [''] * (len(self.header) - 1)]
+            table = Table([self.header] + rows, colWidths=self.col_widths,
+                          rowHeights=ROW_HEIGHT, repeatRows=1)
+            style = _table_style()
+            for col, align in enumerate(self.aligns):
+                style.add('ALIGN', (col, 0), (col, -1), align)
+            table.setStyle(style)
+            return table
+
+        def wrap(self, avail_width, avail_height):
+            capacity = self._capacity(avail_height)
+            self._fill(capacity + 1)
+            if capacity >= 1 and len(self._buffer) <= capacity:
+                # Sisa baris muat di halaman ini
+                self._table = self._make(self._buffer)
+                return self._table.wrap(avail_width, avail_height)
+            self._table = None
+            return avail_width, avail_height + 1
+
+        def split(self, avail_width, avail_height):
+            capacity = self._capacity(avail_height)
+            if capacity < 1:
+                return []
+            self._fill(capacity + 1)
+            page, self._buffer = self._buffer[:capacity], self._buffer[capacity:]
+            table = self._make(page)
+            if not self._buffer:
+                return [table]
+            # Sisa baris lanjut di halaman berikutnya
+            self.__dict__.pop('_postponed', None)
+            return [table, self]
+
+        def draw(self):
+            self._table.drawOn(self.canv, 0, 0)
+
+    return StreamedTable
+
+
+class ReportGenerator:
+    """Generator untuk PDF laporan periode"""
+
+    @staticmethod
+    def default_filename(date_from: date, date_to: date) -> str:
+        return f"laporan_{date_from:%Y%m%d}_{date_to:%Y%m%d}.pdf"
+
+    @staticmethod
+    def generate_period_report(date_from: date, date_to: date, filename: str = None,
+                               include_transaksi: bool = False) -> str:
+        """
+        Generate laporan pendapatan & booking dari database
+
+        Args:
+            date_from: Tanggal awal
+            date_to: Tanggal akhir (inklusif)
+            filename: Nama file output (optional)
+            include_transaksi: Lampirkan daftar semua transaksi
+
+        Returns:
+            str: Path ke file PDF
+        """
+        data = ReportGenerator.period_data(date_from, date_to, include_transaksi)
+        Settings.REPORTS_PDF_DIR.mkdir(parents=True, exist_ok=True)
+        filepath = Settings.REPORTS_PDF_DIR / (filename or ReportGenerator.default_filename(date_from, date_to))
+        try:
+            ReportGenerator.build(str(filepath), date_from, date_to, data)
+        except Exception as e:
+            logger.error(f"❌ Error generating laporan: {e}")
+            raise
+        finally:
+            # Tutup iterator yang belum habis agar koneksi kembali ke pool
+            for value in data.values():
+                close = getattr(value, 'close', None)
+                if close:
+                    close()
+        logger.info(f"✅ PDF laporan berhasil dibuat: {filepath}")
+        return str(filepath)
+
+    @staticmethod
+    def period_data(date_from: date, date_to: date, include_transaksi: bool = False) -> Dict:
+        """Data laporan dari database (iterator per bagian) untuk build()"""
+        from services.report_service import ReportService
+
+        service = ReportService()
+        return {
+            'summary': service.get_summary(date_from, date_to),
+            'per_hari': service.iter_per_hari(date_from, date_to),
+            'per_layanan': service.iter_per_layanan(date_from, date_to),
+            'per_mua': service.iter_per_mua(date_from, date_to),
+            'per_metode': service.iter_per_metode(date_from, date_to),
+            'transaksi': service.iter_transaksi(date_from, date_to) if include_transaksi else None,
+        }
+
+    @staticmethod
+    def build(output, date_from: date, date_to: date, data: Dict):
+        """
+        Susun PDF laporan dari data (iterator per bagian)
+
+        Args:
+            output: Path file atau file-like object
+            data: Dict dengan key summary (dict), per_hari, per_layanan,
+                per_mua, per_metode (iterable of dict) dan transaksi
+                (iterable of dict atau None)
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import mm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+
+        StreamedTable = _make_streamed_table()
+        styles = getSampleStyleSheet()
+        title_style = ParagraphStyle('ReportTitle', parent=styles['Title'], fontSize=16)
+        heading_style = ParagraphStyle('ReportHeading', parent=styles['Heading2'], fontSize=11,
+                                       spaceBefore=10, spaceAfter=4)
+        period = f"{Formatters.format_date(date_from)} s/d {Formatters.format_date(date_to)}"
+        printed = datetime.now().strftime('%d/%m/%Y %H:%M')
+        currency = Formatters.format_currency
+        width = A4[0] - 30 * mm
+
+        def on_page(c, doc):
+            c.saveState()
+            c.setFont(FONT, 7)
+            c.drawString(15 * mm, 10 * mm, f"{Settings.APP_NAME} - Laporan {period}")
+            c.drawRightString(A4[0] - 15 * mm, 10 * mm, f"Halaman {doc.page} - Dicetak {printed}")
+            c.restoreState()
+
+        def section(title, rows, header, to_cells, ratios, aligns):
+            return [
+                Paragraph(title, heading_style),
+                StreamedTable(rows, header, to_cells, [width * r for r in ratios], aligns),
+            ]
+
+        summary = data['summary']
+        summary_table = Table([
+            ["Jumlah Transaksi", str(summary['jumlah_transaksi']),
+             "Pendapatan", currency(summary['pendapatan'])],
+            ["Jumlah Booking", str(summary['jumlah_booking']),
+             "Pembayaran Diterima", currency(summary['diterima'])],
+        ], colWidths=[width * 0.25] * 4, rowHeights=ROW_HEIGHT + 4)
+        summary_table.setStyle([
+            ('FONT', (0, 0), (-1, -1), FONT, 9),
+            ('FONT', (1, 0), (1, -1), FONT_BOLD, 9),
+            ('FONT', (3, 0), (3, -1), FONT_BOLD, 9),
+            ('BOX', (0, 0), (-1, -1), 0.5, '#7B1FA2'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        story = [
+            Paragraph("MAKEUP APP - Laporan Pendapatan & Booking", title_style),
+            Paragraph(f"Periode: {period}", styles['Normal']),
+            Spacer(1, 6 * mm),
+            summary_table,
+        ]
+        story += section(
+            "Pendapatan per Hari", data['per_hari'],
+            ["Tanggal", "Transaksi", "Booking", "Pendapatan"],
+            lambda r: [Formatters.format_date(r['tanggal']), r['transaksi'], r['booking'],
+                       currency(r['pendapatan'])],
+            (0.4, 0.15, 0.15, 0.3), ('LEFT', 'RIGHT', 'RIGHT', 'RIGHT'))
+        story += section(
+            "Per Layanan", data['per_layanan'],
+            ["Layanan", "Qty", "Transaksi", "Pendapatan"],
+            lambda r: [r['nama_layanan'][:60], r['qty'], r['transaksi'], currency(r['pendapatan'])],
+            (0.5, 0.1, 0.15, 0.25), ('LEFT', 'RIGHT', 'RIGHT', 'RIGHT'))
+        story += section(
+            "Per MUA", data['per_mua'],
+            ["MUA", "Booking", "Transaksi", "Pendapatan"],
+            lambda r: [r['nama_mua'][:50], r['booking'], r['transaksi'], currency(r['pendapatan'])],
+            (0.45, 0.15, 0.15, 0.25), ('LEFT', 'RIGHT', 'RIGHT', 'RIGHT'))
+        story += section(
+            "Per Metode Pembayaran", data['per_metode'],
+            ["Metode", "Jumlah Pembayaran", "Total Diterima"],
+            lambda r: [r['metode_bayar'], r['jumlah'], currency(r['total'])],
+            (0.45, 0.25, 0.3), ('LEFT', 'RIGHT', 'RIGHT'))
+
+        if data.get('transaksi') is not None:
+            story.append(PageBreak())
+            story += section(
+                "Daftar Transaksi", data['transaksi'],
+                ["Tanggal", "ID", "Pelanggan", "MUA", "Total"],
+                lambda r: [Formatters.format_date(r['tanggal_transaksi']), r['id_transaksi'],
+                           r['nama_pelanggan'][:40], (r['nama_mua'] or '-')[:30], currency(r['total'])],
+                (0.2, 0.1, 0.3, 0.2, 0.2), ('LEFT', 'RIGHT', 'LEFT', 'LEFT', 'RIGHT'))
+
+        doc = SimpleDocTemplate(
+            output, pagesize=A4, leftMargin=15 * mm, rightMargin=15 * mm,
+            topMargin=15 * mm, bottomMargin=18 * mm,
+            title=f"Laporan {period}", author=Settings.APP_NAME
+        )
+        doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
@@ -0,0 +1,125 @@
+"""
+Startup pipeline: inisialisasi aplikasi di background thread
+"""
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+from config.settings import Settings
+from config.database import Database
+from services.change_feed_service import ChangeFeedService
+from services.reference_service import ReferenceService
+from utils.rbac_helper import RBACHelper
+from utils.receipt_archive import ReceiptArchive
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StartupPipeline(QObject):
+    """
+    Jalankan langkah startup secara paralel tanpa memblokir GUI thread
+
+    Urutan:
+        ensure_directories  ||  preload_receipt_archive
+                            ||  pool_warmup -> reference_versions
+                                               -> (connection_check || prune_change_log
+                                                   || preload_* || preload_permissions)
+
+    Signal finished(success, message) di-emit ke GUI thread setelah
+    semua langkah selesai. Timeline tiap langkah dicatat ke log untuk
+    mengukur cold-start.
+    """
+
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, t0: float = None):
+        """
+        Args:
+            t0: time.perf_counter() saat proses mulai (default: sekarang)
+        """
+        super().__init__()
+        self.t0 = t0 if t0 is not None else time.perf_counter()
+        self.timeline = []  # List of (label, start_ms, end_ms)
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Mulai pipeline di background thread"""
+        threading.Thread(target=self._run, name="startup", daemon=True).start()
+
+    def mark(self, label: str):
+        """Catat event sesaat (contoh: login window tampil)"""
+        now = self._elapsed_ms()
+        with self._lock:
+            self.timeline.append((label, now, now))
+
+    def _run(self):
+        """Jalankan semua langkah startup"""
+        success = False
+        message = ""
+        try:
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="startup") as executor:
+                dirs = executor.submit(self._timed, 'ensure_directories', Settings.ensure_directories)
+                archive = executor.submit(
+                    self._timed, 'preload_receipt_archive', ReceiptArchive.default().load_index
+                )
+
+                # Pool dibuat sekali, semua koneksi dibuka di sini
+                if self._timed('pool_warmup', Database.initialize_pool):
+                    check = executor.submit(self._timed, 'connection_check', Database.test_connection)
+                    prune = executor.submit(self._timed, 'prune_change_log', ChangeFeedService.prune)
+                    # Satu query stamp semua tabel referensi, preload membaca disk jika sama
+                    self._timed('reference_versions', ReferenceService.check_versions)
+                    preloads = [
+                        executor.submit(self._timed, f'preload_{name}', ReferenceService.load, name)
+                        for name in ReferenceService.LOADERS if name != 'pelanggan'
+                    ]
+                    # Pelanggan dimuat sekaligus dengan index picker type-ahead
+                    preloads.append(
+                        executor.submit(self._timed, 'preload_pelanggan', ReferenceService.pelanggan_index)
+                    )
+                    preloads.append(
+                        executor.submit(self._timed, 'preload_permissions', RBACHelper.load_permissions)
+                    )
+                    success = check.result()
+                    for future in preloads:
+                        future.result()
+                    prune.result()
+
+                dirs.result()
+                archive.result()
+
+            if not success:
+                message = "Tidak dapat terhubung ke database"
+        except Exception as e:
+            logger.error(f"❌ Startup error: {e}")
+            success = False
+            message = str(e)
+
+        self.mark('startup_finished')
+        self.log_timeline()
+        self.finished.emit(success, message)
+
+    def _timed(self, label: str, func, *args):
+        """Jalankan func dan catat durasinya di timeline"""
+        start = self._elapsed_ms()
+        try:
+            return func(*args)
+        finally:
+            end = self._elapsed_ms()
+            with self._lock:
+                self.timeline.append((label, start, end))
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+    def log_timeline(self):
+        """Tulis timeline startup ke log"""
+        with self._lock:
+            entries = sorted(self.timeline, key=lambda entry: entry[1])
+
+        lines = [
+            f"  {start:8.1f} → {end:8.1f} ms  ({end - start:7.1f} ms)  {label}"
+            for label, start, end in entries
+        ]
+        logger.info("⏱️ Startup timeline:\n" + "\n".join(lines))
@@ -0,0 +1,119 @@
+"""
+Helper untuk patch baris QTableWidget secara incremental
+"""
+from bisect import bisect_left
+from PyQt5.QtCore import Qt
+
+# Role untuk menyimpan sort key di item kolom ID
+SORT_ROLE = Qt.UserRole + 1
+
+
+class TableRowIndex:
+    """
+    Index id -> baris pada QTableWidget
+
+    Setiap baris di-anchor ke item kolom 0 (kolom ID), sehingga baris
+    tetap bisa ditemukan walaupun ada insert/delete di atasnya.
+    Dipakai view untuk upsert/remove satu baris setelah create/update/delete
+    tanpa reload seluruh tabel.
+    """
+
+    def __init__(self, table, descending: bool = False):
+        """
+        Args:
+            table: QTableWidget yang di-index
+            descending: True jika urutan tabel DESC (data terbaru di atas)
+        """
+        self.table = table
+        self.descending = descending
+        self._anchors = {}
+
+    def clear(self):
+        """Reset index (panggil setiap kali tabel di-load ulang penuh)"""
+        self._anchors.clear()
+
+    def register(self, row_id, row: int, sort_key=None):
+        """Daftarkan baris yang sudah diisi saat full load"""
+        anchor = self.table.item(row, 0)
+        anchor.setData(SORT_ROLE, sort_key)
+        self._anchors[row_id] = anchor
+
+    def row_of(self, row_id) -> int:
+        """Get index baris untuk id, -1 jika tidak ada"""
+        anchor = self._anchors.get(row_id)
+        if anchor is None:
+            return -1
+        return self.table.row(anchor)
+
+    def upsert(self, row_id, fill, sort_key=None) -> int:
+        """
+        Insert atau update satu baris
+
+        Args:
+            row_id: Primary key data
+            fill: Callable(row) yang mengisi item & widget baris tersebut
+            sort_key: Key urutan; baris dipindah jika key berubah
+
+        Returns:
+            int: Index baris hasil upsert
+        """
+        row = self.row_of(row_id)
+        if row >= 0 and self._anchors[row_id].data(SORT_ROLE) != sort_key:
+            self.remove(row_id)
+            row = -1
+
+        if row < 0:
+            row = self._insert_position(sort_key)
+            self.table.insertRow(row)
+
+        fill(row)
+        self.register(row_id, row, sort_key)
+        return row
+
+    def remove(self, row_id) -> bool:
+        """Hapus baris untuk id, return False jika tidak ditemukan"""
+        row = self.row_of(row_id)
+        if row < 0:
+            return False
+        del self._anchors[row_id]
+        self.table.removeRow(row)
+        return True
+
+    def _insert_position(self, sort_key) -> int:
+        """Binary search posisi insert berdasarkan sort key"""
+        count = self.table.rowCount()
+        if sort_key is None:
+            return 0 if self.descending else count
+
+        keys = _SortKeyView(self.table, self.descending)
+        if self.descending:
+            return bisect_left(keys, _Desc(sort_key), 0, count)
+        return bisect_left(keys, sort_key, 0, count)
+
+
+class _Desc:
+    """Wrapper untuk membalik perbandingan pada urutan DESC"""
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+
+class _SortKeyView:
+    """Sequence lazy atas sort key baris, dibaca hanya saat bisect"""
+
+    def __init__(self, table, descending):
+        self.table = table
+        self.descending = descending
+
+    def __len__(self):
+        return self.table.rowCount()
+
+    def __getitem__(self, row):
+        anchor = self.table.item(row, 0)
+        key = anchor.data(SORT_ROLE) if anchor else None
+        return _Desc(key) if self.descending else key
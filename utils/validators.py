@@ -3,7 +3,7 @@ Input validation functions
 """
 import re
 from datetime import datetime, time, date
-from typing import Tuple
+from typing import Tuple, Optional
 
 
 class Validators:
@@ -16,14 +16,39 @@ class Validators:
             return False, f"{field_name} wajib diisi"
         return True, ""
     
+    @staticmethod
+    def normalize_phone(phone: str) -> Optional[str]:
+        """
+        Normalisasi nomor HP Indonesia ke format E.164 (+628xxxxxxxxx)
+        Dipakai sebagai key unik pelanggan (kolom no_hp_e164)
+        
+        Returns:
+            String E.164, atau None jika nomor tidak valid
+        """
+        if not phone:
+            return None
+        phone = re.sub(r'[\s\-.()]', '', phone)
+        if phone.startswith('+'):
+            phone = phone[1:]
+        
+        if not phone.isdigit() or len(phone) < 10 or len(phone) > 13:
+            return None
+        if phone.startswith('08'):
+            return '+62' + phone[1:]
+        if phone.startswith('62'):
+            return '+' + phone
+        return None
+    
     @staticmethod
     def validate_phone(phone: str) -> Tuple[bool, str]:
         """
         Validasi nomor HP Indonesia
-        Format: 08xxxxxxxxxx atau 62xxxxxxxxxx
+        Format: 08xxxxxxxxxx, 62xxxxxxxxxx atau +62xxxxxxxxxx
         """
-        # Hapus spasi dan dash
-        phone = phone.replace(" ", "").replace("-", "")
+        # Hapus spasi, dash, titik, kurung & tanda +
+        phone = re.sub(r'[\s\-.()]', '', phone)
+        if phone.startswith('+'):
+            phone = phone[1:]
         
         # Cek apakah semua digit
         if not phone.isdigit():
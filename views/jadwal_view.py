@@ -4,16 +4,18 @@ Jadwal View dengan CRUD lengkap
 from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem, 
                              QPushButton, QHBoxLayout, QWidget, QApplication)
 from PyQt5.QtCore import Qt, QDate, QTime
-from ui.generated.ui_form_jadwal import Ui_MainWindow
 from services.jadwal_service import JadwalService
-from services.pelanggan_service import PelangganService
-from utils.rbac_decorator import require_role
+from services.reference_service import ReferenceService
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from services.auth_service import AuthService
 from utils.validators import Validators
 from utils.session_manager import SessionManager
 from utils.formatters import Formatters
-from config.constants import StatusJadwal
+from utils.table_helper import TableRowIndex
+from utils.pelanggan_picker import PelangganPicker
+from utils.change_watcher import ChangeWatcher
+from config.constants import StatusJadwal, Permission
 from datetime import date
 import logging
 
@@ -25,22 +27,31 @@ class JadwalView(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_form_jadwal import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
         # Services
         self.jadwal_service = JadwalService()
-        self.pelanggan_service = PelangganService()
+        self.reference_service = ReferenceService()
         
         # State
         self.current_mode = "create"  # "create" atau "update"
         self.current_id = None
+        self.row_index = TableRowIndex(self.ui.tableJadwal, descending=True)
+        self.pelanggan_picker = PelangganPicker(self.ui.cmbPelanggan)
         
         # Initialize
         self.init_ui()
         self.connect_signals()
+        self.change_watcher = ChangeWatcher(self, {
+            'jadwal': self.on_jadwal_changed,
+            'pelanggan': self.pelanggan_picker.on_pelanggan_changed,
+            'user': self.on_mua_changed
+        })
+        self.change_watcher.start()
         self.load_data()
-        self.load_pelanggan_combo()
         self.load_mua_combo()
     
     def init_ui(self):
@@ -54,8 +65,8 @@ class JadwalView(QMainWindow):
             self.ui.lblUsername.setText(
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
-            self.setup_rbac_ui(user.role)
-            self.setup_menu_visibility(user.role)
+            self.setup_rbac_ui()
+            self.setup_menu_visibility()
         
         # Setup calendar
         self.ui.calendarJadwal.setSelectedDate(QDate.currentDate())
@@ -89,38 +100,19 @@ class JadwalView(QMainWindow):
         self.ui.timeJamMulai.setTime(QTime(9, 0))
         self.ui.timeJamSelesai.setTime(QTime(10, 30))
     
-    def setup_rbac_ui(self, role):
-        """Setup UI based on user role"""
-        if role == 'owner':
+    def setup_rbac_ui(self):
+        """Form & tombol booking hanya untuk role dengan MANAGE_JADWAL (owner: read-only)"""
+        if not RBACHelper.has_permission(Permission.MANAGE_JADWAL):
             self.ui.btnBuatJadwal.setVisible(False)
             self.ui.groupFormBooking.setVisible(False)
     
-    def setup_menu_visibility(self, role):
-        """
-        Setup sidebar menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Dashboard dan Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Dashboard, Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only di-handle di setup_rbac_ui)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect signals"""
@@ -156,33 +148,12 @@ class JadwalView(QMainWindow):
             data = self.jadwal_service.get_all()
             
             self.ui.tableJadwal.setRowCount(0)
+            self.row_index.clear()
             
             for row_idx, item in enumerate(data):
                 self.ui.tableJadwal.insertRow(row_idx)
-                
-                # ID
-                self.ui.tableJadwal.setItem(row_idx, 0, self.create_item(item['id_jadwal']))
-                
-                # Tanggal
-                self.ui.tableJadwal.setItem(row_idx, 1, self.create_item(Formatters.format_date(item['tanggal_booking'])))
-                
-                # Jam Mulai
-                self.ui.tableJadwal.setItem(row_idx, 2, self.create_item(Formatters.format_time(item['jam_mulai'])))
-                
-                # Jam Selesai
-                self.ui.tableJadwal.setItem(row_idx, 3, self.create_item(Formatters.format_time(item['jam_selesai'])))
-                
-                # Pelanggan
-                self.ui.tableJadwal.setItem(row_idx, 4, self.create_item(item['nama_pelanggan']))
-                
-                # MUA
-                self.ui.tableJadwal.setItem(row_idx, 5, self.create_item(item['nama_mua']))
-                
-                # Status
-                self.ui.tableJadwal.setItem(row_idx, 6, self.create_item(item['status']))
-                
-                # Action buttons
-                self.add_action_buttons(row_idx, item['id_jadwal'])
+                self.fill_row(row_idx, item)
+                self.row_index.register(item['id_jadwal'], row_idx, self.sort_key(item))
             
             QApplication.restoreOverrideCursor()
             
@@ -191,6 +162,59 @@ class JadwalView(QMainWindow):
             logger.error(f"Error loading data: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat data")
     
+    def fill_row(self, row_idx, item):
+        """Isi satu baris tabel jadwal"""
+        # ID
+        self.ui.tableJadwal.setItem(row_idx, 0, self.create_item(item['id_jadwal']))
+        
+        # Tanggal
+        self.ui.tableJadwal.setItem(row_idx, 1, self.create_item(Formatters.format_date(item['tanggal_booking'])))
+        
+        # Jam Mulai
+        self.ui.tableJadwal.setItem(row_idx, 2, self.create_item(Formatters.format_time(item['jam_mulai'])))
+        
+        # Jam Selesai
+        self.ui.tableJadwal.setItem(row_idx, 3, self.create_item(Formatters.format_time(item['jam_selesai'])))
+        
+        # Pelanggan
+        self.ui.tableJadwal.setItem(row_idx, 4, self.create_item(item['nama_pelanggan']))
+        
+        # MUA
+        self.ui.tableJadwal.setItem(row_idx, 5, self.create_item(item['nama_mua']))
+        
+        # Status
+        self.ui.tableJadwal.setItem(row_idx, 6, self.create_item(item['status']))
+        
+        # Action buttons
+        self.add_action_buttons(row_idx, item['id_jadwal'])
+    
+    def upsert_row(self, item):
+        """Insert/update satu baris tanpa reload tabel"""
+        row = self.row_index.upsert(
+            item['id_jadwal'],
+            lambda row: self.fill_row(row, item),
+            self.sort_key(item)
+        )
+        
+        # Terapkan filter status yang aktif ke baris ini saja
+        status = self.ui.cmbFilterStatus.currentData()
+        self.ui.tableJadwal.setRowHidden(row, status is not None and item['status'] != status)
+    
+    def sort_key(self, item):
+        """Urutan tabel: tanggal_booking DESC, jam_mulai DESC (sama dengan get_all)"""
+        jam_mulai = item['jam_mulai']
+        # mysql.connector mengembalikan kolom TIME sebagai timedelta
+        if hasattr(jam_mulai, 'total_seconds'):
+            jam_mulai = int(jam_mulai.total_seconds())
+        else:
+            jam_mulai = str(jam_mulai)
+        return (str(item['tanggal_booking']), jam_mulai)
+    
+    def on_jadwal_changed(self, changes):
+        """Patch baris yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.jadwal_service.get_by_ids, 'id_jadwal',
+                            self.upsert_row, self.row_index.remove)
+    
     def filter_by_status(self):
         """Filter jadwal by status"""
         status = self.ui.cmbFilterStatus.currentData()
@@ -212,7 +236,7 @@ class JadwalView(QMainWindow):
         selected_date = self.ui.calendarJadwal.selectedDate()
         self.ui.dateTanggal.setDate(selected_date)
     
-    @require_role('admin', 'makeup_artist')
+    @require_permission(Permission.MANAGE_JADWAL)
     def show_form_create(self, checked=False):
         """Show form for create jadwal"""
         self.current_mode = "create"
@@ -222,13 +246,12 @@ class JadwalView(QMainWindow):
         self.ui.groupFormBooking.setTitle("📝 Form Booking Baru")
         self.ui.cmbPelanggan.setFocus()
     
-    @require_role('admin', 'makeup_artist')
+    @require_permission(Permission.MANAGE_JADWAL)
     def show_form_update(self, id_jadwal):
         """Show form for update jadwal"""
         try:
             # Get jadwal data
-            data = self.jadwal_service.get_all()
-            jadwal = next((item for item in data if item['id_jadwal'] == id_jadwal), None)
+            jadwal = self.jadwal_service.get_by_id(id_jadwal)
             
             if not jadwal:
                 QMessageBox.warning(self, "Error", "Data tidak ditemukan")
@@ -239,9 +262,7 @@ class JadwalView(QMainWindow):
             
             # Fill form
             # Set pelanggan
-            index = self.ui.cmbPelanggan.findData(jadwal['id_pelanggan'])
-            if index >= 0:
-                self.ui.cmbPelanggan.setCurrentIndex(index)
+            self.pelanggan_picker.set_pelanggan(jadwal['id_pelanggan'])
             
             # Set MUA
             index = self.ui.cmbMUA.findData(jadwal['id_user'])
@@ -274,11 +295,11 @@ class JadwalView(QMainWindow):
             logger.error(f"Error loading for update: {e}")
             QMessageBox.critical(self, "Error", f"Gagal memuat data: {str(e)}")
     
-    @require_role('admin', 'makeup_artist')
+    @require_permission(Permission.MANAGE_JADWAL)
     def save_jadwal(self, checked=False):
         """Save jadwal"""
         # Get data
-        id_pelanggan = self.ui.cmbPelanggan.currentData()
+        id_pelanggan = self.pelanggan_picker.current_id()
         id_mua = self.ui.cmbMUA.currentData()
         tanggal = self.ui.dateTanggal.date().toPyDate()
         jam_mulai = self.ui.timeJamMulai.time().toString('HH:mm:ss')
@@ -294,33 +315,25 @@ class JadwalView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
             if self.current_mode == "create":
-                query = """
-                    INSERT INTO jadwal (id_pelanggan, id_user, tanggal_booking, 
-                                       jam_mulai, jam_selesai, status) 
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """
-                Database.execute_query(query, (id_pelanggan, id_mua, tanggal, 
-                                              jam_mulai, jam_selesai, status))
-                message = "Jadwal berhasil dibuat"
+                success, message, row = self.jadwal_service.create(
+                    id_pelanggan, id_mua, tanggal, jam_mulai, jam_selesai, status
+                )
             else:
-                query = """
-                    UPDATE jadwal 
-                    SET id_pelanggan=%s, id_user=%s, tanggal_booking=%s, 
-                        jam_mulai=%s, jam_selesai=%s, status=%s 
-                    WHERE id_jadwal=%s
-                """
-                Database.execute_query(query, (id_pelanggan, id_mua, tanggal, 
-                                              jam_mulai, jam_selesai, status, 
-                                              self.current_id))
-                message = "Jadwal berhasil diupdate"
+                success, message, row = self.jadwal_service.update(
+                    self.current_id, id_pelanggan, id_mua, tanggal,
+                    jam_mulai, jam_selesai, status
+                )
             
             QApplication.restoreOverrideCursor()
             
+            if not success:
+                QMessageBox.warning(self, "Gagal", message)
+                return
+            
             QMessageBox.information(self, "Sukses", message)
-            self.load_data()
+            if row:
+                self.upsert_row(row)
             self.cancel_form()
             
         except Exception as e:
@@ -328,7 +341,7 @@ class JadwalView(QMainWindow):
             logger.error(f"Error saving: {e}")
             QMessageBox.critical(self, "Error", "Terjadi kesalahan sistem")
     
-    @require_role('admin', 'makeup_artist')
+    @require_permission(Permission.DELETE_JADWAL)
     def delete_jadwal(self, id_jadwal):
         """Delete jadwal"""
         reply = QMessageBox.question(
@@ -344,23 +357,16 @@ class JadwalView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
-            # Check if used in transaksi
-            check = "SELECT COUNT(*) as count FROM transaksi WHERE id_jadwal = %s"
-            result = Database.execute_query(check, (id_jadwal,), fetch=True)
-            if result[0]['count'] > 0:
-                QApplication.restoreOverrideCursor()
-                QMessageBox.warning(self, "Gagal", "Jadwal sudah digunakan dalam transaksi, tidak dapat dihapus")
-                return
-            
-            query = "DELETE FROM jadwal WHERE id_jadwal = %s"
-            Database.execute_query(query, (id_jadwal,))
+            success, message = self.jadwal_service.delete(id_jadwal)
             
             QApplication.restoreOverrideCursor()
             
-            QMessageBox.information(self, "Sukses", "Jadwal berhasil dihapus")
-            self.load_data()
+            if not success:
+                QMessageBox.warning(self, "Gagal", message)
+                return
+            
+            QMessageBox.information(self, "Sukses", message)
+            self.row_index.remove(id_jadwal)
             
         except Exception as e:
             QApplication.restoreOverrideCursor()
@@ -371,34 +377,10 @@ class JadwalView(QMainWindow):
     # Helper Methods
     # ============================================
     
-    def load_pelanggan_combo(self):
-        """Load pelanggan to combobox"""
-        try:
-            data = self.pelanggan_service.get_all()
-            
-            self.ui.cmbPelanggan.clear()
-            
-            for item in data:
-                self.ui.cmbPelanggan.addItem(
-                    f"{item['nama']} - {item['no_hp']}", 
-                    item['id_pelanggan']
-                )
-            
-        except Exception as e:
-            logger.error(f"Error loading pelanggan combo: {e}")
-    
     def load_mua_combo(self):
         """Load MUA (makeup artist) to combobox"""
         try:
-            from config.database import Database
-            
-            query = """
-                SELECT id_user, nama_user 
-                FROM user 
-                WHERE role = 'makeup_artist'
-                ORDER BY nama_user ASC
-            """
-            data = Database.execute_query(query, fetch=True)
+            data = self.reference_service.get_mua()
             
             self.ui.cmbMUA.clear()
             
@@ -408,6 +390,14 @@ class JadwalView(QMainWindow):
         except Exception as e:
             logger.error(f"Error loading MUA combo: {e}")
     
+    def on_mua_changed(self, changes):
+        """User diubah terminal lain: muat ulang combo MUA (cache sudah di-invalidate)"""
+        id_mua = self.ui.cmbMUA.currentData()
+        self.load_mua_combo()
+        index = self.ui.cmbMUA.findData(id_mua)
+        if index >= 0:
+            self.ui.cmbMUA.setCurrentIndex(index)
+    
     def validate_form(self, id_pelanggan, id_mua, tanggal, jam_mulai, jam_selesai):
         """Validate form"""
         # Pelanggan
@@ -446,15 +436,13 @@ class JadwalView(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         
-        user = SessionManager.get_current_user()
-        
-        if user and user.role in ['admin', 'makeup_artist']:
+        if RBACHelper.has_permission(Permission.MANAGE_JADWAL):
             btn_edit = QPushButton("✏️ Edit")
             # ... style ...
             btn_edit.clicked.connect(lambda: self.show_form_update(id_jadwal))
             layout.addWidget(btn_edit)
         
-        if user and user.role == 'admin':
+        if RBACHelper.has_permission(Permission.DELETE_JADWAL):
             btn_delete = QPushButton("🗑️ Hapus")
             # ... style ...
             btn_delete.clicked.connect(lambda: self.delete_jadwal(id_jadwal))
@@ -471,7 +459,7 @@ class JadwalView(QMainWindow):
     
     def clear_form(self):
         """Clear form"""
-        self.ui.cmbPelanggan.setCurrentIndex(0)
+        self.pelanggan_picker.clear()
         self.ui.cmbMUA.setCurrentIndex(0)
         self.ui.dateTanggal.setDate(QDate.currentDate())
         self.ui.timeJamMulai.setTime(QTime(9, 0))
@@ -5,14 +5,18 @@ from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem,
                              QPushButton, QHBoxLayout, QWidget, QApplication,
                              QInputDialog)
 from PyQt5.QtCore import Qt, QTime
-from ui.generated.ui_form_layanan import Ui_MainWindow
 from services.layanan_service import LayananService
-from utils.rbac_decorator import require_role
+from services.reference_service import ReferenceService
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from services.auth_service import AuthService
 from utils.validators import Validators
 from utils.session_manager import SessionManager
 from utils.formatters import Formatters
+from utils.money import Money
+from utils.table_helper import TableRowIndex
+from utils.change_watcher import ChangeWatcher
+from config.constants import Permission
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,20 +27,30 @@ class LayananView(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_form_layanan import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
         # Services
         self.layanan_service = LayananService()
+        self.reference_service = ReferenceService()
         
         # State
         self.current_mode = "create"  # "create" atau "update"
         self.current_id = None
         self.current_kategori_id = None
+        self.layanan_index = TableRowIndex(self.ui.tableLayanan)
+        self.kategori_index = TableRowIndex(self.ui.tableKategori)
         
         # Initialize
         self.init_ui()
         self.connect_signals()
+        self.change_watcher = ChangeWatcher(self, {
+            'layanan': self.on_layanan_changed,
+            'kategori_layanan': self.on_kategori_changed
+        })
+        self.change_watcher.start()
         self.load_data()
         self.load_kategori()
         self.load_kategori_combo()
@@ -53,8 +67,8 @@ class LayananView(QMainWindow):
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
             # Setup RBAC UI
-            self.setup_rbac_ui(user.role)
-            self.setup_menu_visibility(user.role)
+            self.setup_rbac_ui()
+            self.setup_menu_visibility()
             
         # Setup table layanan
         self.ui.tableLayanan.setColumnWidth(0, 50)   # ID
@@ -69,40 +83,21 @@ class LayananView(QMainWindow):
         self.ui.tableKategori.setColumnWidth(1, 400)  # Nama
         self.ui.tableKategori.setColumnWidth(2, 200)  # Aksi
     
-    def setup_rbac_ui(self, role):
-        """Setup UI based on user role"""
-        if role == 'owner':
-            # Owner: Read-only
+    def setup_rbac_ui(self):
+        """Form & tombol tambah hanya untuk role dengan MANAGE_LAYANAN/MANAGE_KATEGORI (owner: read-only)"""
+        if not RBACHelper.has_permission(Permission.MANAGE_LAYANAN):
             self.ui.btnTambahLayanan.setVisible(False)
-            self.ui.btnTambahKategori.setVisible(False)
             self.ui.groupFormLayanan.setVisible(False)
+        if not RBACHelper.has_permission(Permission.MANAGE_KATEGORI):
+            self.ui.btnTambahKategori.setVisible(False)
     
-    def setup_menu_visibility(self, role):
-        """
-        Setup sidebar menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Dashboard dan Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Dashboard, Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only di-handle di setup_rbac_ui)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect signals"""
@@ -141,27 +136,12 @@ class LayananView(QMainWindow):
             data = self.layanan_service.get_all()
             
             self.ui.tableLayanan.setRowCount(0)
+            self.layanan_index.clear()
             
             for row_idx, item in enumerate(data):
                 self.ui.tableLayanan.insertRow(row_idx)
-                
-                # ID
-                self.ui.tableLayanan.setItem(row_idx, 0, self.create_item(item['id_layanan']))
-                
-                # Nama Layanan
-                self.ui.tableLayanan.setItem(row_idx, 1, self.create_item(item['nama_layanan']))
-                
-                # Kategori
-                self.ui.tableLayanan.setItem(row_idx, 2, self.create_item(item['nama_kategori']))
-                
-                # Harga
-                self.ui.tableLayanan.setItem(row_idx, 3, self.create_item(Formatters.format_currency(item['harga'])))
-                
-                # Durasi
-                self.ui.tableLayanan.setItem(row_idx, 4, self.create_item(Formatters.format_time(item['durasi'])))
-                
-                # Action buttons
-                self.add_action_buttons_layanan(row_idx, item['id_layanan'])
+                self.fill_row_layanan(row_idx, item)
+                self.layanan_index.register(item['id_layanan'], row_idx, item['nama_layanan'].lower())
             
             QApplication.restoreOverrideCursor()
             
@@ -170,6 +150,39 @@ class LayananView(QMainWindow):
             logger.error(f"Error loading data: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat data")
     
+    def fill_row_layanan(self, row_idx, item):
+        """Isi satu baris tabel layanan"""
+        # ID
+        self.ui.tableLayanan.setItem(row_idx, 0, self.create_item(item['id_layanan']))
+        
+        # Nama Layanan
+        self.ui.tableLayanan.setItem(row_idx, 1, self.create_item(item['nama_layanan']))
+        
+        # Kategori
+        self.ui.tableLayanan.setItem(row_idx, 2, self.create_item(item['nama_kategori']))
+        
+        # Harga
+        self.ui.tableLayanan.setItem(row_idx, 3, self.create_item(Formatters.format_currency(item['harga'])))
+        
+        # Durasi
+        self.ui.tableLayanan.setItem(row_idx, 4, self.create_item(Formatters.format_time(item['durasi'])))
+        
+        # Action buttons
+        self.add_action_buttons_layanan(row_idx, item['id_layanan'])
+    
+    def upsert_row_layanan(self, item):
+        """Insert/update satu baris layanan tanpa reload tabel"""
+        self.layanan_index.upsert(
+            item['id_layanan'],
+            lambda row: self.fill_row_layanan(row, item),
+            item['nama_layanan'].lower()
+        )
+    
+    def on_layanan_changed(self, changes):
+        """Patch baris layanan yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.layanan_service.get_by_ids, 'id_layanan',
+                            self.upsert_row_layanan, self.layanan_index.remove)
+    
     def search_layanan(self):
         """Search layanan"""
         keyword = self.ui.txtSearchLayanan.text().strip().lower()
@@ -192,7 +205,7 @@ class LayananView(QMainWindow):
         except Exception as e:
             logger.error(f"Error searching: {e}")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_LAYANAN)
     def show_form_create(self, checked=False):
         """Show form for create layanan"""
         self.current_mode = "create"
@@ -202,13 +215,12 @@ class LayananView(QMainWindow):
         self.ui.groupFormLayanan.setTitle("📝 Form Tambah Layanan")
         self.ui.txtNamaLayanan.setFocus()
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_LAYANAN)
     def show_form_update(self, id_layanan):
         """Show form for update layanan"""
         try:
             # Get layanan data
-            data = self.layanan_service.get_all()
-            layanan = next((item for item in data if item['id_layanan'] == id_layanan), None)
+            layanan = self.layanan_service.get_by_id(id_layanan)
             
             if not layanan:
                 QMessageBox.warning(self, "Error", "Data tidak ditemukan")
@@ -226,7 +238,7 @@ class LayananView(QMainWindow):
                 self.ui.cmbKategori.setCurrentIndex(index)
             
             # Set harga
-            self.ui.spinHarga.setValue(int(layanan['harga']))
+            self.ui.spinHarga.setValue(Money.to_rupiah(layanan['harga']))
             
             # Set durasi
             from datetime import datetime
@@ -245,7 +257,7 @@ class LayananView(QMainWindow):
             logger.error(f"Error loading for update: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat data")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_LAYANAN)
     def save_layanan(self,checked=False):
         """Save layanan"""
         # Get data
@@ -262,28 +274,24 @@ class LayananView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
             if self.current_mode == "create":
-                query = """
-                    INSERT INTO layanan (nama_layanan, id_kategori, harga, durasi, deskripsi) 
-                    VALUES (%s, %s, %s, %s, %s)
-                """
-                Database.execute_query(query, (nama, id_kategori, harga, durasi, deskripsi))
-                message = "Layanan berhasil ditambahkan"
+                success, message, row = self.layanan_service.create(
+                    nama, id_kategori, harga, durasi, deskripsi
+                )
             else:
-                query = """
-                    UPDATE layanan 
-                    SET nama_layanan=%s, id_kategori=%s, harga=%s, durasi=%s, deskripsi=%s 
-                    WHERE id_layanan=%s
-                """
-                Database.execute_query(query, (nama, id_kategori, harga, durasi, deskripsi, self.current_id))
-                message = "Layanan berhasil diupdate"
+                success, message, row = self.layanan_service.update(
+                    self.current_id, nama, id_kategori, harga, durasi, deskripsi
+                )
             
             QApplication.restoreOverrideCursor()
             
+            if not success:
+                QMessageBox.warning(self, "Gagal", message)
+                return
+            
             QMessageBox.information(self, "Sukses", message)
-            self.load_data()
+            if row:
+                self.upsert_row_layanan(row)
             self.cancel_form()
             
         except Exception as e:
@@ -291,7 +299,7 @@ class LayananView(QMainWindow):
             logger.error(f"Error saving: {e}")
             QMessageBox.critical(self, "Error", "Terjadi kesalahan sistem")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_LAYANAN)
     def delete_layanan(self, id_layanan):
         """Delete layanan"""
         reply = QMessageBox.question(
@@ -307,23 +315,16 @@ class LayananView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
-            # Check if used in transaksi
-            check = "SELECT COUNT(*) as count FROM detail_transaksi WHERE id_layanan = %s"
-            result = Database.execute_query(check, (id_layanan,), fetch=True)
-            if result[0]['count'] > 0:
-                QApplication.restoreOverrideCursor()
-                QMessageBox.warning(self, "Gagal", "Layanan sudah digunakan dalam transaksi, tidak dapat dihapus")
-                return
-            
-            query = "DELETE FROM layanan WHERE id_layanan = %s"
-            Database.execute_query(query, (id_layanan,))
+            success, message = self.layanan_service.delete(id_layanan)
             
             QApplication.restoreOverrideCursor()
             
-            QMessageBox.information(self, "Sukses", "Layanan berhasil dihapus")
-            self.load_data()
+            if not success:
+                QMessageBox.warning(self, "Gagal", message)
+                return
+            
+            QMessageBox.information(self, "Sukses", message)
+            self.layanan_index.remove(id_layanan)
             
         except Exception as e:
             QApplication.restoreOverrideCursor()
@@ -342,18 +343,12 @@ class LayananView(QMainWindow):
             data = self.layanan_service.get_kategori_all()
             
             self.ui.tableKategori.setRowCount(0)
+            self.kategori_index.clear()
             
             for row_idx, item in enumerate(data):
                 self.ui.tableKategori.insertRow(row_idx)
-                
-                # ID
-                self.ui.tableKategori.setItem(row_idx, 0, self.create_item(item['id_kategori']))
-                
-                # Nama Kategori
-                self.ui.tableKategori.setItem(row_idx, 1, self.create_item(item['nama_kategori']))
-                
-                # Action buttons
-                self.add_action_buttons_kategori(row_idx, item['id_kategori'])
+                self.fill_row_kategori(row_idx, item)
+                self.kategori_index.register(item['id_kategori'], row_idx, item['nama_kategori'].lower())
             
             QApplication.restoreOverrideCursor()
             
@@ -362,10 +357,43 @@ class LayananView(QMainWindow):
             logger.error(f"Error loading kategori: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat data kategori")
     
+    def fill_row_kategori(self, row_idx, item):
+        """Isi satu baris tabel kategori"""
+        # ID
+        self.ui.tableKategori.setItem(row_idx, 0, self.create_item(item['id_kategori']))
+        
+        # Nama Kategori
+        self.ui.tableKategori.setItem(row_idx, 1, self.create_item(item['nama_kategori']))
+        
+        # Action buttons
+        self.add_action_buttons_kategori(row_idx, item['id_kategori'])
+    
+    def upsert_kategori(self, item):
+        """Upsert satu kategori ke tabel dan combobox tanpa reload"""
+        self.kategori_index.upsert(
+            item['id_kategori'],
+            lambda row: self.fill_row_kategori(row, item),
+            item['nama_kategori'].lower()
+        )
+        
+        index = self.ui.cmbKategori.findData(item['id_kategori'])
+        if index >= 0:
+            self.ui.cmbKategori.setItemText(index, item['nama_kategori'])
+        else:
+            self.ui.cmbKategori.addItem(item['nama_kategori'], item['id_kategori'])
+    
+    def remove_kategori(self, id_kategori):
+        """Hapus satu kategori dari tabel dan combobox"""
+        self.kategori_index.remove(id_kategori)
+        
+        index = self.ui.cmbKategori.findData(id_kategori)
+        if index >= 0:
+            self.ui.cmbKategori.removeItem(index)
+    
     def load_kategori_combo(self):
         """Load kategori to combobox"""
         try:
-            data = self.layanan_service.get_kategori_all()
+            data = self.reference_service.get_kategori()
             
             self.ui.cmbKategori.clear()
             
@@ -375,6 +403,11 @@ class LayananView(QMainWindow):
         except Exception as e:
             logger.error(f"Error loading kategori combo: {e}")
     
+    def on_kategori_changed(self, changes):
+        """Patch kategori yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.layanan_service.get_kategori_by_ids, 'id_kategori',
+                            self.upsert_kategori, self.remove_kategori)
+    
     def search_kategori(self):
         """Search kategori"""
         keyword = self.ui.txtSearchKategori.text().strip().lower()
@@ -397,7 +430,7 @@ class LayananView(QMainWindow):
         except Exception as e:
             logger.error(f"Error searching kategori: {e}")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_KATEGORI)
     def create_kategori(self,checked=False):
         """Create new kategori using input dialog"""
         nama, ok = QInputDialog.getText(
@@ -411,28 +444,29 @@ class LayananView(QMainWindow):
             try:
                 QApplication.setOverrideCursor(Qt.WaitCursor)
                 
-                from config.database import Database
-                query = "INSERT INTO kategori_layanan (nama_kategori) VALUES (%s)"
-                Database.execute_query(query, (nama.strip(),))
+                success, message, row = self.layanan_service.create_kategori(nama.strip())
                 
                 QApplication.restoreOverrideCursor()
                 
-                QMessageBox.information(self, "Sukses", "Kategori berhasil ditambahkan")
-                self.load_kategori()
-                self.load_kategori_combo()
+                if not success:
+                    QMessageBox.warning(self, "Gagal", message)
+                    return
+                
+                QMessageBox.information(self, "Sukses", message)
+                if row:
+                    self.upsert_kategori(row)
                 
             except Exception as e:
                 QApplication.restoreOverrideCursor()
                 logger.error(f"Error creating kategori: {e}")
                 QMessageBox.critical(self, "Error", "Gagal menambahkan kategori")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_KATEGORI)
     def update_kategori(self, id_kategori):
         """Update kategori"""
         try:
             # Get current name
-            data = self.layanan_service.get_kategori_all()
-            kategori = next((item for item in data if item['id_kategori'] == id_kategori), None)
+            kategori = self.layanan_service.get_kategori_by_id(id_kategori)
             
             if not kategori:
                 QMessageBox.warning(self, "Error", "Data tidak ditemukan")
@@ -448,22 +482,26 @@ class LayananView(QMainWindow):
             if ok and nama.strip():
                 QApplication.setOverrideCursor(Qt.WaitCursor)
                 
-                from config.database import Database
-                query = "UPDATE kategori_layanan SET nama_kategori=%s WHERE id_kategori=%s"
-                Database.execute_query(query, (nama.strip(), id_kategori))
+                success, message, row = self.layanan_service.update_kategori(id_kategori, nama.strip())
                 
                 QApplication.restoreOverrideCursor()
                 
-                QMessageBox.information(self, "Sukses", "Kategori berhasil diupdate")
-                self.load_kategori()
-                self.load_kategori_combo()
+                if not success:
+                    QMessageBox.warning(self, "Gagal", message)
+                    return
+                
+                QMessageBox.information(self, "Sukses", message)
+                if row:
+                    self.upsert_kategori(row)
+                    # Nama kategori ikut tampil di tabel layanan
+                    self.load_data()
             
         except Exception as e:
             QApplication.restoreOverrideCursor()
             logger.error(f"Error updating kategori: {e}")
             QMessageBox.critical(self, "Error", "Gagal mengupdate kategori")
     
-    @require_role('admin')
+    @require_permission(Permission.MANAGE_KATEGORI)
     def delete_kategori(self, id_kategori):
         """Delete kategori"""
         reply = QMessageBox.question(
@@ -478,24 +516,16 @@ class LayananView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
-            # Check if used in layanan
-            check = "SELECT COUNT(*) as count FROM layanan WHERE id_kategori = %s"
-            result = Database.execute_query(check, (id_kategori,), fetch=True)
-            if result[0]['count'] > 0:
-                QApplication.restoreOverrideCursor()
-                QMessageBox.warning(self, "Gagal", "Kategori sudah digunakan dalam layanan, tidak dapat dihapus")
-                return
-            
-            query = "DELETE FROM kategori_layanan WHERE id_kategori = %s"
-            Database.execute_query(query, (id_kategori,))
+            success, message = self.layanan_service.delete_kategori(id_kategori)
             
             QApplication.restoreOverrideCursor()
             
-            QMessageBox.information(self, "Sukses", "Kategori berhasil dihapus")
-            self.load_kategori()
-            self.load_kategori_combo()
+            if not success:
+                QMessageBox.warning(self, "Gagal", message)
+                return
+            
+            QMessageBox.information(self, "Sukses", message)
+            self.remove_kategori(id_kategori)
             
         except Exception as e:
             QApplication.restoreOverrideCursor()
@@ -536,9 +566,7 @@ class LayananView(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         
-        user = SessionManager.get_current_user()
-        
-        if user and user.role == 'admin':
+        if RBACHelper.has_permission(Permission.MANAGE_LAYANAN):
             # Edit button
             btn_edit = QPushButton("✏️ Edit")
             btn_edit.setStyleSheet("""
@@ -584,9 +612,7 @@ class LayananView(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         
-        user = SessionManager.get_current_user()
-        
-        if user and user.role == 'admin':
+        if RBACHelper.has_permission(Permission.MANAGE_KATEGORI):
             # Edit button
             btn_edit = QPushButton("✏️ Edit")
             btn_edit.setStyleSheet("""
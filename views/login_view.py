@@ -2,23 +2,70 @@
 Login window
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, 
-                             QPushButton, QMessageBox, QApplication)
-from PyQt5.QtCore import Qt
+                             QPushButton, QMessageBox, QApplication,
+                             QProgressBar)
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
 from PyQt5.QtGui import QFont
+from concurrent.futures import ThreadPoolExecutor
 from services.auth_service import AuthService
 from utils.rbac_helper import RBACHelper
-from views.main_window import MainWindow
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class LoginWorker(QObject):
+    """
+    Jalankan autentikasi di worker thread
+    
+    Lookup user bisa di-prefetch saat username selesai diketik, sehingga
+    saat tombol login ditekan tinggal bcrypt verify yang tersisa.
+    Hasil dikirim ke GUI thread lewat signal finished(success, message, user).
+    """
+    
+    finished = pyqtSignal(bool, str, object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="login")
+        self._prefetch_username = None
+        self._prefetch_future = None
+    
+    def prefetch(self, username: str):
+        """Mulai lookup user di background (dipakai ulang oleh login)"""
+        if not username:
+            return None
+        if username != self._prefetch_username:
+            self._prefetch_username = username
+            self._prefetch_future = self.executor.submit(AuthService.find_user, username)
+        return self._prefetch_future
+    
+    def login(self, username: str, password: str):
+        """Mulai login, hasil via signal finished"""
+        lookup = self.prefetch(username)
+        # Data user tidak dipakai ulang untuk percobaan berikutnya
+        self._prefetch_username = None
+        self._prefetch_future = None
+        self.executor.submit(self._run, lookup, password)
+    
+    def _run(self, lookup, password):
+        try:
+            user_data = lookup.result()
+            success, message, user = AuthService.authenticate(user_data, password)
+        except Exception as e:
+            logger.error(f"❌ Login error: {e}")
+            success, message, user = False, "Terjadi kesalahan sistem", None
+        self.finished.emit(success, message, user)
+
+
 class LoginView(QWidget):
     """Login window"""
     
     def __init__(self):
         super().__init__()
         self.main_window = None
+        self.login_worker = LoginWorker(self)
+        self.login_worker.finished.connect(self.on_login_finished)
         self.init_ui()
     
     def init_ui(self):
@@ -153,6 +200,27 @@ class LoginView(QWidget):
         self.btn_login.clicked.connect(self.handle_login)
         layout.addWidget(self.btn_login)
         
+        # ========================================
+        # Progress (tampil selama autentikasi)
+        # ========================================
+        self.progress_login = QProgressBar()
+        self.progress_login.setRange(0, 0)  # Indeterminate
+        self.progress_login.setTextVisible(False)
+        self.progress_login.setMaximumHeight(6)
+        self.progress_login.setStyleSheet("""
+            QProgressBar {
+                border: none;
+                background-color: #eee;
+                border-radius: 3px;
+            }
+            QProgressBar::chunk {
+                background-color: #E91E63;
+                border-radius: 3px;
+            }
+        """)
+        self.progress_login.setVisible(False)
+        layout.addWidget(self.progress_login)
+        
         # ========================================
         # Info Text (Credential Helper)
         # ========================================
@@ -183,6 +251,11 @@ class LoginView(QWidget):
         # Enter key shortcut
         self.txt_password.returnPressed.connect(self.handle_login)
         
+        # Prefetch user selagi password diketik
+        self.txt_username.editingFinished.connect(
+            lambda: self.login_worker.prefetch(self.txt_username.text().strip())
+        )
+        
         # Set focus to username
         self.txt_username.setFocus()
     
@@ -193,8 +266,20 @@ class LoginView(QWidget):
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
     
+    def set_connecting(self, connecting: bool):
+        """
+        Tandai database sedang disiapkan (startup pipeline)
+        Form tetap bisa diisi, tombol login aktif setelah siap
+        """
+        self.btn_login.setEnabled(not connecting)
+        self.btn_login.setText("⏳ Menghubungkan..." if connecting else "🔐 Login")
+    
     def handle_login(self):
         """Handle login button click"""
+        # Enter di field password tetap memanggil handler ini
+        if not self.btn_login.isEnabled():
+            return
+        
         username = self.txt_username.text().strip()
         password = self.txt_password.text()
         
@@ -209,17 +294,22 @@ class LoginView(QWidget):
             self.txt_password.setFocus()
             return
         
-        # Show loading
-        self.btn_login.setEnabled(False)
-        self.btn_login.setText("⏳ Loading...")
-        QApplication.processEvents()
-        
-        # Login
-        success, message, user = AuthService.login(username, password)
-        
-        # Restore button
-        self.btn_login.setEnabled(True)
-        self.btn_login.setText("🔐 Login")
+        # Login di worker thread, GUI tetap responsif
+        self.set_authenticating(True)
+        self.login_worker.login(username, password)
+    
+    def set_authenticating(self, authenticating: bool):
+        """Tampilkan/sembunyikan state proses autentikasi"""
+        self.btn_login.setEnabled(not authenticating)
+        self.btn_login.setText("⏳ Memverifikasi..." if authenticating else "🔐 Login")
+        self.txt_username.setEnabled(not authenticating)
+        self.txt_password.setEnabled(not authenticating)
+        self.progress_login.setVisible(authenticating)
+    
+    def on_login_finished(self, success, message, user):
+        """Dipanggil di GUI thread setelah worker selesai"""
+        self.set_authenticating(False)
+        username = self.txt_username.text().strip()
         
         if success:
             logger.info(f"Login successful: {username}")
@@ -232,6 +322,7 @@ class LoginView(QWidget):
             )
             
             # Open main window
+            from views.main_window import MainWindow
             self.main_window = MainWindow()
             self.main_window.showMaximized()
             
@@ -1,13 +1,16 @@
 """
 Main window dengan sidebar navigation
 """
-from PyQt5.QtWidgets import QMainWindow, QMessageBox
-from ui.generated.ui_dashboard import Ui_MainWindow
+from PyQt5.QtCore import QObject, QDate, pyqtSignal
+from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QDialog, QVBoxLayout, QFormLayout,
+                             QDateEdit, QCheckBox, QDialogButtonBox, QPushButton)
 from utils.session_manager import SessionManager
 from services.dashboard_service import DashboardService
-from utils.rbac_decorator import require_role
+from config.constants import Permission
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from utils.formatters import Formatters
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,11 +21,14 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_dashboard import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
         # Services
         self.dashboard_service = DashboardService()
+        self.report_job = None
         
         # Initialize
         self.init_ui()
@@ -38,34 +44,31 @@ class MainWindow(QMainWindow):
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
             # Setup menu visibility based on role
-            self.setup_menu_visibility(user.role)
-    
-    def setup_menu_visibility(self, role):
-        """
-        Setup menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only akan di-handle di view)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+            self.setup_menu_visibility()
+        
+        # Laporan periode: tombol sidebar di bawah Pembayaran (tidak ada di generated UI)
+        self.btnLaporan = QPushButton("📊 Laporan", self.ui.frameSidebar)
+        self.btnLaporan.setMinimumSize(self.ui.btnPembayaran.minimumSize())
+        self.ui.verticalLayout.insertWidget(
+            self.ui.verticalLayout.indexOf(self.ui.btnPembayaran) + 1, self.btnLaporan
+        )
+        self.btnLaporan.setVisible(RBACHelper.has_permission(Permission.LAPORAN_PERIODE))
+        
+        # Data offline yang ditolak server saat sync (tampil hanya jika ada)
+        self.btnSyncGagal = QPushButton(self.ui.frameSidebar)
+        self.btnSyncGagal.setMinimumSize(self.ui.btnPembayaran.minimumSize())
+        self.ui.verticalLayout.insertWidget(
+            self.ui.verticalLayout.indexOf(self.btnLaporan) + 1, self.btnSyncGagal
+        )
+        self.btnSyncGagal.setVisible(False)
+    
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect button signals"""
@@ -79,8 +82,10 @@ class MainWindow(QMainWindow):
         self.ui.btnJadwal.clicked.connect(self.go_jadwal)
         self.ui.btnTransaksi.clicked.connect(self.go_transaksi)
         self.ui.btnPembayaran.clicked.connect(self.go_pembayaran)
+        self.btnLaporan.clicked.connect(self.buat_laporan)
+        self.btnSyncGagal.clicked.connect(self.show_sync_gagal)
     
-    @require_role('admin', 'kasir', 'owner')
+    @require_permission(Permission.MENU_PELANGGAN)
     def go_pelanggan(self,checked=False):
         """Go to pelanggan view"""
         from views.pelanggan_view import PelangganView
@@ -88,7 +93,7 @@ class MainWindow(QMainWindow):
         self.pelanggan_view.showMaximized()
         self.close()
 
-    @require_role('admin')
+    @require_permission(Permission.MENU_LAYANAN)
     def go_layanan(self,checked=False):
         """Go to layanan view"""
         from views.layanan_view import LayananView
@@ -96,7 +101,7 @@ class MainWindow(QMainWindow):
         self.layanan_view.showMaximized()
         self.close()
 
-    @require_role('admin', 'makeup_artist', 'owner')
+    @require_permission(Permission.MENU_JADWAL)
     def go_jadwal(self,checked=False):
         """Go to jadwal view"""
         from views.jadwal_view import JadwalView
@@ -104,7 +109,7 @@ class MainWindow(QMainWindow):
         self.jadwal_view.showMaximized()
         self.close()
     
-    @require_role('admin', 'kasir', 'owner')
+    @require_permission(Permission.MENU_TRANSAKSI)
     def go_transaksi(self,checked=False):
         """Go to transaksi view"""
         from views.transaksi_view import TransaksiView
@@ -112,7 +117,7 @@ class MainWindow(QMainWindow):
         self.transaksi_view.showMaximized()
         self.close()
 
-    @require_role('admin', 'kasir', 'owner')
+    @require_permission(Permission.MENU_PEMBAYARAN)
     def go_pembayaran(self,checked=False):
         """Go to pembayaran view"""
         from views.pembayaran_view import PembayaranView
@@ -120,6 +125,62 @@ class MainWindow(QMainWindow):
         self.pembayaran_view.showMaximized()
         self.close()
     
+    @require_permission(Permission.LAPORAN_PERIODE)
+    def buat_laporan(self, checked=False):
+        """Buat PDF laporan periode di background (laporan setahun bisa puluhan detik)"""
+        if self.report_job is not None:
+            QMessageBox.information(self, "Laporan", "Laporan sebelumnya masih dibuat, mohon tunggu")
+            return
+        
+        dialog = LaporanDialog(self)
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        date_from, date_to, include_transaksi = dialog.get_data()
+        if date_to < date_from:
+            QMessageBox.warning(self, "Validasi", "Tanggal akhir harus sama atau setelah tanggal awal")
+            return
+        
+        self.report_job = ReportJob(date_from, date_to, include_transaksi)
+        self.report_job.finished.connect(self.on_laporan_finished)
+        self.btnLaporan.setEnabled(False)
+        self.btnLaporan.setText("⏳ Membuat Laporan...")
+        self.report_job.start()
+    
+    def on_laporan_finished(self, filepath, error):
+        """Dipanggil di GUI thread setelah ReportJob selesai"""
+        self.report_job = None
+        self.btnLaporan.setEnabled(True)
+        self.btnLaporan.setText("📊 Laporan")
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Gagal membuat laporan:\n{error}")
+            return
+        
+        reply = QMessageBox.question(
+            self,
+            'Laporan Selesai',
+            f'✅ Laporan berhasil dibuat!\n\nFile: {filepath}\n\nBuka file PDF sekarang?',
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        if reply == QMessageBox.Yes:
+            from PyQt5.QtGui import QDesktopServices
+            from PyQt5.QtCore import QUrl
+            QDesktopServices.openUrl(QUrl.fromLocalFile(filepath))
+    
+    def update_sync_gagal(self):
+        """Tampilkan tombol Sync Gagal jika ada data offline yang ditolak server"""
+        from services.sync_service import SyncService
+        count = SyncService.failed_count()
+        self.btnSyncGagal.setText(f"⚠️ Sync Gagal ({count})")
+        self.btnSyncGagal.setVisible(count > 0)
+    
+    def show_sync_gagal(self, checked=False):
+        """Tinjau, kirim ulang, atau export data yang gagal sync"""
+        from views.sync_view import SyncGagalDialog
+        SyncGagalDialog(self).exec_()
+        self.update_sync_gagal()
+    
     def show_temp_message(self, module_name):
         """Temporary message for modules not yet implemented"""
         QMessageBox.information(
@@ -155,6 +216,7 @@ class MainWindow(QMainWindow):
             
             # Load jadwal hari ini
             self.load_jadwal_today()
+            self.update_sync_gagal()
             
         except Exception as e:
             logger.error(f"Error loading dashboard: {e}")
@@ -219,3 +281,83 @@ class MainWindow(QMainWindow):
             
             # Close main window
             self.close()
+
+
+# ============================================
+# Laporan Periode
+# ============================================
+
+class LaporanDialog(QDialog):
+    """Dialog untuk memilih periode laporan"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.init_ui()
+    
+    def init_ui(self):
+        """Initialize dialog UI"""
+        self.setWindowTitle("Laporan Periode")
+        self.setMinimumWidth(350)
+        
+        layout = QVBoxLayout()
+        form = QFormLayout()
+        
+        # Default: bulan berjalan sampai hari ini
+        today = QDate.currentDate()
+        self.dateFrom = QDateEdit(QDate(today.year(), today.month(), 1))
+        self.dateFrom.setCalendarPopup(True)
+        self.dateFrom.setDisplayFormat("dd/MM/yyyy")
+        form.addRow("Dari Tanggal:", self.dateFrom)
+        
+        self.dateTo = QDateEdit(today)
+        self.dateTo.setCalendarPopup(True)
+        self.dateTo.setDisplayFormat("dd/MM/yyyy")
+        form.addRow("Sampai Tanggal:", self.dateTo)
+        
+        self.chkTransaksi = QCheckBox("Lampirkan daftar semua transaksi")
+        form.addRow(self.chkTransaksi)
+        layout.addLayout(form)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+    
+    def get_data(self):
+        """(date_from, date_to, include_transaksi)"""
+        return (self.dateFrom.date().toPyDate(), self.dateTo.date().toPyDate(),
+                self.chkTransaksi.isChecked())
+
+
+class ReportJob(QObject):
+    """
+    Jalankan ReportGenerator.generate_period_report di background thread
+    
+    Signal finished(filepath, error) di-emit ke GUI thread; error berisi
+    pesan jika gagal, filepath kosong.
+    """
+    
+    finished = pyqtSignal(str, str)
+    
+    def __init__(self, date_from, date_to, include_transaksi: bool = False):
+        super().__init__()
+        self.date_from = date_from
+        self.date_to = date_to
+        self.include_transaksi = include_transaksi
+    
+    def start(self):
+        threading.Thread(target=self._run, name="report", daemon=True).start()
+    
+    def _run(self):
+        # reportlab di-import saat laporan dibuat, bukan saat dashboard dibuka
+        from utils.report_generator import ReportGenerator
+        try:
+            filepath = ReportGenerator.generate_period_report(
+                self.date_from, self.date_to, include_transaksi=self.include_transaksi
+            )
+            self.finished.emit(filepath, "")
+        except Exception as e:
+            logger.error(f"❌ Error membuat laporan: {e}")
+            self.finished.emit("", str(e))
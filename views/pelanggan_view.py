@@ -4,13 +4,15 @@ Pelanggan View dengan CRUD lengkap
 from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem, 
                              QPushButton, QHBoxLayout, QWidget, QApplication)
 from PyQt5.QtCore import Qt
-from ui.generated.ui_form_pelanggan import Ui_MainWindow
-from utils.rbac_decorator import require_role
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from services.pelanggan_service import PelangganService
 from services.auth_service import AuthService
 from utils.validators import Validators
 from utils.session_manager import SessionManager
+from utils.table_helper import TableRowIndex
+from utils.change_watcher import ChangeWatcher
+from config.constants import Permission
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,8 @@ class PelangganView(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_form_pelanggan import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
@@ -30,10 +34,15 @@ class PelangganView(QMainWindow):
         # State
         self.current_mode = "create"  # "create" atau "update"
         self.current_id = None
+        self.row_index = TableRowIndex(self.ui.tablePelanggan)
         
         # Initialize
         self.init_ui()
         self.connect_signals()
+        self.change_watcher = ChangeWatcher(self, {
+            'pelanggan': self.on_pelanggan_changed
+        })
+        self.change_watcher.start()
         self.load_data()
     
     def init_ui(self):
@@ -48,8 +57,8 @@ class PelangganView(QMainWindow):
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
             # Setup button visibility based on role
-            self.setup_rbac_ui(user.role)
-            self.setup_menu_visibility(user.role)
+            self.setup_rbac_ui()
+            self.setup_menu_visibility()
         
         # Setup table
         self.ui.tablePelanggan.setColumnWidth(0, 50)   # ID
@@ -58,44 +67,19 @@ class PelangganView(QMainWindow):
         self.ui.tablePelanggan.setColumnWidth(3, 250)  # Alamat
         self.ui.tablePelanggan.setColumnWidth(4, 180)  # Aksi
     
-    def setup_rbac_ui(self, role):
-        """
-        Setup UI based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'owner':
-            # Owner: Read-only
+    def setup_rbac_ui(self):
+        """Form & tombol tambah hanya untuk role dengan MANAGE_PELANGGAN (owner: read-only)"""
+        if not RBACHelper.has_permission(Permission.MANAGE_PELANGGAN):
             self.ui.btnTambahPelanggan.setVisible(False)
             self.ui.groupFormPelanggan.setVisible(False)
     
-    def setup_menu_visibility(self, role):
-        """
-        Setup sidebar menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Dashboard dan Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Dashboard, Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only di-handle di setup_rbac_ui)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect signals"""
@@ -126,26 +110,7 @@ class PelangganView(QMainWindow):
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
             data = self.pelanggan_service.get_all()
-            
-            self.ui.tablePelanggan.setRowCount(0)
-            
-            for row_idx, item in enumerate(data):
-                self.ui.tablePelanggan.insertRow(row_idx)
-                
-                # ID
-                self.ui.tablePelanggan.setItem(row_idx, 0, self.create_item(item['id_pelanggan']))
-                
-                # Nama
-                self.ui.tablePelanggan.setItem(row_idx, 1, self.create_item(item['nama']))
-                
-                # No HP
-                self.ui.tablePelanggan.setItem(row_idx, 2, self.create_item(item['no_hp']))
-                
-                # Alamat
-                self.ui.tablePelanggan.setItem(row_idx, 3, self.create_item(item['alamat']))
-                
-                # Action buttons
-                self.add_action_buttons(row_idx, item['id_pelanggan'])
+            self.populate_table(data)
             
             QApplication.restoreOverrideCursor()
             
@@ -166,16 +131,7 @@ class PelangganView(QMainWindow):
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
             data = self.pelanggan_service.search(keyword)
-            
-            self.ui.tablePelanggan.setRowCount(0)
-            
-            for row_idx, item in enumerate(data):
-                self.ui.tablePelanggan.insertRow(row_idx)
-                self.ui.tablePelanggan.setItem(row_idx, 0, self.create_item(item['id_pelanggan']))
-                self.ui.tablePelanggan.setItem(row_idx, 1, self.create_item(item['nama']))
-                self.ui.tablePelanggan.setItem(row_idx, 2, self.create_item(item['no_hp']))
-                self.ui.tablePelanggan.setItem(row_idx, 3, self.create_item(item['alamat']))
-                self.add_action_buttons(row_idx, item['id_pelanggan'])
+            self.populate_table(data)
             
             QApplication.restoreOverrideCursor()
             
@@ -183,7 +139,51 @@ class PelangganView(QMainWindow):
             QApplication.restoreOverrideCursor()
             logger.error(f"Error searching: {e}")
     
-    @require_role('admin', 'kasir')
+    def populate_table(self, data):
+        """Isi ulang seluruh tabel dari list data"""
+        self.ui.tablePelanggan.setRowCount(0)
+        self.row_index.clear()
+        
+        for row_idx, item in enumerate(data):
+            self.ui.tablePelanggan.insertRow(row_idx)
+            self.fill_row(row_idx, item)
+            self.row_index.register(item['id_pelanggan'], row_idx, self.sort_key(item))
+    
+    def fill_row(self, row_idx, item):
+        """Isi satu baris tabel pelanggan"""
+        # ID
+        self.ui.tablePelanggan.setItem(row_idx, 0, self.create_item(item['id_pelanggan']))
+        
+        # Nama
+        self.ui.tablePelanggan.setItem(row_idx, 1, self.create_item(item['nama']))
+        
+        # No HP
+        self.ui.tablePelanggan.setItem(row_idx, 2, self.create_item(item['no_hp']))
+        
+        # Alamat
+        self.ui.tablePelanggan.setItem(row_idx, 3, self.create_item(item['alamat']))
+        
+        # Action buttons
+        self.add_action_buttons(row_idx, item['id_pelanggan'])
+    
+    def upsert_row(self, item):
+        """Insert/update satu baris tanpa reload tabel"""
+        self.row_index.upsert(
+            item['id_pelanggan'],
+            lambda row: self.fill_row(row, item),
+            self.sort_key(item)
+        )
+    
+    def sort_key(self, item):
+        """Urutan tabel: nama ASC (sama dengan get_all)"""
+        return item['nama'].lower()
+    
+    def on_pelanggan_changed(self, changes):
+        """Patch baris yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.pelanggan_service.get_by_ids, 'id_pelanggan',
+                            self.upsert_row, self.row_index.remove)
+    
+    @require_permission(Permission.MANAGE_PELANGGAN)
     def show_form_create(self,checked=False):
         """Show form for create"""
         self.current_mode = "create"
@@ -193,7 +193,7 @@ class PelangganView(QMainWindow):
         self.ui.groupFormPelanggan.setTitle("📝 Form Tambah Pelanggan")
         self.ui.txtNamaPelanggan.setFocus()
     
-    @require_role('admin', 'kasir')
+    @require_permission(Permission.MANAGE_PELANGGAN)
     def show_form_update(self, id_pelanggan):
         """Show form for update"""
         try:
@@ -219,7 +219,7 @@ class PelangganView(QMainWindow):
             logger.error(f"Error loading for update: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat data")
     
-    @require_role('admin', 'kasir')
+    @require_permission(Permission.MANAGE_PELANGGAN)
     def save_pelanggan(self,checked=False):
         """Save pelanggan"""
         # Get data
@@ -235,15 +235,16 @@ class PelangganView(QMainWindow):
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
             if self.current_mode == "create":
-                success, message = self.pelanggan_service.create(nama, no_hp, alamat)
+                success, message, row = self.pelanggan_service.create(nama, no_hp, alamat)
             else:
-                success, message = self.pelanggan_service.update(self.current_id, nama, no_hp, alamat)
+                success, message, row = self.pelanggan_service.update(self.current_id, nama, no_hp, alamat)
             
             QApplication.restoreOverrideCursor()
             
             if success:
                 QMessageBox.information(self, "Sukses", message)
-                self.load_data()
+                if row:
+                    self.upsert_row(row)
                 self.cancel_form()
             else:
                 QMessageBox.warning(self, "Gagal", message)
@@ -253,7 +254,7 @@ class PelangganView(QMainWindow):
             logger.error(f"Error saving: {e}")
             QMessageBox.critical(self, "Error", "Terjadi kesalahan sistem")
     
-    @require_role('admin')
+    @require_permission(Permission.DELETE_PELANGGAN)
     def delete_pelanggan(self, id_pelanggan):
         """Delete pelanggan"""
         reply = QMessageBox.question(
@@ -275,7 +276,7 @@ class PelangganView(QMainWindow):
             
             if success:
                 QMessageBox.information(self, "Sukses", message)
-                self.load_data()
+                self.row_index.remove(id_pelanggan)
             else:
                 QMessageBox.warning(self, "Gagal", message)
                 
@@ -325,9 +326,7 @@ class PelangganView(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         
-        user = SessionManager.get_current_user()
-        
-        if user and user.role in ['admin', 'kasir']:
+        if RBACHelper.has_permission(Permission.MANAGE_PELANGGAN):
             btn_edit = QPushButton("✏️ Edit")
             btn_edit.setStyleSheet("""
                 QPushButton {
@@ -344,7 +343,7 @@ class PelangganView(QMainWindow):
             btn_edit.clicked.connect(lambda: self.show_form_update(id_pelanggan))
             layout.addWidget(btn_edit)
         
-        if user and user.role == 'admin':
+        if RBACHelper.has_permission(Permission.DELETE_PELANGGAN):
             btn_delete = QPushButton("🗑️ Hapus")
             btn_delete.setStyleSheet("""
                 QPushButton {
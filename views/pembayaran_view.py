@@ -4,14 +4,17 @@ Pembayaran View dengan logika lengkap
 from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem, 
                              QApplication)
 from PyQt5.QtCore import Qt, QDate
-from ui.generated.ui_form_pembayaran import Ui_MainWindow
 from services.pembayaran_service import PembayaranService
 from services.auth_service import AuthService
-from utils.rbac_decorator import require_role
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from utils.session_manager import SessionManager
 from utils.formatters import Formatters
-from config.constants import StatusPembayaran, MetodePembayaran
+from utils.money import Money
+from utils.table_helper import TableRowIndex
+from utils.change_watcher import ChangeWatcher
+from config.constants import StatusPembayaran, MetodePembayaran, Permission
+from config.settings import Settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,8 @@ class PembayaranView(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_form_pembayaran import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
@@ -31,10 +36,17 @@ class PembayaranView(QMainWindow):
         # State
         self.current_transaksi = None
         self.current_detail_transaksi = []
+        # Pembayaran yang baru diproses untuk transaksi di form (sumber struk)
+        self.current_pembayaran = None
+        self.history_index = TableRowIndex(self.ui.tableHistoryPembayaran, descending=True)
         
         # Initialize
         self.init_ui()
         self.connect_signals()
+        self.change_watcher = ChangeWatcher(self, {
+            'pembayaran': self.on_pembayaran_changed
+        })
+        self.change_watcher.start()
         self.load_history()
     
     def init_ui(self):
@@ -45,8 +57,8 @@ class PembayaranView(QMainWindow):
             self.ui.lblUsername.setText(
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
-            self.setup_rbac_ui(user.role)
-            self.setup_menu_visibility(user.role)
+            self.setup_rbac_ui()
+            self.setup_menu_visibility()
         
         # Set tanggal hari ini
         self.ui.dateTanggalBayar.setDate(QDate.currentDate())
@@ -78,38 +90,19 @@ class PembayaranView(QMainWindow):
         self.ui.tableHistoryPembayaran.setColumnWidth(5, 120)  # Tanggal
         self.ui.tableHistoryPembayaran.setColumnWidth(6, 100)  # Status
     
-    def setup_rbac_ui(self, role):
-        """Setup UI based on user role"""
-        if role == 'owner':
+    def setup_rbac_ui(self):
+        """Proses pembayaran hanya untuk role dengan PROSES_PEMBAYARAN (owner: read-only)"""
+        if not RBACHelper.has_permission(Permission.PROSES_PEMBAYARAN):
             self.ui.groupSearch.setEnabled(False)
             self.ui.btnProsesPembayaran.setVisible(False)
     
-    def setup_menu_visibility(self, role):
-        """
-        Setup sidebar menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Dashboard dan Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Dashboard, Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only di-handle di setup_rbac_ui)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect signals"""
@@ -156,7 +149,7 @@ class PembayaranView(QMainWindow):
                     JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
                     WHERE t.id_transaksi = %s
                 """
-                result = Database.execute_query(query, (int(keyword),), fetch=True)
+                result = Money.normalize(Database.execute_query(query, (int(keyword),), fetch=True), 'total')
             else:
                 # Search by name
                 query = """
@@ -167,7 +160,7 @@ class PembayaranView(QMainWindow):
                     ORDER BY t.tanggal_transaksi DESC
                     LIMIT 1
                 """
-                result = Database.execute_query(query, (f"%{keyword}%",), fetch=True)
+                result = Money.normalize(Database.execute_query(query, (f"%{keyword}%",), fetch=True), 'total')
             
             QApplication.restoreOverrideCursor()
             
@@ -205,6 +198,8 @@ class PembayaranView(QMainWindow):
             
             # Save current transaksi
             self.current_transaksi = transaksi
+            self.current_pembayaran = None
+            self.ui.btnProsesPembayaran.setEnabled(True)
             
             # Update info labels
             self.ui.lblIDTransaksi.setText(str(transaksi['id_transaksi']))
@@ -218,7 +213,9 @@ class PembayaranView(QMainWindow):
                 JOIN layanan l ON dt.id_layanan = l.id_layanan
                 WHERE dt.id_transaksi = %s
             """
-            details = Database.execute_query(query, (transaksi['id_transaksi'],), fetch=True)
+            details = Money.normalize(
+                Database.execute_query(query, (transaksi['id_transaksi'],), fetch=True), 'harga', 'subtotal'
+            )
             
             self.current_detail_transaksi = details
             
@@ -245,12 +242,12 @@ class PembayaranView(QMainWindow):
                     self.create_item(Formatters.format_currency(item['subtotal'])))
             
             # Update total labels
-            total = float(transaksi['total'])
+            total = Money.to_rupiah(transaksi['total'])
             self.ui.lblTotalTagihan.setText(f"Total: {Formatters.format_currency(total)}")
             self.ui.lblTotalTagihan2.setText(Formatters.format_currency(total))
             
             # Set jumlah bayar to total
-            self.ui.spinJumlahBayar.setValue(int(total))
+            self.ui.spinJumlahBayar.setValue(total)
             
             # Enable form
             self.ui.widgetPembayaranContent.setEnabled(True)
@@ -270,6 +267,7 @@ class PembayaranView(QMainWindow):
         """Clear detail form"""
         self.current_transaksi = None
         self.current_detail_transaksi = []
+        self.current_pembayaran = None
         
         self.ui.lblIDTransaksi.setText("-")
         self.ui.lblNamaPelanggan.setText("-")
@@ -293,10 +291,10 @@ class PembayaranView(QMainWindow):
         if not self.current_transaksi:
             return
         
-        total_tagihan = float(self.current_transaksi['total'])
+        total_tagihan = self.current_transaksi['total']
         jumlah_bayar = self.ui.spinJumlahBayar.value()
         
-        kembalian = jumlah_bayar - total_tagihan
+        kembalian = Money.change(jumlah_bayar, total_tagihan)
         
         # Update labels
         self.ui.lblJumlahBayar.setText(Formatters.format_currency(jumlah_bayar))
@@ -312,7 +310,7 @@ class PembayaranView(QMainWindow):
     # Proses Pembayaran
     # ============================================
     
-    @require_role('admin', 'kasir')
+    @require_permission(Permission.PROSES_PEMBAYARAN)
     def proses_pembayaran(self, checked=False):
         """Process payment"""
         # Validate
@@ -320,8 +318,12 @@ class PembayaranView(QMainWindow):
             QMessageBox.warning(self, "Validasi", "Belum ada transaksi yang dipilih.\n\nSilakan cari transaksi terlebih dahulu.")
             return
         
+        if self.current_pembayaran:
+            QMessageBox.warning(self, "Validasi", "Pembayaran transaksi ini sudah diproses")
+            return
+        
         jumlah_bayar = self.ui.spinJumlahBayar.value()
-        total_tagihan = float(self.current_transaksi['total'])
+        total_tagihan = self.current_transaksi['total']
         
         if jumlah_bayar <= 0:
             QMessageBox.warning(self, "Validasi", "Jumlah bayar harus lebih dari 0")
@@ -341,7 +343,7 @@ class PembayaranView(QMainWindow):
             return
         
         # Confirmation
-        kembalian = jumlah_bayar - total_tagihan
+        kembalian = Money.change(jumlah_bayar, total_tagihan)
         metode = self.ui.cmbMetodePembayaran.currentText()
         tanggal = self.ui.dateTanggalBayar.date().toPyDate()
         
@@ -377,32 +379,36 @@ Proses pembayaran ini?
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
-            query = """
-                INSERT INTO pembayaran (id_transaksi, jumlah_bayar, metode_bayar, 
-                                       tanggal_bayar, status)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            id_pembayaran = Database.execute_query(
-                query,
-                (self.current_transaksi['id_transaksi'], jumlah_bayar, metode, tanggal, status)
+            success, message, row = self.pembayaran_service.create(
+                self.current_transaksi['id_transaksi'], jumlah_bayar, metode, tanggal, status
             )
             
             QApplication.restoreOverrideCursor()
             
-            QMessageBox.information(
-                self,
-                "Sukses",
-                f"✅ Pembayaran berhasil diproses!\n\n"
-                f"ID Pembayaran: {id_pembayaran}\n"
-                f"Kembalian: {Formatters.format_currency(kembalian if kembalian >= 0 else 0)}\n\n"
-                f"Silakan cetak struk pembayaran."
-            )
+            if not success:
+                QMessageBox.critical(self, "Error", message)
+                return
+            
+            if row is None:
+                # Server offline: pembayaran menunggu di journal lokal
+                QMessageBox.information(self, "Tersimpan Offline", message)
+            else:
+                QMessageBox.information(
+                    self,
+                    "Sukses",
+                    f"✅ Pembayaran berhasil diproses!\n\n"
+                    f"ID Pembayaran: {row['id_pembayaran']}\n"
+                    f"Kembalian: {Formatters.format_currency(kembalian if kembalian >= 0 else 0)}\n\n"
+                    f"Silakan cetak struk pembayaran."
+                )
             
-            # Reload history and clear form
-            self.load_history()
-            self.clear_detail()
+            # Patch history; transaksi tetap di form agar struk bisa dicetak dengan id pembayaran
+            if row:
+                self.upsert_history_row(row)
+                self.current_pembayaran = row
+                self.ui.btnProsesPembayaran.setEnabled(False)
+            else:
+                self.clear_detail()
             self.ui.txtSearchTransaksi.clear()
             
         except Exception as e:
@@ -421,49 +427,97 @@ Proses pembayaran ini?
             return
         
         try:
-            from utils.pdf_generator import PDFGenerator
+            from utils.pdf_generator import PDFGenerator, PDFWriteBehind
+            from utils.receipt_archive import ReceiptArchive
             from PyQt5.QtGui import QDesktopServices
             from PyQt5.QtCore import QUrl
             
-            # Prepare data
-            pembayaran_data = {
-                'id_pembayaran': None,
-                'jumlah_bayar': self.ui.spinJumlahBayar.value(),
-                'metode_bayar': self.ui.cmbMetodePembayaran.currentText(),
-                'tanggal_bayar': self.ui.dateTanggalBayar.date().toPyDate(),
-                'status': self.ui.cmbStatusPembayaran.currentText()
-            }
+            # Prepare data: pembayaran yang sudah diproses, atau isi form (belum ada id)
+            if self.current_pembayaran:
+                pembayaran_data = {
+                    key: self.current_pembayaran[key]
+                    for key in ('id_pembayaran', 'jumlah_bayar', 'metode_bayar', 'tanggal_bayar', 'status')
+                }
+            else:
+                pembayaran_data = {
+                    'id_pembayaran': None,
+                    'jumlah_bayar': self.ui.spinJumlahBayar.value(),
+                    'metode_bayar': self.ui.cmbMetodePembayaran.currentText(),
+                    'tanggal_bayar': self.ui.dateTanggalBayar.date().toPyDate(),
+                    'status': self.ui.cmbStatusPembayaran.currentText()
+                }
             
             # Ask user which format - Simple version without nested imports
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Question)
             msg.setWindowTitle('Format Struk')
             msg.setText('Pilih format struk:')
-            msg.setInformativeText('Yes = Format A4 (Standar)\nNo = Format Thermal (Printer Kasir)')
+            msg.setInformativeText('Yes = Format A4 (Standar)\nNo = Format Thermal 80mm (Printer Kasir)\n'
+                                   'Thermal 58mm = Printer kasir kecil')
             msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
+            btn58 = msg.addButton('Thermal 58mm', QMessageBox.ActionRole)
+            # Cetak langsung ke printer kasir (ESC/POS) jika dikonfigurasi
+            btn_printer = None
+            if Settings.ESCPOS_PRINTER:
+                btn_printer = msg.addButton('Kirim ke Printer', QMessageBox.ActionRole)
             msg.setDefaultButton(QMessageBox.Yes)
             
             reply = msg.exec_()
+            clicked = msg.clickedButton()
             
-            if reply == QMessageBox.Cancel:
+            if clicked not in (btn58, btn_printer) and reply == QMessageBox.Cancel:
                 return
             
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
-            # Generate PDF
-            if reply == QMessageBox.Yes:
-                filepath = PDFGenerator.generate_struk_pembayaran(
+            if btn_printer is not None and clicked is btn_printer:
+                from utils.escpos import EscPosPrinter
+                EscPosPrinter.print_struk(
                     self.current_transaksi,
                     self.current_detail_transaksi,
                     pembayaran_data
                 )
+                QMessageBox.information(self, "Sukses", "✅ Struk dikirim ke printer")
+                return
+            
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            
+            if clicked is btn58:
+                fmt, prefix = 'thermal_58', "struk_thermal58"
+            elif reply == QMessageBox.Yes:
+                fmt, prefix = 'a4', "struk"
             else:
-                filepath = PDFGenerator.generate_struk_thermal(
-                    self.current_transaksi,
-                    self.current_detail_transaksi,
-                    pembayaran_data
+                fmt, prefix = 'thermal_80', "struk_thermal"
+            
+            # Cetak ulang struk yang isinya sama diambil dari arsip (tanpa render)
+            archived = ReceiptArchive.default().get(
+                fmt, self.current_transaksi, self.current_detail_transaksi, pembayaran_data
+            )
+            if archived is not None:
+                pdf_bytes = ReceiptArchive.default().read(archived)
+            else:
+                # Render PDF di memori, arsipkan di background
+                if fmt == 'a4':
+                    pdf_bytes = PDFGenerator.render_struk_pembayaran(
+                        self.current_transaksi,
+                        self.current_detail_transaksi,
+                        pembayaran_data
+                    )
+                else:
+                    pdf_bytes = PDFGenerator.render_struk_thermal(
+                        self.current_transaksi,
+                        self.current_detail_transaksi,
+                        pembayaran_data,
+                        paper_mm=58 if fmt == 'thermal_58' else 80
+                    )
+                PDFWriteBehind.archive(
+                    pdf_bytes, fmt, self.current_transaksi,
+                    self.current_detail_transaksi, pembayaran_data
                 )
             
+            # File sementara untuk viewer (salinan tetap ada di arsip struk)
+            filename = (f"{prefix}_{self.current_transaksi['id_transaksi']}_"
+                        f"{pembayaran_data['id_pembayaran'] or 0}.pdf")
+            saved = PDFWriteBehind.submit(pdf_bytes, filename, Settings.RECEIPT_PREVIEW_DIR)
+            
             QApplication.restoreOverrideCursor()
             
             # Ask to open PDF
@@ -471,11 +525,13 @@ Proses pembayaran ini?
             msg2.setIcon(QMessageBox.Information)
             msg2.setWindowTitle('Struk Berhasil Dibuat')
             msg2.setText('✅ Struk pembayaran berhasil dibuat!')
-            msg2.setInformativeText(f'Lokasi: {filepath}\n\nBuka file PDF sekarang?')
+            msg2.setInformativeText(f'File: {filename}\n\nBuka file PDF sekarang?')
             msg2.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             msg2.setDefaultButton(QMessageBox.Yes)
             
             if msg2.exec_() == QMessageBox.Yes:
+                # Viewer butuh file; biasanya penulisan sudah selesai di sini
+                filepath = saved.result()
                 QDesktopServices.openUrl(QUrl.fromLocalFile(filepath))
             
         except Exception as e:
@@ -495,37 +551,12 @@ Proses pembayaran ini?
             data = self.pembayaran_service.get_all()
             
             self.ui.tableHistoryPembayaran.setRowCount(0)
+            self.history_index.clear()
             
             for row_idx, item in enumerate(data):
                 self.ui.tableHistoryPembayaran.insertRow(row_idx)
-                
-                # ID Pembayaran
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 0, 
-                    self.create_item(item['id_pembayaran']))
-                
-                # ID Transaksi
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 1, 
-                    self.create_item(item['id_transaksi']))
-                
-                # Pelanggan
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 2, 
-                    self.create_item(item['nama_pelanggan']))
-                
-                # Jumlah
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 3, 
-                    self.create_item(Formatters.format_currency(item['jumlah_bayar'])))
-                
-                # Metode
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 4, 
-                    self.create_item(item['metode_bayar']))
-                
-                # Tanggal
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 5, 
-                    self.create_item(Formatters.format_date(item['tanggal_bayar'])))
-                
-                # Status
-                self.ui.tableHistoryPembayaran.setItem(row_idx, 6, 
-                    self.create_item(item['status']))
+                self.fill_history_row(row_idx, item)
+                self.history_index.register(item['id_pembayaran'], row_idx, self.history_sort_key(item))
             
             QApplication.restoreOverrideCursor()
             
@@ -534,6 +565,53 @@ Proses pembayaran ini?
             logger.error(f"Error loading history: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat riwayat pembayaran")
     
+    def fill_history_row(self, row_idx, item):
+        """Isi satu baris tabel history pembayaran"""
+        # ID Pembayaran
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 0, 
+            self.create_item(item['id_pembayaran']))
+        
+        # ID Transaksi
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 1, 
+            self.create_item(item['id_transaksi']))
+        
+        # Pelanggan
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 2, 
+            self.create_item(item['nama_pelanggan']))
+        
+        # Jumlah
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 3, 
+            self.create_item(Formatters.format_currency(item['jumlah_bayar'])))
+        
+        # Metode
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 4, 
+            self.create_item(item['metode_bayar']))
+        
+        # Tanggal
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 5, 
+            self.create_item(Formatters.format_date(item['tanggal_bayar'])))
+        
+        # Status
+        self.ui.tableHistoryPembayaran.setItem(row_idx, 6, 
+            self.create_item(item['status']))
+    
+    def upsert_history_row(self, item):
+        """Insert/update satu baris history tanpa reload tabel"""
+        self.history_index.upsert(
+            item['id_pembayaran'],
+            lambda row: self.fill_history_row(row, item),
+            self.history_sort_key(item)
+        )
+    
+    def history_sort_key(self, item):
+        """Urutan history: tanggal_bayar DESC, pembayaran terbaru di atas"""
+        return (str(item['tanggal_bayar']), item['id_pembayaran'])
+    
+    def on_pembayaran_changed(self, changes):
+        """Patch baris yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.pembayaran_service.get_by_ids, 'id_pembayaran',
+                            self.upsert_history_row, self.history_index.remove)
+    
     # ============================================
     # Helper Methods
     # ============================================
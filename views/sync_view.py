@@ -0,0 +1,151 @@
+"""
+Dialog entry journal offline yang ditolak server saat sync
+"""
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
+                             QTableWidgetItem, QPushButton, QAbstractItemView, QHeaderView,
+                             QMessageBox, QFileDialog)
+from services.sync_service import SyncService
+from config.settings import Settings
+from utils.formatters import Formatters
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Nama operasi journal untuk user
+OPERATION_NAMES = {
+    'transaksi.create': "Transaksi",
+    'pembayaran.create': "Pembayaran",
+}
+
+
+class SyncGagalDialog(QDialog):
+    """
+    Daftar transaksi & pembayaran offline yang ditolak server
+    
+    Entry bisa dikirim ulang (setelah penyebabnya diperbaiki, contoh:
+    pelanggan/layanan yang dihapus terminal lain dibuat ulang) atau
+    di-export ke JSON untuk diinput manual.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []
+        self.init_ui()
+        self.load_entries()
+    
+    def init_ui(self):
+        """Initialize dialog UI"""
+        self.setWindowTitle("Sync Gagal")
+        self.setMinimumSize(800, 400)
+        
+        layout = QVBoxLayout()
+        
+        layout.addWidget(QLabel(
+            "Data berikut disimpan saat offline tetapi ditolak server saat dikirim.\n"
+            "Perbaiki penyebabnya lalu kirim ulang, atau export untuk diinput manual."
+        ))
+        
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["#", "Data", "Disimpan", "Percobaan", "Error"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+        
+        buttons = QHBoxLayout()
+        self.btnKirimUlang = QPushButton("🔁 Kirim Ulang")
+        self.btnKirimUlang.clicked.connect(self.kirim_ulang)
+        buttons.addWidget(self.btnKirimUlang)
+        self.btnExport = QPushButton("💾 Export")
+        self.btnExport.clicked.connect(self.export)
+        buttons.addWidget(self.btnExport)
+        buttons.addStretch()
+        btn_tutup = QPushButton("Tutup")
+        btn_tutup.clicked.connect(self.accept)
+        buttons.addWidget(btn_tutup)
+        layout.addLayout(buttons)
+        
+        self.setLayout(layout)
+    
+    def load_entries(self):
+        """Load entry failed dari journal"""
+        self.entries = SyncService.failed_entries()
+        
+        self.table.setRowCount(0)
+        for row_idx, entry in enumerate(self.entries):
+            self.table.insertRow(row_idx)
+            self.table.setItem(row_idx, 0, QTableWidgetItem(str(entry['seq'])))
+            self.table.setItem(row_idx, 1, QTableWidgetItem(self.describe(entry)))
+            self.table.setItem(row_idx, 2, QTableWidgetItem(entry['created_at']))
+            self.table.setItem(row_idx, 3, QTableWidgetItem(str(entry['attempts'])))
+            error = QTableWidgetItem(entry['last_error'] or "-")
+            error.setToolTip(entry['last_error'] or "")
+            self.table.setItem(row_idx, 4, error)
+        self.table.resizeColumnsToContents()
+        
+        has_entries = bool(self.entries)
+        self.btnKirimUlang.setEnabled(has_entries)
+        self.btnExport.setEnabled(has_entries)
+    
+    @staticmethod
+    def describe(entry) -> str:
+        """Ringkasan payload untuk kolom Data"""
+        payload = entry['payload']
+        name = OPERATION_NAMES.get(entry['operation'], entry['operation'])
+        if entry['operation'] == 'transaksi.create':
+            return (f"{name} pelanggan #{payload['id_pelanggan']}, "
+                    f"{Formatters.format_currency(payload['total'])}")
+        if entry['operation'] == 'pembayaran.create':
+            return (f"{name} transaksi #{payload['id_transaksi']}, "
+                    f"{Formatters.format_currency(payload['jumlah_bayar'])} ({payload['metode_bayar']})")
+        return name
+    
+    def selected_entries(self):
+        """Entry di baris terpilih, semua entry jika tidak ada yang dipilih"""
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        return [self.entries[row] for row in rows] if rows else list(self.entries)
+    
+    def kirim_ulang(self):
+        """Antrikan ulang entry (dikirim oleh sync background)"""
+        entries = self.selected_entries()
+        reply = QMessageBox.question(
+            self,
+            'Kirim Ulang',
+            f'Kirim ulang {len(entries)} data ke server?',
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        try:
+            SyncService.retry_failed([entry['seq'] for entry in entries])
+        except Exception as e:
+            logger.error(f"Error retry journal: {e}")
+            QMessageBox.critical(self, "Error", f"Gagal mengantrikan ulang:\n{str(e)}")
+            return
+        
+        QMessageBox.information(
+            self, "Sukses",
+            f"✅ {len(entries)} data diantrikan ulang.\n\n"
+            f"Data dikirim otomatis dalam {Settings.SYNC_INTERVAL_SECONDS} detik."
+        )
+        self.load_entries()
+    
+    def export(self):
+        """Export entry ke file JSON"""
+        entries = self.selected_entries()
+        default = Settings.REPORTS_DIR / f"sync_gagal_{datetime.now():%Y%m%d_%H%M%S}.json"
+        path, _ = QFileDialog.getSaveFileName(self, "Export Sync Gagal", str(default), "JSON (*.json)")
+        if not path:
+            return
+        
+        try:
+            SyncService.export_failed(entries, path)
+        except OSError as e:
+            logger.error(f"Error export journal: {e}")
+            QMessageBox.critical(self, "Error", f"Gagal export:\n{str(e)}")
+            return
+        QMessageBox.information(self, "Sukses", f"✅ {len(entries)} data di-export ke:\n{path}")
@@ -6,15 +6,19 @@ from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QTableWidgetItem,
                              QDialog, QVBoxLayout, QLabel, QComboBox, QSpinBox,
                              QDialogButtonBox)
 from PyQt5.QtCore import Qt, QDate
-from ui.generated.ui_form_transaksi import Ui_MainWindow
 from services.transaksi_service import TransaksiService
-from services.pelanggan_service import PelangganService
-from utils.rbac_decorator import require_role
+from utils.rbac_decorator import require_permission
 from utils.rbac_helper import RBACHelper
 from services.layanan_service import LayananService
+from services.reference_service import ReferenceService
 from services.auth_service import AuthService
 from utils.session_manager import SessionManager
 from utils.formatters import Formatters
+from utils.money import Money
+from utils.table_helper import TableRowIndex
+from utils.pelanggan_picker import PelangganPicker
+from utils.change_watcher import ChangeWatcher
+from config.constants import Permission
 from datetime import datetime, date
 import logging
 
@@ -26,22 +30,32 @@ class TransaksiView(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Generated UI di-import saat window dibuat, bukan saat startup
+        from ui.generated.ui_form_transaksi import Ui_MainWindow
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
         # Services
         self.transaksi_service = TransaksiService()
-        self.pelanggan_service = PelangganService()
+        self.reference_service = ReferenceService()
         self.layanan_service = LayananService()
         
         # State
         self.detail_items = []  # List of {id_layanan, nama_layanan, harga, jumlah, subtotal}
         self.current_transaksi_id = None
+        self.history_index = TableRowIndex(self.ui.tableHistoryTransaksi, descending=True)
+        self.pelanggan_picker = PelangganPicker(self.ui.cmbPelanggan)
         
         # Initialize
         self.init_ui()
         self.connect_signals()
-        self.load_pelanggan_combo()
+        self.change_watcher = ChangeWatcher(self, {
+            'transaksi': self.on_transaksi_changed,
+            'pelanggan': self.pelanggan_picker.on_pelanggan_changed,
+            # TambahLayananDialog membaca ReferenceService tiap dibuka: cukup invalidasi
+            'layanan': None
+        })
+        self.change_watcher.start()
         self.load_jadwal_combo()
         self.load_history()
     
@@ -53,8 +67,8 @@ class TransaksiView(QMainWindow):
             self.ui.lblUsername.setText(
                 f"👤 {user.nama_user} ({RBACHelper.get_role_name(user.role)})"
             )
-            self.setup_rbac_ui(user.role)
-            self.setup_menu_visibility(user.role)
+            self.setup_rbac_ui()
+            self.setup_menu_visibility()
         
         # Set tanggal hari ini
         self.ui.dateTanggal.setDate(QDate.currentDate())
@@ -77,40 +91,21 @@ class TransaksiView(QMainWindow):
         # Reset total
         self.update_total()
     
-    def setup_rbac_ui(self, role):
-        """Setup UI based on user role"""
-        if role == 'owner':
+    def setup_rbac_ui(self):
+        """Input transaksi hanya untuk role dengan MANAGE_TRANSAKSI (owner: read-only)"""
+        if not RBACHelper.has_permission(Permission.MANAGE_TRANSAKSI):
             self.ui.btnTambahLayanan.setVisible(False)
             self.ui.btnSimpanTransaksi.setVisible(False)
             self.ui.groupInfoTransaksi.setEnabled(False)
             self.ui.groupDetailLayanan.setEnabled(False)
     
-    def setup_menu_visibility(self, role):
-        """
-        Setup sidebar menu visibility based on user role
-        
-        Args:
-            role: User role string
-        """
-        if role == 'makeup_artist':
-            # MUA: Hanya Dashboard dan Jadwal
-            self.ui.btnPelanggan.setVisible(False)
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnTransaksi.setVisible(False)
-            self.ui.btnPembayaran.setVisible(False)
-            
-        elif role == 'kasir':
-            # Kasir: Dashboard, Pelanggan, Transaksi, Pembayaran
-            self.ui.btnLayanan.setVisible(False)
-            self.ui.btnJadwal.setVisible(False)
-            
-        elif role == 'owner':
-            # Owner: Semua menu visible (read-only di-handle di setup_rbac_ui)
-            pass
-            
-        elif role == 'admin':
-            # Admin: Full access - semua visible
-            pass
+    def setup_menu_visibility(self):
+        """Setup sidebar menu visibility sesuai permission matrix (Permission.MENU_*)"""
+        self.ui.btnPelanggan.setVisible(RBACHelper.has_permission(Permission.MENU_PELANGGAN))
+        self.ui.btnLayanan.setVisible(RBACHelper.has_permission(Permission.MENU_LAYANAN))
+        self.ui.btnJadwal.setVisible(RBACHelper.has_permission(Permission.MENU_JADWAL))
+        self.ui.btnTransaksi.setVisible(RBACHelper.has_permission(Permission.MENU_TRANSAKSI))
+        self.ui.btnPembayaran.setVisible(RBACHelper.has_permission(Permission.MENU_PEMBAYARAN))
     
     def connect_signals(self):
         """Connect signals"""
@@ -132,23 +127,6 @@ class TransaksiView(QMainWindow):
     # Load Data
     # ============================================
     
-    def load_pelanggan_combo(self):
-        """Load pelanggan to combobox"""
-        try:
-            data = self.pelanggan_service.get_all()
-            
-            self.ui.cmbPelanggan.clear()
-            self.ui.cmbPelanggan.addItem("-- Pilih Pelanggan --", None)
-            
-            for item in data:
-                self.ui.cmbPelanggan.addItem(
-                    f"{item['nama']} - {item['no_hp']}", 
-                    item['id_pelanggan']
-                )
-            
-        except Exception as e:
-            logger.error(f"Error loading pelanggan combo: {e}")
-    
     def load_jadwal_combo(self):
         """Load jadwal to combobox"""
         try:
@@ -190,32 +168,12 @@ class TransaksiView(QMainWindow):
             data = self.transaksi_service.get_all()
             
             self.ui.tableHistoryTransaksi.setRowCount(0)
+            self.history_index.clear()
             
             for row_idx, item in enumerate(data):
                 self.ui.tableHistoryTransaksi.insertRow(row_idx)
-                
-                # ID Transaksi
-                self.ui.tableHistoryTransaksi.setItem(row_idx, 0, 
-                    self.create_item(item['id_transaksi']))
-                
-                # Tanggal
-                self.ui.tableHistoryTransaksi.setItem(row_idx, 1, 
-                    self.create_item(Formatters.format_date(item['tanggal_transaksi'])))
-                
-                # Pelanggan
-                self.ui.tableHistoryTransaksi.setItem(row_idx, 2, 
-                    self.create_item(item['nama_pelanggan']))
-                
-                # Total
-                self.ui.tableHistoryTransaksi.setItem(row_idx, 3, 
-                    self.create_item(Formatters.format_currency(item['total'])))
-                
-                # Status (hardcoded Selesai untuk transaksi yang sudah tersimpan)
-                self.ui.tableHistoryTransaksi.setItem(row_idx, 4, 
-                    self.create_item("Selesai"))
-                
-                # Action buttons
-                self.add_action_buttons_history(row_idx, item['id_transaksi'])
+                self.fill_history_row(row_idx, item)
+                self.history_index.register(item['id_transaksi'], row_idx, self.history_sort_key(item))
             
             QApplication.restoreOverrideCursor()
             
@@ -224,11 +182,53 @@ class TransaksiView(QMainWindow):
             logger.error(f"Error loading history: {e}")
             QMessageBox.critical(self, "Error", "Gagal memuat riwayat transaksi")
     
+    def fill_history_row(self, row_idx, item):
+        """Isi satu baris tabel history transaksi"""
+        # ID Transaksi
+        self.ui.tableHistoryTransaksi.setItem(row_idx, 0, 
+            self.create_item(item['id_transaksi']))
+        
+        # Tanggal
+        self.ui.tableHistoryTransaksi.setItem(row_idx, 1, 
+            self.create_item(Formatters.format_date(item['tanggal_transaksi'])))
+        
+        # Pelanggan
+        self.ui.tableHistoryTransaksi.setItem(row_idx, 2, 
+            self.create_item(item['nama_pelanggan']))
+        
+        # Total
+        self.ui.tableHistoryTransaksi.setItem(row_idx, 3, 
+            self.create_item(Formatters.format_currency(item['total'])))
+        
+        # Status (hardcoded Selesai untuk transaksi yang sudah tersimpan)
+        self.ui.tableHistoryTransaksi.setItem(row_idx, 4, 
+            self.create_item("Selesai"))
+        
+        # Action buttons
+        self.add_action_buttons_history(row_idx, item['id_transaksi'])
+    
+    def upsert_history_row(self, item):
+        """Insert/update satu baris history tanpa reload tabel"""
+        self.history_index.upsert(
+            item['id_transaksi'],
+            lambda row: self.fill_history_row(row, item),
+            self.history_sort_key(item)
+        )
+    
+    def history_sort_key(self, item):
+        """Urutan history: tanggal_transaksi DESC, transaksi terbaru di atas"""
+        return (str(item['tanggal_transaksi']), item['id_transaksi'])
+    
+    def on_transaksi_changed(self, changes):
+        """Patch baris yang diubah terminal lain (dari change feed)"""
+        ChangeWatcher.patch(changes, self.transaksi_service.get_by_ids, 'id_transaksi',
+                            self.upsert_history_row, self.history_index.remove)
+    
     # ============================================
     # Detail Layanan Management
     # ============================================
     
-    @require_role('admin', 'kasir')
+    @require_permission(Permission.MANAGE_TRANSAKSI)
     def show_dialog_tambah_layanan(self, checked=False):
         """Show dialog to add layanan"""
         dialog = TambahLayananDialog(self)
@@ -244,7 +244,7 @@ class TransaksiView(QMainWindow):
             if item['id_layanan'] == layanan_data['id_layanan']:
                 # Update quantity
                 item['jumlah'] += layanan_data['jumlah']
-                item['subtotal'] = item['harga'] * item['jumlah']
+                item['subtotal'] = Money.subtotal(item['harga'], item['jumlah'])
                 self.refresh_detail_table()
                 self.update_total()
                 return
@@ -255,7 +255,7 @@ class TransaksiView(QMainWindow):
             'nama_layanan': layanan_data['nama_layanan'],
             'harga': layanan_data['harga'],
             'jumlah': layanan_data['jumlah'],
-            'subtotal': layanan_data['harga'] * layanan_data['jumlah']
+            'subtotal': Money.subtotal(layanan_data['harga'], layanan_data['jumlah'])
         })
         
         self.refresh_detail_table()
@@ -305,9 +305,7 @@ class TransaksiView(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         
-        user = SessionManager.get_current_user()
-        
-        if user and user.role in ['admin', 'kasir']:
+        if RBACHelper.has_permission(Permission.MANAGE_TRANSAKSI):
             btn_delete = QPushButton("🗑️")
             # ... style ...
             btn_delete.clicked.connect(lambda: self.remove_detail_item(index))
@@ -318,7 +316,7 @@ class TransaksiView(QMainWindow):
     
     def update_total(self):
         """Update total calculation"""
-        subtotal = sum(item['subtotal'] for item in self.detail_items)
+        subtotal = Money.total(item['subtotal'] for item in self.detail_items)
         diskon = 0  # TODO: Implement discount logic
         grand_total = subtotal - diskon
         
@@ -330,11 +328,11 @@ class TransaksiView(QMainWindow):
     # Save Transaksi
     # ============================================
     
-    @require_role('admin', 'kasir')
+    @require_permission(Permission.MANAGE_TRANSAKSI)
     def save_transaksi(self, checked=False):
         """Save transaction"""
         # Validate
-        id_pelanggan = self.ui.cmbPelanggan.currentData()
+        id_pelanggan = self.pelanggan_picker.current_id()
         if id_pelanggan is None:
             QMessageBox.warning(self, "Validasi", "Pelanggan wajib dipilih")
             return
@@ -351,7 +349,7 @@ class TransaksiView(QMainWindow):
         tanggal = self.ui.dateTanggal.date().toPyDate()
         
         # Calculate total
-        total = sum(item['subtotal'] for item in self.detail_items)
+        total = Money.total(item['subtotal'] for item in self.detail_items)
         
         # Get current user
         user = SessionManager.get_current_user()
@@ -360,40 +358,30 @@ class TransaksiView(QMainWindow):
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             
-            from config.database import Database
-            
-            # Insert transaksi
-            query = """
-                INSERT INTO transaksi (tanggal_transaksi, total, id_user, id_pelanggan, id_jadwal)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            id_transaksi = Database.execute_query(
-                query, 
-                (tanggal, total, id_user, id_pelanggan, id_jadwal)
+            success, message, row = self.transaksi_service.create(
+                tanggal, total, id_user, id_pelanggan, id_jadwal, self.detail_items
             )
             
-            # Insert detail transaksi
-            for item in self.detail_items:
-                query = """
-                    INSERT INTO detail_transaksi (id_transaksi, id_layanan, jumlah, subtotal)
-                    VALUES (%s, %s, %s, %s)
-                """
-                Database.execute_query(
-                    query,
-                    (id_transaksi, item['id_layanan'], item['jumlah'], item['subtotal'])
-                )
-            
             QApplication.restoreOverrideCursor()
             
-            QMessageBox.information(
-                self, 
-                "Sukses", 
-                f"Transaksi berhasil disimpan!\n\nID Transaksi: {id_transaksi}\nTotal: {Formatters.format_currency(total)}"
-            )
+            if not success:
+                QMessageBox.critical(self, "Error", message)
+                return
+            
+            if row is None:
+                # Server offline: transaksi menunggu di journal lokal
+                QMessageBox.information(self, "Tersimpan Offline", message)
+            else:
+                QMessageBox.information(
+                    self, 
+                    "Sukses", 
+                    f"Transaksi berhasil disimpan!\n\nID Transaksi: {row['id_transaksi']}\nTotal: {Formatters.format_currency(total)}"
+                )
             
-            # Reset form and reload
+            # Reset form and patch history
             self.reset_form()
-            self.load_history()
+            if row:
+                self.upsert_history_row(row)
             
         except Exception as e:
             QApplication.restoreOverrideCursor()
@@ -402,7 +390,7 @@ class TransaksiView(QMainWindow):
     
     def reset_form(self, checked=False):
         """Reset form"""
-        self.ui.cmbPelanggan.setCurrentIndex(0)
+        self.pelanggan_picker.clear()
         self.ui.cmbJadwal.setCurrentIndex(0)
         self.ui.dateTanggal.setDate(QDate.currentDate())
         self.detail_items.clear()
@@ -425,7 +413,7 @@ class TransaksiView(QMainWindow):
                 JOIN pelanggan p ON t.id_pelanggan = p.id_pelanggan
                 WHERE t.id_transaksi = %s
             """
-            transaksi = Database.execute_query(query, (id_transaksi,), fetch=True)
+            transaksi = Money.normalize(Database.execute_query(query, (id_transaksi,), fetch=True), 'total')
             
             if not transaksi:
                 QMessageBox.warning(self, "Error", "Data tidak ditemukan")
@@ -440,7 +428,7 @@ class TransaksiView(QMainWindow):
                 JOIN layanan l ON dt.id_layanan = l.id_layanan
                 WHERE dt.id_transaksi = %s
             """
-            details = Database.execute_query(query, (id_transaksi,), fetch=True)
+            details = Money.normalize(Database.execute_query(query, (id_transaksi,), fetch=True), 'subtotal')
             
             # Show detail dialog
             detail_text = f"""
@@ -456,7 +444,7 @@ LAYANAN:
             for item in details:
                 detail_text += f"""
 • {item['nama_layanan']}
-  Qty: {item['jumlah']} x {Formatters.format_currency(item['subtotal']/item['jumlah'])}
+  Qty: {item['jumlah']} x {Formatters.format_currency(item['subtotal'] // item['jumlah'])}
   Subtotal: {Formatters.format_currency(item['subtotal'])}
 """
             
@@ -566,7 +554,7 @@ class TambahLayananDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.layanan_service = LayananService()
+        self.reference_service = ReferenceService()
         self.init_ui()
     
     def init_ui(self):
@@ -607,14 +595,14 @@ class TambahLayananDialog(QDialog):
     def load_layanan(self):
         """Load layanan to combobox"""
         try:
-            data = self.layanan_service.get_all()
+            data = self.reference_service.get_layanan()
             
             for item in data:
                 label = f"{item['nama_layanan']} - {Formatters.format_currency(item['harga'])}"
                 self.cmbLayanan.addItem(label, {
                     'id_layanan': item['id_layanan'],
                     'nama_layanan': item['nama_layanan'],
-                    'harga': float(item['harga'])
+                    'harga': Money.to_rupiah(item['harga'])
                 })
             
         except Exception as e: